@@ -71,11 +71,13 @@ from networkx.algorithms.isomorphism import (is_isomorphic, could_be_isomorphic,
     fast_could_be_isomorphic, faster_could_be_isomorphic)
 # flow
 from networkx.algorithms.flow import (maximum_flow, maximum_flow_value,
-    minimum_cut, minimum_cut_value, capacity_scaling, network_simplex,
-    min_cost_flow_cost, max_flow_min_cost, min_cost_flow, cost_of_flow)
+    minimum_cut, minimum_cut_value, capacity_scaling, cost_scaling,
+    network_simplex, min_cost_flow_cost, max_flow_min_cost, min_cost_flow,
+    cost_of_flow, gomory_hu_tree, gomory_hu_minimum_cut, NetworkSimplex)
 
 from .tree.recognition import *
 from .tree.mst import *
+from .tree.dynamic_mst import *
 from .tree.branchings import (
 	maximum_branching, minimum_branching,
 	maximum_spanning_arborescence, minimum_spanning_arborescence
@@ -4,10 +4,16 @@
 #   Jordi Torrents <jtorrents@milnou.net>
 #   All rights reserved.
 #   BSD license.
+from __future__ import division
+from bisect import bisect_right
+from math import log, sqrt
 import random
+
+import networkx as nx
 from networkx.utils import not_implemented_for
 
-__all__ = ['average_clustering']
+__all__ = ['average_clustering', 'transitivity', 'number_of_triangles',
+           'streaming_triangles']
 __author__ = """\n""".join(['Fred Morstatter <fred.morstatter@asu.edu>',
                             'Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -58,3 +64,346 @@ def average_clustering(G, trials=1000):
         if u in G[v]:
             triangles += 1
     return triangles / float(trials)
+
+
+def _check_sampling(trials, delta):
+    """Raise NetworkXError unless `trials` is positive and `delta`, if
+    given, is in the open interval (0, 1).
+    """
+    if trials < 1:
+        raise nx.NetworkXError('trials must be at least 1.')
+    if delta is not None and not 0 < delta < 1:
+        raise nx.NetworkXError('delta must be in the open interval (0, 1).')
+
+
+def _hoeffding(trials, delta):
+    """Return the half-width of a `1 - delta` confidence interval for the
+    mean of `trials` independent samples with values in [0, 1].
+    """
+    return sqrt(log(2 / delta) / (2 * trials))
+
+
+def _nonloop_neighbors(G, v):
+    return [u for u in G[v] if u != v]
+
+
+def _cumulative(G, weight):
+    """Return the nodes of `G` and the cumulative sums of `weight(d)` for
+    their degrees `d` (self loops ignored).
+    """
+    nodes = []
+    cumulative = []
+    total = 0
+    for v, nbrs in G.adj.items():
+        w = weight(len(nbrs) - (v in nbrs))
+        if w > 0:
+            total += w
+            nodes.append(v)
+            cumulative.append(total)
+    return nodes, cumulative
+
+
+def _wedge_sample(G, trials, rng):
+    """Return the total number of wedges of `G` and the number of closed
+    wedges among `trials` wedges sampled uniformly at random.
+    """
+    nodes, cumulative = _cumulative(G, lambda d: d * (d - 1) // 2)
+    if not nodes:
+        return 0, 0
+    wedges = cumulative[-1]
+    closed = 0
+    for _ in range(trials):
+        v = nodes[bisect_right(cumulative, rng.random() * wedges)]
+        u, w = rng.sample(_nonloop_neighbors(G, v), 2)
+        if w in G[u]:
+            closed += 1
+    return wedges, closed
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def transitivity(G, trials=1000, delta=None, seed=None):
+    r"""Estimates the transitivity of G by wedge sampling.
+
+    The transitivity is the fraction of wedges (paths of length two)
+    that are closed by a third edge into a triangle.
+
+    This function samples `trials` wedges uniformly at random, by
+    choosing a node with probability proportional to the number of
+    wedges centered on it and then two of its neighbors, and returns
+    the fraction of sampled wedges that are closed [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    trials : integer
+        Number of wedges to sample (default 1000).
+
+    delta : float, optional (default=None)
+        If given, also return the half-width `\epsilon` of a confidence
+        interval such that the estimate is within `\epsilon` of the
+        exact transitivity with probability at least `1 - \delta`.
+
+    seed : integer, optional (default=None)
+        Seed for the random number generator.
+
+    Returns
+    -------
+    t : float, or tuple
+        Approximated transitivity, or the tuple ``(t, epsilon)`` if
+        `delta` is given.
+
+    Raises
+    ------
+    NetworkXError
+        If `trials` is less than 1 or `delta` is not in (0, 1).
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> approx.transitivity(G, trials=100)
+    1.0
+
+    Notes
+    -----
+    By Hoeffding's inequality the error bound is
+
+    .. math::
+
+        \epsilon = \sqrt{\frac{\ln(2/\delta)}{2 k}},
+
+    where `k` is the number of trials, so `k` samples suffice for an
+    additive error of `\epsilon` independently of the size of the graph.
+
+    See Also
+    --------
+    networkx.algorithms.cluster.transitivity
+
+    References
+    ----------
+    .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
+       coefficient and transitivity. Universität Karlsruhe, Fakultät für
+       Informatik, 2004.
+       http://www.emis.ams.org/journals/JGAA/accepted/2005/SchankWagner2005.9.2.pdf
+    """
+    _check_sampling(trials, delta)
+    rng = random.Random(seed)
+    wedges, closed = _wedge_sample(G, trials, rng)
+    t = closed / trials if wedges > 0 else 0
+    if delta is None:
+        return t
+    return t, _hoeffding(trials, delta) if wedges > 0 else 0
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def number_of_triangles(G, trials=1000, method='wedge', delta=None,
+                        seed=None):
+    r"""Estimates the number of triangles in G by sampling.
+
+    Two sampling schemes are available.
+
+    Wedge sampling samples wedges (paths of length two) uniformly at
+    random and scales the fraction of closed wedges by one third of the
+    total number of wedges, which is computed exactly from the degrees.
+
+    Edge sampling samples edges uniformly at random, counts the common
+    neighbors of their endpoints and scales the mean count by one third
+    of the number of edges.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    trials : integer
+        Number of wedges or edges to sample (default 1000).
+
+    method : string, optional (default='wedge')
+        The sampling scheme, either 'wedge' or 'edge'.
+
+    delta : float, optional (default=None)
+        If given, also return the half-width `\epsilon` of a confidence
+        interval such that the estimate is within `\epsilon` of the
+        exact number of triangles with probability at least
+        `1 - \delta`.
+
+    seed : integer, optional (default=None)
+        Seed for the random number generator.
+
+    Returns
+    -------
+    t : float, or tuple
+        Approximated number of triangles, or the tuple ``(t, epsilon)``
+        if `delta` is given.
+
+    Raises
+    ------
+    NetworkXError
+        If `method` is not 'wedge' or 'edge', `trials` is less than 1 or
+        `delta` is not in (0, 1).
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> approx.number_of_triangles(G, trials=100)
+    10.0
+
+    Notes
+    -----
+    Both bounds follow from Hoeffding's inequality.  With `k` trials,
+    `W` wedges, `m` edges and maximum degree `d_{max}` the error bounds
+    are
+
+    .. math::
+
+        \epsilon_{wedge} = \frac{W}{3} \sqrt{\frac{\ln(2/\delta)}{2 k}}
+        \qquad
+        \epsilon_{edge} = \frac{m (d_{max} - 1)}{3}
+                         \sqrt{\frac{\ln(2/\delta)}{2 k}}.
+
+    Wedge sampling usually gives the tighter bound; edge sampling has
+    lower variance on graphs whose triangles concentrate on few edges.
+
+    See Also
+    --------
+    transitivity, streaming_triangles
+    networkx.algorithms.cluster.triangles
+
+    References
+    ----------
+    .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
+       coefficient and transitivity. Universität Karlsruhe, Fakultät für
+       Informatik, 2004.
+    .. [2] M. Al Hasan and V. S. Dave, Triangle counting in large networks:
+       a review. WIREs Data Mining and Knowledge Discovery 8 (2018).
+    """
+    _check_sampling(trials, delta)
+    rng = random.Random(seed)
+    if method == 'wedge':
+        wedges, closed = _wedge_sample(G, trials, rng)
+        if wedges == 0:
+            return 0.0 if delta is None else (0.0, 0)
+        t = wedges * closed / trials / 3
+        bound = wedges / 3
+    elif method == 'edge':
+        nodes, cumulative = _cumulative(G, lambda d: d)
+        if not nodes:
+            return 0.0 if delta is None else (0.0, 0)
+        # Picking a node proportionally to its degree and then one of
+        # its neighbors picks every edge with the same probability.
+        degree_sum = cumulative[-1]
+        common = 0
+        for _ in range(trials):
+            u = nodes[bisect_right(cumulative, rng.random() * degree_sum)]
+            v = rng.choice(_nonloop_neighbors(G, u))
+            common += len(set(G[u]) & set(G[v]) - {u, v})
+        t = degree_sum * common / trials / 6
+        dmax = max(len(_nonloop_neighbors(G, v)) for v in nodes)
+        bound = degree_sum * (dmax - 1) / 6
+    else:
+        raise nx.NetworkXError("method must be 'wedge' or 'edge'.")
+    if delta is None:
+        return t
+    return t, bound * _hoeffding(trials, delta)
+
+
+def streaming_triangles(edges, sample_size=10000, seed=None):
+    r"""Estimates the number of triangles and the transitivity of a graph
+    given as a stream of edges.
+
+    The edges are consumed in a single pass and the graph is never
+    built.  A uniform reservoir sample of at most `sample_size` edges is
+    kept; each arriving edge counts the triangles it closes in the
+    sample, weighted by the inverse probability that the other two
+    edges of the triangle are sampled (the TRIÈST-IMPR estimator [1]_).
+    The number of wedges, needed for the transitivity, is computed
+    exactly from the node degrees.
+
+    Parameters
+    ----------
+    edges : iterable
+        Iterable of edges ``(u, v)`` of a simple undirected graph.
+        Each edge must appear once; additional items of an edge tuple
+        (such as a data dictionary) are ignored.
+
+    sample_size : integer
+        Maximum number of edges kept in memory (default 10000).
+
+    seed : integer, optional (default=None)
+        Seed for the random number generator.
+
+    Returns
+    -------
+    (triangles, transitivity) : tuple of floats
+        Approximated number of triangles and transitivity.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> approx.streaming_triangles(G.edges(), sample_size=20)
+    (10.0, 1.0)
+
+    A large edge list file can be processed line by line::
+
+    >>> lines = ['0 1', '1 2', '0 2', '2 3']
+    >>> approx.streaming_triangles(line.split() for line in lines)
+    (1.0, 0.6)
+
+    Notes
+    -----
+    The estimate is unbiased and exact when the stream has at most
+    `sample_size` edges.  Besides the sample, the degree of every node
+    is stored.  Self loops are ignored.
+
+    See Also
+    --------
+    number_of_triangles, transitivity
+
+    References
+    ----------
+    .. [1] L. De Stefani, A. Epasto, M. Riondato and E. Upfal,
+       TRIÈST: Counting local and global triangles in fully-dynamic
+       streams with fixed memory size.  Proceedings of KDD 2016.
+    """
+    if sample_size < 2:
+        raise nx.NetworkXError('sample_size must be at least 2.')
+    rng = random.Random(seed)
+    M = sample_size
+    degree = {}
+    sample = []
+    sample_adj = {}
+    triangles = 0.0
+    t = 0
+    for e in edges:
+        u, v = e[0], e[1]
+        if u == v:
+            continue
+        degree[u] = degree.get(u, 0) + 1
+        degree[v] = degree.get(v, 0) + 1
+        t += 1
+        # count the triangles closed in the sample
+        nbrs_u = sample_adj.get(u)
+        nbrs_v = sample_adj.get(v)
+        if nbrs_u and nbrs_v:
+            eta = max(1.0, (t - 1) * (t - 2) / (M * (M - 1)))
+            triangles += eta * len(nbrs_u & nbrs_v)
+        # reservoir sampling of the edges
+        if t <= M:
+            sample.append((u, v))
+        elif rng.random() < M / t:
+            i = rng.randrange(M)
+            x, y = sample[i]
+            sample_adj[x].discard(y)
+            sample_adj[y].discard(x)
+            sample[i] = (u, v)
+        else:
+            continue
+        sample_adj.setdefault(u, set()).add(v)
+        sample_adj.setdefault(v, set()).add(u)
+    wedges = sum(d * (d - 1) // 2 for d in degree.values())
+    transitivity = 3 * triangles / wedges if wedges > 0 else 0.0
+    return triangles, transitivity
@@ -13,8 +13,13 @@ http://en.wikipedia.org/wiki/Matching_(graph_theory)
 #   Nicholas Mancuso <nick.mancuso@gmail.com>
 #   All rights reserved.
 #   BSD license.
+from operator import itemgetter
+
 import networkx as nx
-__all__ = ["min_maximal_matching"]
+from networkx.utils import not_implemented_for
+
+__all__ = ["min_maximal_matching", "approximate_max_weight_matching",
+           "matching_approximation_ratio"]
 __author__ = """Nicholas Mancuso (nick.mancuso@gmail.com)"""
 
 def min_maximal_matching(G):
@@ -44,3 +49,242 @@ def min_maximal_matching(G):
     .. [1] Vazirani, Vijay Approximation Algorithms (2001)
     """
     return nx.maximal_matching(G)
+
+
+#: Fraction of the maximum weight that each method is guaranteed to reach.
+_RATIOS = {'greedy': 1 / 2., 'path_growing': 1 / 2., 'local_search': 2 / 3.}
+
+
+def matching_approximation_ratio(method):
+    """Returns the approximation guarantee of a matching method.
+
+    Parameters
+    ----------
+    method : string
+      One of the methods of :func:`approximate_max_weight_matching`:
+      ``'greedy'``, ``'path_growing'`` or ``'local_search'``.
+
+    Returns
+    -------
+    ratio : float
+      The fraction of the weight of a maximum weight matching that the
+      matchings computed by `method` are guaranteed to reach.
+
+    Raises
+    ------
+    ValueError
+      If `method` is not one of the supported methods.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> approx.matching_approximation_ratio('greedy')
+    0.5
+
+    """
+    try:
+        return _RATIOS[method]
+    except KeyError:
+        msg = '{} is not a valid choice for an algorithm.'.format(method)
+        raise ValueError(msg)
+
+
+@not_implemented_for('directed')
+def approximate_max_weight_matching(G, method='greedy', weight='weight'):
+    """Returns a matching whose weight approximates the maximum weight.
+
+    These methods run in nearly linear time and are meant for graphs on
+    which the exact :func:`~networkx.algorithms.matching.max_weight_matching`
+    is too slow.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+      Undirected graph
+
+    method : string (default 'greedy')
+      The approximation algorithm to use:
+
+      ``'greedy'``
+        Scan the edges from heaviest to lightest and keep every edge
+        whose endpoints are still unmatched. Reaches 1/2 of the maximum
+        weight in $O(m \\log m)$ time.
+
+      ``'path_growing'``
+        The path growing algorithm of Drake and Hougardy [1]_. Grows
+        paths along the heaviest remaining edges and alternately assigns
+        their edges to two matchings, of which the heavier is kept and
+        then extended greedily. Reaches 1/2 of the maximum weight; the
+        path growing phase takes $O(m)$ time.
+
+      ``'local_search'``
+        Starts from the greedy matching and applies improving
+        augmentations with at most two new edges until none is left,
+        which reaches 2/3 of the maximum weight [2]_. Each round takes
+        $O(m)$ time and usually only a few rounds are needed.
+
+      :func:`matching_approximation_ratio` returns the guarantee of each
+      method.
+
+    weight : string (default 'weight')
+      Edge data key corresponding to the edge weight. If the key is not
+      found, the weight of the edge is 1.
+
+    Returns
+    -------
+    mate : dictionary
+      The matching is returned as a dictionary, `mate`, such that
+      ``mate[v] == w`` if node `v` is matched to node `w`. Unmatched
+      nodes do not occur as a key in `mate`.
+
+    Raises
+    ------
+    ValueError
+      If `method` is not one of the supported methods.
+
+    NetworkXNotImplemented
+      If `G` is directed.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.Graph()
+    >>> G.add_weighted_edges_from([(0, 1, 2), (1, 2, 3), (2, 3, 2)])
+    >>> sorted(approx.approximate_max_weight_matching(G).items())
+    [(1, 2), (2, 1)]
+    >>> mate = approx.approximate_max_weight_matching(G, 'local_search')
+    >>> sorted(mate.items())
+    [(0, 1), (1, 0), (2, 3), (3, 2)]
+
+    Notes
+    -----
+    Self-loops and edges with non-positive weight never belong to the
+    returned matching, since they cannot increase its weight. For
+    multigraphs only the heaviest of parallel edges is considered.
+
+    References
+    ----------
+    .. [1] Doratha E. Drake and Stefan Hougardy,
+       "A simple approximation algorithm for the weighted matching
+       problem", Information Processing Letters 85 (2003), pp. 211--213.
+    .. [2] Seth Pettie and Peter Sanders,
+       "A simpler linear time 2/3 - epsilon approximation for maximum
+       weight matching", Information Processing Letters 91 (2004),
+       pp. 271--276.
+
+    """
+    if method not in _RATIOS:
+        msg = '{} is not a valid choice for an algorithm.'.format(method)
+        raise ValueError(msg)
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    n = len(nodes)
+    # The heaviest positive edge between each pair of distinct nodes.
+    wt = {}
+    for u, v, w in G.edges(data=weight, default=1):
+        i, j = index[u], index[v]
+        if i == j or w <= 0:
+            continue
+        if i > j:
+            i, j = j, i
+        if w > wt.get((i, j), 0):
+            wt[i, j] = w
+    edges = sorted(((w, i, j) for (i, j), w in wt.items()),
+                   key=itemgetter(0), reverse=True)
+    adj = [[] for i in range(n)]
+    for w, i, j in edges:
+        adj[i].append((j, w))
+        adj[j].append((i, w))
+    # mate[i] is the index matched to i or -1; mw[i] is the weight of the
+    # matched edge at i, or 0 if i is unmatched.
+    mate = [-1] * n
+    mw = [0] * n
+
+    def unmatch(i):
+        j = mate[i]
+        if j != -1:
+            mate[i] = mate[j] = -1
+            mw[i] = mw[j] = 0
+
+    def match(i, j, w):
+        mate[i] = j
+        mate[j] = i
+        mw[i] = mw[j] = w
+
+    def greedy():
+        for w, i, j in edges:
+            if mate[i] == -1 and mate[j] == -1:
+                match(i, j, w)
+
+    if method == 'path_growing':
+        removed = [False] * n
+        paths = ([], [])
+        totals = [0, 0]
+        for x in range(n):
+            side = 0
+            while not removed[x]:
+                removed[x] = True
+                y, wy = -1, 0
+                for z, w in adj[x]:
+                    if not removed[z] and w > wy:
+                        y, wy = z, w
+                if y == -1:
+                    break
+                paths[side].append((x, y, wy))
+                totals[side] += wy
+                side ^= 1
+                x = y
+        for i, j, w in paths[totals[1] > totals[0]]:
+            match(i, j, w)
+        greedy()
+    else:
+        greedy()
+    if method == 'local_search':
+        improved = True
+        while improved:
+            improved = False
+            for a in range(n):
+                b = mate[a]
+                # A single new edge (a, x), replacing the matched edges at
+                # a and x.
+                gain, move = 0, None
+                for x, w in adj[a]:
+                    g = w - mw[a] - mw[x]
+                    if g > gain and x != b:
+                        gain, move = g, ((a, x, w),)
+                if b != -1 and a < b:
+                    # Two new edges (a, x) and (b, y) replacing the matched
+                    # edge (a, b) and the matched edges at x and y. The two
+                    # best choices on each side always contain a pair with
+                    # x != y.
+                    best = ([], [])
+                    for side, (c, d) in enumerate(((a, b), (b, a))):
+                        cand = sorted(((w - mw[x], x, w) for x, w in adj[c]
+                                       if x != d), reverse=True)
+                        best[side].extend(cand[:2])
+                    for ga, x, wx in best[0]:
+                        for gb, y, wy in best[1]:
+                            g = ga + gb - mw[a]
+                            if x != y and g > gain:
+                                gain = g
+                                move = ((a, x, wx), (b, y, wy))
+                    # When x and y are matched to each other, only one
+                    # matched edge is lost and the pair forms a 4-cycle.
+                    for x, wx in adj[a]:
+                        y = mate[x]
+                        if x == b or y == -1 or y == a:
+                            continue
+                        wy = wt.get((b, y) if b < y else (y, b))
+                        if wy is not None:
+                            g = wx + wy - mw[a] - mw[x]
+                            if g > gain:
+                                gain = g
+                                move = ((a, x, wx), (b, y, wy))
+                if move is not None:
+                    for i, j, w in move:
+                        unmatch(i)
+                        unmatch(j)
+                    for i, j, w in move:
+                        match(i, j, w)
+                    improved = True
+    return {nodes[i]: nodes[j] for i, j in enumerate(mate) if j != -1}
@@ -1,4 +1,5 @@
-from nose.tools import assert_equal
+from nose.tools import (assert_almost_equal, assert_equal, assert_raises,
+                        assert_true)
 import networkx as nx
 from networkx.algorithms.approximation import average_clustering
 
@@ -31,3 +32,89 @@ def test_complete():
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
     G = nx.complete_graph(7)
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
+
+
+def test_transitivity_exact_cases():
+    from networkx.algorithms.approximation import transitivity
+    for G in (nx.petersen_graph(), nx.complete_graph(6), nx.empty_graph(5)):
+        assert_equal(transitivity(G, trials=50), nx.transitivity(G))
+
+
+def test_transitivity_bound():
+    from networkx.algorithms.approximation import transitivity
+    G = nx.gnp_random_graph(100, 0.2, seed=1)
+    t, eps = transitivity(G, trials=5000, delta=0.001, seed=42)
+    assert_true(abs(t - nx.transitivity(G)) <= eps)
+
+
+def test_transitivity_invalid_parameters():
+    from networkx.algorithms.approximation import transitivity
+    G = nx.complete_graph(5)
+    assert_raises(nx.NetworkXError, transitivity, G, trials=0)
+    assert_raises(nx.NetworkXError, transitivity, G, trials=0, delta=0.05)
+    for delta in (0, 1, -0.5, 2):
+        assert_raises(nx.NetworkXError, transitivity, G, trials=100,
+                      delta=delta)
+
+
+def test_number_of_triangles():
+    from networkx.algorithms.approximation import number_of_triangles
+    G = nx.gnp_random_graph(100, 0.2, seed=1)
+    G.add_edge(3, 3)
+    exact = sum(nx.triangles(G).values()) / 3
+    for method in ('wedge', 'edge'):
+        t, eps = number_of_triangles(G, trials=5000, method=method,
+                                     delta=0.001, seed=42)
+        assert_true(abs(t - exact) <= eps)
+    assert_equal(number_of_triangles(nx.complete_graph(5), method='edge'),
+                 10)
+    assert_equal(number_of_triangles(nx.path_graph(4)), 0)
+    assert_equal(number_of_triangles(nx.empty_graph(3), method='edge'), 0)
+    assert_raises(nx.NetworkXError, number_of_triangles, G, method='node')
+
+
+def test_number_of_triangles_invalid_parameters():
+    from networkx.algorithms.approximation import number_of_triangles
+    G = nx.complete_graph(5)
+    for method in ('wedge', 'edge'):
+        assert_raises(nx.NetworkXError, number_of_triangles, G, trials=0,
+                      method=method)
+        assert_raises(nx.NetworkXError, number_of_triangles, G, trials=0,
+                      method=method, delta=0.05)
+        for delta in (0, 1, -0.5, 2):
+            assert_raises(nx.NetworkXError, number_of_triangles, G,
+                          trials=100, method=method, delta=delta)
+
+
+def test_seed_keeps_global_random_state():
+    import random
+    from networkx.algorithms.approximation import (number_of_triangles,
+                                                   streaming_triangles,
+                                                   transitivity)
+    G = nx.gnp_random_graph(30, 0.3, seed=1)
+    state = random.getstate()
+    t = transitivity(G, trials=100, seed=3)
+    w = number_of_triangles(G, trials=100, seed=3)
+    e = number_of_triangles(G, trials=100, method='edge', seed=3)
+    s = streaming_triangles(G.edges(), sample_size=20, seed=3)
+    assert_equal(random.getstate(), state)
+    assert_equal(transitivity(G, trials=100, seed=3), t)
+    assert_equal(number_of_triangles(G, trials=100, seed=3), w)
+    assert_equal(number_of_triangles(G, trials=100, method='edge', seed=3), e)
+    assert_equal(streaming_triangles(G.edges(), sample_size=20, seed=3), s)
+
+
+def test_streaming_triangles():
+    from networkx.algorithms.approximation import streaming_triangles
+    G = nx.gnp_random_graph(100, 0.2, seed=1)
+    exact = sum(nx.triangles(G).values()) / 3
+    # the sample holds the whole stream
+    t, c = streaming_triangles(G.edges(), sample_size=G.size())
+    assert_almost_equal(t, exact)
+    assert_almost_equal(c, nx.transitivity(G))
+    # average of independent runs with a small sample
+    runs = [streaming_triangles(G.edges(data=True), sample_size=400,
+                                seed=i)[0] for i in range(20)]
+    assert_true(abs(sum(runs) / len(runs) - exact) < 0.2 * exact)
+    assert_equal(streaming_triangles([]), (0.0, 0.0))
+    assert_raises(nx.NetworkXError, streaming_triangles, [], sample_size=1)
@@ -6,3 +6,74 @@ def test_min_maximal_matching():
     # smoke test
     G = nx.Graph()
     assert_equal(len(a.min_maximal_matching(G)),0)
+
+
+class TestApproximateMaxWeightMatching(object):
+
+    methods = ['greedy', 'path_growing', 'local_search']
+
+    def weight(self, G, mate):
+        return sum(G[u][v]['weight'] for u, v in mate.items()) / 2.
+
+    def test_guarantee(self):
+        for seed in range(30):
+            G = nx.gnp_random_graph(10, 0.4, seed=seed)
+            for i, (u, v) in enumerate(G.edges()):
+                G[u][v]['weight'] = (seed * 7 + i * 13) % 10 + 1
+            mate = nx.max_weight_matching(G)
+            best = self.weight(G, mate)
+            for method in self.methods:
+                mate = a.approximate_max_weight_matching(G, method)
+                assert_true(nx.is_matching(G, mate))
+                assert_true(all(mate[v] in G[v] for v in mate))
+                ratio = a.matching_approximation_ratio(method)
+                assert_true(self.weight(G, mate) >= ratio * best)
+
+    def test_local_search_improves_greedy(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 2), (1, 2, 3), (2, 3, 2)])
+        mate = a.approximate_max_weight_matching(G)
+        assert_equal(mate, {1: 2, 2: 1})
+        mate = a.approximate_max_weight_matching(G, 'local_search')
+        assert_equal(mate, {0: 1, 1: 0, 2: 3, 3: 2})
+        # The 4-cycle augmentation swaps both matched edges.
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 5), (2, 3, 5), (0, 2, 6),
+                                   (1, 3, 6)])
+        mate = a.approximate_max_weight_matching(G, 'local_search')
+        assert_equal(mate, {0: 2, 2: 0, 1: 3, 3: 1})
+
+    def test_path_growing(self):
+        G = nx.path_graph(5)
+        nx.set_edge_attributes(G, 'weight', 1)
+        G[3][4]['weight'] = 3
+        mate = a.approximate_max_weight_matching(G, 'path_growing')
+        assert_equal(self.weight(G, mate), 4)
+
+    def test_ignored_edges(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 0, weight=10)
+        G.add_edge(0, 1, weight=-1)
+        G.add_edge(0, 1, weight=2)
+        G.add_edge(1, 2, weight=0)
+        for method in self.methods:
+            mate = a.approximate_max_weight_matching(G, method)
+            assert_equal(mate, {0: 1, 1: 0})
+
+    def test_empty(self):
+        for method in self.methods:
+            mate = a.approximate_max_weight_matching(nx.empty_graph(3),
+                                                     method)
+            assert_equal(mate, {})
+
+    @raises(ValueError)
+    def test_invalid_method(self):
+        a.approximate_max_weight_matching(nx.path_graph(3), 'exact')
+
+    @raises(ValueError)
+    def test_invalid_ratio(self):
+        a.matching_approximation_ratio('exact')
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed(self):
+        a.approximate_max_weight_matching(nx.DiGraph([(0, 1)]))
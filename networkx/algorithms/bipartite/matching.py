@@ -41,19 +41,14 @@ The dictionary returned by :func:`maximum_matching` includes a mapping for
 vertices in both the left and right vertex sets.
 
 """
-import collections
-import itertools
-
 from networkx.algorithms.bipartite import sets as bipartite_sets
 import networkx as nx
 
 __all__ = ['maximum_matching', 'hopcroft_karp_matching', 'eppstein_matching',
-           'to_vertex_cover']
-
-INFINITY = float('inf')
+           'to_vertex_cover', 'IncrementalMatching']
 
 
-def hopcroft_karp_matching(G):
+def hopcroft_karp_matching(G, initial_matching=None):
     """Returns the maximum cardinality matching of the bipartite graph `G`.
 
     Parameters
@@ -62,6 +57,14 @@ def hopcroft_karp_matching(G):
 
       Undirected bipartite graph
 
+    initial_matching : dictionary, optional
+
+      A matching to start from, in the same format as the returned one,
+      for example the matching of a previous version of `G` or a greedy
+      matching. Pairs that are not edges of `G`, or whose nodes already
+      occur in another pair, are ignored. A good initial matching leaves
+      few augmenting paths to find.
+
     Returns
     -------
     matches : dictionary
@@ -75,12 +78,20 @@ def hopcroft_karp_matching(G):
 
     This function is implemented with the `Hopcroft--Karp matching algorithm
     <https://en.wikipedia.org/wiki/Hopcroft%E2%80%93Karp_algorithm>`_ for
-    bipartite graphs.
+    bipartite graphs. It runs in $O(m \\sqrt{n})$ time.
+
+    The neighbors of the left nodes are stored in compressed sparse row
+    form, that is, in a single list of right node indices sliced by an
+    offset list, and the matching and the layers in lists indexed by
+    node. The augmenting paths are searched with an iterative depth-first
+    search, so that long paths do not hit the recursion limit. The
+    initial matching is extended greedily before the first phase.
 
     See Also
     --------
 
     eppstein_matching
+    IncrementalMatching
 
     References
     ----------
@@ -89,68 +100,105 @@ def hopcroft_karp_matching(G):
        2.4 (1973), pp. 225--231. <https://dx.doi.org/10.1137/0202019>.
 
     """
-    # First we define some auxiliary search functions.
-    #
-    # If you are a human reading these auxiliary search functions, the "global"
-    # variables `leftmatches`, `rightmatches`, `distances`, etc. are defined
-    # below the functions, so that they are initialized close to the initial
-    # invocation of the search functions.
-    def breadth_first_search():
-        for v in left:
-            if leftmatches[v] is None:
-                distances[v] = 0
-                queue.append(v)
-            else:
-                distances[v] = INFINITY
-        distances[None] = INFINITY
-        while queue:
-            v = queue.popleft()
-            if distances[v] < distances[None]:
-                for u in G[v]:
-                    if distances[rightmatches[u]] is INFINITY:
-                        distances[rightmatches[u]] = distances[v] + 1
-                        queue.append(rightmatches[u])
-        return distances[None] is not INFINITY
-
-    def depth_first_search(v):
-        if v is not None:
-            for u in G[v]:
-                if distances[rightmatches[u]] == distances[v] + 1:
-                    if depth_first_search(rightmatches[u]):
-                        rightmatches[u] = v
-                        leftmatches[v] = u
-                        return True
-            distances[v] = INFINITY
-            return False
-        return True
-
-    # Initialize the "global" variables that maintain state during the search.
     left, right = bipartite_sets(G)
-    leftmatches = {v: None for v in left}
-    rightmatches = {v: None for v in right}
-    distances = {}
-    queue = collections.deque()
-
-    # Implementation note: this counter is incremented as pairs are matched but
-    # it is currently not used elsewhere in the computation.
-    num_matched_pairs = 0
-    while breadth_first_search():
-        for v in left:
-            if leftmatches[v] is None:
-                if depth_first_search(v):
-                    num_matched_pairs += 1
-
-    # Strip the entries matched to `None`.
-    leftmatches = {k: v for k, v in leftmatches.items() if v is not None}
-    rightmatches = {k: v for k, v in rightmatches.items() if v is not None}
-
-    # At this point, the left matches and the right matches are inverses of one
-    # another. In other words,
-    #
-    #     leftmatches == {v, k for k, v in rightmatches.items()}
-    #
-    # Finally, we combine both the left matches and right matches.
-    return dict(itertools.chain(leftmatches.items(), rightmatches.items()))
+    left = list(left)
+    right = list(right)
+    index = {v: i for i, v in enumerate(right)}
+    # The right neighbors of left node `u` are the right node indices
+    # ``targets[offsets[u]:offsets[u + 1]]``.
+    offsets = [0]
+    targets = []
+    for u in left:
+        targets.extend(index[v] for v in G[u])
+        offsets.append(len(targets))
+    nleft = len(left)
+    leftmates = [-1] * nleft
+    rightmates = [-1] * len(right)
+    if initial_matching:
+        leftindex = {u: i for i, u in enumerate(left)}
+        for u, v in initial_matching.items():
+            if u in leftindex and v in index and G.has_edge(u, v):
+                i, j = leftindex[u], index[v]
+                if leftmates[i] == -1 and rightmates[j] == -1:
+                    leftmates[i] = j
+                    rightmates[j] = i
+    for i in range(nleft):
+        if leftmates[i] == -1:
+            for p in range(offsets[i], offsets[i + 1]):
+                j = targets[p]
+                if rightmates[j] == -1:
+                    leftmates[i] = j
+                    rightmates[j] = i
+                    break
+
+    while True:
+        # Breadth-first search from the unmatched left nodes, layering the
+        # left nodes by their distance along alternating paths, until an
+        # unmatched right node is reached at distance `limit`. Unreached
+        # nodes are at distance -1.
+        distances = [-1] * nleft
+        queue = [i for i in range(nleft) if leftmates[i] == -1]
+        for i in queue:
+            distances[i] = 0
+        limit = -1
+        for u in queue:
+            d = distances[u]
+            if limit != -1 and d > limit:
+                break
+            for j in targets[offsets[u]:offsets[u + 1]]:
+                w = rightmates[j]
+                if w == -1:
+                    if limit == -1:
+                        limit = d
+                elif distances[w] == -1:
+                    distances[w] = d + 1
+                    queue.append(w)
+        if limit == -1:
+            break
+        # Depth-first search for vertex-disjoint shortest augmenting paths
+        # along the layers. `position[u]` is the next edge of `u` to try;
+        # while `u` is on the stack it is the edge to the next node.
+        position = offsets[:-1]
+        for root in range(nleft):
+            if leftmates[root] != -1 or distances[root] != 0:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                d = distances[u]
+                p = position[u]
+                end = offsets[u + 1]
+                while p < end:
+                    w = rightmates[targets[p]]
+                    if w == -1:
+                        if d == limit:
+                            break
+                    elif d < limit and distances[w] == d + 1:
+                        break
+                    p += 1
+                position[u] = p
+                if p == end:
+                    # No augmenting path goes through `u` in this phase.
+                    distances[u] = -1
+                    stack.pop()
+                    if stack:
+                        position[stack[-1]] += 1
+                elif w == -1:
+                    # Augment along the path and keep later searches of
+                    # this phase away from its nodes.
+                    for u in stack:
+                        j = targets[position[u]]
+                        leftmates[u] = j
+                        rightmates[j] = u
+                        distances[u] = -1
+                    break
+                else:
+                    stack.append(w)
+
+    matches = {left[i]: right[j] for i, j in enumerate(leftmates) if j != -1}
+    matches.update((right[j], left[i]) for j, i in enumerate(rightmates)
+                   if i != -1)
+    return matches
 
 
 def eppstein_matching(G):
@@ -253,21 +301,338 @@ def eppstein_matching(G):
                 matching[matching[key]] = key
             return matching
 
-        # recursively search backward through layers to find alternating paths
-        # recursion returns true if found path, false otherwise
-        def recurse(v):
-            if v in preds:
-                L = preds.pop(v)
-                for u in L:
+        # search backward through layers to find alternating paths; each
+        # stack entry holds a vertex v in V, an iterator over its unused
+        # predecessors and the predecessor being tried
+        for v in unmatched:
+            if v not in preds:
+                continue
+            stack = [[v, iter(preds.pop(v)), None]]
+            while stack:
+                entry = stack[-1]
+                for u in entry[1]:
                     if u in pred:
                         pu = pred.pop(u)
-                        if pu is unmatched or recurse(pu):
-                            matching[v] = u
-                            return True
-            return False
+                        if pu is unmatched:
+                            # found a path: match it along the stack
+                            entry[2] = u
+                            for v, _, u in stack:
+                                matching[v] = u
+                            stack = []
+                            break
+                        if pu in preds:
+                            entry[2] = u
+                            stack.append([pu, iter(preds.pop(pu)), None])
+                            break
+                else:
+                    stack.pop()
 
-        for v in unmatched:
-            recurse(v)
+
+class IncrementalMatching(object):
+    """Maximum cardinality matching of a bipartite graph that is repaired
+    while edges and nodes are added and removed.
+
+    The matching is initially computed with :func:`hopcroft_karp_matching`.
+    Adding an edge or removing a matched edge changes the size of a
+    maximum matching by at most one, and any augmenting path that appears
+    goes through the endpoints of that edge. Each update is thus repaired
+    by searching for an alternating path from these endpoints only.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected bipartite graph. It is copied, and is not modified
+        by the updates.
+
+    top_nodes : container, optional
+        The nodes of one side of the bipartition. If not given, the sides
+        are computed with :func:`~networkx.algorithms.bipartite.basic.sets`.
+
+    initial_matching : dictionary, optional
+        A matching of `G` to start from, as in
+        :func:`hopcroft_karp_matching`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed.
+
+    NetworkXError
+        If `G` is not bipartite.
+
+    See also
+    --------
+    hopcroft_karp_matching
+
+    Notes
+    -----
+    Each search runs breadth-first from the endpoint, alternately with a
+    search backward from the unmatched nodes of the other side, until
+    they meet or one of them has reached all it can. An update whose
+    matching cannot grow thus costs about twice the size of the smaller
+    of the two explored regions instead of the whole region reachable
+    from the endpoint. In the worst case an update takes time linear in
+    the size of the graph.
+
+    Every node keeps its side for its whole lifetime. A new edge between
+    a node and a node not yet present puts the new node on the other
+    side; when both nodes are new, `u` goes to the top side. An edge
+    between two nodes of the same side raises an exception.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import bipartite
+    >>> G = nx.Graph([(0, 'a'), (1, 'a'), (1, 'b')])
+    >>> M = bipartite.IncrementalMatching(G, top_nodes=[0, 1])
+    >>> M.number_of_edges()
+    2
+    >>> M.remove_edge(0, 'a')
+    >>> M.number_of_edges()
+    1
+    >>> M.add_edge(0, 'b')
+    >>> M.in_matching(0, 'b'), M.in_matching(1, 'a')
+    (True, True)
+    """
+
+    def __init__(self, G, top_nodes=None, initial_matching=None):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for directed type')
+        if top_nodes is None:
+            top_nodes = bipartite_sets(G)[0]
+        top_nodes = set(top_nodes)
+        self._adj = {u: set(G[u]) for u in G}
+        self._top = {u: u in top_nodes for u in G}
+        for u, nbrs in self._adj.items():
+            if any(self._top[v] == self._top[u] for v in nbrs):
+                raise nx.NetworkXError('graph is not bipartite')
+        self._mate = hopcroft_karp_matching(G, initial_matching)
+        # The unmatched nodes of the bottom and top sides.
+        self._free = (set(), set())
+        for u in G:
+            if u not in self._mate:
+                self._free[self._top[u]].add(u)
+
+    def __len__(self):
+        return len(self._adj)
+
+    def __contains__(self, n):
+        return n in self._adj
+
+    def number_of_edges(self):
+        """Returns the number of edges of the matching."""
+        return len(self._mate) // 2
+
+    def matching(self):
+        """Returns the matching as a new dictionary, in the format of
+        :func:`hopcroft_karp_matching`."""
+        return dict(self._mate)
+
+    def in_matching(self, u, v):
+        """Returns True if ``(u, v)`` is an edge of the matching."""
+        return self._mate.get(u) == v
+
+    def add_node(self, n, top=True):
+        """Adds the isolated node `n` to the top side, or to the bottom
+        side if `top` is False. Nothing is done if `n` is present."""
+        if n not in self._adj:
+            self._adj[n] = set()
+            self._top[n] = top
+            self._free[top].add(n)
+
+    def remove_node(self, n):
+        """Removes the node `n` and its incident edges.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not a node.
+        """
+        try:
+            nbrs = self._adj.pop(n)
+        except KeyError:
+            raise nx.NetworkXError('node %r is not in the graph' % (n,))
+        for v in nbrs:
+            self._adj[v].discard(n)
+        mate = self._mate.get(n)
+        if mate is not None:
+            self._unmatch(n)
+        self._free[self._top.pop(n)].discard(n)
+        if mate is not None:
+            self._augment(mate)
+
+    def add_edge(self, u, v):
+        """Adds the edge ``(u, v)``, adding the nodes if needed.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` and `v` are on the same side.
+        """
+        if u in self._top:
+            self.add_node(v, not self._top[u])
+        else:
+            self.add_node(u, v not in self._top or not self._top[v])
+            self.add_node(v, not self._top[u])
+        if self._top[u] == self._top[v]:
+            raise nx.NetworkXError('edge %r joins two nodes of the same '
+                                   'side' % ((u, v),))
+        if v in self._adj[u]:
+            return
+        self._adj[u].add(v)
+        self._adj[v].add(u)
+        mate = self._mate
+        if u in mate and v not in mate:
+            u, v = v, u
+        if u in mate:
+            # Look for an alternating path that frees `u` without changing
+            # the size of the matching, then for an augmenting path from
+            # `u`, which must use the new edge. Undo the first path if the
+            # second does not exist.
+            path = self._alternating_path(mate[u])
+            if path is None:
+                return
+            self._unmatch(u)
+            self._flip(path)
+            if not self._augment(u):
+                y = path[0]
+                del mate[y]
+                self._free[self._top[y]].add(y)
+                self._flip(path[1:] + [u])
+        else:
+            self._augment(u)
+
+    def remove_edge(self, u, v):
+        """Removes the edge ``(u, v)``.
+
+        Raises
+        ------
+        NetworkXError
+            If ``(u, v)`` is not an edge.
+        """
+        try:
+            self._adj[u].remove(v)
+        except KeyError:
+            raise nx.NetworkXError('edge %r is not in the graph' % ((u, v),))
+        self._adj[v].remove(u)
+        if self.in_matching(u, v):
+            self._unmatch(u)
+            if not self._augment(u):
+                self._augment(v)
+
+    def _alternating_path(self, x):
+        """Returns an alternating path from `x` to an unmatched node on
+        the other side, whose first edge is not in the matching, as a list
+        ``[y_k, x_(k-1), ..., y_1, x]`` in which ``y_i`` is to be matched
+        with the following node. The matched edge at `x`, if any, is not
+        used. Returns None if there is no such path.
+
+        The forward search from `x` and the backward search from the
+        unmatched nodes of the other side expand one node in turn.
+        """
+        adj = self._adj
+        mate = self._mate
+        side = self._top[x]
+        free = self._free[not side]
+        if not free:
+            return None
+        # parent[y] is the node from which the forward search reached y.
+        parent = {x: None}
+        if x in mate:
+            parent[mate[x]] = None
+        queue = [x]
+        # target[t] is the neighbor y of the node t on the side of x, such
+        # that y is unmatched or the backward search reached t from y.
+        target = {}
+        seeds = iter(free)
+        stack = []
+        i = 0
+        while True:
+            if i == len(queue):
+                return None
+            z = queue[i]
+            i += 1
+            for y in adj[z]:
+                if y in parent:
+                    continue
+                parent[y] = z
+                if y not in mate:
+                    path = []
+                    while y is not None:
+                        path.append(y)
+                        y = parent[y]
+                    return path
+                w = mate[y]
+                if w not in parent:
+                    parent[w] = y
+                    if w in target:
+                        return self._join(parent, target, w)
+                    queue.append(w)
+            if not stack:
+                y = next(seeds, None)
+                if y is None:
+                    # The backward search is complete.
+                    if x in target:
+                        return self._join(parent, target, x)
+                    return None
+            else:
+                y = stack.pop()
+            for t in adj[y]:
+                if t in target or mate.get(t) == y:
+                    continue
+                target[t] = y
+                if t in parent:
+                    return self._join(parent, target, t)
+                if t in mate:
+                    stack.append(mate[t])
+
+    def _join(self, parent, target, t):
+        """Returns the path of :meth:`_alternating_path` that follows the
+        forward search to `t` and the backward search from `t`.
+
+        The two parts only share `t`: the searches stop as soon as one of
+        them reaches a node already reached by the other.
+        """
+        mate = self._mate
+        path = [t]
+        while True:
+            y = target[path[-1]]
+            path.append(y)
+            if y not in mate:
+                break
+            path.append(mate[y])
+        path.reverse()
+        t = parent[t]
+        while t is not None:
+            path.append(t)
+            t = parent[t]
+        return path
+
+    def _unmatch(self, y):
+        z = self._mate.pop(y)
+        del self._mate[z]
+        self._free[self._top[y]].add(y)
+        self._free[self._top[z]].add(z)
+
+    def _flip(self, path):
+        mate = self._mate
+        free = self._free
+        top = self._top
+        for i in range(0, len(path), 2):
+            y, z = path[i], path[i + 1]
+            mate[y] = z
+            mate[z] = y
+            free[top[y]].discard(y)
+            free[top[z]].discard(z)
+
+    def _augment(self, x):
+        """Augments the matching along a path from the unmatched node `x`,
+        if any, and returns True if it did."""
+        path = self._alternating_path(x)
+        if path is None:
+            return False
+        self._flip(path)
+        return True
 
 
 def _is_connected_by_alternating_path(G, v, matching, targets):
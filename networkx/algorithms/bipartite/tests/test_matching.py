@@ -8,13 +8,17 @@
 # information.
 """Unit tests for the :mod:`networkx.algorithms.bipartite.matching` module."""
 import itertools
+import random
 
 import networkx as nx
 
+from nose.tools import assert_equal
 from nose.tools import assert_true
+from nose.tools import raises
 
 from networkx.algorithms.bipartite.matching import eppstein_matching
 from networkx.algorithms.bipartite.matching import hopcroft_karp_matching
+from networkx.algorithms.bipartite.matching import IncrementalMatching
 from networkx.algorithms.bipartite.matching import maximum_matching
 from networkx.algorithms.bipartite.matching import to_vertex_cover
 
@@ -96,3 +100,125 @@ def test_eppstein_matching():
     matching = eppstein_matching(G)
     assert_true(len(matching)==len(maximum_matching(G)))
     assert all(x in set(matching.keys()) for x in set(matching.values()))
+
+
+def test_hopcroft_karp_initial_matching():
+    G = nx.complete_bipartite_graph(3, 3)
+    G.remove_edge(0, 3)
+    # Invalid and conflicting pairs are ignored.
+    initial = {0: 3, 3: 0, 1: 4, 4: 1, 2: 4}
+    matching = hopcroft_karp_matching(G, initial)
+    assert_equal(len(matching), 6)
+    assert_true(all(matching[matching[u]] == u for u in matching))
+    assert_true(all(G.has_edge(u, v) for u, v in matching.items()))
+    # A maximum initial matching is kept.
+    initial = {0: 4, 4: 0, 1: 5, 5: 1, 2: 3, 3: 2}
+    assert_equal(hopcroft_karp_matching(G, initial), initial)
+
+
+def test_long_augmenting_paths():
+    # Greedily matching each left node with its first right node leaves a
+    # single augmenting path through the whole graph.
+    n = 5000
+    G = nx.Graph()
+    for i in range(n):
+        G.add_edge(('l', i), ('r', i))
+        G.add_edge(('l', i), ('r', i + 1))
+    G.add_edge(('l', n), ('r', n))
+    for f in (hopcroft_karp_matching, eppstein_matching):
+        matching = f(G)
+        assert_equal(len(matching), 2 * (n + 1))
+
+
+class TestIncrementalMatching(object):
+
+    def check(self, M, H):
+        matching = M.matching()
+        assert_equal(len(matching), len(hopcroft_karp_matching(H)))
+        assert_equal(M.number_of_edges(), len(matching) // 2)
+        for u, v in matching.items():
+            assert_equal(matching[v], u)
+            assert_true(H.has_edge(u, v))
+            assert_true(M.in_matching(u, v))
+        assert_equal(len(M), len(H))
+
+    def test_random_updates(self):
+        rng = random.Random(42)
+        n = 25
+        G = nx.bipartite.random_graph(n, n, 0.08, seed=42)
+        M = IncrementalMatching(G, top_nodes=range(n))
+        H = G.copy()
+        self.check(M, H)
+        for step in range(400):
+            op = rng.random()
+            if op < 0.45:
+                u, v = rng.randrange(n + 2), rng.randrange(n, 2 * n + 2)
+                if u >= n:
+                    u += 2 * n
+                M.add_edge(u, v)
+                H.add_edge(u, v)
+            elif op < 0.9 and H.size():
+                u, v = rng.choice(list(H.edges()))
+                M.remove_edge(u, v)
+                H.remove_edge(u, v)
+            elif len(H) > 2:
+                u = rng.choice(list(H))
+                M.remove_node(u)
+                H.remove_node(u)
+            self.check(M, H)
+
+    def test_insertion_between_matched_nodes(self):
+        # With 0 - a and 1 - b matched, the new edge (1, a) completes the
+        # augmenting path 2 - b - 1 - a - 0 - c.
+        G = nx.Graph([(0, 'a'), (1, 'b'), (2, 'b'), (0, 'c')])
+        M = IncrementalMatching(G, top_nodes=[0, 1, 2],
+                                initial_matching={0: 'a', 'a': 0,
+                                                  1: 'b', 'b': 1})
+        assert_equal(M.number_of_edges(), 2)
+        M.add_edge(1, 'a')
+        assert_equal(M.number_of_edges(), 3)
+        assert_equal(M.matching(), {0: 'c', 'c': 0, 1: 'a', 'a': 1,
+                                    2: 'b', 'b': 2})
+
+    def test_insertion_without_augmentation(self):
+        G = nx.Graph([(0, 'a'), (1, 'b'), (2, 'b')])
+        M = IncrementalMatching(G, top_nodes=[0, 1, 2],
+                                initial_matching={0: 'a', 'a': 0,
+                                                  1: 'b', 'b': 1})
+        M.add_edge(0, 'b')
+        assert_equal(M.matching(), {0: 'a', 'a': 0, 1: 'b', 'b': 1})
+
+    def test_new_nodes(self):
+        M = IncrementalMatching(nx.Graph())
+        M.add_edge(0, 'a')
+        M.add_edge('b', 0)
+        M.add_node(1)
+        M.add_node('c', top=False)
+        M.add_edge(1, 'c')
+        assert_equal(M.number_of_edges(), 2)
+        assert_true('b' in M)
+        M.remove_node(0)
+        assert_equal(M.number_of_edges(), 1)
+        assert_equal(len(M), 4)
+
+    @raises(nx.NetworkXError)
+    def test_same_side(self):
+        M = IncrementalMatching(nx.Graph([(0, 'a')]), top_nodes=[0])
+        M.add_edge(0, 1)
+        M.add_edge(1, 'a')
+
+    @raises(nx.NetworkXError)
+    def test_not_bipartite(self):
+        IncrementalMatching(nx.cycle_graph(3))
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_edge(self):
+        IncrementalMatching(nx.path_graph(3)).remove_edge(0, 2)
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_node(self):
+        IncrementalMatching(nx.path_graph(3)).remove_node(5)
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed(self):
+        IncrementalMatching(nx.DiGraph([(0, 1)]))
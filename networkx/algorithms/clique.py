@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 #    Copyright (C) 2004-2016 by
 #    Aric Hagberg <hagberg@lanl.gov>
 #    Dan Schult <dschult@colgate.edu>
@@ -22,9 +23,11 @@ try:
 except ImportError:
     pass
 import networkx
+from networkx.algorithms.core import _core_order
 from networkx.utils import not_implemented_for
 __author__ = """Dan Schult (dschult@colgate.edu)"""
-__all__ = ['find_cliques', 'find_cliques_recursive', 'make_max_clique_graph',
+__all__ = ['find_cliques', 'find_cliques_recursive',
+           'find_cliques_degeneracy', 'make_max_clique_graph',
            'make_clique_bipartite' ,'graph_clique_number',
            'graph_number_of_cliques', 'node_clique_number',
            'number_of_cliques', 'cliques_containing_node',
@@ -207,6 +210,179 @@ def find_cliques(G):
         pass
 
 
+def _degeneracy_adjacency(G):
+    """Returns the nodes of `G` in degeneracy order and the adjacency sets
+    of their integer indices, without self-loops or parallel edges.
+
+    The order is obtained by repeatedly removing a node of minimum
+    remaining degree, as in :func:`core_number`, so that no node has
+    more neighbors later in the order than the degeneracy of the graph.
+    """
+    H = G
+    if G.is_multigraph() or G.number_of_selfloops() > 0:
+        H = networkx.Graph(G)
+        H.remove_edges_from(list(H.selfloop_edges()))
+    nodes = _core_order(H)[0]
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = [{index[u] for u in H[v]} for v in nodes]
+    return nodes, adj
+
+
+def _vertex_cliques(adj, v, min_size):
+    """Yields the maximal cliques (lists of indices) with at least
+    `min_size` nodes whose earliest node in degeneracy order is `v`.
+
+    This is the iterative Bron--Kerbosch search with Tomita pivoting of
+    :func:`find_cliques` restricted to the subproblem with candidate set
+    the later neighbors of `v` and excluded set its earlier neighbors.
+    """
+    subg = adj[v]
+    if not subg:
+        if min_size <= 1:
+            yield [v]
+        return
+    cand = {u for u in subg if u > v}
+    if not cand or len(cand) + 1 < min_size:
+        return
+    Q = [v, None]
+    u = max(subg, key=lambda u: len(cand & adj[u]))
+    ext_u = cand - adj[u]
+    stack = []
+
+    try:
+        while True:
+            if ext_u:
+                q = ext_u.pop()
+                cand.remove(q)
+                Q[-1] = q
+                adj_q = adj[q]
+                subg_q = subg & adj_q
+                if not subg_q:
+                    if len(Q) >= min_size:
+                        yield Q[:]
+                else:
+                    cand_q = cand & adj_q
+                    if cand_q and len(Q) + len(cand_q) >= min_size:
+                        stack.append((subg, cand, ext_u))
+                        Q.append(None)
+                        subg = subg_q
+                        cand = cand_q
+                        u = max(subg, key=lambda u: len(cand & adj[u]))
+                        ext_u = cand - adj[u]
+            else:
+                Q.pop()
+                subg, cand, ext_u = stack.pop()
+    except IndexError:
+        pass
+
+
+# Adjacency and minimum clique size shared with the worker processes.
+_worker_adj = None
+_worker_min_size = None
+
+
+def _init_clique_worker(adj, min_size):
+    global _worker_adj, _worker_min_size
+    _worker_adj = adj
+    _worker_min_size = min_size
+
+
+def _clique_worker(v):
+    return list(_vertex_cliques(_worker_adj, v, _worker_min_size))
+
+
+@not_implemented_for('directed')
+def find_cliques_degeneracy(G, min_size=1, n_jobs=None, chunksize=16):
+    """Returns all maximal cliques in an undirected graph using a
+    degeneracy ordering of the nodes.
+
+    This function returns an iterator over the same cliques as
+    :func:`find_cliques`, but it splits the search into one independent
+    subproblem per node as proposed by Eppstein, Löffler and Strash
+    [1]_.  The nodes are put in a degeneracy order, by repeatedly
+    removing a node of minimum remaining degree, and the
+    subproblem of a node `v` enumerates, with the pivoting Bron--Kerbosch
+    search of :func:`find_cliques`, the maximal cliques whose first
+    node in that order is `v`.  The candidates of the subproblem are the
+    neighbors of `v` later in the order, of which there are at most the
+    degeneracy of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected graph.
+
+    min_size : int, optional (default=1)
+        Only report maximal cliques with at least `min_size` nodes.
+        Search branches that cannot reach this size are pruned.
+
+    n_jobs : int, optional (default=None)
+        Number of processes used to solve the subproblems.  If None or
+        1 the subproblems are solved lazily in the current process.
+
+    chunksize : int, optional (default=16)
+        Number of subproblems sent at once to a worker process.
+
+    Returns
+    -------
+    iterator
+        An iterator over maximal cliques, each of which is a list of
+        nodes in `G`.  With several processes the cliques are yielded
+        as soon as their subproblem has been solved, so their order is
+        arbitrary.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.barbell_graph(4, 0)
+    >>> sorted(map(sorted, nx.find_cliques_degeneracy(G, min_size=3)))
+    [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    See Also
+    --------
+    find_cliques
+
+    Notes
+    -----
+    The graph is copied into an integer indexed adjacency structure
+    that is sent once to each worker process.  The cliques of a
+    subproblem are returned together, so the memory used by a worker
+    is proportional to the number of cliques of its largest subproblem.
+
+    This algorithm ignores self-loops and parallel edges, since cliques
+    are not conventionally defined with such edges.
+
+    References
+    ----------
+    .. [1] D. Eppstein, M. Löffler and D. Strash,
+       "Listing all maximal cliques in sparse graphs in near-optimal time",
+       *Algorithms and Computation (ISAAC 2010)*, LNCS 6506, 403--414.
+       <http://dx.doi.org/10.1007/978-3-642-17517-6_36>
+    """
+    if len(G) == 0:
+        return
+
+    nodes, adj = _degeneracy_adjacency(G)
+    if n_jobs is None or n_jobs <= 1:
+        for v in range(len(nodes)):
+            for clique in _vertex_cliques(adj, v, min_size):
+                yield [nodes[u] for u in clique]
+        return
+
+    from multiprocessing import Pool
+    pool = Pool(n_jobs, _init_clique_worker, (adj, min_size))
+    try:
+        results = pool.imap_unordered(_clique_worker, range(len(nodes)),
+                                      chunksize)
+        for cliques in results:
+            for clique in cliques:
+                yield [nodes[u] for u in clique]
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 # TODO Should this also be not implemented for directed graphs?
 def find_cliques_recursive(G):
     """Returns all maximal cliques in a graph.
@@ -393,7 +569,7 @@ def make_clique_bipartite(G,fpos=None,create_using=None,name=None):
     return B
 
 
-def graph_clique_number(G, cliques=None):
+def graph_clique_number(G, cliques=None, n_jobs=None):
     """Returns the clique number of the graph.
 
     The *clique number* of a graph is the size of the largest clique in
@@ -409,6 +585,11 @@ def graph_clique_number(G, cliques=None):
         not specified, the list of all cliques will be computed, as by
         :func:`find_cliques`.
 
+    n_jobs : int, optional (default=None)
+        If `cliques` is not specified and `n_jobs` is larger than one,
+        the cliques are computed in parallel by
+        :func:`find_cliques_degeneracy` with `n_jobs` processes.
+
     Returns
     -------
     int
@@ -422,7 +603,10 @@ def graph_clique_number(G, cliques=None):
 
     """
     if cliques is None:
-        cliques=find_cliques(G)
+        if n_jobs is not None and n_jobs > 1:
+            cliques = find_cliques_degeneracy(G, n_jobs=n_jobs)
+        else:
+            cliques = find_cliques(G)
     return   max( [len(c) for c in cliques] )
 
 
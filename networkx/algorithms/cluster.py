@@ -25,7 +25,7 @@ __all__= ['triangles', 'average_clustering', 'clustering', 'transitivity',
 
 
 @not_implemented_for('directed')
-def triangles(G, nodes=None):
+def triangles(G, nodes=None, n_jobs=None):
     """Compute the number of triangles.
 
     Finds the number of triangles that include a node as one vertex.
@@ -36,6 +36,9 @@ def triangles(G, nodes=None):
        A networkx graph
     nodes : container of nodes, optional (default= all nodes in G)
        Compute triangles for nodes in this container. 
+    n_jobs : int, optional (default=None)
+       Number of processes used to count the triangles of the entire
+       graph. If None or 1 the computation runs in the current process.
 
     Returns
     -------
@@ -54,9 +57,15 @@ def triangles(G, nodes=None):
 
     Notes
     -----
-    When computing triangles for the entire graph each triangle is counted 
-    three times, once at each node.  Self loops are ignored.
+    When computing triangles for the entire graph each triangle is
+    found once by the degree-ordered "forward" algorithm [1]_ and
+    credited to each of its three nodes.  Self loops are ignored.
 
+    References
+    ----------
+    .. [1] T. Schank and D. Wagner, Finding, counting and listing all
+       triangles in large graphs, an experimental study.
+       Experimental and Efficient Algorithms, LNCS 3503, 606-609 (2005).
     """
     # If `nodes` represents a single node in the graph, return only its number
     # of triangles.
@@ -64,17 +73,106 @@ def triangles(G, nodes=None):
         return next(_triangles_and_degree_iter(G,nodes))[2] // 2
     # Otherwise, `nodes` represents an iterable of nodes, so return a
     # dictionary mapping node to number of triangles.
-    return {v: t // 2 for v, d, t in _triangles_and_degree_iter(G, nodes)}
+    return {v: t // 2 for v, d, t
+            in _triangles_and_degree_iter(G, nodes, n_jobs)}
+
+
+def _forward_out_neighbors(G):
+    """Return the nodes of `G` and the integer-indexed forward adjacency.
+
+    Nodes are ranked by increasing degree (ties broken by position) and
+    ``out[i]`` is the set of indices of the neighbors of node ``i``
+    with a higher rank.  Every out-set has size at most the square root
+    of twice the number of edges.  Self loops are dropped.
+    """
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    degree = [len(G[v]) - (v in G[v]) for v in nodes]
+    rank = [0] * len(nodes)
+    for r, i in enumerate(sorted(range(len(nodes)), key=degree.__getitem__)):
+        rank[i] = r
+    out = []
+    for i, v in enumerate(nodes):
+        ri = rank[i]
+        out.append({j for j in map(index.__getitem__, G[v]) if rank[j] > ri})
+    return nodes, degree, out
+
+
+def _forward_triangle_counts(out, chunk):
+    """Return the per-node triangle counts of the triangles whose lowest
+    ranked node is in `chunk`.
+
+    Each triangle ``u < v < w`` (by rank) is found exactly once, from
+    its lowest node ``u`` as the intersection of the out-sets of ``u``
+    and ``v``.
+    """
+    counts = [0] * len(out)
+    for u in chunk:
+        out_u = out[u]
+        for v in out_u:
+            common = out_u & out[v]
+            if common:
+                k = len(common)
+                counts[u] += k
+                counts[v] += k
+                for w in common:
+                    counts[w] += 1
+    return counts
+
+
+# Forward adjacency shared with the worker processes of a pool.
+_forward_out = None
+
+
+def _init_forward_worker(out):
+    global _forward_out
+    _forward_out = out
+
+
+def _forward_worker(chunk):
+    return _forward_triangle_counts(_forward_out, chunk)
+
+
+def _forward_triangles(G, n_jobs=None):
+    """Return the nodes, degrees and triangle counts of an undirected graph.
+
+    The node ranges are split in chunks that are processed by a pool of
+    `n_jobs` worker processes if `n_jobs` is larger than one.
+    """
+    nodes, degree, out = _forward_out_neighbors(G)
+    n = len(nodes)
+    if n_jobs is None or n_jobs <= 1 or n < 2:
+        return nodes, degree, _forward_triangle_counts(out, range(n))
+    from multiprocessing import Pool
+    # Interleave the chunks so that high degree nodes, which have the
+    # largest out-sets, are spread over all the workers.
+    nchunks = 4 * n_jobs
+    chunks = [range(i, n, nchunks) for i in range(min(nchunks, n))]
+    pool = Pool(n_jobs, _init_forward_worker, (out,))
+    try:
+        counts = [0] * n
+        for partial in pool.imap_unordered(_forward_worker, chunks):
+            counts = [a + b for a, b in zip(counts, partial)]
+    finally:
+        pool.close()
+        pool.join()
+    return nodes, degree, counts
 
 
 @not_implemented_for('multigraph')
-def _triangles_and_degree_iter(G, nodes=None):
+def _triangles_and_degree_iter(G, nodes=None, n_jobs=None):
     """ Return an iterator of (node, degree, triangles).  
 
     This double counts triangles so you may want to divide by 2.
     See degree() and triangles() for definitions and details.
 
     """
+    if nodes is None and not G.is_directed():
+        nodes, degree, counts = _forward_triangles(G, n_jobs)
+        for v, d, t in zip(nodes, degree, counts):
+            yield (v, d, 2 * t)
+        return
+
     if nodes is None:
         nodes_nbrs = G.adj.items()
     else:
@@ -121,7 +219,8 @@ def _weighted_triangles_and_degree_iter(G, nodes=None, weight='weight'):
         yield (i, len(inbrs), 2 * weighted_triangles)
 
 
-def average_clustering(G, nodes=None, weight=None, count_zeros=True):
+def average_clustering(G, nodes=None, weight=None, count_zeros=True,
+                       n_jobs=None):
     r"""Compute the average clustering coefficient for the graph G.
 
     The clustering coefficient for the graph is the average, 
@@ -146,6 +245,10 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
     count_zeros : bool
        If False include only the nodes with nonzero clustering in the average.
 
+    n_jobs : int, optional (default=None)
+       Number of processes used to count the triangles of the entire
+       unweighted graph, see :func:`triangles`.
+
     Returns
     -------
     avg : float
@@ -174,14 +277,14 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
        nodes and leafs on clustering measures for small-world networks.
        http://arxiv.org/abs/0802.2512
     """
-    c = clustering(G, nodes, weight=weight).values()
+    c = clustering(G, nodes, weight=weight, n_jobs=n_jobs).values()
     if not count_zeros:
         c = [v for v in c if v > 0]
     return sum(c) / len(c)
 
 
 @not_implemented_for('directed')
-def clustering(G, nodes=None, weight=None):
+def clustering(G, nodes=None, weight=None, n_jobs=None):
     r"""Compute the clustering coefficient for nodes.
 
     For unweighted graphs, the clustering of a node `u`
@@ -218,6 +321,10 @@ def clustering(G, nodes=None, weight=None):
        The edge attribute that holds the numerical value used as a weight.
        If None, then each edge has weight 1.
 
+    n_jobs : int, optional (default=None)
+       Number of processes used to count the triangles of the entire
+       unweighted graph, see :func:`triangles`.
+
     Returns
     -------
     out : float, or dictionary
@@ -245,7 +352,7 @@ def clustering(G, nodes=None, weight=None):
     if weight is not None:
         td_iter = _weighted_triangles_and_degree_iter(G, nodes, weight)
     else:
-        td_iter = _triangles_and_degree_iter(G, nodes)
+        td_iter = _triangles_and_degree_iter(G, nodes, n_jobs)
     clusterc = {v: 0 if t == 0 else t / (d * (d - 1)) for v, d, t in td_iter}
     if nodes in G: 
         # Return the value of the sole entry in the dictionary.
@@ -253,7 +360,7 @@ def clustering(G, nodes=None, weight=None):
     return clusterc
 
 
-def transitivity(G):
+def transitivity(G, n_jobs=None):
     r"""Compute graph transitivity, the fraction of all possible triangles 
     present in G.
 
@@ -270,6 +377,10 @@ def transitivity(G):
     ----------
     G : graph
 
+    n_jobs : int, optional (default=None)
+       Number of processes used to count the triangles, see
+       :func:`triangles`.
+
     Returns
     -------
     out : float
@@ -281,8 +392,10 @@ def transitivity(G):
     >>> print(nx.transitivity(G))
     1.0
     """
-    triangles = sum(t for v, d, t in _triangles_and_degree_iter(G))
-    contri = sum(d * (d - 1) for v, d, t in _triangles_and_degree_iter(G))
+    triangles = contri = 0
+    for v, d, t in _triangles_and_degree_iter(G, n_jobs=n_jobs):
+        triangles += t
+        contri += d * (d - 1)
     return 0 if triangles == 0 else triangles / contri
 
 def square_clustering(G, nodes=None):
@@ -5,12 +5,15 @@
 #    All rights reserved.
 #    BSD license.
 from collections import defaultdict
+from itertools import combinations
+
 import networkx as nx
+from networkx.utils import UnionFind
 __author__ = """\n""".join(['Conrad Lee <conradlee@gmail.com>',
                             'Aric Hagberg <aric.hagberg@gmail.com>'])
 __all__ = ['k_clique_communities']
 
-def k_clique_communities(G, k, cliques=None):
+def k_clique_communities(G, k, cliques=None, n_jobs=None):
     """Find k-clique communities in graph using the percolation method.
 
     A k-clique community is the union of all cliques of size k that
@@ -26,6 +29,11 @@ def k_clique_communities(G, k, cliques=None):
     cliques: list or generator       
        Precomputed cliques (use networkx.find_cliques(G))
 
+    n_jobs : int, optional (default=None)
+       If `cliques` is not given, the maximal cliques with at least `k`
+       nodes are computed by :func:`find_cliques_degeneracy` with
+       `n_jobs` processes.
+
     Returns
     -------
     Yields sets of nodes, one for each k-clique community.
@@ -41,6 +49,18 @@ def k_clique_communities(G, k, cliques=None):
     >>> list(nx.k_clique_communities(G, 6))
     []
 
+    Notes
+    -----
+    The cliques are consumed as a stream and merged with a union-find
+    structure; neither the list of cliques nor the clique graph is
+    built.  For ``k <= 3`` two cliques percolate exactly when they share
+    a node (``k = 2``) or an edge (``k = 3``), so each clique is merged
+    through an index of its (k-1)-subsets and the memory used is
+    proportional to the size of the graph.  For larger `k` the number of
+    shared nodes with earlier cliques is counted through a node to
+    clique index, which uses memory proportional to the total size of
+    the cliques with at least `k` nodes.
+
     References
     ----------
     .. [1] Gergely Palla, Imre Derényi, Illés Farkas1, and Tamás Vicsek,
@@ -51,32 +71,78 @@ def k_clique_communities(G, k, cliques=None):
     if k < 2:
         raise nx.NetworkXError("k=%d, k must be greater than 1."%k)
     if cliques is None:
-        cliques = nx.find_cliques(G)
-    cliques = [frozenset(c) for c in cliques if len(c) >= k]
-
-    # First index which nodes are in which cliques
-    membership_dict = defaultdict(list)
-    for clique in cliques:
-        for node in clique:
-            membership_dict[node].append(clique)
-
-    # For each clique, see which adjacent cliques percolate
-    perc_graph = nx.Graph()
-    perc_graph.add_nodes_from(cliques)
-    for clique in cliques:
-        for adj_clique in _get_adjacent_cliques(clique, membership_dict):
-            if len(clique.intersection(adj_clique)) >= (k - 1):
-                perc_graph.add_edge(clique, adj_clique)
-
-    # Connected components of clique graph with perc edges
-    # are the percolated cliques
-    for component in nx.connected_components(perc_graph):
-        yield(frozenset.union(*component))
-
-def _get_adjacent_cliques(clique, membership_dict):
-    adjacent_cliques = set()
-    for n in clique:
-        for adj_clique in membership_dict[n]:
-            if clique != adj_clique:
-                adjacent_cliques.add(adj_clique)
-    return adjacent_cliques
+        cliques = nx.find_cliques_degeneracy(G, min_size=k, n_jobs=n_jobs)
+    cliques = (c for c in cliques if len(c) >= k)
+
+    if k <= 3:
+        communities = _percolate_subsets(cliques, k)
+    else:
+        communities = _percolate_shared_counts(cliques, k)
+    for community in communities:
+        yield frozenset(community)
+
+
+def _percolate_subsets(cliques, k):
+    """Returns the clique percolation communities, merging cliques that
+    contain a common (k-1)-subset.
+
+    Only the first clique seen with a given (k-1)-subset is recorded in
+    the index. For every node only one clique per community is kept.
+    """
+    uf = UnionFind()
+    index = {}
+    representatives = {}
+    for i, clique in enumerate(cliques):
+        uf[i]
+        if k == 2:
+            subsets = clique
+        else:
+            subsets = (frozenset(e) for e in combinations(clique, k - 1))
+        for subset in subsets:
+            j = index.setdefault(subset, i)
+            if j != i:
+                uf.union(i, j)
+        root = uf[i]
+        for v in clique:
+            reps = representatives.get(v)
+            if reps is None:
+                representatives[v] = [i]
+            else:
+                roots = set(uf[j] for j in reps)
+                if root not in roots:
+                    roots.add(i)
+                    representatives[v] = list(roots)
+    return _group_members(uf, representatives)
+
+
+def _percolate_shared_counts(cliques, k):
+    """Returns the clique percolation communities, merging cliques that
+    share at least k-1 nodes.
+
+    The number of nodes shared with every earlier clique is counted with
+    an index from nodes to the cliques containing them.
+    """
+    uf = UnionFind()
+    node_cliques = defaultdict(list)
+    for i, clique in enumerate(cliques):
+        uf[i]
+        shared = defaultdict(int)
+        for v in clique:
+            for j in node_cliques[v]:
+                shared[j] += 1
+        for j, count in shared.items():
+            if count >= k - 1:
+                uf.union(i, j)
+        for v in clique:
+            node_cliques[v].append(i)
+    return _group_members(uf, node_cliques)
+
+
+def _group_members(uf, node_cliques):
+    """Returns the sets of nodes of the cliques in each union-find block.
+    """
+    communities = defaultdict(set)
+    for v, ids in node_cliques.items():
+        for j in ids:
+            communities[uf[j]].add(v)
+    return communities.values()
@@ -44,3 +44,32 @@ def test_zachary():
 @raises(nx.NetworkXError)
 def test_bad_k():
     c = list(k_clique_communities(nx.Graph(),1))
+
+def test_parallel():
+    z = nx.karate_club_graph()
+    for k in (2, 3, 4):
+        expected = set(k_clique_communities(z, k, nx.find_cliques(z)))
+        assert_equal(set(k_clique_communities(z, k, n_jobs=2)), expected)
+
+def _reference_communities(G, k):
+    cliques = [frozenset(c) for c in nx.find_cliques(G) if len(c) >= k]
+    perc_graph = nx.Graph()
+    perc_graph.add_nodes_from(cliques)
+    perc_graph.add_edges_from((c, d) for c, d in combinations(cliques, 2)
+                              if len(c & d) >= k - 1)
+    return set(frozenset.union(*component) for component
+               in nx.connected_components(perc_graph))
+
+def test_random_graphs():
+    for seed in range(3):
+        G = nx.gnp_random_graph(40, 0.3, seed=seed)
+        for k in (2, 3, 4, 5):
+            assert_equal(set(k_clique_communities(G, k)),
+                         _reference_communities(G, k))
+
+def test_clique_generator():
+    G = nx.karate_club_graph()
+    for k in (3, 4):
+        cliques = nx.find_cliques(G)
+        assert_equal(set(k_clique_communities(G, k, cliques)),
+                     _reference_communities(G, k))
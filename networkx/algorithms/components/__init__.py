@@ -4,3 +4,4 @@ from .weakly_connected import *
 from .attracting import *
 from .biconnected import *
 from .semiconnected import *
+from .strongly_connected_csr import *
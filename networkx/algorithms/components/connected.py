@@ -10,6 +10,8 @@
 #          Aric Hagberg (hagberg@lanl.gov)
 #          Christopher Ellison
 """Connected components."""
+from itertools import count
+
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
 from ...utils import arbitrary_element
@@ -20,6 +22,7 @@ __all__ = [
     'connected_component_subgraphs',
     'is_connected',
     'node_connected_component',
+    'DynamicConnectedComponents',
 ]
 
 
@@ -243,3 +246,275 @@ def _plain_bfs(G, source):
                 yield v
                 seen.add(v)
                 nextlevel.update(G[v])
+
+
+class DynamicConnectedComponents(object):
+    """Connected components of an undirected graph maintained under edge
+    insertions and deletions.
+
+    Every node is mapped to a label of a union-find structure over
+    integer labels whose blocks are the connected components, so that
+    edge insertions, component membership queries and component sizes
+    take near-constant time.  A spanning forest of the graph is
+    maintained alongside.  Deleting an edge outside the forest never
+    changes the components.  Deleting a forest edge splits its tree in
+    two; the smaller tree is found by searching both trees in lockstep,
+    and its nodes are scanned for a replacement edge reconnecting the
+    two trees.  If there is none the nodes of the smaller tree are moved
+    to a new label.  Labels no longer used by any node are freed and
+    reused, so memory stays proportional to the size of the graph over
+    any sequence of updates.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.  The graph is modified in place by the
+       update methods of this object.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> cc = nx.DynamicConnectedComponents(G)
+    >>> cc.remove_edge(1, 2)
+    >>> cc.same_component(0, 3)
+    False
+    >>> cc.component_size(0), cc.number_of_components
+    (2, 2)
+    >>> cc.add_edge(3, 0)
+    >>> cc.same_component(1, 2)
+    True
+
+    Notes
+    -----
+    Changes made to `G` directly instead of through this object are not
+    seen and leave the components out of date.
+
+    Deleting a forest edge costs time proportional to the number of
+    edges incident to the smaller of the two trees, which is small for
+    the typical deletion that cuts off a little piece of a component.
+    All other operations take near-constant amortized time.
+
+    See Also
+    --------
+    connected_components
+    """
+
+    def __init__(self, G):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'directed type')
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'multigraph type')
+        self.G = G
+        # union-find over labels: parent label, component size of each
+        # root label, and number of nodes and labels pointing to a label
+        self._parent = {}
+        self._size = {}
+        self._refs = {}
+        self._free = []
+        self._labels = count()
+        # label of each node; several nodes share a label after their
+        # component was split off
+        self._element = {}
+        self._forest = {}
+        self.number_of_components = 0
+        for v in G:
+            self._new_node(v)
+        for u, v in G.edges():
+            self._link(u, v)
+
+    def _new_label(self, size):
+        """Return an unused root label of a component of `size` nodes."""
+        label = self._free.pop() if self._free else next(self._labels)
+        self._parent[label] = label
+        self._size[label] = size
+        self._refs[label] = 0
+        return label
+
+    def _release(self, label):
+        """Drop a reference to `label`, freeing the labels no longer
+        referenced.
+        """
+        parent, refs = self._parent, self._refs
+        while True:
+            refs[label] -= 1
+            if refs[label] > 0:
+                return
+            up = parent.pop(label)
+            del refs[label]
+            self._size.pop(label, None)
+            self._free.append(label)
+            if up == label:
+                return
+            label = up
+
+    def _assign(self, n, label):
+        """Point the node `n` to `label`."""
+        self._refs[label] += 1
+        old = self._element.get(n)
+        self._element[n] = label
+        if old is not None:
+            self._release(old)
+
+    def _new_node(self, n):
+        self._assign(n, self._new_label(1))
+        self._forest[n] = set()
+        self.number_of_components += 1
+
+    def _find(self, n):
+        parent = self._parent
+        label = self._element[n]
+        path = []
+        root = parent[label]
+        while root != label:
+            path.append(label)
+            label = root
+            root = parent[label]
+        # compress the path from the top, so that the labels it frees
+        # are not visited again
+        for label in reversed(path[:-1]):
+            self._refs[root] += 1
+            up = parent[label]
+            parent[label] = root
+            self._release(up)
+        if path:
+            self._assign(n, root)
+        return root
+
+    def _link(self, u, v):
+        """Join the components of `u` and `v` if they are different."""
+        ru = self._find(u)
+        rv = self._find(v)
+        if ru != rv:
+            size = self._size
+            if size[ru] < size[rv]:
+                ru, rv = rv, ru
+            self._parent[rv] = ru
+            self._refs[ru] += 1
+            size[ru] += size.pop(rv)
+            self._forest[u].add(v)
+            self._forest[v].add(u)
+            self.number_of_components -= 1
+
+    def _smaller_tree(self, u, v):
+        """Return the node set of the smaller of the forest trees
+        containing `u` and `v`, which must be different trees.
+        """
+        forest = self._forest
+        searches = []
+        for source in (u, v):
+            seen = {source}
+            searches.append((seen, [source]))
+        while True:
+            for seen, stack in searches:
+                if not stack:
+                    return seen
+                x = stack.pop()
+                for y in forest[x]:
+                    if y not in seen:
+                        seen.add(y)
+                        stack.append(y)
+
+    def add_node(self, n):
+        """Add the node `n` to the graph as a new component."""
+        if n not in self._element:
+            self.G.add_node(n)
+            self._new_node(n)
+
+    def remove_node(self, n):
+        """Remove the node `n` and its edges from the graph."""
+        for v in list(self.G.adj[n]):
+            self.remove_edge(n, v)
+        self.G.remove_node(n)
+        # n is now alone in its component
+        self._size[self._find(n)] -= 1
+        self._release(self._element.pop(n))
+        del self._forest[n]
+        self.number_of_components -= 1
+
+    def add_edge(self, u, v, **attr):
+        """Add the edge `(u, v)` to the graph.
+
+        Missing nodes are added.  Edge attributes can be given as keyword
+        arguments, as in :meth:`Graph.add_edge`.
+        """
+        self.add_node(u)
+        self.add_node(v)
+        self.G.add_edge(u, v, **attr)
+        self._link(u, v)
+
+    def add_edges_from(self, ebunch, **attr):
+        """Add all the edges in `ebunch`, see :meth:`add_edge`."""
+        for e in ebunch:
+            d = dict(attr)
+            if len(e) == 3:
+                d.update(e[2])
+            self.add_edge(e[0], e[1], **d)
+
+    def remove_edge(self, u, v):
+        """Remove the edge `(u, v)` from the graph.
+
+        Raises
+        ------
+        NetworkXError
+            If the edge is not in the graph.
+        """
+        self.G.remove_edge(u, v)
+        forest = self._forest
+        if v not in forest[u]:
+            return
+        forest[u].remove(v)
+        forest[v].remove(u)
+        tree = self._smaller_tree(u, v)
+        adj = self.G.adj
+        for x in tree:
+            for y in adj[x]:
+                if y not in tree:
+                    # replacement edge into the other tree
+                    forest[x].add(y)
+                    forest[y].add(x)
+                    return
+        # the component splits: move the smaller tree to a new label
+        self._size[self._find(u)] -= len(tree)
+        label = self._new_label(len(tree))
+        for x in tree:
+            self._assign(x, label)
+        self.number_of_components += 1
+
+    def remove_edges_from(self, ebunch):
+        """Remove all the edges in `ebunch`, see :meth:`remove_edge`.
+
+        Edges not in the graph are silently ignored.
+        """
+        adj = self.G.adj
+        for e in ebunch:
+            u, v = e[0], e[1]
+            if u in adj and v in adj[u]:
+                self.remove_edge(u, v)
+
+    def same_component(self, u, v):
+        """Return True if `u` and `v` are in the same component."""
+        return self._find(u) == self._find(v)
+
+    def component_size(self, n):
+        """Return the number of nodes in the component of `n`."""
+        return self._size[self._find(n)]
+
+    def component(self, n):
+        """Return the set of nodes in the component of `n`."""
+        return set(_plain_bfs(self._forest, n))
+
+    def components(self):
+        """Generate the connected components as sets of nodes."""
+        seen = set()
+        for v in self._forest:
+            if v not in seen:
+                c = set(_plain_bfs(self._forest, v))
+                yield c
+                seen.update(c)
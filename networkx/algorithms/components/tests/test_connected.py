@@ -94,3 +94,75 @@ class TestConnected:
         assert_raises(NetworkXNotImplemented, nx.node_connected_component, self.DG,1)
         assert_raises(NetworkXNotImplemented, nx.is_connected, self.DG)
         assert_raises(nx.NetworkXPointlessConcept, nx.is_connected, nx.Graph())
+
+
+class TestDynamicConnectedComponents:
+
+    def check(self, G, cc):
+        components = list(nx.connected_components(G))
+        assert_equal(cc.number_of_components, len(components))
+        assert_equal(sorted(map(sorted, cc.components())),
+                     sorted(map(sorted, components)))
+        for c in components:
+            for v in c:
+                assert_equal(cc.component_size(v), len(c))
+        nodes = list(G)
+        for u, v in zip(nodes, nodes[1:]):
+            assert_equal(cc.same_component(u, v),
+                         v in nx.node_connected_component(G, u))
+
+    def test_random_updates(self):
+        import random
+        random.seed(11)
+        G = nx.gnm_random_graph(40, 45, seed=2)
+        cc = nx.DynamicConnectedComponents(G)
+        self.check(G, cc)
+        for _ in range(400):
+            u, v = random.sample(range(42), 2)
+            if G.has_edge(u, v):
+                cc.remove_edge(u, v)
+            else:
+                cc.add_edge(u, v)
+            self.check(G, cc)
+
+    def test_labels_are_freed(self):
+        import random
+        random.seed(5)
+        G = nx.gnm_random_graph(30, 40, seed=3)
+        cc = nx.DynamicConnectedComponents(G)
+        for i in range(3000):
+            u, v = random.sample(range(35), 2)
+            if i % 50 == 0 and u in G:
+                cc.remove_node(u)
+            elif G.has_edge(u, v):
+                cc.remove_edge(u, v)
+            else:
+                cc.add_edge(u, v)
+            assert_true(len(cc._parent) <= len(G))
+            assert_equal(set(cc._size), set(cc._find(v) for v in G))
+        self.check(G, cc)
+        for v in list(G):
+            cc.remove_node(v)
+        assert_equal((cc._parent, cc._size, cc._refs), ({}, {}, {}))
+        assert_equal(cc.number_of_components, 0)
+
+    def test_nodes_and_batches(self):
+        G = nx.Graph()
+        cc = nx.DynamicConnectedComponents(G)
+        cc.add_edges_from([(0, 1), (1, 2), (3, 4, {'weight': 3})], color=1)
+        assert_equal(G[3][4], {'weight': 3, 'color': 1})
+        cc.add_edge(2, 2)
+        cc.add_node(5)
+        self.check(G, cc)
+        assert_equal(cc.component(1), {0, 1, 2})
+        cc.remove_node(1)
+        self.check(G, cc)
+        cc.remove_edges_from([(3, 4), (2, 2), (7, 8)])
+        self.check(G, cc)
+        assert_raises(nx.NetworkXError, cc.remove_edge, 0, 5)
+
+    def test_not_implemented(self):
+        assert_raises(nx.NetworkXNotImplemented,
+                      nx.DynamicConnectedComponents, nx.DiGraph())
+        assert_raises(nx.NetworkXNotImplemented,
+                      nx.DynamicConnectedComponents, nx.MultiGraph())
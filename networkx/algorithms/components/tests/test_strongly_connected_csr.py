@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+
+
+class TestStronglyConnectedCSR(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+            import scipy
+        except ImportError:
+            raise SkipTest('NumPy and SciPy not available.')
+
+    def setUp(self):
+        self.graphs = [nx.gnp_random_graph(200, 0.01, seed=i, directed=True)
+                       for i in range(3)]
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3),
+                        (5, 5), (5, 4)])
+        G.add_node(6)
+        self.graphs.append(G)
+        # long cycle plus a tail, too deep for recursion
+        G = nx.cycle_graph(5000, create_using=nx.DiGraph())
+        nx.add_path(G, range(4999, 6000))
+        self.graphs.append(G)
+
+    def csr(self, G):
+        nodelist = list(range(len(G)))
+        A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, format='csr')
+        return A.indptr, A.indices
+
+    def check(self, G, n, labels):
+        expected = set(frozenset(c)
+                       for c in nx.strongly_connected_components(G))
+        assert_equal(n, len(expected))
+        assert_equal(sorted(set(labels.tolist())), list(range(n)))
+        found = {}
+        for v, l in enumerate(labels.tolist()):
+            found.setdefault(l, set()).add(v)
+        assert_equal(set(map(frozenset, found.values())), expected)
+
+    def test_methods(self):
+        for G in self.graphs:
+            indptr, indices = self.csr(G)
+            for kwds in ({}, {'method': 'forward-backward'},
+                         {'method': 'forward-backward', 'n_jobs': 3}):
+                n, labels = nx.strongly_connected_component_labels(
+                    indptr, indices, **kwds)
+                self.check(G, n, labels)
+
+    def test_condensation(self):
+        for G in self.graphs:
+            indptr, indices = self.csr(G)
+            n, labels = nx.strongly_connected_component_labels(indptr,
+                                                               indices)
+            cptr, cind = nx.condensation_csr(indptr, indices, labels, n)
+            C = nx.DiGraph()
+            C.add_nodes_from(range(n))
+            for i in range(n):
+                C.add_edges_from((i, j) for j in cind[cptr[i]:cptr[i + 1]])
+            assert_equal(C.number_of_edges(), len(cind))
+            assert_true(nx.is_directed_acyclic_graph(C))
+            edges = set((labels[u], labels[v]) for u, v in G.edges()
+                        if labels[u] != labels[v])
+            assert_equal(set(C.edges()), edges)
+
+    def test_empty(self):
+        n, labels = nx.strongly_connected_component_labels([0], [])
+        assert_equal((n, len(labels)), (0, 0))
+        cptr, cind = nx.condensation_csr([0], [], labels, n)
+        assert_equal((len(cptr), len(cind)), (1, 0))
+
+    def test_bad_method(self):
+        assert_raises(nx.NetworkXError,
+                      nx.strongly_connected_component_labels, [0, 0], [],
+                      method='tarjan')
@@ -6,6 +6,7 @@ from __future__ import division
 
 import itertools
 from operator import itemgetter
+from timeit import default_timer
 
 import networkx as nx
 # Define the default maximum flow function to use in all flow based
@@ -210,7 +211,8 @@ def local_node_connectivity(G, s, t, flow_func=None, auxiliary=None,
     return nx.maximum_flow_value(H, '%sB' % mapping[s], '%sA' % mapping[t], **kwargs)
 
 
-def node_connectivity(G, s=None, t=None, flow_func=None):
+def node_connectivity(G, s=None, t=None, flow_func=None, auxiliary=None,
+                      residual=None):
     """Returns node connectivity for a graph or digraph G.
 
     Node connectivity is equal to the minimum number of nodes that
@@ -240,6 +242,16 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
         choice of the default function may change from version
         to version and should not be relied on. Default value: None.
 
+    auxiliary : NetworkX DiGraph
+        Auxiliary digraph to compute flow based node connectivity. It has
+        to have a graph attribute called mapping with a dictionary mapping
+        node names in G and in the auxiliary digraph. If provided
+        it will be reused instead of recreated. Default value: None.
+
+    residual : NetworkX DiGraph
+        Residual network to compute maximum flow. If provided it will be
+        reused instead of recreated. Default value: None.
+
     Returns
     -------
     K : integer
@@ -309,9 +321,19 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
             raise nx.NetworkXError('node %s not in graph' % s)
         if t not in G:
             raise nx.NetworkXError('node %s not in graph' % t)
-        return local_node_connectivity(G, s, t, flow_func=flow_func)
+        return local_node_connectivity(G, s, t, flow_func=flow_func,
+                                       auxiliary=auxiliary, residual=residual)
 
     # Global node connectivity
+    return _node_connectivity(G, flow_func=flow_func, auxiliary=auxiliary,
+                              residual=residual)
+
+
+def _node_connectivity(G, flow_func=None, auxiliary=None, residual=None,
+                       deadline=None):
+    """Returns the node connectivity of G, or None if the time given by
+    :func:`timeit.default_timer` passes `deadline` before it is known.
+    """
     if G.is_directed():
         if not nx.is_weakly_connected(G):
             return 0
@@ -328,8 +350,14 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
         neighbors = G.neighbors
 
     # Reuse the auxiliary digraph and the residual network
-    H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
+    if auxiliary is None:
+        H = build_auxiliary_node_connectivity(G)
+    else:
+        H = auxiliary
+    if residual is None:
+        R = build_residual_network(H, 'capacity')
+    else:
+        R = residual
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     # Pick a node with minimum degree
@@ -337,12 +365,16 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
     v, K = min(G.degree(), key=itemgetter(1))
     # compute local node connectivity with all its non-neighbors nodes
     for w in set(G) - set(neighbors(v)) - set([v]):
+        if deadline is not None and default_timer() > deadline:
+            return None
         kwargs['cutoff'] = K
         K = min(K, local_node_connectivity(G, v, w, **kwargs))
     # Also for non adjacent pairs of neighbors of v
     for x, y in iter_func(neighbors(v), 2):
         if y in G[x]:
             continue
+        if deadline is not None and default_timer() > deadline:
+            return None
         kwargs['cutoff'] = K
         K = min(K, local_node_connectivity(G, x, y, **kwargs))
 
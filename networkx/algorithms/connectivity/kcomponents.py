@@ -5,11 +5,15 @@ Moody and White algorithm for k-components
 from collections import defaultdict
 from itertools import combinations
 from operator import itemgetter
+from timeit import default_timer
 
 import networkx as nx
 from networkx.utils import not_implemented_for
 # Define the default maximum flow function.
+from networkx.algorithms.flow import build_residual_network
 from networkx.algorithms.flow import edmonds_karp
+from .connectivity import _node_connectivity
+from .utils import build_auxiliary_node_connectivity
 default_flow_func = edmonds_karp
 
 __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
@@ -18,7 +22,7 @@ __all__ = ['k_components']
 
 
 @not_implemented_for('directed')
-def k_components(G, flow_func=None):
+def k_components(G, flow_func=None, n_jobs=None, time_limit=None):
     r"""Returns the k-component structure of a graph G.
     
     A `k`-component is a maximal subgraph of a graph G that has, at least,
@@ -38,6 +42,20 @@ def k_components(G, flow_func=None):
         right tailed degree distributions. :meth:`shortest_augmenting_path` will
         perform better in denser graphs.
 
+    n_jobs : int, optional (default=None)
+        Number of worker processes used by :meth:`all_node_cuts` to run
+        the local maximum flow computations in parallel. If None or 1 all
+        computations run in the current process. The result does not
+        depend on `n_jobs`.
+
+    time_limit : float, optional (default=None)
+        Maximum number of seconds to spend looking for k-components.
+        When it is reached the search stops and the k-components found
+        so far are returned: the 1-components and 2-components are
+        always complete, but k-components of higher levels may be
+        missing, or reported at a level lower than their connectivity.
+        If None there is no limit.
+
     Returns
     -------
     k_components : dict
@@ -77,7 +95,9 @@ def k_components(G, flow_func=None):
            else end.
 
     This implementation also uses some heuristics (see [3]_ for details) 
-    to speed up the computation.
+    to speed up the computation. The auxiliary digraph and the residual
+    network of each subgraph are built once and shared by the node
+    connectivity and the cutset computations.
 
     See also
     --------
@@ -119,24 +139,54 @@ def k_components(G, flow_func=None):
         # avoid considering dyads as bicomponents
         if len(bicomp) > 2:
             k_components[2].append(bicomp)
+    if time_limit is None:
+        deadline = None
+    else:
+        deadline = default_timer() + time_limit
+
+    def connectivity_and_cuts(C):
+        """Returns the node connectivity and the minimum cutsets of C,
+        or None and no cutsets if the time limit is reached before the
+        node connectivity is known."""
+        H = build_auxiliary_node_connectivity(C)
+        R = build_residual_network(H, 'capacity')
+        k = _node_connectivity(C, flow_func=flow_func, auxiliary=H,
+                               residual=R, deadline=deadline)
+        if k is None:
+            return None, []
+        if deadline is None:
+            remaining = None
+        else:
+            remaining = deadline - default_timer()
+        cuts = list(nx.all_node_cuts(C, k=k, flow_func=flow_func,
+                                     auxiliary=H, residual=R, n_jobs=n_jobs,
+                                     time_limit=remaining))
+        return k, cuts
+
     for B in bicomponents:
         if len(B) <= 2:
             continue
-        k = nx.node_connectivity(B, flow_func=flow_func)
+        if deadline is not None and default_timer() > deadline:
+            break
+        k, cuts = connectivity_and_cuts(B)
+        if k is None:
+            break
         if k > 2:
             k_components[k].append(set(B.nodes()))
         # Perform cuts in a DFS like order.
-        cuts = list(nx.all_node_cuts(B, k=k, flow_func=flow_func))
         stack = [(k, _generate_partition(B, cuts, k))]
         while stack:
+            if deadline is not None and default_timer() > deadline:
+                break
             (parent_k, partition) = stack[-1]
             try:
                 nodes = next(partition)
                 C = B.subgraph(nodes)
-                this_k = nx.node_connectivity(C, flow_func=flow_func)
+                this_k, cuts = connectivity_and_cuts(C)
+                if this_k is None:
+                    break
                 if this_k > parent_k and this_k > 2:
                     k_components[this_k].append(set(C.nodes()))
-                cuts = list(nx.all_node_cuts(C, k=this_k, flow_func=flow_func))
                 if cuts:
                     stack.append((this_k, _generate_partition(C, cuts, this_k)))
             except StopIteration:
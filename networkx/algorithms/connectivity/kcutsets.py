@@ -4,11 +4,16 @@ Kanevsky all minimum node k cutsets algorithm.
 """
 from operator import itemgetter
 from itertools import combinations
+from timeit import default_timer
 
 import networkx as nx
+from .connectivity import _node_connectivity
 from .utils import build_auxiliary_node_connectivity
 from networkx.algorithms.flow import (
+    ArrayResidualNetwork,
+    boykov_kolmogorov,
     build_residual_network,
+    dinitz,
     edmonds_karp,
     shortest_augmenting_path,
 )
@@ -19,7 +24,29 @@ __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
 
 __all__ = ['all_node_cuts']
 
-def all_node_cuts(G, k=None, flow_func=None):
+# Flow functions that can stop as soon as the flow value reaches a cutoff.
+_cutoff_flow_funcs = (boykov_kolmogorov, dinitz, edmonds_karp,
+                      shortest_augmenting_path)
+
+# Auxiliary digraph, residual network and flow function shared with the
+# worker processes of a pool.
+_worker_state = None
+
+
+def _init_flow_worker(H, flow_func, kwargs):
+    global _worker_state
+    R = build_residual_network(H, 'capacity')
+    _worker_state = (H, R, flow_func, dict(kwargs, residual=R))
+
+
+def _flow_value_worker(pair):
+    H, R, flow_func, kwargs = _worker_state
+    s, t = pair
+    return flow_func(H, s, t, **kwargs).graph['flow_value']
+
+
+def all_node_cuts(G, k=None, flow_func=None, auxiliary=None, residual=None,
+                  n_jobs=None, time_limit=None):
     r"""Returns all minimum k cutsets of an undirected graph G. 
 
     This implementation is based on Kanevsky's algorithm [1]_ for finding all
@@ -41,7 +68,28 @@ def all_node_cuts(G, k=None, flow_func=None):
         edmonds_karp. This function performs better in sparse graphs with
         right tailed degree distributions. shortest_augmenting_path will
         perform better in denser graphs.
-        
+
+    auxiliary : NetworkX DiGraph
+        Auxiliary digraph to compute flow based node connectivity, as
+        built by :func:`build_auxiliary_node_connectivity`. If provided
+        it will be reused instead of recreated; the edges added to it
+        during the computation are removed at the end. Default value:
+        None.
+
+    residual : NetworkX DiGraph
+        Residual network to compute maximum flow. If provided it will be
+        reused instead of recreated. Default value: None.
+
+    n_jobs : int, optional (default=None)
+        Number of worker processes used to run the local maximum flow
+        computations in parallel. If None or 1 all computations run in
+        the current process. The cutsets do not depend on `n_jobs`.
+
+    time_limit : float, optional (default=None)
+        Maximum number of seconds to spend looking for cutsets. When it
+        is reached no more cutsets are generated, so only part of them
+        may be found. The computation of `k`, if it is not given, counts
+        towards the limit. If None there is no limit.
 
     Returns
     -------
@@ -71,6 +119,13 @@ def all_node_cuts(G, k=None, flow_func=None):
     node and the target node of the local maximum flow computation to make 
     sure that we will not find that minimum cut again.
 
+    Only the local maximum flows of value `k` lead to cutsets, so the
+    flow computations stop as soon as the flow value exceeds `k` for the
+    flow functions that support a cutoff. Adding edges never lowers a
+    local connectivity, so with `n_jobs` the flows on the initial
+    auxiliary digraph are computed in parallel and only the pairs of
+    nodes with local connectivity `k` are then processed in order.
+
     See also
     --------
     node_connectivity
@@ -103,15 +158,23 @@ def all_node_cuts(G, k=None, flow_func=None):
         for cut_set in combinations(G, len(G)-1):
             yield set(cut_set)
         return
+    if time_limit is None:
+        deadline = None
+    else:
+        deadline = default_timer() + time_limit
     # Initialize data structures.
     # Keep track of the cuts already computed so we do not repeat them.
     seen = []
     # Even-Tarjan reduction is what we call auxiliary digraph 
     # for node connectivity.
-    H = build_auxiliary_node_connectivity(G)
+    if auxiliary is None:
+        H = build_auxiliary_node_connectivity(G)
+    else:
+        H = auxiliary
     mapping = H.graph['mapping']
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(capacity='capacity', residual=R)
+    if residual is None:
+        residual = build_residual_network(H, 'capacity')
+    kwargs = dict(capacity='capacity', residual=residual)
     # Define default flow function
     if flow_func is None:
         flow_func = default_flow_func
@@ -120,7 +183,14 @@ def all_node_cuts(G, k=None, flow_func=None):
     # Begin the actual algorithm
     # step 1: Find node connectivity k of G
     if k is None:
-        k = nx.node_connectivity(G, flow_func=flow_func)
+        k = _node_connectivity(G, flow_func=flow_func, auxiliary=H,
+                               residual=residual, deadline=deadline)
+        if k is None:
+            # The time limit was reached before k was known.
+            return
+    if flow_func in _cutoff_flow_funcs:
+        # Flows larger than k do not lead to k-cutsets.
+        kwargs['cutoff'] = k + 1
     # step 2: 
     # Find k nodes with top degree, call it X:
     X = {n for n, d in sorted(G.degree(), key=itemgetter(1), reverse=True)[:k]}
@@ -129,17 +199,38 @@ def all_node_cuts(G, k=None, flow_func=None):
         seen.append(X)
         yield X
 
-    for x in X:
-        # step 3: Compute local connectivity flow of x with all other
-        # non adjacent nodes in G
-        non_adjacent = set(G) - X - set(G[x])
-        for v in non_adjacent:
+    # step 3: Compute local connectivity flow of each x in X with all
+    # other non adjacent nodes in G
+    pairs = [(x, v) for x in X for v in set(G) - X - set(G[x])]
+    flow_values = None
+    pool = None
+    added_edges = []
+    try:
+        # Small instances are not worth starting the worker processes.
+        if n_jobs is not None and n_jobs > 1 and len(pairs) > 16 * n_jobs:
+            from multiprocessing import Pool
+            worker_kwargs = dict((key, value) for key, value in kwargs.items()
+                                 if key != 'residual')
+            pool = Pool(n_jobs, _init_flow_worker,
+                        (H, flow_func, worker_kwargs))
+            flow_values = pool.imap(
+                _flow_value_worker,
+                [('%sB' % mapping[x], '%sA' % mapping[v]) for x, v in pairs],
+                chunksize=max(1, len(pairs) // (4 * n_jobs)))
+        for x, v in pairs:
+            if deadline is not None and default_timer() > deadline:
+                return
+            if flow_values is not None and next(flow_values) > k:
+                # The flow can only be larger on the current H.
+                continue
             # step 4: compute maximum flow in an Even-Tarjan reduction H of G
             # and step:5 build the associated residual network R
             R = flow_func(H, '%sB' % mapping[x], '%sA' % mapping[v], **kwargs)
             flow_value = R.graph['flow_value']
 
             if flow_value == k:
+                if isinstance(R, ArrayResidualNetwork):
+                    R = R.to_residual_network()
                 ## Remove saturated edges form the residual network
                 saturated_edges = [(u, w, d) for (u, w, d) in
                                     R.edges(data=True)
@@ -173,18 +264,27 @@ def all_node_cuts(G, k=None, flow_func=None):
                         # of adding the edge in the input graph 
                         # G.add_edge(x, v) and then regenerate H and R:
                         # Add edges to the auxiliary digraph.
-                        H.add_edge('%sB' % mapping[x], '%sA' % mapping[v],
-                                   capacity=1)
-                        H.add_edge('%sB' % mapping[v], '%sA' % mapping[x],
-                                   capacity=1)
+                        xB, xA = '%sB' % mapping[x], '%sA' % mapping[x]
+                        vB, vA = '%sB' % mapping[v], '%sA' % mapping[v]
+                        H.add_edge(xB, vA, capacity=1)
+                        H.add_edge(vB, xA, capacity=1)
                         # Add edges to the residual network.
-                        R.add_edge('%sB' % mapping[x], '%sA' % mapping[v],
-                                   capacity=1)
-                        R.add_edge('%sA' % mapping[v], '%sB' % mapping[x],
-                                   capacity=1)
+                        residual.add_edge(xB, vA, capacity=1)
+                        residual.add_edge(vA, xB, capacity=1)
+                        added_edges.append((xB, vA, vB, xA))
                         break
                 # Add again the saturated edges to reuse the residual network
                 R.add_edges_from(saturated_edges)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        # Leave the auxiliary digraph and the residual network as they were.
+        for xB, vA, vB, xA in added_edges:
+            H.remove_edge(xB, vA)
+            H.remove_edge(vB, xA)
+            residual.remove_edge(xB, vA)
+            residual.remove_edge(vA, xB)
 
 
 def _is_separating_set(G, cut):
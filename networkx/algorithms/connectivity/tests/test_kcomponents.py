@@ -1,11 +1,22 @@
 # Test for Moody and White k-components algorithm
+from timeit import default_timer
 from nose.tools import assert_equal, assert_true, raises
 import networkx as nx
+from networkx.algorithms import flow
 from networkx.algorithms.connectivity.kcomponents import (
     build_k_number_dict,
     _consolidate,
 )
 
+flow_funcs = [
+    flow.array_preflow_push,
+    flow.boykov_kolmogorov,
+    flow.dinitz,
+    flow.edmonds_karp,
+    flow.preflow_push,
+    flow.shortest_augmenting_path,
+]
+
 ##
 ## A nice synthetic graph
 ##
@@ -80,8 +91,8 @@ def test_directed():
     nx.k_components(G)
 
 # Helper function
-def _check_connectivity(G):
-    result = nx.k_components(G)
+def _check_connectivity(G, flow_func=None):
+    result = nx.k_components(G, flow_func=flow_func)
     for k, components in result.items():
         if k < 3:
             continue
@@ -93,6 +104,15 @@ def test_torrents_and_ferraro_graph():
     G = torrents_and_ferraro_graph()
     _check_connectivity(G)
 
+def test_alternative_flow_functions():
+    G = nx.petersen_graph()
+    for flow_func in flow_funcs:
+        k_components = nx.k_components(G, flow_func=flow_func)
+        assert_equal(k_components[3], [set(G)])
+    G = torrents_and_ferraro_graph()
+    for flow_func in flow_funcs:
+        _check_connectivity(G, flow_func=flow_func)
+
 def test_random_gnp():
     G = nx.gnp_random_graph(50, 0.2)
     _check_connectivity(G)
@@ -254,3 +274,29 @@ def test_set_consolidation_rosettacode():
     question = [{'H','I','K'}, {'A','B'}, {'C','D'}, {'D','B'}, {'F','G','H'}, {'A','H'}]
     solution = [{'A', 'C', 'B', 'D', 'G', 'F', 'I', 'H', 'K'}]
     list_of_sets_equal(_consolidate(question, 1), solution)
+
+
+def test_parallel():
+    G = nx.karate_club_graph()
+    assert_equal(build_k_number_dict(nx.k_components(G)),
+                 build_k_number_dict(nx.k_components(G, n_jobs=2)))
+
+
+def test_time_limit():
+    G = nx.karate_club_graph()
+    k_components = nx.k_components(G, time_limit=0)
+    assert_equal(sorted(k_components), [1, 2])
+    bicomponents = [set(c) for c in nx.biconnected_components(G)
+                    if len(c) > 2]
+    assert_equal(sorted(map(sorted, k_components[2])),
+                 sorted(map(sorted, bicomponents)))
+    assert_equal(build_k_number_dict(nx.k_components(G, time_limit=60)),
+                 build_k_number_dict(nx.k_components(G)))
+
+
+def test_time_limit_includes_connectivity():
+    G = nx.random_regular_graph(4, 1500, seed=1)
+    start = default_timer()
+    k_components = nx.k_components(G, time_limit=0.5)
+    assert_true(default_timer() - start < 1.5)
+    assert_equal(k_components[1], [set(G)])
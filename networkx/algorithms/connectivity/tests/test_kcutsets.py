@@ -1,14 +1,17 @@
 # Jordi Torrents
 # Test for k-cutsets
 from operator import itemgetter
+from timeit import default_timer
 from nose.tools import assert_equal, assert_false, assert_true, assert_raises
 
 import networkx as nx
 from networkx.algorithms import flow
+from networkx.algorithms.connectivity import build_auxiliary_node_connectivity
 from networkx.algorithms.connectivity.kcutsets import _is_separating_set
 
 
 flow_funcs = [
+    flow.array_preflow_push,
     flow.boykov_kolmogorov,
     flow.dinitz,
     flow.edmonds_karp,
@@ -219,6 +222,14 @@ def test_alternative_flow_functions():
                 H.remove_nodes_from(cut)
                 assert_false(nx.is_connected(H))
 
+def test_alternative_flow_functions_petersen():
+    G = nx.petersen_graph()
+    for flow_func in flow_funcs:
+        cuts = list(nx.all_node_cuts(G, flow_func=flow_func))
+        assert_true(len(cuts) > 0)
+        for cut in cuts:
+            assert_equal(len(cut), 3)
+
 def test_is_separating_set_complete_graph():
     G = nx.complete_graph(5)
     assert_true(_is_separating_set(G, {0, 1, 2, 3}))
@@ -269,3 +280,37 @@ def test_complete_graph():
     assert_true(len(solution) == len(cuts))
     for cut in cuts:
         assert_true(cut in solution)
+
+
+def test_parallel():
+    G = nx.grid_2d_graph(8, 8)
+    G.add_edges_from([((0, 0), (1, 1)), ((6, 7), (7, 6)), ((0, 7), (1, 6))])
+    cuts = list(nx.all_node_cuts(G))
+    assert_equal(cuts, list(nx.all_node_cuts(G, n_jobs=2)))
+    assert_equal(sorted(sorted(cut) for cut in cuts),
+                 [[(6, 0), (7, 1)], [(6, 7), (7, 6)]])
+
+
+def test_reuse_auxiliary():
+    G = nx.karate_club_graph()
+    H = build_auxiliary_node_connectivity(G)
+    R = flow.build_residual_network(H, 'capacity')
+    H_edges = sorted(H.edges())
+    R_edges = sorted(R.edges())
+    k = nx.node_connectivity(G, auxiliary=H, residual=R)
+    cuts = list(nx.all_node_cuts(G, k=k, auxiliary=H, residual=R))
+    assert_equal(cuts, list(nx.all_node_cuts(G)))
+    assert_equal(H_edges, sorted(H.edges()))
+    assert_equal(R_edges, sorted(R.edges()))
+
+
+def test_time_limit():
+    G = nx.grid_2d_graph(5, 5)
+    assert_equal(list(nx.all_node_cuts(G, time_limit=0)), [])
+    assert_equal(len(list(nx.all_node_cuts(G, time_limit=60))), 4)
+
+def test_time_limit_includes_connectivity():
+    G = nx.random_regular_graph(4, 1500, seed=1)
+    start = default_timer()
+    list(nx.all_node_cuts(G, time_limit=0.5))
+    assert_true(default_timer() - start < 1.5)
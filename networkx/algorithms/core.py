@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 #    Copyright (C) 2004-2016 by
 #    Aric Hagberg <hagberg@lanl.gov>
 #    Dan Schult <dschult@colgate.edu>
@@ -31,12 +32,14 @@ D-cores: Measuring Collaboration of Directed Graphs Based on Degeneracy
 Christos Giatsidis, Dimitrios M. Thilikos, Michalis Vazirgiannis, ICDM 2011.
 http://www.graphdegeneracy.org/dcores_ICDM_2011.pdf
 """
+from collections import deque
+
 import networkx as nx
 from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 
 __all__ = ['core_number', 'find_cores', 'k_core',
-           'k_shell', 'k_crust', 'k_corona']
+           'k_shell', 'k_crust', 'k_corona', 'DynamicCoreNumber']
 
 
 @not_implemented_for('multigraph')
@@ -81,6 +84,18 @@ def core_number(G):
         msg = ('Input graph has self loops which is not permitted; '
                'Consider using G.remove_edges_from(G.selfloop_edges()).')
         raise NetworkXError(msg)
+    return _core_order(G)[1]
+
+
+def _core_order(G):
+    """Returns the nodes of `G` in a degeneracy order and their core
+    numbers.
+
+    The nodes are removed in turn with minimum remaining degree using
+    the bucket queue of Batagelj and Zaversnik, so that no node has more
+    neighbors later in the order than its core number.  `G` must not
+    have self loops.
+    """
     degrees = dict(G.degree())
     # Sort nodes by degree.
     nodes = sorted(degrees, key=degrees.get)
@@ -105,7 +120,7 @@ def core_number(G):
                 nodes[bin_start], nodes[pos] = nodes[pos], nodes[bin_start]
                 bin_boundaries[core[u]] += 1
                 core[u] -= 1
-    return core
+    return nodes, core
 
 
 find_cores = core_number
@@ -353,3 +368,249 @@ def k_corona(G, k, core_number=None):
     def func(v, k, c):
         return c[v] == k and k == sum(1 for w in G[v] if c[w] >= k)
     return _core_subgraph(G, func, k, core_number)
+
+
+class DynamicCoreNumber(object):
+    """Core numbers of an undirected graph maintained under edge updates.
+
+    The core numbers are computed once with :func:`core_number` and then
+    updated locally whenever an edge is added to or removed from the
+    graph through this object.  Inserting or deleting an edge changes
+    the core number of a node by at most one, and only nodes with the
+    core number `K` of the lower endpoint that are connected to it
+    through nodes with core number `K` (its *subcore*) can change [1]_.
+    Each update therefore only traverses that subcore instead of the
+    whole graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops.  The graph is modified
+       in place by the update methods of this object.
+
+    attr : string, optional (default=None)
+       If given, the core number of every node is also stored in the
+       node attribute `attr` and kept up to date, so that the state is
+       cached on the graph itself.  If all nodes of `G` already have
+       this attribute the stored values are trusted and the initial
+       decomposition is skipped.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    NetworkXError
+        If `G` has self loops.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> cores = nx.DynamicCoreNumber(G)
+    >>> cores[0]
+    2
+    >>> cores.add_edge(0, 2)
+    >>> cores.add_edge(1, 3)
+    >>> cores[0]
+    3
+    >>> cores.remove_edge(0, 1)
+    >>> sorted(cores.core.items())
+    [(0, 2), (1, 2), (2, 2), (3, 2)]
+
+    Notes
+    -----
+    Changes made to `G` directly instead of through this object are not
+    seen and leave the core numbers out of date.
+
+    The update uses the subcore algorithm of Sarıyüce et al. [1]_.  For
+    an insertion the candidate nodes of the subcore whose number of
+    neighbors with core number at least `K` exceeds `K` are peeled, and
+    the survivors move to core number `K + 1`.  For a deletion the
+    nodes of the subcore left with fewer than `K` such neighbors are
+    peeled and move to core number `K - 1`.
+
+    References
+    ----------
+    .. [1] A. E. Sarıyüce, B. Gedik, G. Jacques-Silva, K.-L. Wu and
+       Ü. V. Çatalyürek, Streaming algorithms for k-core decomposition.
+       Proceedings of the VLDB Endowment 6(6), 433-444, 2013.
+    """
+
+    def __init__(self, G, attr=None):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'directed type')
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'multigraph type')
+        self.G = G
+        self.attr = attr
+        nodes = list(G.nodes(data=True))
+        if attr is not None and all(attr in d for v, d in nodes):
+            if G.number_of_selfloops() > 0:
+                raise NetworkXError('Input graph has self loops which is '
+                                    'not permitted.')
+            self._core = {v: d[attr] for v, d in nodes}
+        else:
+            self._core = core_number(G)
+            self._store(self._core)
+
+    @property
+    def core(self):
+        """Dictionary keyed by node with the current core numbers.
+
+        The dictionary is owned by this object and must not be modified.
+        """
+        return self._core
+
+    def __getitem__(self, v):
+        return self._core[v]
+
+    def __contains__(self, v):
+        return v in self._core
+
+    def __len__(self):
+        return len(self._core)
+
+    def _store(self, nodes):
+        if self.attr is not None:
+            node = self.G.node
+            for v in nodes:
+                node[v][self.attr] = self._core[v]
+
+    def _subcore(self, roots, K):
+        """Return the nodes with core number `K` connected to `roots`
+        through nodes with core number `K`.
+        """
+        adj = self.G.adj
+        core = self._core
+        seen = set(roots)
+        queue = deque(roots)
+        while queue:
+            v = queue.popleft()
+            for w in adj[v]:
+                if w not in seen and core[w] == K:
+                    seen.add(w)
+                    queue.append(w)
+        return seen
+
+    def add_node(self, n):
+        """Add the node `n` to the graph with core number 0."""
+        if n not in self._core:
+            self.G.add_node(n)
+            self._core[n] = 0
+            self._store([n])
+
+    def remove_node(self, n):
+        """Remove the node `n` and its edges from the graph."""
+        for v in list(self.G.adj[n]):
+            self.remove_edge(n, v)
+        self.G.remove_node(n)
+        del self._core[n]
+
+    def add_edge(self, u, v, **attr):
+        """Add the edge `(u, v)` to the graph and update the core numbers.
+
+        Missing nodes are added.  Edge attributes can be given as keyword
+        arguments, as in :meth:`Graph.add_edge`.
+        """
+        if u == v:
+            raise NetworkXError('Self loops are not permitted.')
+        self.add_node(u)
+        self.add_node(v)
+        G = self.G
+        if v in G.adj[u]:
+            G.add_edge(u, v, **attr)
+            return
+        G.add_edge(u, v, **attr)
+        core = self._core
+        K = min(core[u], core[v])
+        roots = [w for w in (u, v) if core[w] == K]
+        candidates = self._subcore(roots, K)
+        adj = G.adj
+        # number of neighbors that can be in the (K + 1)-core
+        cd = {w: sum(1 for x in adj[w] if core[x] >= K) for w in candidates}
+        queue = deque(w for w in candidates if cd[w] <= K)
+        evicted = set(queue)
+        while queue:
+            w = queue.popleft()
+            for x in adj[w]:
+                if x in candidates and x not in evicted:
+                    cd[x] -= 1
+                    if cd[x] <= K:
+                        evicted.add(x)
+                        queue.append(x)
+        promoted = candidates - evicted
+        for w in promoted:
+            core[w] = K + 1
+        self._store(promoted)
+
+    def remove_edge(self, u, v):
+        """Remove the edge `(u, v)` from the graph and update the core
+        numbers.
+
+        Raises
+        ------
+        NetworkXError
+            If the edge is not in the graph.
+        """
+        G = self.G
+        G.remove_edge(u, v)
+        core = self._core
+        K = min(core[u], core[v])
+        if K == 0:
+            return
+        roots = [w for w in (u, v) if core[w] == K]
+        candidates = self._subcore(roots, K)
+        adj = G.adj
+        # number of neighbors that can be in the K-core
+        mcd = {w: sum(1 for x in adj[w] if core[x] >= K) for w in candidates}
+        queue = deque(w for w in candidates if mcd[w] < K)
+        demoted = set(queue)
+        while queue:
+            w = queue.popleft()
+            for x in adj[w]:
+                if x in candidates and x not in demoted:
+                    mcd[x] -= 1
+                    if mcd[x] < K:
+                        demoted.add(x)
+                        queue.append(x)
+        for w in demoted:
+            core[w] = K - 1
+        self._store(demoted)
+
+    def add_edges_from(self, ebunch, **attr):
+        """Add all the edges in `ebunch`, see :meth:`add_edge`."""
+        for e in ebunch:
+            u, v = e[0], e[1]
+            dd = e[2] if len(e) == 3 else {}
+            d = dict(attr)
+            d.update(dd)
+            self.add_edge(u, v, **d)
+
+    def remove_edges_from(self, ebunch):
+        """Remove all the edges in `ebunch`, see :meth:`remove_edge`.
+
+        Edges not in the graph are silently ignored.
+        """
+        adj = self.G.adj
+        for e in ebunch:
+            u, v = e[0], e[1]
+            if u in adj and v in adj[u]:
+                self.remove_edge(u, v)
+
+    def k_core(self, k=None):
+        """Return the k-core of the graph, see :func:`k_core`."""
+        return k_core(self.G, k, self._core)
+
+    def k_shell(self, k=None):
+        """Return the k-shell of the graph, see :func:`k_shell`."""
+        return k_shell(self.G, k, self._core)
+
+    def k_crust(self, k=None):
+        """Return the k-crust of the graph, see :func:`k_crust`."""
+        return k_crust(self.G, k, self._core)
+
+    def k_corona(self, k):
+        """Return the k-corona of the graph, see :func:`k_corona`."""
+        return k_corona(self.G, k, self._core)
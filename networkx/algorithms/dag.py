@@ -8,6 +8,7 @@
 #    BSD license.
 from fractions import gcd
 import heapq
+import random
 
 import networkx as nx
 from networkx.utils import consume, arbitrary_element, pairwise
@@ -27,7 +28,9 @@ __all__ = ['descendants',
            'transitive_reduction',
            'antichains',
            'dag_longest_path',
-           'dag_longest_path_length']
+           'dag_longest_path_length',
+           'ReachabilityIndex',
+           'IncrementalTopologicalOrder']
 
 
 def descendants(G, source):
@@ -341,6 +344,10 @@ def transitive_closure(G):
     NetworkXNotImplemented
         If G is not directed
 
+    See also
+    --------
+    ReachabilityIndex
+
     References
     ----------
     .. [1] http://www.ics.uci.edu/~eppstein/PADS/PartialOrder.py
@@ -451,7 +458,7 @@ def antichains(G):
 
 
 @not_implemented_for('undirected')
-def dag_longest_path(G, weight='weight', default_weight=1):
+def dag_longest_path(G, weight='weight', default_weight=1, topo_order=None):
     """Returns the longest path in a DAG
     If G has edges with 'weight' attribute the edge data are used as weight values.
 
@@ -466,6 +473,11 @@ def dag_longest_path(G, weight='weight', default_weight=1):
     default_weight : integer (default 1)
         The weight of edges that do not have a weight attribute
 
+    topo_order : iterable, optional (default None)
+        The nodes of G in a topological order, for instance an
+        :class:`IncrementalTopologicalOrder` maintained for G. If None,
+        the order is computed with :func:`topological_sort`.
+
     Returns
     -------
     path : list
@@ -478,10 +490,12 @@ def dag_longest_path(G, weight='weight', default_weight=1):
 
     See also
     --------
-    dag_longest_path_length
+    dag_longest_path_length, IncrementalTopologicalOrder
     """
+    if topo_order is None:
+        topo_order = nx.topological_sort(G)
     dist = {} # stores {v : (length, u)}
-    for v in nx.topological_sort(G):
+    for v in topo_order:
         us = [(dist[u][0] + data.get(weight, default_weight), u)
             for u, data in G.pred[v].items()]
         # Use the best predecessor if there is one and its distance is non-negative, otherwise terminate.
@@ -499,7 +513,8 @@ def dag_longest_path(G, weight='weight', default_weight=1):
 
 
 @not_implemented_for('undirected')
-def dag_longest_path_length(G, weight='weight', default_weight=1):
+def dag_longest_path_length(G, weight='weight', default_weight=1,
+                            topo_order=None):
     """Returns the longest path length in a DAG
 
     Parameters
@@ -513,6 +528,10 @@ def dag_longest_path_length(G, weight='weight', default_weight=1):
     default_weight : integer (default 1)
         The weight of edges that do not have a weight attribute
 
+    topo_order : iterable, optional (default None)
+        The nodes of G in a topological order. If None, the order is
+        computed with :func:`topological_sort`.
+
     Returns
     -------
     path_length : int
@@ -527,9 +546,498 @@ def dag_longest_path_length(G, weight='weight', default_weight=1):
     --------
     dag_longest_path
     """
-    path = nx.dag_longest_path(G, weight, default_weight)
+    path = nx.dag_longest_path(G, weight, default_weight, topo_order)
     path_length = 0
     for (u, v) in pairwise(path):
         path_length += G[u][v].get(weight, default_weight)
 
     return path_length
+
+
+class IncrementalTopologicalOrder(object):
+    """Topological order of a DAG maintained while edges are added.
+
+    The order is bound to a directed acyclic graph G, which must then be
+    changed through the methods of this object only. Adding an edge
+    reorders only the nodes between its endpoints in the current order
+    that are reachable from its head or reach its tail, with the
+    algorithm of Pearce and Kelly [1]_. An edge that would close a cycle
+    is detected immediately and not added.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        A directed acyclic graph.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is undirected.
+
+    NetworkXUnfeasible
+        If G contains a cycle.
+
+    See also
+    --------
+    topological_sort, is_directed_acyclic_graph, dag_longest_path
+
+    Notes
+    -----
+    Iterating over this object yields the nodes in topological order.
+    The position of a node is an integer that increases along every edge.
+    Positions are consecutive, from 0, unless nodes were removed.
+
+    Adding an edge ``(u, v)`` with ``v`` after ``u`` in the current order
+    costs constant time. Otherwise both endpoints are searched, forward
+    from ``v`` and backward from ``u``, within the positions between
+    them, and the nodes visited swap positions among themselves.
+
+    References
+    ----------
+    .. [1] D. J. Pearce and P. H. J. Kelly, "A dynamic topological sort
+       algorithm for directed acyclic graphs", ACM Journal of
+       Experimental Algorithmics 11, 2006.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (2, 3)])
+    >>> order = nx.IncrementalTopologicalOrder(G)
+    >>> order.add_edge(3, 0)
+    >>> order.position(3) < order.position(0) < order.position(1)
+    True
+    >>> order.add_edge(1, 2)
+    [(1, 2), (2, 3), (3, 0), (0, 1)]
+    >>> G.has_edge(1, 2)
+    False
+    >>> nx.dag_longest_path(G, topo_order=order)
+    [2, 3, 0, 1]
+    """
+
+    def __init__(self, G):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for undirected type')
+        self.G = G
+        self._nodes = list(topological_sort(G))
+        self._position = {v: i for i, v in enumerate(self._nodes)}
+        self._holes = 0
+
+    def __len__(self):
+        return len(self._position)
+
+    def __contains__(self, v):
+        return v in self._position
+
+    def __iter__(self):
+        return (v for v in self._nodes if v is not None)
+
+    def position(self, v):
+        """Returns the position of node `v` in the topological order.
+
+        Raises
+        ------
+        NetworkXError
+            If `v` is not in G.
+        """
+        try:
+            return self._position[v]
+        except KeyError:
+            raise nx.NetworkXError('node %r not in graph' % (v,))
+
+    def add_node(self, v, **attr):
+        """Adds the node `v` to G, last in the order if it is new."""
+        if v not in self._position:
+            self._position[v] = len(self._nodes)
+            self._nodes.append(v)
+        self.G.add_node(v, **attr)
+
+    def remove_node(self, v):
+        """Removes the node `v` from G.
+
+        Raises
+        ------
+        NetworkXError
+            If `v` is not in G.
+        """
+        self.G.remove_node(v)
+        self._nodes[self._position.pop(v)] = None
+        self._holes += 1
+        if 2 * self._holes > len(self._nodes):
+            self._nodes = [u for u in self._nodes if u is not None]
+            for i, u in enumerate(self._nodes):
+                self._position[u] = i
+            self._holes = 0
+
+    def remove_edge(self, u, v, *args):
+        """Removes the edge ``(u, v)`` from G; the order stays valid."""
+        self.G.remove_edge(u, v, *args)
+
+    def add_edge(self, u, v, **attr):
+        """Adds the edge ``(u, v)`` to G if it does not close a cycle.
+
+        The nodes are added to G if they are not already present.
+
+        Returns
+        -------
+        cycle : list or None
+            None if the edge was added. Otherwise the edge is not added
+            and the cycle it would close is returned as a list of edges,
+            starting with ``(u, v)``.
+        """
+        if u == v:
+            return [(u, v)]
+        self.add_node(u)
+        self.add_node(v)
+        position = self._position
+        lower, upper = position[v], position[u]
+        if lower < upper:
+            forward = self._forward(v, u, upper)
+            if isinstance(forward, list):
+                return forward
+            backward = self._backward(u, lower)
+            self._reorder(backward, forward)
+        self.G.add_edge(u, v, **attr)
+
+    def add_edges_from(self, ebunch, **attr):
+        """Adds the edges of `ebunch` in turn, as :meth:`add_edge` does.
+
+        Returns
+        -------
+        cycle : list or None
+            None if all the edges were added. Otherwise the cycle closed
+            by the first edge that was not added; the edges after it are
+            not added either.
+        """
+        for e in ebunch:
+            data = dict(attr)
+            if len(e) == 3:
+                data.update(e[2])
+            cycle = self.add_edge(e[0], e[1], **data)
+            if cycle is not None:
+                return cycle
+
+    def _forward(self, start, target, upper):
+        """Returns the set of nodes reachable from `start` before
+        position `upper`, or the cycle through `target` if it is
+        reachable."""
+        succ = self.G.succ
+        position = self._position
+        parent = {start: None}
+        stack = [start]
+        while stack:
+            w = stack.pop()
+            for z in succ[w]:
+                if z == target:
+                    path = [target, w]
+                    while parent[w] is not None:
+                        w = parent[w]
+                        path.append(w)
+                    path.append(target)
+                    path.reverse()
+                    return list(pairwise(path))
+                if z not in parent and position[z] < upper:
+                    parent[z] = w
+                    stack.append(z)
+        return set(parent)
+
+    def _backward(self, start, lower):
+        """Returns the set of nodes reaching `start` after position
+        `lower`."""
+        pred = self.G.pred
+        position = self._position
+        seen = set([start])
+        stack = [start]
+        while stack:
+            for z in pred[stack.pop()]:
+                if z not in seen and position[z] > lower:
+                    seen.add(z)
+                    stack.append(z)
+        return seen
+
+    def _reorder(self, backward, forward):
+        """Moves the nodes of `backward` before those of `forward`, using
+        the positions they already occupy."""
+        key = self._position.__getitem__
+        nodes = sorted(backward, key=key) + sorted(forward, key=key)
+        slots = sorted(map(key, nodes))
+        for v, i in zip(nodes, slots):
+            self._position[v] = i
+            self._nodes[i] = v
+
+
+class ReachabilityIndex(object):
+    """Index answering reachability queries on a directed graph.
+
+    The strongly connected components of G are numbered in topological
+    order, and every component receives interval labels computed by a few
+    depth-first traversals of the condensation, as in GRAIL [1]_. Most
+    queries are answered by comparing these numbers alone; the others by
+    a depth-first search that the labels prune. The index uses memory
+    linear in the size of G.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        A directed graph. If it is not acyclic, the index is built on its
+        condensation. G must not change while the index is in use.
+
+    labels : integer, optional (default=2)
+        Number of randomized traversals giving interval labels. More
+        labels answer more queries without search but take more memory
+        and time to build.
+
+    seed : integer, optional (default=None)
+        Seed for the random order of the traversals.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is undirected.
+
+    Attributes
+    ----------
+    nodes : list
+        The nodes of G, grouped by strongly connected component, with the
+        components in topological order. Bit ``i`` of the bitsets
+        returned by :meth:`descendants_bitset` and
+        :meth:`ancestors_bitset` stands for ``nodes[i]``.
+
+    See also
+    --------
+    descendants, ancestors, transitive_closure, condensation
+
+    Notes
+    -----
+    A query ``reachable(u, v)`` between different components is answered
+    negatively in constant time if the component of `v` precedes that of
+    `u` in topological order, or if an interval label of `v` is not
+    contained in the corresponding label of `u`. It is answered
+    positively in constant time if `v` is below `u` in the depth-first
+    forest of the first traversal. Otherwise the search only enters the
+    components whose labels contain those of `v`.
+
+    References
+    ----------
+    .. [1] H. Yildirim, V. Chaoji and M. J. Zaki, "GRAIL: Scalable
+       reachability index for large graphs", Proceedings of the VLDB
+       Endowment 3(1-2), 276-284, 2010.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 1), (3, 2)])
+    >>> index = nx.ReachabilityIndex(G)
+    >>> index.reachable(0, 2), index.reachable(2, 0)
+    (True, False)
+    >>> sorted(index.descendants(0))
+    [1, 2]
+    >>> bits = index.descendants_bitset(3)
+    >>> sorted(v for i, v in enumerate(index.nodes) if bits >> i & 1)
+    [1, 2]
+    """
+
+    def __init__(self, G, labels=2, seed=None):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for undirected type')
+        # Number the components and order them topologically.
+        components = list(nx.strongly_connected_components(G))
+        comp_of = {}
+        for i, c in enumerate(components):
+            for v in c:
+                comp_of[v] = i
+        succ = [set() for c in components]
+        for u, v in G.edges():
+            cu, cv = comp_of[u], comp_of[v]
+            if cu != cv:
+                succ[cu].add(cv)
+        indegree = [0] * len(components)
+        for ws in succ:
+            for w in ws:
+                indegree[w] += 1
+        order = [i for i, d in enumerate(indegree) if d == 0]
+        for c in order:
+            for w in succ[c]:
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    order.append(w)
+        position = [0] * len(order)
+        for i, c in enumerate(order):
+            position[c] = i
+
+        self.nodes = nodes = []
+        self._offset = offset = [0]
+        self._comp = {}
+        for i, c in enumerate(order):
+            for v in components[c]:
+                self._comp[v] = i
+                nodes.append(v)
+            offset.append(len(nodes))
+        self._index = {v: i for i, v in enumerate(nodes)}
+        self._succ = [sorted(position[w] for w in succ[c]) for c in order]
+        self._pred = [[] for c in order]
+        for c, ws in enumerate(self._succ):
+            for w in ws:
+                self._pred[w].append(c)
+
+        rng = random.Random(seed)
+        self._labels = [self._traverse(rng if i else None)
+                        for i in range(max(labels, 1))]
+
+    def _traverse(self, rng):
+        """Returns the interval labels of a depth-first traversal of the
+        components, in a random order if `rng` is not None.
+
+        The first traversal also records the preorder number and the end
+        of the subtree of each component in its depth-first forest.
+        """
+        succ = self._succ
+        n = len(succ)
+        low = [0] * n
+        post = [0] * n
+        visited = [False] * n
+        first = rng is None
+        if first:
+            self._start = start = [0] * n
+            self._end = end = [0] * n
+
+        def children(c):
+            if rng is None:
+                return iter(succ[c])
+            ws = list(succ[c])
+            rng.shuffle(ws)
+            return iter(ws)
+
+        roots = [c for c in range(n) if not self._pred[c]]
+        if rng is not None:
+            rng.shuffle(roots)
+        rank = 0
+        pre = 0
+        for root in roots:
+            visited[root] = True
+            if first:
+                start[root] = pre
+                pre += 1
+            stack = [(root, children(root))]
+            while stack:
+                c, it = stack[-1]
+                for w in it:
+                    if not visited[w]:
+                        visited[w] = True
+                        if first:
+                            start[w] = pre
+                            pre += 1
+                        stack.append((w, children(w)))
+                        break
+                else:
+                    stack.pop()
+                    lo = rank
+                    for w in succ[c]:
+                        if low[w] < lo:
+                            lo = low[w]
+                    low[c] = lo
+                    post[c] = rank
+                    rank += 1
+                    if first:
+                        end[c] = pre
+        return low, post
+
+    def _component(self, v):
+        try:
+            return self._comp[v]
+        except KeyError:
+            raise nx.NetworkXError('node %r not in graph' % (v,))
+
+    def _may_reach(self, a, b):
+        """Returns False if the labels show that component `a` does not
+        reach component `b`."""
+        for low, post in self._labels:
+            if low[a] > low[b] or post[b] > post[a]:
+                return False
+        return True
+
+    def reachable(self, u, v):
+        """Returns True if there is a path from `u` to `v` in G.
+
+        Every node is reachable from itself.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` or `v` is not in G.
+        """
+        a = self._component(u)
+        b = self._component(v)
+        if a == b:
+            return True
+        if a > b or not self._may_reach(a, b):
+            return False
+        start, end = self._start, self._end
+        if start[a] <= start[b] < end[a]:
+            return True
+        # Search the components that the labels do not exclude.
+        succ = self._succ
+        may_reach = self._may_reach
+        seen = set([a])
+        stack = [a]
+        while stack:
+            c = stack.pop()
+            for w in succ[c]:
+                if w == b or start[w] <= start[b] < end[w]:
+                    return True
+                if w < b and w not in seen and may_reach(w, b):
+                    seen.add(w)
+                    stack.append(w)
+        return False
+
+    def _reached(self, c, adj):
+        seen = set([c])
+        stack = [c]
+        while stack:
+            for w in adj[stack.pop()]:
+                if w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        return seen
+
+    def _nodes_of(self, components, exclude):
+        nodes = self.nodes
+        offset = self._offset
+        result = set()
+        for c in components:
+            result.update(nodes[offset[c]:offset[c + 1]])
+        result.discard(exclude)
+        return result
+
+    def _bitset_of(self, components, exclude):
+        offset = self._offset
+        bits = bytearray(b'0') * len(self.nodes)
+        for c in components:
+            bits[offset[c]:offset[c + 1]] = b'1' * (offset[c + 1] - offset[c])
+        bits[self._index[exclude]] = ord(b'0')
+        if not bits:
+            return 0
+        return int(bits[::-1].decode('ascii'), 2)
+
+    def descendants(self, u):
+        """Returns the set of nodes reachable from `u`, other than `u`."""
+        return self._nodes_of(self._reached(self._component(u), self._succ),
+                              u)
+
+    def ancestors(self, v):
+        """Returns the set of nodes from which `v` is reachable, other
+        than `v`."""
+        return self._nodes_of(self._reached(self._component(v), self._pred),
+                              v)
+
+    def descendants_bitset(self, u):
+        """Returns the nodes reachable from `u`, other than `u`, as an
+        integer whose bit ``i`` is set if ``nodes[i]`` is one of them."""
+        return self._bitset_of(self._reached(self._component(u), self._succ),
+                               u)
+
+    def ancestors_bitset(self, v):
+        """Returns the nodes from which `v` is reachable, other than `v`,
+        as an integer whose bit ``i`` is set if ``nodes[i]`` is one of
+        them."""
+        return self._bitset_of(self._reached(self._component(v), self._pred),
+                               v)
@@ -4,7 +4,11 @@ from .boykovkolmogorov import *
 from .dinitz_alg import *
 from .edmondskarp import *
 from .preflowpush import *
+from .arraypreflowpush import *
 from .shortestaugmentingpath import *
 from .capacityscaling import *
+from .costscaling import *
 from .networksimplex import *
+from .gomory_hu import *
 from .utils import build_flow_dict, build_residual_network
+from .utils import ArrayResidualNetwork
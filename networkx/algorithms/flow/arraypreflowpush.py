@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Highest-label preflow-push algorithm on an array residual network.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import networkx as nx
+from .utils import ArrayResidualNetwork
+from .utils import GlobalRelabelThreshold
+from .utils import highest_label_phases
+from .utils import Level
+
+__all__ = ['array_preflow_push']
+
+
+def array_preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
+                            value_only):
+    """Implementation of the highest-label preflow-push algorithm on an
+    array residual network.
+    """
+    if s not in G:
+        raise nx.NetworkXError('node %s not in graph' % str(s))
+    if t not in G:
+        raise nx.NetworkXError('node %s not in graph' % str(t))
+    if s == t:
+        raise nx.NetworkXError('source and sink are the same node')
+
+    if global_relabel_freq is None:
+        global_relabel_freq = 0
+    if global_relabel_freq < 0:
+        raise nx.NetworkXError('global_relabel_freq must be nonnegative.')
+
+    if isinstance(residual, ArrayResidualNetwork):
+        R = residual
+    else:
+        R = ArrayResidualNetwork(G, capacity)
+
+    # Work with node numbers from here on.
+    s = R.index[s]
+    t = R.index[t]
+    R.detect_unboundedness(s, t)
+
+    indptr = R.indptr
+    head = R.head
+    rev = R.rev
+    # Initialize/reset the residual network.
+    res = R.reset()
+    n = len(R)
+    excess = [0] * n
+
+    # Initialize heights of the nodes.
+    heights = R.distances_to(t)
+
+    if heights[s] < 0:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        R.graph['flow_value'] = 0
+        return R
+
+    # max_height represents the height of the highest level below level n with
+    # at least one active node.
+    max_height = max(h for u, h in enumerate(heights) if u != s)
+    heights[s] = n
+    for u in range(n):
+        if heights[u] < 0:
+            heights[u] = n + 1
+
+    grt = GlobalRelabelThreshold(n, len(head), global_relabel_freq)
+
+    # Index of the 'current arc' of each node.
+    curr_arc = indptr[:-1]
+
+    # The maximum flow must be nonzero now. Initialize the preflow by
+    # saturating all arcs emanating from s.
+    for a in range(indptr[s], indptr[s + 1]):
+        flow = res[a]
+        if flow > 0:
+            res[a] = 0
+            res[rev[a]] += flow
+            excess[s] -= flow
+            excess[head[a]] += flow
+
+    # Partition nodes into levels.
+    levels = [Level() for i in range(2 * n)]
+    for u in range(n):
+        if u != s and u != t:
+            level = levels[heights[u]]
+            if excess[u] > 0:
+                level.active.add(u)
+            else:
+                level.inactive.add(u)
+
+    def activate(v):
+        """Move a node from the inactive set to the active set of its level.
+        """
+        if v != s and v != t:
+            level = levels[heights[v]]
+            if v in level.inactive:
+                level.inactive.remove(v)
+                level.active.add(v)
+
+    def relabel(u):
+        """Relabel a node to create an admissible arc.
+        """
+        start = indptr[u]
+        end = indptr[u + 1]
+        grt.add_work(end - start)
+        return min(heights[head[a]] for a in range(start, end)
+                   if res[a] > 0) + 1
+
+    def discharge(u, is_phase1):
+        """Discharge a node until it becomes inactive or, during phase 1 (see
+        below), its height reaches at least n. The node is known to have the
+        largest height among active nodes.
+        """
+        height = heights[u]
+        a = curr_arc[u]
+        end = indptr[u + 1]
+        # next_height represents the next height to examine after discharging
+        # the current node. During phase 1, it is capped to below n.
+        next_height = height
+        levels[height].active.remove(u)
+        while True:
+            v = head[a]
+            r = res[a]
+            if r > 0 and height == heights[v] + 1:
+                flow = min(excess[u], r)
+                res[a] -= flow
+                res[rev[a]] += flow
+                excess[u] -= flow
+                excess[v] += flow
+                activate(v)
+                if excess[u] == 0:
+                    # The node has become inactive.
+                    levels[height].inactive.add(u)
+                    break
+            a += 1
+            if a == end:
+                # We have run off the end of the arc list, and there can be
+                # no more admissible arcs. Relabel the node to create one.
+                a = indptr[u]
+                height = relabel(u)
+                if is_phase1 and height >= n - 1:
+                    # Although the node is still active, with a height at least
+                    # n - 1, it is now known to be on the s side of the minimum
+                    # s-t cut. Stop processing it until phase 2.
+                    levels[height].active.add(u)
+                    break
+                # The first relabel operation after global relabeling may not
+                # increase the height of the node since the 'current arc' is
+                # not rewound. Use height instead of (height - 1) in case
+                # other active nodes at the same level are missed.
+                next_height = height
+        curr_arc[u] = a
+        heights[u] = height
+        return next_height
+
+    def global_relabel(from_sink):
+        """Apply the global relabeling heuristic.
+        """
+        src = t if from_sink else s
+        new_heights = R.distances_to(src)
+        if not from_sink:
+            # s must be reachable from t. Remove t explicitly.
+            new_heights[t] = -1
+        max_height = max(new_heights)
+        if from_sink:
+            # Also mark nodes from which t is unreachable for relabeling. This
+            # serves the same purpose as the gap heuristic.
+            for u in range(n):
+                if new_heights[u] < 0 and heights[u] < n:
+                    new_heights[u] = n + 1
+        else:
+            # Shift the computed heights because the height of s is n.
+            for u in range(n):
+                if new_heights[u] >= 0:
+                    new_heights[u] += n
+            max_height += n
+        new_heights[src] = -1
+        for u in range(n):
+            new_height = new_heights[u]
+            old_height = heights[u]
+            if new_height >= 0 and new_height != old_height:
+                if u in levels[old_height].active:
+                    levels[old_height].active.remove(u)
+                    levels[new_height].active.add(u)
+                else:
+                    levels[old_height].inactive.remove(u)
+                    levels[new_height].inactive.add(u)
+                heights[u] = new_height
+        return max_height
+
+    highest_label_phases(n, levels, max_height, discharge, global_relabel,
+                         heights.__setitem__, grt, value_only)
+
+    R.graph['flow_value'] = excess[t]
+    return R
+
+
+def array_preflow_push(G, s, t, capacity='capacity', residual=None,
+                       global_relabel_freq=1, value_only=False):
+    """Find a maximum single-commodity flow using the highest-label
+    preflow-push algorithm on an array residual network.
+
+    This is the algorithm of :func:`preflow_push`, with the same gap and
+    global relabeling heuristics, running on an
+    :class:`ArrayResidualNetwork` that stores the residual network in
+    compressed sparse row arrays with paired reverse arcs instead of a
+    DiGraph with attribute dictionaries. It returns that array residual
+    network, which the interface functions :func:`maximum_flow`,
+    :func:`maximum_flow_value`, :func:`minimum_cut` and
+    :func:`minimum_cut_value` accept.
+
+    This algorithm has a running time of `O(n^2 \sqrt{m})` for `n` nodes and
+    `m` edges.
+
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    s : node
+        Source node for the flow.
+
+    t : node
+        Sink node for the flow.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    residual : ArrayResidualNetwork
+        Array residual network of G on which the algorithm is to be
+        executed. If None, or if it is not an ArrayResidualNetwork, a new
+        residual network is created. Default value: None.
+
+    global_relabel_freq : integer, float
+        Relative frequency of applying the global relabeling heuristic to speed
+        up the algorithm. If it is None, the heuristic is disabled. Default
+        value: 1.
+
+    value_only : bool
+        If False, compute a maximum flow; otherwise, compute a maximum preflow
+        which is enough for computing the maximum flow value. Default value:
+        False.
+
+    Returns
+    -------
+    R : ArrayResidualNetwork
+        Array residual network after computing the maximum flow.
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    NetworkXUnbounded
+        If the graph has a path of infinite capacity, the value of a
+        feasible flow on the graph is unbounded above and the function
+        raises a NetworkXUnbounded.
+
+    See also
+    --------
+    :meth:`maximum_flow`
+    :meth:`minimum_cut`
+    :meth:`preflow_push`
+    :class:`ArrayResidualNetwork`
+
+    Notes
+    -----
+    The flow value is stored in :samp:`R.graph['flow_value']`. The flow
+    on arc :samp:`a` of :samp:`R` is
+    :samp:`R.capacity[a] - R.residual[a]`.
+    :meth:`ArrayResidualNetwork.flow_dict` returns the flow dictionary,
+    and with `lazy=True` a flow dictionary whose inner dictionaries are
+    only built when they are accessed.
+    :meth:`ArrayResidualNetwork.to_residual_network` returns the residual
+    network as a DiGraph, as the other flow functions do.
+
+    Passing the same residual network in the `residual` argument of
+    repeated calls on the same graph avoids building the arrays again.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> from networkx.algorithms.flow import array_preflow_push
+
+    The functions that implement flow algorithms and output a residual
+    network, such as this one, are not imported to the base NetworkX
+    namespace, so you have to explicitly import them from the flow package.
+
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x','a', capacity=3.0)
+    >>> G.add_edge('x','b', capacity=1.0)
+    >>> G.add_edge('a','c', capacity=3.0)
+    >>> G.add_edge('b','c', capacity=5.0)
+    >>> G.add_edge('b','d', capacity=4.0)
+    >>> G.add_edge('d','e', capacity=2.0)
+    >>> G.add_edge('c','y', capacity=2.0)
+    >>> G.add_edge('e','y', capacity=3.0)
+    >>> R = array_preflow_push(G, 'x', 'y')
+    >>> R.graph['flow_value']
+    3.0
+    >>> flow_value, flow_dict = nx.maximum_flow(G, 'x', 'y',
+    ...                                         flow_func=array_preflow_push)
+    >>> flow_dict['x']['b']
+    1.0
+
+    """
+    R = array_preflow_push_impl(G, s, t, capacity, residual,
+                                global_relabel_freq, value_only)
+    R.graph['algorithm'] = 'array_preflow_push'
+    return R
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+Cost scaling minimum cost flow algorithm.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+from collections import deque
+from heapq import heappop, heappush
+import networkx as nx
+from ...utils import not_implemented_for
+
+__all__ = ['cost_scaling']
+
+
+def _detect_unboundedness(n, edges):
+    """Detect negative cycles made of the infinite-capacity edges
+    `(u, v, w)` of weight `w`.
+    """
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    for u, v, w in edges:
+        if not G.has_edge(u, v) or w < G[u][v]['weight']:
+            G.add_edge(u, v, weight=w)
+    if nx.negative_edge_cycle(G):
+        raise nx.NetworkXUnbounded(
+            'Negative cost cycle of infinite capacity found. '
+            'Min cost flow may be unbounded below.')
+
+
+@not_implemented_for('undirected')
+def cost_scaling(G, demand='demand', capacity='capacity', weight='weight',
+                 alpha=16):
+    r"""Find a minimum cost flow satisfying all demands in digraph G.
+
+    This is Goldberg and Tarjan's cost scaling push-relabel algorithm [1]_.
+
+    G is a digraph with edge costs and capacities and in which nodes
+    have demand, i.e., they want to send or receive some amount of
+    flow. A negative demand means that the node wants to send flow, a
+    positive demand means that the node want to receive flow. A flow on
+    the digraph G satisfies all demand if the net flow into each node
+    is equal to the demand of that node.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        DiGraph or MultiDiGraph on which a minimum cost flow satisfying all
+        demands is to be found.
+
+    demand : string
+        Nodes of the graph G are expected to have an attribute demand
+        that indicates how much flow a node wants to send (negative
+        demand) or receive (positive demand). Note that the sum of the
+        demands should be 0 otherwise the problem in not feasible. If
+        this attribute is not present, a node is considered to have 0
+        demand. Default value: 'demand'.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    weight : string
+        Edges of the graph G are expected to have an attribute weight
+        that indicates the cost incurred by sending one unit of flow on
+        that edge. If not present, the weight is considered to be 0.
+        Default value: 'weight'.
+
+    alpha : integer
+        Factor by which the optimality tolerance is divided at each
+        scaling phase. It must be at least 2. Default value: 16.
+
+    Returns
+    -------
+    flowCost : integer
+        Cost of a minimum cost flow satisfying all demands.
+
+    flowDict : dictionary
+        If G is a digraph, a dict-of-dicts keyed by nodes such that
+        flowDict[u][v] is the flow on edge (u, v).
+        If G is a MultiDiGraph, a dict-of-dicts-of-dicts keyed by nodes
+        so that flowDict[u][v][key] is the flow on edge (u, v, key).
+
+    Raises
+    ------
+    NetworkXError
+        This exception is raised if the input graph is not directed or
+        is empty, if a node has infinite demand, if an edge has an
+        infinite weight, if an edge weight is not an integer or if
+        `alpha` is smaller than 2.
+
+    NetworkXUnfeasible
+        This exception is raised in the following situations:
+
+            * The sum of the demands is not zero. Then, there is no
+              flow satisfying all demands.
+            * An edge has negative capacity.
+            * There is no flow satisfying all demand.
+
+    NetworkXUnbounded
+        This exception is raised if the digraph G has a cycle of
+        negative cost and infinite capacity. Then, the cost of a flow
+        satisfying all demands is unbounded below.
+
+    Notes
+    -----
+    Edge weights must be integers. Capacities and demands should be
+    integers as well; floating point numbers may cause roundoff errors.
+
+    The residual network is stored in compressed sparse row arrays. Edge
+    weights are multiplied by ``n + 1``, where `n` is the number of
+    nodes of the residual network, and a flow that is :math:`\epsilon`-optimal
+    for these weights is found for decreasing values of
+    :math:`\epsilon`, starting from the largest weight and dividing by
+    `alpha` at each phase. Each phase starts by saturating the residual
+    edges of negative reduced cost and then pushes the excesses along
+    edges of negative reduced cost, relabeling nodes in first-in
+    first-out order. A flow that is 1-optimal for the scaled weights is
+    optimal. The running time is :math:`O(n^2 m \log(n C))`, where `m`
+    is the number of edges and `C` the largest absolute edge weight, and
+    does not depend on the capacities.
+
+    Feasibility is handled by an artificial node joined to the nodes
+    with nonzero demand by edges of very large weight, which carry flow
+    only if the demands cannot be satisfied.
+
+    See also
+    --------
+    :meth:`capacity_scaling`, :meth:`network_simplex`, :meth:`min_cost_flow`
+
+    Examples
+    --------
+    A simple example of a min cost flow problem.
+
+    >>> import networkx as nx
+    >>> G = nx.DiGraph()
+    >>> G.add_node('a', demand = -5)
+    >>> G.add_node('d', demand = 5)
+    >>> G.add_edge('a', 'b', weight = 3, capacity = 4)
+    >>> G.add_edge('a', 'c', weight = 6, capacity = 10)
+    >>> G.add_edge('b', 'd', weight = 1, capacity = 9)
+    >>> G.add_edge('c', 'd', weight = 2, capacity = 5)
+    >>> flowCost, flowDict = nx.cost_scaling(G)
+    >>> flowCost
+    24
+    >>> flowDict # doctest: +SKIP
+    {'a': {'c': 1, 'b': 4}, 'c': {'d': 1}, 'b': {'d': 4}, 'd': {}}
+
+    The solver can be selected in :func:`min_cost_flow`.
+
+    >>> from networkx.algorithms.flow import cost_scaling
+    >>> flowDict = nx.min_cost_flow(G, flow_func=cost_scaling)
+    >>> nx.cost_of_flow(G, flowDict)
+    24
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and R. E. Tarjan. Finding minimum-cost
+           circulations by successive approximation. Mathematics of
+           Operations Research 15(3):430-466, 1990.
+    .. [2] A. V. Goldberg. An efficient implementation of a scaling
+           minimum-cost flow algorithm. Journal of Algorithms
+           22(1):1-29, 1997.
+    """
+    if len(G) == 0:
+        raise nx.NetworkXError('graph has no nodes')
+    if alpha < 2:
+        raise nx.NetworkXError('alpha must be at least 2.')
+
+    inf = float('inf')
+    nodes = list(G)
+    n = len(nodes)
+    index = dict(zip(nodes, range(n)))
+    D = [G.node[u].get(demand, 0) for u in nodes]
+    for u, b in zip(nodes, D):
+        if abs(b) == inf:
+            raise nx.NetworkXError('node %r has infinite demand' % (u,))
+
+    if G.is_multigraph():
+        edge_list = list(G.edges(data=True, keys=True))
+    else:
+        edge_list = [(u, v, 0, e) for u, v, e in G.edges(data=True)]
+    for u, v, k, e in edge_list:
+        w = e.get(weight, 0)
+        if abs(w) == inf:
+            raise nx.NetworkXError('edge %r has infinite weight' % ((u, v),))
+        if w != int(w):
+            raise nx.NetworkXError('edge %r has a noninteger weight'
+                                   % ((u, v),))
+        if e.get(capacity, inf) < 0:
+            raise nx.NetworkXUnfeasible('edge %r has negative capacity'
+                                        % ((u, v),))
+    if sum(D) != 0:
+        raise nx.NetworkXUnfeasible('total node demand is not zero')
+
+    # Negative selfloops are saturated and other selfloops carry no flow.
+    flow_cost = 0
+    for u, v, k, e in edge_list:
+        if u == v and e.get(weight, 0) < 0:
+            if e.get(capacity, inf) == inf:
+                raise nx.NetworkXUnbounded(
+                    'Negative cost cycle of infinite capacity found. '
+                    'Min cost flow may be unbounded below.')
+            flow_cost += e[capacity] * e[weight]
+
+    # Extract edges with positive capacities. Self loops excluded.
+    edge_list = [(u, v, k, e) for u, v, k, e in edge_list
+                 if u != v and e.get(capacity, inf) > 0]
+    # Simulate infinity with a value larger than any flow an optimal
+    # solution needs on an edge.
+    faux_inf = 1 + sum(abs(b) for b in D) + \
+        sum(e[capacity] for u, v, k, e in edge_list
+            if e.get(capacity, inf) != inf)
+    edges = [(index[u], index[v], min(e.get(capacity, inf), faux_inf),
+              int(e.get(weight, 0))) for u, v, k, e in edge_list]
+    _detect_unboundedness(n, [(index[u], index[v], int(e.get(weight, 0)))
+                              for u, v, k, e in edge_list
+                              if e.get(capacity, inf) == inf])
+
+    # Join the artificial root node n to the nodes with nonzero demand by
+    # edges whose weight exceeds the cost of any simple path.
+    C = max([abs(w) for u, v, r, w in edges] or [0])
+    big = n * C + 1
+    for i, b in enumerate(D):
+        if b < 0:
+            edges.append((i, n, faux_inf, big))
+        elif b > 0:
+            edges.append((n, i, faux_inf, big))
+    N = n + 1
+
+    # Build the residual network in CSR form. Each edge gives an arc out
+    # of its tail and a reverse arc out of its head, paired through rev.
+    indptr = [0] * (N + 1)
+    for u, v, r, w in edges:
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for i in range(N):
+        indptr[i + 1] += indptr[i]
+    m = indptr[N]
+    pos = indptr[:-1]
+    head = [0] * m
+    res = [0] * m
+    cost = [0] * m
+    rev = [0] * m
+    arc_of_edge = []
+    for u, v, r, w in edges:
+        a = pos[u]
+        pos[u] += 1
+        b = pos[v]
+        pos[v] += 1
+        head[a] = v
+        head[b] = u
+        res[a] = r
+        cost[a] = w * (N + 1)
+        cost[b] = -w * (N + 1)
+        rev[a] = b
+        rev[b] = a
+        arc_of_edge.append(a)
+
+    excess = [-b for b in D] + [0]
+    pi = [0] * N
+    curr_arc = [0] * N
+
+    def update_prices(eps):
+        """Lower the potentials by eps times the distances to the nodes
+        with a deficit, measured in number of relabelings.
+        """
+        dist = [None] * N
+        heap = []
+        for u in range(N):
+            if excess[u] < 0:
+                dist[u] = 0
+                heap.append((0, u))
+        pending = sum(1 for u in range(N) if excess[u] > 0)
+        d = 0
+        while heap and pending:
+            d, w = heappop(heap)
+            if d > dist[w]:
+                continue
+            if excess[w] > 0:
+                pending -= 1
+            p_w = pi[w]
+            for b in range(indptr[w], indptr[w + 1]):
+                a = rev[b]
+                if res[a] > 0:
+                    v = head[b]
+                    rc = cost[a] + pi[v] - p_w
+                    d_v = d + rc // eps + 1 if rc >= 0 else d
+                    if dist[v] is None or d_v < dist[v]:
+                        dist[v] = d_v
+                        heappush(heap, (d_v, v))
+        # Nodes not scanned are not closer than the last scanned node.
+        for u in range(N):
+            d_u = dist[u]
+            pi[u] -= (d if d_u is None or d_u > d else d_u) * eps
+            curr_arc[u] = indptr[u]
+
+    def refine(eps):
+        """Turn the flow into an eps-optimal flow.
+        """
+        # Saturate the residual arcs with negative reduced costs.
+        for u in range(N):
+            p_u = pi[u]
+            for a in range(indptr[u], indptr[u + 1]):
+                r = res[a]
+                if r > 0:
+                    v = head[a]
+                    if cost[a] + p_u - pi[v] < 0:
+                        res[a] = 0
+                        res[rev[a]] += r
+                        excess[u] -= r
+                        excess[v] += r
+        update_prices(eps)
+
+        # Discharge the active nodes in first-in first-out order, updating
+        # the potentials globally after every N relabelings.
+        active = deque(u for u in range(N) if excess[u] > 0)
+        relabels = 0
+        while active:
+            u = active.popleft()
+            e_u = excess[u]
+            p_u = pi[u]
+            a = curr_arc[u]
+            end = indptr[u + 1]
+            while True:
+                r = res[a]
+                if r > 0:
+                    v = head[a]
+                    if cost[a] + p_u - pi[v] < 0:
+                        flow = e_u if e_u < r else r
+                        res[a] = r - flow
+                        res[rev[a]] += flow
+                        e_u -= flow
+                        e_v = excess[v]
+                        excess[v] = e_v + flow
+                        if e_v <= 0 < e_v + flow:
+                            active.append(v)
+                        if e_u == 0:
+                            break
+                a += 1
+                if a == end:
+                    # Relabel the node to create an admissible arc.
+                    a = indptr[u]
+                    p_u = max(pi[head[b]] - cost[b] for b in range(a, end)
+                              if res[b] > 0) - eps
+                    pi[u] = p_u
+                    relabels += 1
+            excess[u] = 0
+            curr_arc[u] = a
+            if relabels >= N // 2:
+                relabels = 0
+                update_prices(eps)
+
+    eps = max(abs(c) for c in cost) if cost else 0
+    while True:
+        eps = max(eps // alpha, 1)
+        refine(eps)
+        if eps == 1:
+            break
+
+    for a in arc_of_edge[len(edge_list):]:
+        if res[rev[a]] > 0:
+            raise nx.NetworkXUnfeasible('no flow satisfies all node demands')
+
+    # Compute the flow of the edges and the flow cost.
+    flows = [res[rev[a]] for a in arc_of_edge[:len(edge_list)]]
+    for (u, v, r, w), flow in zip(edges, flows):
+        flow_cost += w * flow
+
+    flow_dict = {}
+    if G.is_multigraph():
+        for u in G:
+            flow_dict[u] = dict(
+                (v, dict((k, 0) for k in es)) for v, es in G[u].items())
+        for u, v, k, e in G.selfloop_edges(data=True, keys=True):
+            if e.get(weight, 0) < 0:
+                flow_dict[u][v][k] = e[capacity]
+        for (u, v, k, e), flow in zip(edge_list, flows):
+            flow_dict[u][v][k] = flow
+    else:
+        for u in G:
+            flow_dict[u] = dict((v, 0) for v in G[u])
+        for u, v, e in G.selfloop_edges(data=True):
+            if e.get(weight, 0) < 0:
+                flow_dict[u][v] = e[capacity]
+        for (u, v, k, e), flow in zip(edge_list, flows):
+            flow_dict[u][v] = flow
+    return flow_cost, flow_dict
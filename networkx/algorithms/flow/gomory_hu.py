@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Gomory-Hu tree of undirected graphs.
+"""
+import networkx as nx
+from networkx.utils import not_implemented_for
+
+from .maxflow import default_flow_func, minimum_cut
+from .utils import build_residual_network
+
+__all__ = ['gomory_hu_tree', 'gomory_hu_minimum_cut']
+
+
+class _CutSolver(object):
+    """Compute minimum cuts of a graph reusing one residual network."""
+
+    def __init__(self, G, capacity, flow_func):
+        self.G = G
+        self.capacity = capacity
+        self.flow_func = flow_func
+        self.R = build_residual_network(G, capacity)
+
+    def __call__(self, pair):
+        s, t = pair
+        cut_value, partition = minimum_cut(self.G, s, t,
+                                           capacity=self.capacity,
+                                           flow_func=self.flow_func,
+                                           residual=self.R)
+        return cut_value, partition[0]
+
+
+# Cut solver shared with the worker processes of a pool.
+_cut_solver = None
+
+
+def _init_cut_worker(G, capacity, flow_func):
+    global _cut_solver
+    _cut_solver = _CutSolver(G, capacity, flow_func)
+
+
+def _cut_worker(pair):
+    return _cut_solver(pair)
+
+
+@not_implemented_for('directed')
+def gomory_hu_tree(G, capacity='capacity', flow_func=None, n_jobs=None):
+    """Returns the Gomory-Hu tree of an undirected graph G.
+
+    A Gomory-Hu tree of an undirected graph with capacities is a
+    weighted tree that represents the minimum s-t cuts for all s-t
+    pairs in the graph: the value of a minimum s-t cut is the minimum
+    edge weight on the path between s and t in the tree, and removing
+    that edge from the tree gives the two sides of the cut.
+
+    The tree is built with Gusfield's algorithm [1]_, which needs only
+    ``n - 1`` maximum flow computations on the input graph, without
+    node contractions, instead of the ``n (n - 1) / 2`` computations
+    needed to find all minimum cuts one pair at a time.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Undirected graph
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    flow_func : function
+        Function to perform the underlying flow computations. It has to
+        accept the `residual` keyword argument of the flow functions in
+        :mod:`networkx.algorithms.flow`, because a single residual
+        network is reused for all computations. Default value
+        :func:`preflow_push`. The choice of the default function may
+        change from version to version and should not be relied on.
+
+    n_jobs : int, optional (default=None)
+        Number of worker processes used to run the independent maximum
+        flow computations in parallel. If None or 1 all computations run
+        in the current process. The tree does not depend on `n_jobs`.
+
+    Returns
+    -------
+    Tree : NetworkX graph
+        A NetworkX graph representing the Gomory-Hu tree of the input
+        graph. The cut values are stored in the edge attribute 'weight'.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If the input graph is directed.
+
+    NetworkXError
+        If the input graph is empty.
+
+    Examples
+    --------
+    >>> G = nx.karate_club_graph()
+    >>> nx.set_edge_attributes(G, 'capacity', 1)
+    >>> T = nx.gomory_hu_tree(G)
+    >>> cut_value, partition = nx.gomory_hu_minimum_cut(T, 0, 33)
+    >>> cut_value == nx.minimum_cut_value(G, 0, 33)
+    True
+
+    Notes
+    -----
+    Gusfield's algorithm processes the nodes in a fixed order, computing
+    a minimum cut between each node and its current parent in the tree.
+    Processing a node only changes the parents of nodes that share its
+    parent, so the parent of the first unprocessed node of every group
+    of nodes with a common parent is already final and its cut can be
+    computed ahead of its turn. With `n_jobs` larger than one these
+    independent computations run in parallel, each worker process
+    reusing its own residual network, and the tree is the same as the
+    one found sequentially.
+
+    See also
+    --------
+    :func:`gomory_hu_minimum_cut`
+    :func:`minimum_cut`
+    :func:`maximum_flow`
+
+    References
+    ----------
+    .. [1] Gusfield D: Very simple methods for all pairs network flow
+           analysis. SIAM J Comput 19(1):143-155, 1990.
+
+    """
+    if flow_func is None:
+        flow_func = default_flow_func
+
+    if len(G) == 0:
+        msg = 'Empty Graph does not have a Gomory-Hu tree representation'
+        raise nx.NetworkXError(msg)
+
+    nodes = list(G)
+    n = len(nodes)
+    parent = [0] * n
+    value = [0] * n
+    pool = None
+    if n_jobs is not None and n_jobs > 1 and n > 2:
+        from multiprocessing import Pool
+        pool = Pool(n_jobs, _init_cut_worker, (G, capacity, flow_func))
+        solve = lambda pairs: pool.map(_cut_worker, pairs)
+    else:
+        solver = _CutSolver(G, capacity, flow_func)
+        solve = lambda pairs: [solver(pair) for pair in pairs]
+    try:
+        cuts = {}
+        s = 1
+        while s < n:
+            # The cut of the first pending node of each group of nodes
+            # sharing a parent is computed ahead of its turn: the parent
+            # of such a node does not change until it is processed.
+            ready = []
+            groups = set()
+            for i in range(s, n):
+                if parent[i] not in groups:
+                    groups.add(parent[i])
+                    if cuts.get(i, (None,))[0] != parent[i]:
+                        ready.append(i)
+            pairs = [(nodes[i], nodes[parent[i]]) for i in ready]
+            for i, cut in zip(ready, solve(pairs)):
+                cuts[i] = (parent[i],) + tuple(cut)
+            # Process the nodes in order while their cuts are known.
+            while s < n and cuts.get(s, (None,))[0] == parent[s]:
+                t, cut_value, side = cuts.pop(s)
+                value[s] = cut_value
+                for i in range(1, n):
+                    if i != s and parent[i] == t and nodes[i] in side:
+                        parent[i] = s
+                if t != 0 and nodes[parent[t]] in side:
+                    parent[s] = parent[t]
+                    parent[t] = s
+                    value[s] = value[t]
+                    value[t] = cut_value
+                s += 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    T = nx.Graph()
+    T.add_nodes_from(nodes)
+    T.add_weighted_edges_from((nodes[i], nodes[parent[i]], value[i])
+                              for i in range(1, n))
+    return T
+
+
+def gomory_hu_minimum_cut(T, s, t, weight='weight'):
+    """Returns the value and the node partition of a minimum (s, t)-cut
+    read from a Gomory-Hu tree.
+
+    Parameters
+    ----------
+    T : NetworkX graph
+        Gomory-Hu tree as returned by :func:`gomory_hu_tree`.
+
+    s : node
+        Source node.
+
+    t : node
+        Sink node.
+
+    weight : string
+        Edge attribute of the tree holding the cut values.
+        Default value: 'weight'.
+
+    Returns
+    -------
+    cut_value : integer, float
+        Value of a minimum (s, t)-cut in the graph the tree was built
+        from, the minimum edge weight on the path from s to t in `T`.
+
+    partition : pair of node sets
+        A partitioning of the nodes that defines a minimum cut; the
+        first set contains `s`.
+
+    Raises
+    ------
+    NetworkXError
+        If s and t are the same node or if they are not connected in
+        `T`.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_edge('a', 'b', capacity=3)
+    >>> G.add_edge('b', 'c', capacity=1)
+    >>> G.add_edge('a', 'c', capacity=1)
+    >>> T = nx.gomory_hu_tree(G)
+    >>> cut_value, partition = nx.gomory_hu_minimum_cut(T, 'a', 'c')
+    >>> cut_value
+    2
+    >>> sorted(partition[0]), sorted(partition[1])
+    (['a', 'b'], ['c'])
+
+    See also
+    --------
+    :func:`gomory_hu_tree`
+
+    """
+    if s == t:
+        raise nx.NetworkXError('source and sink are the same node')
+    try:
+        path = nx.shortest_path(T, s, t)
+    except nx.NetworkXNoPath:
+        raise nx.NetworkXError('%s and %s are not connected in the tree'
+                               % (s, t))
+    edges = zip(path[:-1], path[1:])
+    u, v = min(edges, key=lambda e: T[e[0]][e[1]][weight])
+    # The side of s is the tree component of s without the edge (u, v).
+    side = {s}
+    stack = [s]
+    while stack:
+        x = stack.pop()
+        for y in T[x]:
+            if y not in side and set((x, y)) != set((u, v)):
+                side.add(y)
+                stack.append(y)
+    return T[u][v][weight], (side, set(T) - side)
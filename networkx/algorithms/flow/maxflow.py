@@ -4,16 +4,19 @@ Maximum flow (and minimum cut) algorithms on capacitated graphs.
 """
 import networkx as nx
 
+from .arraypreflowpush import array_preflow_push
 from .boykovkolmogorov import boykov_kolmogorov
 from .dinitz_alg import dinitz
 from .edmondskarp import edmonds_karp
 from .preflowpush import preflow_push
 from .shortestaugmentingpath import shortest_augmenting_path
 from .utils import build_flow_dict
+from .utils import ArrayResidualNetwork
 # Define the default flow function for computing maximum flow.
 default_flow_func = preflow_push
 # Functions that don't support cutoff for minimum cut computations.
 flow_funcs = [
+    array_preflow_push,
     boykov_kolmogorov,
     dinitz,
     edmonds_karp,
@@ -455,6 +458,8 @@ def minimum_cut(G, s, t, capacity='capacity', flow_func=None, **kwargs):
         raise nx.NetworkXError("cutoff should not be specified.")
 
     R = flow_func(G, s, t, capacity=capacity, value_only=True, **kwargs)
+    if isinstance(R, ArrayResidualNetwork):
+        return (R.graph['flow_value'], R.minimum_cut_partition(t))
     # Remove saturated edges from the residual network 
     cutset = [(u, v, d) for u, v, d in R.edges(data=True)
               if d['flow'] == d['capacity']]
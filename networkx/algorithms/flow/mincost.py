@@ -18,7 +18,7 @@ import networkx as nx
 
 
 def min_cost_flow_cost(G, demand = 'demand', capacity = 'capacity',
-                        weight = 'weight'):
+                        weight = 'weight', simplex = None, flow_func = None):
     r"""Find the cost of a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -54,6 +54,19 @@ def min_cost_flow_cost(G, demand = 'demand', capacity = 'capacity',
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    simplex : NetworkSimplex, optional (default=None)
+        Solver built on G and reused between calls. If given, its data
+        are read again from the graph and the minimum cost flow is
+        reoptimized from the basis of its previous solve. The attribute
+        names of the solver are used instead of the ones given here.
+
+    flow_func : function, optional (default=None)
+        Function used to find the minimum cost flow when `simplex` is
+        None. It must accept a graph and the `demand`, `capacity` and
+        `weight` keyword arguments, and return the cost of the flow and
+        the flow dictionary, like :func:`network_simplex` (the default),
+        :func:`capacity_scaling` and :func:`cost_scaling`.
+
     Returns
     -------
     flowCost : integer, float
@@ -79,7 +92,8 @@ def min_cost_flow_cost(G, demand = 'demand', capacity = 'capacity',
 
     See also
     --------
-    cost_of_flow, max_flow_min_cost, min_cost_flow, network_simplex
+    cost_of_flow, max_flow_min_cost, min_cost_flow, network_simplex,
+    NetworkSimplex, capacity_scaling, cost_scaling
 
     Notes
     -----
@@ -105,12 +119,17 @@ def min_cost_flow_cost(G, demand = 'demand', capacity = 'capacity',
     >>> flowCost
     24
     """
-    return nx.network_simplex(G, demand = demand, capacity = capacity,
-                              weight = weight)[0]
+    if simplex is not None:
+        simplex.update()
+        return simplex.solve()[0]
+    if flow_func is None:
+        flow_func = nx.network_simplex
+    return flow_func(G, demand = demand, capacity = capacity,
+                     weight = weight)[0]
 
 
 def min_cost_flow(G, demand = 'demand', capacity = 'capacity',
-                  weight = 'weight'):
+                  weight = 'weight', simplex = None, flow_func = None):
     r"""Return a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -146,6 +165,19 @@ def min_cost_flow(G, demand = 'demand', capacity = 'capacity',
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    simplex : NetworkSimplex, optional (default=None)
+        Solver built on G and reused between calls. If given, its data
+        are read again from the graph and the minimum cost flow is
+        reoptimized from the basis of its previous solve. The attribute
+        names of the solver are used instead of the ones given here.
+
+    flow_func : function, optional (default=None)
+        Function used to find the minimum cost flow when `simplex` is
+        None. It must accept a graph and the `demand`, `capacity` and
+        `weight` keyword arguments, and return the cost of the flow and
+        the flow dictionary, like :func:`network_simplex` (the default),
+        :func:`capacity_scaling` and :func:`cost_scaling`.
+
     Returns
     -------
     flowDict : dictionary
@@ -172,7 +204,8 @@ def min_cost_flow(G, demand = 'demand', capacity = 'capacity',
 
     See also
     --------
-    cost_of_flow, max_flow_min_cost, min_cost_flow_cost, network_simplex
+    cost_of_flow, max_flow_min_cost, min_cost_flow_cost, network_simplex,
+    NetworkSimplex, capacity_scaling, cost_scaling
 
     Notes
     -----
@@ -196,8 +229,13 @@ def min_cost_flow(G, demand = 'demand', capacity = 'capacity',
     >>> G.add_edge('c', 'd', weight = 2, capacity = 5)
     >>> flowDict = nx.min_cost_flow(G)
     """
-    return nx.network_simplex(G, demand = demand, capacity = capacity,
-                              weight = weight)[1]
+    if simplex is not None:
+        simplex.update()
+        return simplex.solve()[1]
+    if flow_func is None:
+        flow_func = nx.network_simplex
+    return flow_func(G, demand = demand, capacity = capacity,
+                     weight = weight)[1]
 
 
 def cost_of_flow(G, flowDict, weight = 'weight'):
@@ -245,7 +283,8 @@ def cost_of_flow(G, flowDict, weight = 'weight'):
                 for u, v, d in G.edges(data = True)))
 
 
-def max_flow_min_cost(G, s, t, capacity = 'capacity', weight = 'weight'):
+def max_flow_min_cost(G, s, t, capacity = 'capacity', weight = 'weight',
+                      simplex = None):
     """Return a maximum (s, t)-flow of minimum cost.
 
     G is a digraph with edge costs and capacities. There is a source
@@ -276,6 +315,12 @@ def max_flow_min_cost(G, s, t, capacity = 'capacity', weight = 'weight'):
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    simplex : NetworkSimplex, optional (default=None)
+        Solver built on G and reused between calls. If given, the
+        demands of s and t are set to the maximum flow value, the other
+        data are read again from the graph, and the minimum cost flow is
+        reoptimized from the basis of the previous solve.
+
     Returns
     -------
     flowDict: dictionary
@@ -297,7 +342,8 @@ def max_flow_min_cost(G, s, t, capacity = 'capacity', weight = 'weight'):
 
     See also
     --------
-    cost_of_flow, min_cost_flow, min_cost_flow_cost, network_simplex
+    cost_of_flow, min_cost_flow, min_cost_flow_cost, network_simplex,
+    NetworkSimplex
 
     Notes
     -----
@@ -337,6 +383,9 @@ def max_flow_min_cost(G, s, t, capacity = 'capacity', weight = 'weight'):
 
     """
     maxFlow = nx.maximum_flow_value(G, s, t, capacity = capacity)
+    if simplex is not None:
+        simplex.update(demands = {s: -maxFlow, t: maxFlow})
+        return simplex.solve()[1]
     H = nx.DiGraph(G)
     H.add_node(s, demand = -maxFlow)
     H.add_node(t, demand = maxFlow)
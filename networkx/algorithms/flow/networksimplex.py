@@ -8,7 +8,7 @@ __author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
 # All rights reserved.
 # BSD license.
 
-__all__ = ['network_simplex']
+__all__ = ['network_simplex', 'NetworkSimplex']
 
 from itertools import chain, islice, repeat
 from math import ceil, sqrt
@@ -180,419 +180,704 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
            optimization.
            INFOR 17(1):16--34. 1979.
     """
-    ###########################################################################
-    # Problem essentials extraction and sanity check
-    ###########################################################################
-
-    if len(G) == 0:
-        raise nx.NetworkXError('graph has no nodes')
-
-    # Number all nodes and edges and hereafter reference them using ONLY their
-    # numbers
-
-    N = list(G)                                # nodes
-    I = {u: i for i, u in enumerate(N)}        # node indices
-    D = [G.node[u].get(demand, 0) for u in N]  # node demands
-
-    inf = float('inf')
-    for p, b in zip(N, D):
-        if abs(b) == inf:
-            raise nx.NetworkXError('node %r has infinite demand' % (p,))
-
-    multigraph = G.is_multigraph()
-    S = []  # edge sources
-    T = []  # edge targets
-    if multigraph:
-        K = []  # edge keys
-    E = {}  # edge indices
-    U = []  # edge capacities
-    C = []  # edge weights
-
-    if not multigraph:
-        edges = G.edges(data=True)
-    else:
-        edges = G.edges(data=True, keys=True)
-    edges = (e for e in edges
-             if e[0] != e[1] and e[-1].get(capacity, inf) != 0)
-    for i, e in enumerate(edges):
-        S.append(I[e[0]])
-        T.append(I[e[1]])
-        if multigraph:
-            K.append(e[2])
-        E[e[:-1]] = i
-        U.append(e[-1].get(capacity, inf))
-        C.append(e[-1].get(weight, 0))
-
-    for e, c in zip(E, C):
-        if abs(c) == inf:
-            raise nx.NetworkXError('edge %r has infinite weight' % (e,))
-    if not multigraph:
-        edges = G.selfloop_edges(data=True)
-    else:
-        edges = G.selfloop_edges(data=True, keys=True)
-    for e in edges:
-        if abs(e[-1].get(weight, 0)) == inf:
-            raise nx.NetworkXError('edge %r has infinite weight' % (e[:-1],))
-
-    ###########################################################################
-    # Quick infeasibility detection
-    ###########################################################################
-
-    if sum(D) != 0:
-        raise nx.NetworkXUnfeasible('total node demand is not zero')
-    for e, u in zip(E, U):
-        if u < 0:
-            raise nx.NetworkXUnfeasible('edge %r has negative capacity' % (e,))
-    if not multigraph:
-        edges = G.selfloop_edges(data=True)
-    else:
-        edges = G.selfloop_edges(data=True, keys=True)
-    for e in edges:
-        if e[-1].get(capacity, inf) < 0:
-            raise nx.NetworkXUnfeasible(
-                'edge %r has negative capacity' % (e[:-1],))
-
-    ###########################################################################
-    # Initialization
-    ###########################################################################
-
-    # Add a dummy node -1 and connect all existing nodes to it with infinite-
-    # capacity dummy edges. Node -1 will serve as the root of the
-    # spanning tree of the network simplex method. The new edges will used to
-    # trivially satisfy the node demands and create an initial strongly
-    # feasible spanning tree.
-    n = len(N)  # number of nodes
-    for p, d in enumerate(D):
-        if d > 0:  # Must be greater-than here. Zero-demand nodes must have
-                   # edges pointing towards the root to ensure strong
-                   # feasibility.
-            S.append(-1)
-            T.append(p)
+    return NetworkSimplex(G, demand=demand, capacity=capacity,
+                          weight=weight).solve()
+
+
+class NetworkSimplex(object):
+    r"""Primal network simplex solver that keeps its basis between solves.
+
+    The solver extracts the nodes and edges of the digraph G once and
+    stores the problem and the spanning tree basis of the network
+    simplex method in flat lists indexed by node and edge numbers. After
+    a solve, the demands, capacities and weights can be changed with
+    :meth:`update` and :meth:`solve` reoptimizes starting from the
+    previous optimal spanning tree instead of from scratch. When the
+    changes are small, as for a problem solved over and over with
+    slightly different data, only a few pivots are needed.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        DiGraph on which a minimum cost flow satisfying all demands is
+        to be found. The nodes and edges of G must not change while the
+        solver is in use; the node and edge attributes may.
+
+    demand : string
+        Node attribute holding the demand of the node. If this attribute
+        is not present, a node is considered to have 0 demand. Default
+        value: 'demand'.
+
+    capacity : string
+        Edge attribute holding the capacity of the edge. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    weight : string
+        Edge attribute holding the cost of sending one unit of flow on
+        the edge. If not present, the weight is considered to be 0.
+        Default value: 'weight'.
+
+    block_size : int, optional (default=None)
+        Number of edges searched for the entering edge of each pivot.
+        The edges are searched cyclically in blocks of this size and
+        the edge with the most negative reduced cost of the first block
+        holding an eligible edge enters the basis. If None, the square
+        root of the number of edges is used.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is undirected.
+
+    NetworkXError
+        If G has no nodes, or a node has infinite demand or an edge has
+        infinite weight.
+
+    NetworkXUnfeasible
+        If the sum of the demands is not zero or an edge has negative
+        capacity.
+
+    See also
+    --------
+    network_simplex, min_cost_flow, max_flow_min_cost
+
+    Notes
+    -----
+    A warm start sets the edges outside the spanning tree to their
+    bounds under the new capacities and recomputes the flows on the tree
+    edges from the new demands. The subtree below a tree edge whose flow
+    would violate its bounds, or that would break the strong feasibility
+    of the tree, is reattached to the artificial root of the method
+    through its artificial edge. The flows are then feasible for the
+    modified problem and the pivots proceed as after a cold start.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.DiGraph()
+    >>> G.add_node('a', demand=-5)
+    >>> G.add_node('d', demand=5)
+    >>> G.add_edge('a', 'b', weight=3, capacity=4)
+    >>> G.add_edge('a', 'c', weight=6, capacity=10)
+    >>> G.add_edge('b', 'd', weight=1, capacity=9)
+    >>> G.add_edge('c', 'd', weight=2, capacity=5)
+    >>> simplex = nx.NetworkSimplex(G)
+    >>> flowCost, flowDict = simplex.solve()
+    >>> flowCost
+    24
+
+    Change the data and reoptimize from the previous basis. Values that
+    are not given to :meth:`update` are read again from the graph.
+
+    >>> G['a']['b']['capacity'] = 5
+    >>> simplex.update(demands={'a': -6, 'd': 6})
+    >>> flowCost, flowDict = simplex.solve()
+    >>> flowCost
+    28
+    """
+
+    def __init__(self, G, demand='demand', capacity='capacity',
+                 weight='weight', block_size=None):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for undirected type')
+        if len(G) == 0:
+            raise nx.NetworkXError('graph has no nodes')
+
+        self.G = G
+        self.demand = demand
+        self.capacity = capacity
+        self.weight = weight
+        self.block_size = block_size
+
+        # Number all nodes and edges and hereafter reference them using ONLY
+        # their numbers
+        self.N = N = list(G)                       # nodes
+        self.I = I = {u: i for i, u in enumerate(N)}  # node indices
+        self.multigraph = multigraph = G.is_multigraph()
+        self.S = S = []  # edge sources
+        self.T = T = []  # edge targets
+        self.E = E = {}  # edge indices
+        self.loops = []  # self-loops
+        if not multigraph:
+            edges = G.edges()
         else:
-            S.append(p)
-            T.append(-1)
-    faux_inf = 3 * max(chain([sum(u for u in U if u < inf),
-                              sum(abs(c) for c in C)],
-                             (abs(d) for d in D))) or 1
-    C.extend(repeat(faux_inf, n))
-    U.extend(repeat(faux_inf, n))
-
-    # Construct the initial spanning tree.
-    e = len(E)                                           # number of edges
-    x = list(chain(repeat(0, e), (abs(d) for d in D)))   # edge flows
-    pi = [faux_inf if d <= 0 else -faux_inf for d in D]  # node potentials
-    parent = list(chain(repeat(-1, n), [None]))  # parent nodes
-    edge = list(range(e, e + n))                 # edges to parents
-    size = list(chain(repeat(1, n), [n + 1]))    # subtree sizes
-    next = list(chain(range(1, n), [-1, 0]))     # next nodes in depth-first thread
-    prev = list(range(-1, n))                    # previous nodes in depth-first thread
-    last = list(chain(range(n), [n - 1]))        # last descendants in depth-first thread
-
-    ###########################################################################
-    # Pivot loop
-    ###########################################################################
-
-    def reduced_cost(i):
-        """Return the reduced cost of an edge i.
+            edges = G.edges(keys=True)
+        for e in edges:
+            if e[0] == e[1]:
+                self.loops.append(e)
+                continue
+            E[e] = len(S)
+            S.append(I[e[0]])
+            T.append(I[e[1]])
+
+        # Spanning tree basis of the last solve.
+        self._basis = None
+        self.update()
+
+    def _edge_data(self, e):
+        """Return the attribute dictionary of an edge.
         """
-        c = C[i] - pi[S[i]] + pi[T[i]]
-        return c if x[i] == 0 else -c
-
-    def find_entering_edges():
-        """Yield entering edges until none can be found.
+        if self.multigraph:
+            return self.G[e[0]][e[1]][e[2]]
+        return self.G[e[0]][e[1]]
+
+    def update(self, demands=None, capacities=None, weights=None):
+        """Set the demands, capacities and weights of the next solve.
+
+        Parameters
+        ----------
+        demands : dictionary, optional (default=None)
+            Demands keyed by node. The demands of the other nodes are
+            read from the node attributes of the graph.
+
+        capacities : dictionary, optional (default=None)
+            Capacities keyed by edge, given as ``(u, v)`` tuples, or
+            ``(u, v, key)`` tuples for multigraphs. The capacities of
+            the other edges are read from the edge attributes of the
+            graph.
+
+        weights : dictionary, optional (default=None)
+            Weights keyed by edge. The weights of the other edges are
+            read from the edge attributes of the graph.
+
+        Raises
+        ------
+        NetworkXError
+            If a node has infinite demand, an edge has infinite weight
+            or a key of the dictionaries is not a node or an edge of
+            the graph.
+
+        NetworkXUnfeasible
+            If the sum of the demands is not zero or an edge has negative
+            capacity.
         """
-        if e == 0:
-            return
-
-        # Entering edges are found by combining Dantzig's rule and Bland's
-        # rule. The edges are cyclically grouped into blocks of size B. Within
-        # each block, Dantzig's rule is applied to find an entering edge. The
-        # blocks to search is determined following Bland's rule.
-        B = int(ceil(sqrt(e)))  # pivot block size
-        M = (e + B - 1) // B    # number of blocks needed to cover all edges
-        m = 0                   # number of consecutive blocks without eligible
-                                # entering edges
-        f = 0                   # first edge in block
-        while m < M:
-            # Determine the next block of edges.
-            l = f + B
-            if l <= e:
-                edges = range(f, l)
-            else:
-                l -= e
-                edges = chain(range(f, e), range(l))
-            f = l
-            # Find the first edge with the lowest reduced cost.
-            i = min(edges, key=reduced_cost)
-            c = reduced_cost(i)
-            if c >= 0:
-                # No entering edge found in the current block.
-                m += 1
-            else:
-                # Entering edge found.
-                if x[i] == 0:
-                    p = S[i]
-                    q = T[i]
-                else:
-                    p = T[i]
-                    q = S[i]
-                yield i, p, q
-                m = 0
-        # All edges have nonnegative reduced costs. The current flow is
-        # optimal.
-
-    def find_apex(p, q):
-        """Find the lowest common ancestor of nodes p and q in the spanning
-        tree.
+        G = self.G
+        N = self.N
+        I = self.I
+        inf = float('inf')
+        D = [G.node[u].get(self.demand, 0) for u in N]  # node demands
+        for u, b in (demands or {}).items():
+            try:
+                D[I[u]] = b
+            except KeyError:
+                raise nx.NetworkXError('node %r not in graph' % (u,))
+        for p, b in zip(N, D):
+            if abs(b) == inf:
+                raise nx.NetworkXError('node %r has infinite demand' % (p,))
+
+        capacities = capacities or {}
+        weights = weights or {}
+        for e in chain(capacities, weights):
+            if e not in self.E and e not in self.loops:
+                raise nx.NetworkXError('edge %r not in graph' % (e,))
+
+        def edge_values(e):
+            attr = self._edge_data(e)
+            u = capacities[e] if e in capacities else \
+                attr.get(self.capacity, inf)
+            c = weights[e] if e in weights else attr.get(self.weight, 0)
+            return u, c
+
+        U = [None] * len(self.E)  # edge capacities
+        C = [None] * len(self.E)  # edge weights
+        for e, i in self.E.items():
+            U[i], C[i] = edge_values(e)
+        loops = [(e,) + edge_values(e) for e in self.loops]
+
+        for e, i in self.E.items():
+            if abs(C[i]) == inf:
+                raise nx.NetworkXError('edge %r has infinite weight' % (e,))
+        for e, u, c in loops:
+            if abs(c) == inf:
+                raise nx.NetworkXError('edge %r has infinite weight' % (e,))
+
+        if sum(D) != 0:
+            raise nx.NetworkXUnfeasible('total node demand is not zero')
+        for e, i in self.E.items():
+            if U[i] < 0:
+                raise nx.NetworkXUnfeasible(
+                    'edge %r has negative capacity' % (e,))
+        for e, u, c in loops:
+            if u < 0:
+                raise nx.NetworkXUnfeasible(
+                    'edge %r has negative capacity' % (e,))
+
+        self.D = D
+        self.U = U
+        self.C = C
+        self.loop_values = loops
+
+    def solve(self):
+        """Find a minimum cost flow satisfying all demands.
+
+        The first solve starts from the trivial basis of the network
+        simplex method; the next ones start from the previous basis.
+
+        Returns
+        -------
+        flowCost : integer, float
+            Cost of a minimum cost flow satisfying all demands.
+
+        flowDict : dictionary
+            Dictionary of dictionaries keyed by nodes such that
+            flowDict[u][v] is the flow edge (u, v).
+
+        Raises
+        ------
+        NetworkXUnfeasible
+            If there is no flow satisfying all demands.
+
+        NetworkXUnbounded
+            If the digraph G has a cycle of negative cost and infinite
+            capacity.
         """
-        size_p = size[p]
-        size_q = size[q]
-        while True:
-            while size_p < size_q:
-                p = parent[p]
-                size_p = size[p]
-            while size_p > size_q:
-                q = parent[q]
-                size_q = size[q]
-            if size_p == size_q:
-                if p != q:
+        N = self.N
+        D = self.D
+        n = len(N)        # number of nodes
+        e = len(self.S)   # number of edges
+        inf = float('inf')
+
+        #######################################################################
+        # Initialization
+        #######################################################################
+
+        # Add a dummy node -1 and connect all existing nodes to it with
+        # infinite-capacity dummy edges. Node -1 will serve as the root of the
+        # spanning tree of the network simplex method. The new edges will used
+        # to trivially satisfy the node demands and create an initial strongly
+        # feasible spanning tree.
+        faux_inf = 3 * max(chain([sum(u for u in self.U if u < inf),
+                                  sum(abs(c) for c in self.C)],
+                                 (abs(d) for d in D))) or 1
+        C = self.C + [faux_inf] * n
+        U = self.U + [faux_inf] * n
+
+        if self._basis is None:
+            S = list(self.S)
+            T = list(self.T)
+            for p, d in enumerate(D):
+                if d > 0:  # Must be greater-than here. Zero-demand nodes must
+                           # have edges pointing towards the root to ensure
+                           # strong feasibility.
+                    S.append(-1)
+                    T.append(p)
+                else:
+                    S.append(p)
+                    T.append(-1)
+
+            # Construct the initial spanning tree.
+            x = list(chain(repeat(0, e), (abs(d) for d in D)))  # edge flows
+            pi = [faux_inf if d <= 0 else -faux_inf for d in D]  # potentials
+            parent = list(chain(repeat(-1, n), [None]))  # parent nodes
+            edge = list(range(e, e + n))                 # edges to parents
+            size = list(chain(repeat(1, n), [n + 1]))    # subtree sizes
+            next = list(chain(range(1, n), [-1, 0]))     # next nodes in
+                                                         # depth-first thread
+            prev = list(range(-1, n))                    # previous nodes in
+                                                         # depth-first thread
+            last = list(chain(range(n), [n - 1]))        # last descendants in
+                                                         # depth-first thread
+        else:
+            # Work on copies to keep the basis intact if the solve fails.
+            x, parent, edge, size, next, prev, last, S_root, T_root = \
+                [list(a) for a in self._basis]
+            S = self.S + S_root
+            T = self.T + T_root
+            pi = [0] * n
+
+        #######################################################################
+        # Pivot loop
+        #######################################################################
+
+        def reduced_cost(i):
+            """Return the reduced cost of an edge i.
+            """
+            if U[i] == 0:
+                # An edge without capacity can never enter the basis.
+                return 0
+            c = C[i] - pi[S[i]] + pi[T[i]]
+            return c if x[i] == 0 else -c
+
+        def find_entering_edges():
+            """Yield entering edges until none can be found.
+            """
+            if e == 0:
+                return
+
+            # Entering edges are found by combining Dantzig's rule and Bland's
+            # rule. The edges are cyclically grouped into blocks of size B.
+            # Within each block, Dantzig's rule is applied to find an entering
+            # edge. The blocks to search is determined following Bland's rule.
+            B = self.block_size or int(ceil(sqrt(e)))  # pivot block size
+            B = min(B, e)
+            M = (e + B - 1) // B  # number of blocks needed to cover all edges
+            m = 0                 # number of consecutive blocks without
+                                  # eligible entering edges
+            f = 0                 # first edge in block
+            while m < M:
+                # Determine the next block of edges.
+                l = f + B
+                if l <= e:
+                    edges = range(f, l)
+                else:
+                    l -= e
+                    edges = chain(range(f, e), range(l))
+                f = l
+                # Find the first edge with the lowest reduced cost.
+                i = min(edges, key=reduced_cost)
+                c = reduced_cost(i)
+                if c >= 0:
+                    # No entering edge found in the current block.
+                    m += 1
+                else:
+                    # Entering edge found.
+                    if x[i] == 0:
+                        p = S[i]
+                        q = T[i]
+                    else:
+                        p = T[i]
+                        q = S[i]
+                    yield i, p, q
+                    m = 0
+            # All edges have nonnegative reduced costs. The current flow is
+            # optimal.
+
+        def find_apex(p, q):
+            """Find the lowest common ancestor of nodes p and q in the spanning
+            tree.
+            """
+            size_p = size[p]
+            size_q = size[q]
+            while True:
+                while size_p < size_q:
                     p = parent[p]
                     size_p = size[p]
+                while size_p > size_q:
                     q = parent[q]
                     size_q = size[q]
+                if size_p == size_q:
+                    if p != q:
+                        p = parent[p]
+                        size_p = size[p]
+                        q = parent[q]
+                        size_q = size[q]
+                    else:
+                        return p
+
+        def trace_path(p, w):
+            """Return the nodes and edges on the path from node p to its
+            ancestor w.
+            """
+            Wn = [p]
+            We = []
+            while p != w:
+                We.append(edge[p])
+                p = parent[p]
+                Wn.append(p)
+            return Wn, We
+
+        def find_cycle(i, p, q):
+            """Return the nodes and edges on the cycle containing edge
+            i == (p, q) when the latter is added to the spanning tree.
+
+            The cycle is oriented in the direction from p to q.
+            """
+            w = find_apex(p, q)
+            Wn, We = trace_path(p, w)
+            Wn.reverse()
+            We.reverse()
+            We.append(i)
+            WnR, WeR = trace_path(q, w)
+            del WnR[-1]
+            Wn += WnR
+            We += WeR
+            return Wn, We
+
+        def residual_capacity(i, p):
+            """Return the residual capacity of an edge i in the direction away
+            from its endpoint p.
+            """
+            return U[i] - x[i] if S[i] == p else x[i]
+
+        def find_leaving_edge(Wn, We):
+            """Return the leaving edge in a cycle represented by Wn and We.
+            """
+            j, s = min(zip(reversed(We), reversed(Wn)),
+                       key=lambda i_p: residual_capacity(*i_p))
+            t = T[j] if S[j] == s else S[j]
+            return j, s, t
+
+        def augment_flow(Wn, We, f):
+            """Augment f units of flow along a cycle represented by Wn and We.
+            """
+            for i, p in zip(We, Wn):
+                if S[i] == p:
+                    x[i] += f
                 else:
-                    return p
-
-    def trace_path(p, w):
-        """Return the nodes and edges on the path from node p to its ancestor
-        w.
-        """
-        Wn = [p]
-        We = []
-        while p != w:
-            We.append(edge[p])
-            p = parent[p]
-            Wn.append(p)
-        return Wn, We
-
-    def find_cycle(i, p, q):
-        """Return the nodes and edges on the cycle containing edge i == (p, q)
-        when the latter is added to the spanning tree.
-
-        The cycle is oriented in the direction from p to q.
-        """
-        w = find_apex(p, q)
-        Wn, We = trace_path(p, w)
-        Wn.reverse()
-        We.reverse()
-        We.append(i)
-        WnR, WeR = trace_path(q, w)
-        del WnR[-1]
-        Wn += WnR
-        We += WeR
-        return Wn, We
-
-
-    def residual_capacity(i, p):
-        """Return the residual capacity of an edge i in the direction away
-        from its endpoint p.
-        """
-        return U[i] - x[i] if S[i] == p else x[i]
+                    x[i] -= f
 
-    def find_leaving_edge(Wn, We):
-        """Return the leaving edge in a cycle represented by Wn and We.
-        """
-        j, s = min(zip(reversed(We), reversed(Wn)),
-                   key=lambda i_p: residual_capacity(*i_p))
-        t = T[j] if S[j] == s else S[j]
-        return j, s, t
-
-    def augment_flow(Wn, We, f):
-        """Augment f units of flow along a cycle represented by Wn and We.
-        """
-        for i, p in zip(We, Wn):
-            if S[i] == p:
-                x[i] += f
-            else:
-                x[i] -= f
-
-    def trace_subtree(p):
-        """Yield the nodes in the subtree rooted at a node p.
-        """
-        yield p
-        l = last[p]
-        while p != l:
-            p = next[p]
+        def trace_subtree(p):
+            """Yield the nodes in the subtree rooted at a node p.
+            """
             yield p
-
-    def remove_edge(s, t):
-        """Remove an edge (s, t) where parent[t] == s from the spanning tree.
-        """
-        size_t = size[t]
-        prev_t = prev[t]
-        last_t = last[t]
-        next_last_t = next[last_t]
-        # Remove (s, t).
-        parent[t] = None
-        edge[t] = None
-        # Remove the subtree rooted at t from the depth-first thread.
-        next[prev_t] = next_last_t
-        prev[next_last_t] = prev_t
-        next[last_t] = t
-        prev[t] = last_t
-        # Update the subtree sizes and last descendants of the (old) acenstors
-        # of t.
-        while s is not None:
-            size[s] -= size_t
-            if last[s] == last_t:
-                last[s] = prev_t
-            s = parent[s]
-
-    def make_root(q):
-        """Make a node q the root of its containing subtree.
-        """
-        ancestors = []
-        while q is not None:
-            ancestors.append(q)
-            q = parent[q]
-        ancestors.reverse()
-        for p, q in zip(ancestors, islice(ancestors, 1, None)):
-            size_p = size[p]
+            l = last[p]
+            while p != l:
+                p = next[p]
+                yield p
+
+        def remove_edge(s, t):
+            """Remove an edge (s, t) where parent[t] == s from the spanning
+            tree.
+            """
+            size_t = size[t]
+            prev_t = prev[t]
+            last_t = last[t]
+            next_last_t = next[last_t]
+            # Remove (s, t).
+            parent[t] = None
+            edge[t] = None
+            # Remove the subtree rooted at t from the depth-first thread.
+            next[prev_t] = next_last_t
+            prev[next_last_t] = prev_t
+            next[last_t] = t
+            prev[t] = last_t
+            # Update the subtree sizes and last descendants of the (old)
+            # acenstors of t.
+            while s is not None:
+                size[s] -= size_t
+                if last[s] == last_t:
+                    last[s] = prev_t
+                s = parent[s]
+
+        def make_root(q):
+            """Make a node q the root of its containing subtree.
+            """
+            ancestors = []
+            while q is not None:
+                ancestors.append(q)
+                q = parent[q]
+            ancestors.reverse()
+            for p, q in zip(ancestors, islice(ancestors, 1, None)):
+                size_p = size[p]
+                last_p = last[p]
+                prev_q = prev[q]
+                last_q = last[q]
+                next_last_q = next[last_q]
+                # Make p a child of q.
+                parent[p] = q
+                parent[q] = None
+                edge[p] = edge[q]
+                edge[q] = None
+                size[p] = size_p - size[q]
+                size[q] = size_p
+                # Remove the subtree rooted at q from the depth-first thread.
+                next[prev_q] = next_last_q
+                prev[next_last_q] = prev_q
+                next[last_q] = q
+                prev[q] = last_q
+                if last_p == last_q:
+                    last[p] = prev_q
+                    last_p = prev_q
+                # Add the remaining parts of the subtree rooted at p as a
+                # subtree of q in the depth-first thread.
+                prev[p] = last_q
+                next[last_q] = p
+                next[last_p] = q
+                prev[q] = last_p
+                last[q] = last_p
+
+        def add_edge(i, p, q):
+            """Add an edge (p, q) to the spanning tree where q is the root of a
+            subtree.
+            """
             last_p = last[p]
-            prev_q = prev[q]
+            next_last_p = next[last_p]
+            size_q = size[q]
             last_q = last[q]
-            next_last_q = next[last_q]
-            # Make p a child of q.
-            parent[p] = q
-            parent[q] = None
-            edge[p] = edge[q]
-            edge[q] = None
-            size[p] = size_p - size[q]
-            size[q] = size_p
-            # Remove the subtree rooted at q from the depth-first thread.
-            next[prev_q] = next_last_q
-            prev[next_last_q] = prev_q
-            next[last_q] = q
-            prev[q] = last_q
-            if last_p == last_q:
-                last[p] = prev_q
-                last_p = prev_q
-            # Add the remaining parts of the subtree rooted at p as a subtree
-            # of q in the depth-first thread.
-            prev[p] = last_q
-            next[last_q] = p
+            # Make q a child of p.
+            parent[q] = p
+            edge[q] = i
+            # Insert the subtree rooted at q into the depth-first thread.
             next[last_p] = q
             prev[q] = last_p
-            last[q] = last_p
+            prev[next_last_p] = last_q
+            next[last_q] = next_last_p
+            # Update the subtree sizes and last descendants of the (new)
+            # ancestors of q.
+            while p is not None:
+                size[p] += size_q
+                if last[p] == last_p:
+                    last[p] = last_q
+                p = parent[p]
 
-    def add_edge(i, p, q):
-        """Add an edge (p, q) to the spanning tree where q is the root of a
-        subtree.
-        """
-        last_p = last[p]
-        next_last_p = next[last_p]
-        size_q = size[q]
-        last_q = last[q]
-        # Make q a child of p.
-        parent[q] = p
-        edge[q] = i
-        # Insert the subtree rooted at q into the depth-first thread.
-        next[last_p] = q
-        prev[q] = last_p
-        prev[next_last_p] = last_q
-        next[last_q] = next_last_p
-        # Update the subtree sizes and last descendants of the (new) ancestors
-        # of q.
-        while p is not None:
-            size[p] += size_q
-            if last[p] == last_p:
-                last[p] = last_q
-            p = parent[p]
-
-    def update_potentials(i, p, q):
-        """Update the potentials of the nodes in the subtree rooted at a node
-        q connected to its parent p by an edge i.
-        """
-        if q == T[i]:
-            d = pi[p] - C[i] - pi[q]
-        else:
-            d = pi[p] + C[i] - pi[q]
-        for q in trace_subtree(q):
-            pi[q] += d
-
-    # Pivot loop
-    for i, p, q in find_entering_edges():
-        Wn, We = find_cycle(i, p, q)
-        j, s, t = find_leaving_edge(Wn, We)
-        augment_flow(Wn, We, residual_capacity(j, s))
-        if i != j:  # Do nothing more if the entering edge is the same as the
-                    # the leaving edge.
-            if parent[t] != s:
-                # Ensure that s is the parent of t.
-                s, t = t, s
-            if We.index(i) > We.index(j):
-                # Ensure that q is in the subtree rooted at t.
-                p, q = q, p
-            remove_edge(s, t)
-            make_root(q)
-            add_edge(i, p, q)
-            update_potentials(i, p, q)
-
-    ###########################################################################
-    # Infeasibility and unboundedness detection
-    ###########################################################################
-
-    if any(x[i] != 0 for i in range(-n, 0)):
-        raise nx.NetworkXUnfeasible('no flow satisfies all node demands')
-
-    if (any(x[i] * 2 >= faux_inf for i in range(e)) or
-        any(e[-1].get(capacity, inf) == inf and e[-1].get(weight, 0) < 0
-            for e in G.selfloop_edges(data=True))):
-        raise nx.NetworkXUnbounded(
-            'negative cycle with infinite capacity found')
-
-    ###########################################################################
-    # Flow cost calculation and flow dict construction
-    ###########################################################################
-
-    del x[e:]
-    flow_cost = sum(c * x for c, x in zip(C, x))
-    flow_dict = {n: {} for n in N}
-
-    def add_entry(e):
-        """Add a flow dict entry.
-        """
-        d = flow_dict[e[0]]
-        for k in e[1:-2]:
-            try:
-                d = d[k]
-            except KeyError:
-                t = {}
-                d[k] = t
-                d = t
-        d[e[-2]] = e[-1]
-
-    S = (N[s] for s in S)  # Use original nodes.
-    T = (N[t] for t in T)  # Use original nodes.
-    if not multigraph:
-        for e in zip(S, T, x):
-            add_entry(e)
-        edges = G.edges(data=True)
-    else:
-        for e in zip(S, T, K, x):
-            add_entry(e)
-        edges = G.edges(data=True, keys=True)
-    for e in edges:
-        if e[0] != e[1]:
-            if e[-1].get(capacity, inf) == 0:
-                add_entry(e[:-1] + (0,))
-        else:
-            c = e[-1].get(weight, 0)
+        def update_potentials(i, p, q):
+            """Update the potentials of the nodes in the subtree rooted at a
+            node q connected to its parent p by an edge i.
+            """
+            if q == T[i]:
+                d = pi[p] - C[i] - pi[q]
+            else:
+                d = pi[p] + C[i] - pi[q]
+            for q in trace_subtree(q):
+                pi[q] += d
+
+        def thread():
+            """Return the nodes in the order of the depth-first thread.
+            """
+            nodes = []
+            p = next[-1]
+            while p != -1:
+                nodes.append(p)
+                p = next[p]
+            return nodes
+
+        def compute_potentials():
+            """Compute the node potentials from the spanning tree, with a zero
+            potential at the root.
+            """
+            for p in thread():
+                i = edge[p]
+                q = parent[p]
+                pi_q = pi[q] if q != -1 else 0
+                pi[p] = pi_q - C[i] if T[i] == p else pi_q + C[i]
+
+        def warm_start():
+            """Make the previous spanning tree a strongly feasible basis for
+            the current demands and capacities.
+            """
+            in_tree = [False] * (e + n)
+            for p in range(n):
+                in_tree[edge[p]] = True
+            # Keep the edges outside of the tree at their bounds and compute
+            # the flow each node still has to receive through the tree.
+            r = list(D)
+            for i in range(e + n):
+                if in_tree[i]:
+                    continue
+                if x[i] != 0:
+                    x[i] = U[i] if i < e and U[i] < inf else 0
+                    r[S[i]] += x[i]
+                    r[T[i]] -= x[i]
+            # Compute the tree flows bottom-up. A subtree that cannot be fed
+            # through its tree edge is attached to the root instead.
+            for p in reversed(thread()):
+                i = edge[p]
+                q = parent[p]
+                if i >= e:
+                    # Orient the artificial edge (p, -1) so that it carries a
+                    # nonnegative flow and has a positive residual capacity
+                    # towards the root.
+                    if r[p] > 0:
+                        S[i], T[i], x[i] = -1, p, r[p]
+                    else:
+                        S[i], T[i], x[i] = p, -1, -r[p]
+                    continue
+                f = r[p] if T[i] == p else -r[p]
+                towards_root = U[i] - f if S[i] == p else f
+                if 0 <= f <= U[i] and towards_root > 0:
+                    x[i] = f
+                    r[q] += r[p]
+                    continue
+                # Leave edge i at its nearest bound outside of the tree.
+                x[i] = min(max(f, 0), U[i])
+                if S[i] == p:
+                    r[p] += x[i]
+                    r[q] -= x[i]
+                else:
+                    r[p] -= x[i]
+                    r[q] += x[i]
+                a = e + p
+                if r[p] > 0:
+                    S[a], T[a], x[a] = -1, p, r[p]
+                else:
+                    S[a], T[a], x[a] = p, -1, -r[p]
+                remove_edge(q, p)
+                add_edge(a, -1, p)
+            compute_potentials()
+
+        if self._basis is not None:
+            warm_start()
+
+        def pivot():
+            """Pivot until the flow is optimal. Return False, without
+            augmenting the flow, if a cycle of negative cost and infinite
+            capacity is found.
+            """
+            for i, p, q in find_entering_edges():
+                Wn, We = find_cycle(i, p, q)
+                j, s, t = find_leaving_edge(Wn, We)
+                f = residual_capacity(j, s)
+                if f == inf:
+                    return False
+                augment_flow(Wn, We, f)
+                if i != j:  # Do nothing more if the entering edge is the
+                            # same as the leaving edge.
+                    if parent[t] != s:
+                        # Ensure that s is the parent of t.
+                        s, t = t, s
+                    if We.index(i) > We.index(j):
+                        # Ensure that q is in the subtree rooted at t.
+                        p, q = q, p
+                    remove_edge(s, t)
+                    make_root(q)
+                    add_edge(i, p, q)
+                    update_potentials(i, p, q)
+            return True
+
+        # Pivot loop
+        unbounded = not pivot()
+        if unbounded:
+            # The cost is unbounded below if there is a feasible flow at all.
+            # Find out with zero edge costs, which leave no negative cycle.
+            C[:e] = repeat(0, e)
+            compute_potentials()
+            pivot()
+
+        self._basis = (list(x), parent, edge, size, next, prev, last,
+                       S[e:], T[e:])
+
+        #######################################################################
+        # Infeasibility and unboundedness detection
+        #######################################################################
+
+        if any(x[i] != 0 for i in range(-n, 0)):
+            raise nx.NetworkXUnfeasible('no flow satisfies all node demands')
+
+        if (unbounded or any(x[i] * 2 >= faux_inf for i in range(e)) or
+            any(u == inf and c < 0 for l, u, c in self.loop_values)):
+            raise nx.NetworkXUnbounded(
+                'negative cycle with infinite capacity found')
+
+        #######################################################################
+        # Flow cost calculation and flow dict construction
+        #######################################################################
+
+        del x[e:]
+        flow_cost = sum(c * x for c, x in zip(C, x))
+        flow_dict = {n: {} for n in N}
+
+        def add_entry(e):
+            """Add a flow dict entry.
+            """
+            d = flow_dict[e[0]]
+            for k in e[1:-2]:
+                try:
+                    d = d[k]
+                except KeyError:
+                    t = {}
+                    d[k] = t
+                    d = t
+            d[e[-2]] = e[-1]
+
+        for edge, i in self.E.items():
+            add_entry(edge + (x[i],))
+        for edge, u, c in self.loop_values:
             if c >= 0:
-                add_entry(e[:-1] + (0,))
+                add_entry(edge + (0,))
             else:
-                u = e[-1][capacity]
                 flow_cost += c * u
-                add_entry(e[:-1] + (u,))
+                add_entry(edge + (u,))
 
-    return flow_cost, flow_dict
+        return flow_cost, flow_dict
@@ -9,14 +9,13 @@ __author__ = """ysitu <ysitu@users.noreply.github.com>"""
 # BSD license.
 
 from collections import deque
-from itertools import islice
 import networkx as nx
 #from networkx.algorithms.flow.utils import *
-from ...utils import arbitrary_element
 from .utils import build_residual_network
 from .utils import CurrentEdge
 from .utils import detect_unboundedness
 from .utils import GlobalRelabelThreshold
+from .utils import highest_label_phases
 from .utils import Level
 
 __all__ = ['preflow_push']
@@ -176,20 +175,6 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         R_node[u]['height'] = height
         return next_height
 
-    def gap_heuristic(height):
-        """Apply the gap heuristic.
-        """
-        # Move all nodes at levels (height + 1) to max_height to level n + 1.
-        for level in islice(levels, height + 1, max_height + 1):
-            for u in level.active:
-                R_node[u]['height'] = n + 1
-            for u in level.inactive:
-                R_node[u]['height'] = n + 1
-            levels[n + 1].active.update(level.active)
-            level.active.clear()
-            levels[n + 1].inactive.update(level.inactive)
-            level.inactive.clear()
-
     def global_relabel(from_sink):
         """Apply the global relabeling heuristic.
         """
@@ -223,72 +208,11 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
                 R_node[u]['height'] = new_height
         return max_height
 
-    # Phase 1: Find the maximum preflow by pushing as much flow as possible to
-    # t.
-
-    height = max_height
-    while height > 0:
-        # Discharge active nodes in the current level.
-        while True:
-            level = levels[height]
-            if not level.active:
-                # All active nodes in the current level have been discharged.
-                # Move to the next lower level.
-                height -= 1
-                break
-            # Record the old height and level for the gap heuristic.
-            old_height = height
-            old_level = level
-            u = arbitrary_element(level.active)
-            height = discharge(u, True)
-            if grt.is_reached():
-                # Global relabeling heuristic: Recompute the exact heights of
-                # all nodes.
-                height = global_relabel(True)
-                max_height = height
-                grt.clear_work()
-            elif not old_level.active and not old_level.inactive:
-                # Gap heuristic: If the level at old_height is empty (a 'gap'),
-                # a minimum cut has been identified. All nodes with heights
-                # above old_height can have their heights set to n + 1 and not
-                # be further processed before a maximum preflow is found.
-                gap_heuristic(old_height)
-                height = old_height - 1
-                max_height = height
-            else:
-                # Update the height of the highest level with at least one
-                # active node.
-                max_height = max(max_height, height)
-
-    # A maximum preflow has been found. The excess at t is the maximum flow
-    # value.
-    if value_only:
-        R.graph['flow_value'] = R_node[t]['excess']
-        return R
-
-    # Phase 2: Convert the maximum preflow into a maximum flow by returning the
-    # excess to s.
-
-    # Relabel all nodes so that they have accurate heights.
-    height = global_relabel(False)
-    grt.clear_work()
+    def set_height(u, height):
+        R_node[u]['height'] = height
 
-    # Continue to discharge the active nodes.
-    while height > n:
-        # Discharge active nodes in the current level.
-        while True:
-            level = levels[height]
-            if not level.active:
-                # All active nodes in the current level have been discharged.
-                # Move to the next lower level.
-                height -= 1
-                break
-            u = arbitrary_element(level.active)
-            height = discharge(u, False)
-            if grt.is_reached():
-                # Global relabeling heuristic.
-                height = global_relabel(False)
-                grt.clear_work()
+    highest_label_phases(n, levels, max_height, discharge, global_relabel,
+                         set_height, grt, value_only)
 
     R.graph['flow_value'] = R_node[t]['excess']
     return R
@@ -0,0 +1,100 @@
+from itertools import combinations
+from nose.tools import *
+
+import networkx as nx
+from networkx.algorithms.flow import boykov_kolmogorov
+from networkx.algorithms.flow import edmonds_karp
+from networkx.algorithms.flow import preflow_push
+from networkx.algorithms.flow import shortest_augmenting_path
+from networkx.algorithms.flow import dinitz
+
+flow_funcs = [
+    boykov_kolmogorov,
+    dinitz,
+    edmonds_karp,
+    preflow_push,
+    shortest_augmenting_path,
+]
+
+
+def cut_capacity(G, partition, capacity='capacity'):
+    side, other = partition
+    return sum(d.get(capacity, 1) for u, v, d in G.edges(data=True)
+               if (u in side) != (v in side))
+
+
+class TestGomoryHuTree:
+
+    def check_all_pairs(self, G, T, capacity='capacity'):
+        assert_true(nx.is_tree(T))
+        assert_equal(set(T), set(G))
+        for u, v in combinations(G, 2):
+            cut_value, partition = nx.gomory_hu_minimum_cut(T, u, v)
+            assert_equal(cut_value,
+                         nx.minimum_cut_value(G, u, v, capacity=capacity))
+            assert_true(u in partition[0])
+            assert_true(v in partition[1])
+            assert_equal(cut_capacity(G, partition, capacity), cut_value)
+
+    def test_default_flow_function_karate_club_graph(self):
+        G = nx.karate_club_graph()
+        nx.set_edge_attributes(G, 'capacity', 1)
+        T = nx.gomory_hu_tree(G)
+        self.check_all_pairs(G, T)
+
+    def test_flow_functions(self):
+        G = nx.davis_southern_women_graph()
+        nx.set_edge_attributes(G, 'capacity', 1)
+        for flow_func in flow_funcs:
+            T = nx.gomory_hu_tree(G, flow_func=flow_func)
+            self.check_all_pairs(G, T)
+
+    def test_weighted(self):
+        G = nx.gnp_random_graph(25, 0.3, seed=42)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = (7 * i) % 5 + 1
+        T = nx.gomory_hu_tree(G, capacity='weight')
+        self.check_all_pairs(G, T, capacity='weight')
+
+    def test_disconnected(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, capacity=2)
+        G.add_edge(1, 2, capacity=3)
+        G.add_edge(3, 4, capacity=1)
+        T = nx.gomory_hu_tree(G)
+        self.check_all_pairs(G, T)
+        assert_equal(nx.gomory_hu_minimum_cut(T, 0, 4)[0], 0)
+
+    def test_parallel(self):
+        G = nx.gnp_random_graph(30, 0.25, seed=7)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['capacity'] = (3 * i) % 4 + 1
+        T = nx.gomory_hu_tree(G)
+        T2 = nx.gomory_hu_tree(G, n_jobs=3)
+        assert_equal(sorted(T.edges(data=True)),
+                     sorted(T2.edges(data=True)))
+        self.check_all_pairs(G, T2)
+
+    def test_single_node(self):
+        G = nx.Graph()
+        G.add_node(1)
+        T = nx.gomory_hu_tree(G)
+        assert_equal(list(T), [1])
+        assert_equal(T.number_of_edges(), 0)
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed_raises(self):
+        G = nx.DiGraph()
+        nx.gomory_hu_tree(G)
+
+    @raises(nx.NetworkXError)
+    def test_empty_raises(self):
+        G = nx.empty_graph()
+        nx.gomory_hu_tree(G)
+
+    @raises(nx.NetworkXError)
+    def test_same_node_query_raises(self):
+        G = nx.path_graph(3)
+        nx.set_edge_attributes(G, 'capacity', 1)
+        T = nx.gomory_hu_tree(G)
+        nx.gomory_hu_minimum_cut(T, 1, 1)
@@ -5,13 +5,16 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import ArrayResidualNetwork
+from networkx.algorithms.flow import array_preflow_push
 from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import edmonds_karp
 from networkx.algorithms.flow import preflow_push
 from networkx.algorithms.flow import shortest_augmenting_path
 from networkx.algorithms.flow import dinitz
 
-flow_funcs = [boykov_kolmogorov, dinitz, edmonds_karp, preflow_push, shortest_augmenting_path]
+flow_funcs = [array_preflow_push, boykov_kolmogorov, dinitz, edmonds_karp,
+              preflow_push, shortest_augmenting_path]
 max_min_funcs = [nx.maximum_flow, nx.minimum_cut]
 flow_value_funcs = [nx.maximum_flow_value, nx.minimum_cut_value]
 interface_funcs = sum([max_min_funcs, flow_value_funcs], [])
@@ -468,6 +471,84 @@ def test_preflow_push_makes_enough_space():
     R = preflow_push(G, 0, 3, value_only=False)
     assert_equal(R.graph['flow_value'], 1)
 
+def test_array_preflow_push_global_relabel_freq():
+    G = nx.DiGraph()
+    G.add_edge(1, 2, capacity=1)
+    R = array_preflow_push(G, 1, 2, global_relabel_freq=None)
+    assert_equal(R.graph['flow_value'], 1)
+    assert_raises(nx.NetworkXError, array_preflow_push, G, 1, 2,
+                  global_relabel_freq=-1)
+
+def test_array_preflow_push_reusing_residual():
+    G = nx.grid_2d_graph(5, 5)
+    for i, (u, v) in enumerate(G.edges()):
+        G[u][v]['capacity'] = i % 3 + 1
+    R = ArrayResidualNetwork(G, 'capacity')
+    for s, t in [((0, 0), (4, 4)), ((2, 2), (0, 4)), ((4, 0), (0, 0))]:
+        R2 = array_preflow_push(G, s, t, residual=R)
+        assert_true(R2 is R)
+        assert_equal(R.graph['flow_value'], nx.maximum_flow_value(G, s, t))
+        cut_value, partition = nx.minimum_cut(G, s, t,
+                                              flow_func=array_preflow_push,
+                                              residual=R)
+        validate_cuts(G, s, t, cut_value, partition, 'capacity',
+                      array_preflow_push)
+
+def test_array_preflow_push_flow_dict():
+    G = nx.DiGraph()
+    nx.add_path(G, [0, 1, 3], capacity=1)
+    nx.add_path(G, [1, 2, 3], capacity=1)
+    G.add_edge(0, 2, capacity=2)
+    G.add_node(4)
+    flow_value, flow_dict = nx.maximum_flow(G, 0, 3,
+                                            flow_func=array_preflow_push)
+    assert_equal(flow_value, 2)
+    assert_equal(len(flow_dict), 5)
+    assert_equal(flow_dict[4], {})
+    validate_flows(G, 0, 3, flow_dict, 2, 'capacity', array_preflow_push)
+    assert_equal(type(flow_dict), dict)
+    assert_equal(flow_dict, nx.maximum_flow(G, 0, 3)[1])
+    R = array_preflow_push(G, 0, 3)
+    lazy_flow_dict = R.flow_dict(G, lazy=True)
+    assert_equal(len(lazy_flow_dict), 5)
+    assert_equal(dict(lazy_flow_dict), flow_dict)
+
+def test_array_residual_network_storage():
+    from array import array
+    from fractions import Fraction
+    G = nx.DiGraph()
+    nx.add_path(G, [0, 1, 2], capacity=2)
+    R = ArrayResidualNetwork(G)
+    for arr in (R.indptr, R.head, R.rev, R.capacity, R.residual):
+        assert_true(isinstance(arr, array))
+    assert_true(R.capacity.typecode in 'ql')
+    G[1][2]['capacity'] = 1.5
+    R = ArrayResidualNetwork(G)
+    assert_equal(R.capacity.typecode, 'd')
+    assert_equal(array_preflow_push(G, 0, 2, residual=R).graph['flow_value'],
+                 1.5)
+    G[1][2]['capacity'] = Fraction(1, 3)
+    R = array_preflow_push(G, 0, 2)
+    assert_true(isinstance(R.capacity, list))
+    assert_equal(R.graph['flow_value'], Fraction(1, 3))
+
+def test_array_preflow_push_to_residual_network():
+    G = nx.grid_2d_graph(4, 4)
+    for i, (u, v) in enumerate(G.edges()):
+        G[u][v]['capacity'] = i % 3 + 1
+    s, t = (0, 0), (3, 3)
+    R = array_preflow_push(G, s, t).to_residual_network()
+    R2 = preflow_push(G, s, t)
+    assert_equal(sorted(R.edges()), sorted(R2.edges()))
+    assert_equal(R.graph['flow_value'], R2.graph['flow_value'])
+    assert_equal(R.graph['inf'], R2.graph['inf'])
+    for u, v, d in R.edges(data=True):
+        assert_equal(d['capacity'], R2[u][v]['capacity'])
+        assert_equal(d['flow'], -R[v][u]['flow'])
+    flow_dict = build_flow_dict(G, R)
+    validate_flows(G, s, t, flow_dict, R.graph['flow_value'], 'capacity',
+                   array_preflow_push)
+
 def test_shortest_augmenting_path_two_phase():
     k = 5
     p = 1000
@@ -11,6 +11,7 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import array_preflow_push
 from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import dinitz
 from networkx.algorithms.flow import edmonds_karp
@@ -18,6 +19,7 @@ from networkx.algorithms.flow import preflow_push
 from networkx.algorithms.flow import shortest_augmenting_path
 
 flow_funcs = [
+    array_preflow_push,
     boykov_kolmogorov,
     dinitz,
     edmonds_karp,
@@ -455,3 +455,319 @@ class TestMinCostFlow:
         flowCost, flowDict = nx.capacity_scaling(G)
         assert_equal(6749969302, flowCost)
         assert_equal(6749969302, nx.cost_of_flow(G, flowDict))
+
+
+class TestCostScaling:
+    def check(self, G, expected_cost, **kwargs):
+        flowCost, H = nx.cost_scaling(G, **kwargs)
+        assert_equal(flowCost, expected_cost)
+        assert_equal(nx.cost_of_flow(G, H, weight=kwargs.get('weight',
+                                                              'weight')),
+                     expected_cost)
+        demand = kwargs.get('demand', 'demand')
+        for u in G:
+            net = (sum(H[u].values()) -
+                   sum(H[v][u] for v in G.predecessors(u)))
+            assert_equal(net, -G.node[u].get(demand, 0))
+        return H
+
+    def test_simple_digraph(self):
+        G = nx.DiGraph()
+        G.add_node('a', demand = -5)
+        G.add_node('d', demand = 5)
+        G.add_edge('a', 'b', weight = 3, capacity = 4)
+        G.add_edge('a', 'c', weight = 6, capacity = 10)
+        G.add_edge('b', 'd', weight = 1, capacity = 9)
+        G.add_edge('c', 'd', weight = 2, capacity = 5)
+        soln = {'a': {'b': 4, 'c': 1},
+                'b': {'d': 4},
+                'c': {'d': 1},
+                'd': {}}
+        assert_equal(self.check(G, 24), soln)
+        assert_equal(self.check(G, 24, alpha=2), soln)
+        assert_equal(nx.min_cost_flow_cost(G, flow_func=nx.cost_scaling), 24)
+        assert_equal(nx.min_cost_flow(G, flow_func=nx.cost_scaling), soln)
+
+    def test_transshipment(self):
+        G = nx.DiGraph()
+        G.add_nodes_from([('a', {'demand': 1}), ('b', {'demand': -2}),
+                          ('c', {'demand': -2}), ('d', {'demand': 3}),
+                          ('e', {'demand': -4}), ('f', {'demand': -4}),
+                          ('g', {'demand': 3}), ('h', {'demand': 2}),
+                          ('r', {'demand': 3})])
+        G.add_weighted_edges_from([('a', 'c', 3), ('r', 'a', 2),
+                                   ('b', 'a', 9), ('r', 'c', 0),
+                                   ('b', 'r', -6), ('c', 'd', 5),
+                                   ('e', 'r', 4), ('e', 'f', 3),
+                                   ('h', 'b', 4), ('f', 'd', 7),
+                                   ('f', 'h', 12), ('g', 'd', 12),
+                                   ('f', 'g', -1), ('h', 'g', -10)])
+        self.check(G, 41)
+
+    def test_attribute_names(self):
+        G = nx.DiGraph()
+        G.add_node('p', spam = -4)
+        G.add_node('q', spam = 2)
+        G.add_node('a', spam = -2)
+        G.add_node('d', spam = -1)
+        G.add_node('t', spam = 2)
+        G.add_node('w', spam = 3)
+        G.add_edge('p', 'q', cost = 7, vacancies = 5)
+        G.add_edge('p', 'a', cost = 1, vacancies = 4)
+        G.add_edge('q', 'd', cost = 2, vacancies = 3)
+        G.add_edge('t', 'q', cost = 1, vacancies = 2)
+        G.add_edge('a', 't', cost = 2, vacancies = 4)
+        G.add_edge('d', 'w', cost = 3, vacancies = 4)
+        G.add_edge('t', 'w', cost = 4, vacancies = 1)
+        self.check(G, 37, demand='spam', capacity='vacancies',
+                   weight='cost')
+
+    def test_digon(self):
+        G = nx.DiGraph()
+        G.add_node(2, demand = -4)
+        G.add_node(3, demand = 4)
+        G.add_edge(1, 2, capacity = 3, weight = 600000)
+        G.add_edge(2, 1, capacity = 2, weight = 0)
+        G.add_edge(2, 3, capacity = 5, weight = 714285)
+        G.add_edge(3, 2, capacity = 2, weight = 0)
+        self.check(G, 2857140)
+        G[1][2].pop('capacity')
+        G[1][2]['weight'] = -600
+        G[2][1].pop('capacity')
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
+
+    def test_finite_capacity_neg_digon(self):
+        G = nx.DiGraph()
+        G.add_edge('a', 'b', capacity=1, weight=-1)
+        G.add_edge('b', 'a', capacity=1, weight=-1)
+        assert_equal(self.check(G, -2), {'a': {'b': 1}, 'b': {'a': 1}})
+
+    def test_finite_capacity_equal_to_faux_inf(self):
+        # The finite capacity equals the sum of the finite capacities,
+        # so it must not be taken for an infinite one.
+        G = nx.DiGraph([(0, 1, {'capacity': 2, 'weight': -1}),
+                        (1, 0, {'weight': -2})])
+        assert_equal(self.check(G, -6), {0: {1: 2}, 1: {0: 2}})
+
+    def test_negative_selfloops(self):
+        G = nx.DiGraph()
+        G.add_edge(1, 1, weight=-1)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
+        G[1][1]['capacity'] = 2
+        assert_equal(nx.cost_scaling(G), (-2, {1: {1: 2}}))
+
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 1, 'x', weight=-1)
+        G.add_edge(1, 1, 'y', weight=1)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
+        G[1][1]['x']['capacity'] = 2
+        assert_equal(nx.cost_scaling(G), (-2, {1: {1: {'x': 2, 'y': 0}}}))
+
+    def test_multidigraph(self):
+        G = nx.MultiDiGraph()
+        G.add_node(1, demand=-3)
+        G.add_node(3, demand=3)
+        G.add_edge(1, 2, 'a', capacity=2, weight=1)
+        G.add_edge(1, 2, 'b', weight=4)
+        G.add_edge(2, 3, capacity=5, weight=1)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 9)
+        assert_equal(H, {1: {2: {'a': 2, 'b': 1}}, 2: {3: {0: 3}}, 3: {}})
+
+    def test_unfeasible(self):
+        G = nx.DiGraph()
+        G.add_node('s', demand = -5)
+        G.add_node('t', demand = 5)
+        G.add_edge('s', 'a', weight = 1, capacity = 3)
+        G.add_edge('a', 'b', weight = 3)
+        G.add_edge('a', 'c', weight = -6)
+        G.add_edge('b', 'd', weight = 1)
+        G.add_edge('c', 'd', weight = -2)
+        G.add_edge('d', 't', weight = 1, capacity = 3)
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
+        G.node['t']['demand'] = 4
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
+        G.node['t']['demand'] = 3
+        G.node['s']['demand'] = -3
+        self.check(G, -18)
+        G['a']['b']['capacity'] = -1
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
+
+    def test_exceptions(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.cost_scaling, nx.Graph())
+        assert_raises(nx.NetworkXError, nx.cost_scaling, nx.DiGraph())
+        G = nx.DiGraph()
+        G.add_node(0, demand=float('inf'))
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
+        G.node[0]['demand'] = 0
+        G.add_edge(0, 1, weight=-float('inf'))
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
+        G[0][1]['weight'] = 0.5
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
+        G[0][1]['weight'] = 1
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G, alpha=1)
+
+    def test_large(self):
+        fname = os.path.join(os.path.dirname(__file__), 'netgen-2.gpickle.bz2')
+        G = nx.read_gpickle(fname)
+        self.check(G, 6749969302)
+
+
+class TestNetworkSimplexWarmStart:
+    def setUp(self):
+        G = nx.DiGraph()
+        G.add_node('p', demand=-4)
+        G.add_node('q', demand=2)
+        G.add_node('a', demand=-2)
+        G.add_node('d', demand=-1)
+        G.add_node('t', demand=2)
+        G.add_node('w', demand=3)
+        G.add_edge('p', 'q', weight=7, capacity=5)
+        G.add_edge('p', 'a', weight=1, capacity=4)
+        G.add_edge('q', 'd', weight=2, capacity=3)
+        G.add_edge('t', 'q', weight=1, capacity=2)
+        G.add_edge('a', 't', weight=2, capacity=4)
+        G.add_edge('d', 'w', weight=3, capacity=4)
+        G.add_edge('t', 'w', weight=4, capacity=1)
+        self.G = G
+
+    def check(self, simplex):
+        flowCost, flowDict = simplex.solve()
+        assert_equal(flowCost, nx.network_simplex(self.G)[0])
+        assert_equal(flowCost, nx.cost_of_flow(self.G, flowDict))
+
+    def test_cold_start(self):
+        flowCost, flowDict = nx.NetworkSimplex(self.G).solve()
+        assert_equal((flowCost, flowDict), nx.network_simplex(self.G))
+
+    def test_changed_data(self):
+        G = self.G
+        simplex = nx.NetworkSimplex(G)
+        self.check(simplex)
+        G['p']['a']['weight'] = 9
+        simplex.update()
+        self.check(simplex)
+        G['a']['t']['capacity'] = 3
+        G['t']['w']['capacity'] = 0
+        simplex.update()
+        self.check(simplex)
+        G.node['p']['demand'] = -3
+        G.node['a']['demand'] = -3
+        G['p']['a']['capacity'] = 0
+        G['t']['w']['capacity'] = 6
+        simplex.update()
+        self.check(simplex)
+
+    def test_update_dicts(self):
+        G = self.G
+        simplex = nx.NetworkSimplex(G)
+        simplex.solve()
+        simplex.update(demands={'p': -5, 'd': 0},
+                       capacities={('p', 'q'): 3, ('t', 'w'): 3},
+                       weights={('a', 't'): 0})
+        flowCost, flowDict = simplex.solve()
+        G.node['p']['demand'] = -5
+        G.node['d']['demand'] = 0
+        G['p']['q']['capacity'] = 3
+        G['t']['w']['capacity'] = 3
+        G['a']['t']['weight'] = 0
+        assert_equal(flowCost, nx.network_simplex(G)[0])
+        assert_raises(nx.NetworkXError, simplex.update, demands={'x': 1})
+        assert_raises(nx.NetworkXError, simplex.update,
+                      capacities={('p', 'w'): 1})
+
+    def test_unfeasible_then_feasible(self):
+        G = self.G
+        simplex = nx.NetworkSimplex(G)
+        simplex.solve()
+        G['p']['a']['capacity'] = 0
+        G['p']['q']['capacity'] = 0
+        simplex.update()
+        assert_raises(nx.NetworkXUnfeasible, simplex.solve)
+        G['p']['a']['capacity'] = 4
+        G['p']['q']['capacity'] = 5
+        simplex.update()
+        self.check(simplex)
+
+    def test_negative_cycle(self):
+        G = self.G
+        G.add_edge('w', 'x', weight=-1)
+        G.add_edge('x', 'w', weight=-1)
+        simplex = nx.NetworkSimplex(G)
+        assert_raises(nx.NetworkXUnbounded, simplex.solve)
+        G['x']['w']['capacity'] = 1
+        simplex.update()
+        self.check(simplex)
+        G.node['x']['demand'] = 1
+        G.node['p']['demand'] = -5
+        G['w']['x']['capacity'] = 0
+        simplex.update()
+        assert_raises(nx.NetworkXUnfeasible, simplex.solve)
+
+    def test_block_size(self):
+        for block_size in (1, 2, 100):
+            simplex = nx.NetworkSimplex(self.G, block_size=block_size)
+            self.check(simplex)
+
+    def test_random_changes(self):
+        import random
+        random.seed(42)
+        G = nx.gnm_random_graph(30, 150, seed=42, directed=True)
+        for u, v in G.edges():
+            G[u][v]['weight'] = random.randint(-3, 20)
+            G[u][v]['capacity'] = random.randint(2, 10)
+        for i in range(0, 30, 3):
+            G.node[i]['demand'] = -2
+            G.node[i + 1]['demand'] = 2
+        simplex = nx.NetworkSimplex(G)
+        edges = list(G.edges())
+        for i in range(10):
+            for u, v in random.sample(edges, 5):
+                G[u][v]['weight'] = random.randint(-3, 20)
+                G[u][v]['capacity'] = random.randint(0, 10)
+            u, v = random.sample(range(30), 2)
+            G.node[u]['demand'] = G.node[u].get('demand', 0) - 1
+            G.node[v]['demand'] = G.node[v].get('demand', 0) + 1
+            simplex.update()
+            try:
+                flowCost = nx.network_simplex(G)[0]
+            except nx.NetworkXUnfeasible:
+                assert_raises(nx.NetworkXUnfeasible, simplex.solve)
+            else:
+                assert_equal(simplex.solve()[0], flowCost)
+
+    def test_min_cost_flow_interface(self):
+        G = self.G
+        simplex = nx.NetworkSimplex(G)
+        assert_equal(nx.min_cost_flow_cost(G, simplex=simplex), 37)
+        G['p']['q']['weight'] = 1
+        flowDict = nx.min_cost_flow(G, simplex=simplex)
+        assert_equal(nx.cost_of_flow(G, flowDict),
+                     nx.min_cost_flow_cost(G))
+
+    def test_max_flow_min_cost_interface(self):
+        G = nx.DiGraph()
+        G.add_edges_from([(1, 2, {'capacity': 12, 'weight': 4}),
+                          (1, 3, {'capacity': 20, 'weight': 6}),
+                          (2, 3, {'capacity': 6, 'weight': -3}),
+                          (2, 6, {'capacity': 14, 'weight': 1}),
+                          (3, 4, {'weight': 9}),
+                          (3, 5, {'capacity': 10, 'weight': 5}),
+                          (4, 2, {'capacity': 19, 'weight': 13}),
+                          (4, 5, {'capacity': 4, 'weight': 0}),
+                          (5, 7, {'capacity': 28, 'weight': 2}),
+                          (6, 5, {'capacity': 11, 'weight': 1}),
+                          (6, 7, {'weight': 8}),
+                          (7, 4, {'capacity': 6, 'weight': 6})])
+        simplex = nx.NetworkSimplex(G)
+        flowDict = nx.max_flow_min_cost(G, 1, 7, simplex=simplex)
+        assert_equal(nx.cost_of_flow(G, flowDict), 373)
+        G[1][3]['capacity'] = 15
+        G[2][6]['weight'] = 3
+        flowDict = nx.max_flow_min_cost(G, 1, 7, simplex=simplex)
+        assert_equal(nx.cost_of_flow(G, flowDict),
+                     nx.cost_of_flow(G, nx.max_flow_min_cost(G, 1, 7)))
+
+    def test_undirected_raises(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.NetworkSimplex,
+                      nx.Graph([(0, 1)]))
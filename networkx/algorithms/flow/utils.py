@@ -8,11 +8,19 @@ __author__ = """ysitu <ysitu@users.noreply.github.com>"""
 # All rights reserved.
 # BSD license.
 
+from array import array
 from collections import deque
+from itertools import islice
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 import networkx as nx
+from ...utils import arbitrary_element
 
 __all__ = ['CurrentEdge', 'Level', 'GlobalRelabelThreshold',
-           'build_residual_network', 'detect_unboundedness', 'build_flow_dict']
+           'build_residual_network', 'detect_unboundedness', 'build_flow_dict',
+           'ArrayResidualNetwork', 'highest_label_phases']
 
 
 class CurrentEdge(object):
@@ -70,6 +78,97 @@ class GlobalRelabelThreshold(object):
         self._work = 0
 
 
+def highest_label_phases(n, levels, max_height, discharge, global_relabel,
+                         set_height, grt, value_only):
+    """Run the two phases of the highest-label preflow-push algorithm.
+
+    :samp:`levels` partitions the nodes other than the source and the
+    sink by height, and :samp:`max_height` is the highest level below
+    :samp:`n` with an active node. :samp:`discharge(u, is_phase1)`
+    discharges the active node :samp:`u` and returns the next height to
+    examine, :samp:`global_relabel(from_sink)` recomputes the exact
+    heights and returns the highest level to examine, and
+    :samp:`set_height(u, height)` stores the height of :samp:`u`. The
+    second phase, which turns the maximum preflow into a maximum flow,
+    is skipped if :samp:`value_only` is True.
+    """
+    # Phase 1: Find the maximum preflow by pushing as much flow as possible to
+    # t.
+
+    height = max_height
+    while height > 0:
+        # Discharge active nodes in the current level.
+        while True:
+            level = levels[height]
+            if not level.active:
+                # All active nodes in the current level have been discharged.
+                # Move to the next lower level.
+                height -= 1
+                break
+            # Record the old height and level for the gap heuristic.
+            old_height = height
+            old_level = level
+            u = arbitrary_element(level.active)
+            height = discharge(u, True)
+            if grt.is_reached():
+                # Global relabeling heuristic: Recompute the exact heights of
+                # all nodes.
+                height = global_relabel(True)
+                max_height = height
+                grt.clear_work()
+            elif not old_level.active and not old_level.inactive:
+                # Gap heuristic: If the level at old_height is empty (a 'gap'),
+                # a minimum cut has been identified. All nodes with heights
+                # above old_height can have their heights set to n + 1 and not
+                # be further processed before a maximum preflow is found.
+                # Move all nodes at levels (old_height + 1) to max_height to
+                # level n + 1.
+                for level in islice(levels, old_height + 1, max_height + 1):
+                    for u in level.active:
+                        set_height(u, n + 1)
+                    for u in level.inactive:
+                        set_height(u, n + 1)
+                    levels[n + 1].active.update(level.active)
+                    level.active.clear()
+                    levels[n + 1].inactive.update(level.inactive)
+                    level.inactive.clear()
+                height = old_height - 1
+                max_height = height
+            else:
+                # Update the height of the highest level with at least one
+                # active node.
+                max_height = max(max_height, height)
+
+    # A maximum preflow has been found. The excess at t is the maximum flow
+    # value.
+    if value_only:
+        return
+
+    # Phase 2: Convert the maximum preflow into a maximum flow by returning the
+    # excess to s.
+
+    # Relabel all nodes so that they have accurate heights.
+    height = global_relabel(False)
+    grt.clear_work()
+
+    # Continue to discharge the active nodes.
+    while height > n:
+        # Discharge active nodes in the current level.
+        while True:
+            level = levels[height]
+            if not level.active:
+                # All active nodes in the current level have been discharged.
+                # Move to the next lower level.
+                height -= 1
+                break
+            u = arbitrary_element(level.active)
+            height = discharge(u, False)
+            if grt.is_reached():
+                # Global relabeling heuristic.
+                height = global_relabel(False)
+                grt.clear_work()
+
+
 def build_residual_network(G, capacity):
     """Build a residual network and initialize a zero flow.
 
@@ -159,9 +258,223 @@ def detect_unboundedness(R, s, t):
                 q.append(v)
 
 
+class ArrayResidualNetwork(object):
+    """Residual network stored in compressed sparse row (CSR) arrays.
+
+    The nodes of the input graph :samp:`G` are numbered in iteration
+    order and :samp:`index` maps each node to its number. The arcs
+    leaving node number :samp:`i` are :samp:`indptr[i]` to
+    :samp:`indptr[i + 1] - 1`; arc :samp:`a` goes to node number
+    :samp:`head[a]` and :samp:`rev[a]` is its paired reverse arc. The
+    arcs are the edges of the residual network built by
+    :func:`build_residual_network`, with the same capacities and the
+    same value simulating infinity, stored in :samp:`graph['inf']`.
+
+    The flow is kept as the residual capacities :samp:`residual`, so the
+    flow on arc :samp:`a` is :samp:`capacity[a] - residual[a]`. The flow
+    value is stored in :samp:`graph['flow_value']` by the flow
+    functions.
+
+    :samp:`indptr`, :samp:`head` and :samp:`rev` are :mod:`array` arrays
+    of machine integers. :samp:`capacity` and :samp:`residual` are
+    arrays of machine integers if the capacities are integers that fit,
+    arrays of doubles if some capacities are floats, and lists for other
+    numeric types.
+
+    A network can be reused for several flow computations on the same
+    graph by passing it as the `residual` argument of a flow function
+    that supports it, such as :func:`array_preflow_push`.
+    """
+
+    def __init__(self, G, capacity='capacity'):
+        if G.is_multigraph():
+            raise nx.NetworkXError(
+                'MultiGraph and MultiDiGraph not supported (yet).')
+
+        self.nodes = nodes = list(G)
+        self.index = index = dict(zip(nodes, range(len(nodes))))
+
+        inf = float('inf')
+        # Extract edges with positive capacities. Self loops excluded.
+        edge_list = [(u, v, attr) for u, v, attr in G.edges(data=True)
+                     if u != v and attr.get(capacity, inf) > 0]
+        # Simulate infinity as in build_residual_network.
+        inf = 3 * sum(attr[capacity] for u, v, attr in edge_list
+                      if capacity in attr and attr[capacity] != inf) or 1
+        # Capacities of the arcs leaving each node, keyed by head.
+        arcs = [{} for u in nodes]
+        directed = G.is_directed()
+        for u, v, attr in edge_list:
+            i = index[u]
+            j = index[v]
+            r = min(attr.get(capacity, inf), inf)
+            arcs[i][j] = r
+            if directed:
+                arcs[j].setdefault(i, 0)
+            else:
+                arcs[j][i] = r
+
+        indptr = array('l', [0])
+        head = array('l')
+        cap = []
+        for i, out in enumerate(arcs):
+            for j, r in out.items():
+                # Replace the capacity by the arc number to pair the arcs.
+                out[j] = len(head)
+                head.append(j)
+                cap.append(r)
+            indptr.append(len(head))
+        rev = array('l', (arcs[j][i] for i, out in enumerate(arcs)
+                          for j in out))
+
+        self.indptr = indptr
+        self.head = head
+        self.rev = rev
+        self.capacity = _number_array(cap)
+        self.residual = self.capacity[:]
+        self.graph = {'inf': inf}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def reset(self):
+        """Reset the flow to zero and return the residual capacities."""
+        self.residual = self.capacity[:]
+        return self.residual
+
+    def detect_unboundedness(self, s, t):
+        """Detect an infinite-capacity path between node numbers s and t.
+        """
+        indptr, head, cap = self.indptr, self.head, self.capacity
+        inf = self.graph['inf']
+        q = deque([s])
+        seen = set([s])
+        while q:
+            u = q.popleft()
+            for a in range(indptr[u], indptr[u + 1]):
+                v = head[a]
+                if cap[a] == inf and v not in seen:
+                    if v == t:
+                        raise nx.NetworkXUnbounded(
+                            'Infinite capacity path, flow unbounded above.')
+                    seen.add(v)
+                    q.append(v)
+
+    def distances_to(self, t):
+        """Return the list of residual distances of all node numbers to
+        node number t, with -1 for the nodes that cannot reach t.
+        """
+        indptr, head, rev, res = self.indptr, self.head, self.rev, \
+            self.residual
+        dist = [-1] * len(self.nodes)
+        dist[t] = 0
+        q = deque([t])
+        while q:
+            v = q.popleft()
+            d = dist[v] + 1
+            for a in range(indptr[v], indptr[v + 1]):
+                u = head[a]
+                if dist[u] < 0 and res[rev[a]] > 0:
+                    dist[u] = d
+                    q.append(u)
+        return dist
+
+    def minimum_cut_partition(self, t):
+        """Return the partition of the nodes defined by the nodes that can
+        reach the sink t in the residual network.
+        """
+        dist = self.distances_to(self.index[t])
+        non_reachable = set(u for u, d in zip(self.nodes, dist) if d >= 0)
+        return set(self.nodes) - non_reachable, non_reachable
+
+    def flow_dict(self, G, lazy=False):
+        """Return the flow dictionary of the current flow on G.
+
+        If lazy is True, the inner dictionaries are only built when they
+        are accessed. Such a flow dictionary reads the current flow, so it
+        should not be used after the network is reused for another
+        computation.
+        """
+        flow_dict = _ArrayFlowDict(G, self)
+        if lazy:
+            return flow_dict
+        return dict((u, flow_dict[u]) for u in G)
+
+    def to_residual_network(self):
+        """Return the residual network as a NetworkX DiGraph.
+
+        The DiGraph has the layout of the residual networks returned by
+        the other flow functions: each arc has the attributes 'capacity'
+        and 'flow', and the graph attributes 'inf' and 'flow_value' are
+        copied.
+        """
+        nodes, head, cap, res = self.nodes, self.head, self.capacity, \
+            self.residual
+        R = nx.DiGraph()
+        R.add_nodes_from(nodes)
+        indptr = self.indptr
+        for i, u in enumerate(nodes):
+            for a in range(indptr[i], indptr[i + 1]):
+                R.add_edge(u, nodes[head[a]], capacity=cap[a],
+                           flow=cap[a] - res[a])
+        R.graph.update(self.graph)
+        return R
+
+
+def _number_array(values):
+    """Return the list of numbers `values` as an array of machine integers
+    if they fit, as an array of doubles if they are floats and integers
+    with at least one float, and unchanged otherwise.
+    """
+    # 'q' is missing before Python 3.3.
+    for typecode in ('q', 'l'):
+        try:
+            return array(typecode, values)
+        except (ValueError, TypeError, OverflowError):
+            pass
+    types = set(map(type, values))
+    if float in types and types <= set([int, float]):
+        return array('d', values)
+    return values
+
+
+class _ArrayFlowDict(Mapping):
+    """Flow dictionary of an ArrayResidualNetwork built on access.
+    """
+
+    def __init__(self, G, R):
+        self._G = G
+        self._R = R
+        self._rows = {}
+
+    def __getitem__(self, u):
+        try:
+            return self._rows[u]
+        except KeyError:
+            pass
+        row = dict((v, 0) for v in self._G[u])
+        R = self._R
+        nodes, head, cap, res = R.nodes, R.head, R.capacity, R.residual
+        i = R.index[u]
+        for a in range(R.indptr[i], R.indptr[i + 1]):
+            flow = cap[a] - res[a]
+            if flow > 0:
+                row[nodes[head[a]]] = flow
+        self._rows[u] = row
+        return row
+
+    def __iter__(self):
+        return iter(self._G)
+
+    def __len__(self):
+        return len(self._G)
+
+
 def build_flow_dict(G, R):
     """Build a flow dictionary from a residual network.
     """
+    if isinstance(R, ArrayResidualNetwork):
+        return R.flow_dict(G)
     flow_dict = {}
     for u in G:
         flow_dict[u] = dict((v, 0) for v in G[u])
@@ -0,0 +1,389 @@
+"""Out-of-core PageRank and HITS over memory-mapped CSR adjacency arrays.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+#    NetworkX:http://networkx.github.io/
+from multiprocessing.pool import ThreadPool
+
+import networkx as nx
+from networkx.exception import NetworkXError
+from networkx.utils import is_string_like
+__all__ = ['pagerank_mmap', 'hits_mmap']
+
+
+def _load_csr(indptr, indices, weights):
+    """Return the CSR arrays, memory-mapping the ones given as file names.
+    """
+    import numpy as np
+
+    def load(a):
+        if a is not None and is_string_like(a):
+            return np.load(a, mmap_mode='r')
+        return a
+    indptr, indices, weights = load(indptr), load(indices), load(weights)
+    if len(indptr) == 0:
+        raise NetworkXError('indptr must have at least one entry.')
+    if len(indices) != indptr[-1]:
+        raise NetworkXError('indices must have indptr[-1] entries.')
+    if weights is not None and len(weights) != len(indices):
+        raise NetworkXError('weights must have as many entries as indices.')
+    return indptr, indices, weights
+
+
+def _row_chunks(indptr, chunksize):
+    """Return row boundaries splitting the CSR rows in chunks of about
+    `chunksize` stored entries each.
+    """
+    import numpy as np
+    n = len(indptr) - 1
+    nnz = int(indptr[-1])
+    cuts = np.searchsorted(indptr, np.arange(0, nnz, max(chunksize, 1)),
+                           side='right') - 1
+    bounds = sorted(set(cuts.tolist()) | set([0, n]))
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:])
+            if start < end]
+
+
+def _chunk_matrix(indptr, indices, weights, start, end):
+    """Read rows `start` to `end` of the CSR arrays as a sparse matrix.
+    """
+    import numpy as np
+    import scipy.sparse
+    n = len(indptr) - 1
+    ptr = np.array(indptr[start:end + 1], dtype=np.int64)
+    lo, hi = ptr[0], ptr[-1]
+    idx = np.array(indices[lo:hi])
+    if weights is None:
+        data = np.ones(hi - lo)
+    else:
+        data = np.array(weights[lo:hi], dtype=float)
+    return scipy.sparse.csr_matrix((data, idx, ptr - lo),
+                                   shape=(end - start, n))
+
+
+class _ChunkedCSR(object):
+    """Row-chunked view of a CSR matrix whose products run in a thread pool.
+
+    Only the chunks currently multiplied are read into memory.  The
+    chunks are divided among the worker threads in a round-robin fashion
+    and every worker accumulates its own partial result, so at most
+    `n_jobs` dense vectors are resident during a transposed product.
+    """
+
+    def __init__(self, indptr, indices, weights, chunksize, n_jobs):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.n = len(indptr) - 1
+        self.chunks = _row_chunks(indptr, chunksize)
+        if n_jobs is None:
+            import multiprocessing
+            n_jobs = multiprocessing.cpu_count()
+        self.n_jobs = max(1, min(n_jobs, len(self.chunks)))
+        self.pool = ThreadPool(self.n_jobs)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def _map(self, func):
+        groups = [self.chunks[i::self.n_jobs] for i in range(self.n_jobs)]
+        return self.pool.map(func, groups)
+
+    def _matrix(self, start, end):
+        return _chunk_matrix(self.indptr, self.indices, self.weights,
+                             start, end)
+
+    def row_sums(self):
+        """Return the vector of row sums."""
+        import numpy as np
+        if self.weights is None:
+            return np.diff(np.asarray(self.indptr)).astype(float)
+        s = np.zeros(self.n)
+
+        def work(group):
+            for start, end in group:
+                M = self._matrix(start, end)
+                s[start:end] = np.asarray(M.sum(axis=1)).flatten()
+        self._map(work)
+        return s
+
+    def dot(self, x):
+        """Return ``M x``; the chunks write disjoint slices of the result.
+        """
+        import numpy as np
+        y = np.zeros(self.n)
+
+        def work(group):
+            for start, end in group:
+                y[start:end] = self._matrix(start, end).dot(x)
+        self._map(work)
+        return y
+
+    def tdot(self, x):
+        """Return ``M^T x`` summing the partial products of every worker.
+        """
+        import numpy as np
+
+        def work(group):
+            y = np.zeros(self.n)
+            for start, end in group:
+                y += self._matrix(start, end).T.dot(x[start:end])
+            return y
+        return sum(self._map(work))
+
+
+def pagerank_mmap(indptr, indices, weights=None, alpha=0.85,
+                  personalization=None, max_iter=100, tol=1.0e-6,
+                  dangling=None, chunksize=2 ** 22, n_jobs=None):
+    """Return the PageRank of a graph stored as memory-mapped CSR arrays.
+
+    The graph is given by its adjacency matrix in compressed sparse row
+    (CSR) format: the out-neighbors of node ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]`` with edge weights in the same
+    positions of `weights`.  Each array may be passed as the file name
+    of a ``.npy`` file, which is then opened with ``mmap_mode='r'`` so
+    that the adjacency never has to fit in memory.  Only the rank
+    vectors are kept resident; the power iteration streams over the
+    rows in chunks and multiplies the chunks in a thread pool.
+
+    Parameters
+    ----------
+    indptr : array_like or string
+      CSR row pointer array of length ``n + 1`` (or a ``.npy`` file name).
+
+    indices : array_like or string
+      CSR column index array (or a ``.npy`` file name).
+
+    weights : array_like or string, optional
+      CSR edge weight array (or a ``.npy`` file name). If None all
+      weights are set to 1.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    personalization: array_like, optional
+      The personalization vector of length ``n``.  By default, a uniform
+      distribution is used.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method solver.
+
+    dangling: array_like, optional
+      The outedges to be assigned to any "dangling" nodes, as a vector
+      of length ``n``.  By default, dangling nodes are given outedges
+      according to the personalization vector.
+
+    chunksize : integer, optional
+      Approximate number of stored edges read per chunk.
+
+    n_jobs : integer, optional
+      Number of worker threads.  Defaults to the number of CPUs.
+
+    Returns
+    -------
+    pagerank : NumPy array
+       Array of length ``n`` with the PageRank of node ``i`` at position
+       ``i``.
+
+    Raises
+    ------
+    NetworkXError
+        If the CSR arrays are inconsistent or a vector has the wrong
+        length.
+
+    PowerIterationFailedConvergence
+        If the algorithm fails to converge to the specified tolerance
+        within the specified number of iterations of the power iteration
+        method.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> M = nx.to_scipy_sparse_matrix(G, nodelist=range(4), format='csr')
+    >>> pr = nx.pagerank_mmap(M.indptr, M.indices, n_jobs=1)
+    >>> np.allclose(pr, [nx.pagerank_scipy(G)[n] for n in range(4)])
+    True
+
+    Notes
+    -----
+    The arrays can be produced for a graph that fits in memory with
+    :func:`to_scipy_sparse_matrix` and :func:`numpy.save`; larger graphs
+    are usually converted with external tools.  Duplicate column indices
+    in a row are treated as parallel edges and their weights are summed.
+
+    The computation is the same power iteration as in
+    :func:`pagerank_scipy`.  NumPy and SciPy release the interpreter lock
+    in the sparse matrix products so the chunks are multiplied in
+    parallel.
+
+    See Also
+    --------
+    pagerank, pagerank_scipy, hits_mmap
+    """
+    import numpy as np
+
+    indptr, indices, weights = _load_csr(indptr, indices, weights)
+    N = len(indptr) - 1
+    if N == 0:
+        return np.zeros(0)
+
+    # Personalization vector
+    if personalization is None:
+        p = np.repeat(1.0 / N, N)
+    else:
+        p = np.array(personalization, dtype=float)
+        if p.shape != (N,):
+            raise NetworkXError('Personalization vector must have '
+                                'length %d.' % N)
+        p /= p.sum()
+
+    # Dangling nodes
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = np.array(dangling, dtype=float)
+        if dangling_weights.shape != (N,):
+            raise NetworkXError('Dangling node vector must have '
+                                'length %d.' % N)
+        dangling_weights /= dangling_weights.sum()
+
+    M = _ChunkedCSR(indptr, indices, weights, chunksize, n_jobs)
+    try:
+        S = M.row_sums()
+        is_dangling = np.where(S == 0)[0]
+        S[S != 0] = 1.0 / S[S != 0]
+
+        # power iteration: make up to max_iter iterations
+        x = np.repeat(1.0 / N, N)
+        for _ in range(max_iter):
+            xlast = x
+            x = alpha * (M.tdot(x * S) + x[is_dangling].sum() *
+                         dangling_weights) + (1 - alpha) * p
+            # check convergence, l1 norm
+            err = np.absolute(x - xlast).sum()
+            if err < N * tol:
+                return x
+    finally:
+        M.close()
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def hits_mmap(indptr, indices, weights=None, max_iter=100, tol=1.0e-6,
+              normalized=True, chunksize=2 ** 22, n_jobs=None):
+    """Return HITS hubs and authorities of a graph stored as memory-mapped
+    CSR arrays.
+
+    The graph is given by its adjacency matrix in compressed sparse row
+    (CSR) format, see :func:`pagerank_mmap`.  Each array may be the file
+    name of a ``.npy`` file, which is then memory-mapped.  Only the hub
+    and authority vectors are kept resident; every iteration streams
+    over the rows in chunks that are multiplied in a thread pool.
+
+    Parameters
+    ----------
+    indptr : array_like or string
+      CSR row pointer array of length ``n + 1`` (or a ``.npy`` file name).
+
+    indices : array_like or string
+      CSR column index array (or a ``.npy`` file name).
+
+    weights : array_like or string, optional
+      CSR edge weight array (or a ``.npy`` file name). If None all
+      weights are set to 1.
+
+    max_iter : interger, optional
+      Maximum number of iterations in power method.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method iteration.
+
+    normalized : bool (default=True)
+       Normalize results by the sum of all of the values.
+
+    chunksize : integer, optional
+      Approximate number of stored edges read per chunk.
+
+    n_jobs : integer, optional
+      Number of worker threads.  Defaults to the number of CPUs.
+
+    Returns
+    -------
+    (hubs,authorities) : two-tuple of NumPy arrays
+       Two arrays of length ``n`` with the hub and authority values of
+       node ``i`` at position ``i``.
+
+    Raises
+    ------
+    PowerIterationFailedConvergence
+        If the algorithm fails to converge to the specified tolerance
+        within the specified number of iterations of the power iteration
+        method.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> M = nx.to_scipy_sparse_matrix(G, nodelist=range(4), format='csr')
+    >>> h, a = nx.hits_mmap(M.indptr, M.indices, n_jobs=1)
+
+    Notes
+    -----
+    The computation is the same power iteration on the authority matrix
+    ``M^T M`` as in :func:`hits_scipy`, but the authority matrix is never
+    formed: each iteration computes ``M^T (M x)`` with two passes over
+    the chunks.
+
+    See Also
+    --------
+    hits, hits_scipy, pagerank_mmap
+    """
+    import numpy as np
+
+    indptr, indices, weights = _load_csr(indptr, indices, weights)
+    N = len(indptr) - 1
+    if N == 0:
+        return np.zeros(0), np.zeros(0)
+
+    M = _ChunkedCSR(indptr, indices, weights, chunksize, n_jobs)
+    try:
+        x = np.repeat(1.0 / N, N)  # initial guess
+        # power iteration on authority matrix
+        for _ in range(max_iter):
+            xlast = x
+            x = M.tdot(M.dot(x))
+            x = x / x.max()
+            # check convergence, l1 norm
+            err = np.absolute(x - xlast).sum()
+            if err < tol:
+                break
+        else:
+            raise nx.PowerIterationFailedConvergence(max_iter)
+        a = x
+        h = M.dot(a)
+    finally:
+        M.close()
+    if normalized:
+        h = h / h.sum()
+        a = a / a.sum()
+    return h, a
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("SciPy not available")
@@ -6,12 +6,15 @@
 #    All rights reserved.
 #    BSD license.
 #    NetworkX:http://networkx.github.io/
+from collections import deque
+
 import networkx as nx
 from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix',
+           'pagerank_push', 'pagerank_push_batch']
 
 
 @not_implemented_for('multigraph')
@@ -169,7 +172,8 @@ def pagerank(G, alpha=0.85, personalization=None,
 
 
 def google_matrix(G, alpha=0.85, personalization=None,
-                  nodelist=None, weight='weight', dangling=None):
+                  nodelist=None, weight='weight', dangling=None,
+                  operator=False):
     """Return the Google matrix of the graph.
 
     Parameters
@@ -202,11 +206,23 @@ def google_matrix(G, alpha=0.85, personalization=None,
       matrix (see notes below). It may be common to have the dangling dict to
       be the same as the personalization dict.
 
+    operator : bool, optional (default=False)
+      If True, return a SciPy ``LinearOperator`` instead of a dense matrix.
+      The operator stores only the sparse adjacency matrix and applies the
+      teleportation and the dangling node correction implicitly.
+
     Returns
     -------
-    A : NumPy matrix
+    A : NumPy matrix or SciPy LinearOperator
        Google matrix of the graph
 
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> A = nx.google_matrix(G, operator=True)
+    >>> A.shape
+    (4, 4)
+
     Notes
     -----
     The matrix returned represents the transition matrix that describes the
@@ -216,6 +232,12 @@ def google_matrix(G, alpha=0.85, personalization=None,
     there exists a path between every pair of nodes in the graph, or else there
     is the potential of "rank sinks."
 
+    The dense matrix needs memory quadratic in the number of nodes.  The
+    operator form needs memory linear in the number of edges and supports
+    both ``A.matvec(x)`` and ``A.rmatvec(x)``, so it can be passed to the
+    iterative eigensolvers in :mod:`scipy.sparse.linalg`.  The PageRank
+    vector is the dominant eigenvector of the transpose ``A.T``.
+
     This implementation works with Multi(Di)Graphs. For multigraphs the
     weight between two nodes is set to be the sum of all edge weights
     between those nodes.
@@ -229,6 +251,10 @@ def google_matrix(G, alpha=0.85, personalization=None,
     if nodelist is None:
         nodelist = list(G)
 
+    if operator:
+        return _google_operator(G, alpha, personalization, nodelist,
+                                weight, dangling)
+
     M = nx.to_numpy_matrix(G, nodelist=nodelist, weight=weight)
     N = len(G)
     if N == 0:
@@ -270,6 +296,70 @@ def google_matrix(G, alpha=0.85, personalization=None,
     return alpha * M + (1 - alpha) * p
 
 
+def _google_operator(G, alpha, personalization, nodelist, weight, dangling):
+    """Return the Google matrix of `G` as a SciPy LinearOperator.
+
+    See :func:`google_matrix` for a description of the parameters.
+    """
+    import numpy as np
+    from scipy.sparse.linalg import aslinearoperator, LinearOperator
+
+    N = len(nodelist)
+    if N == 0:
+        return aslinearoperator(np.zeros((0, 0)))
+
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                  dtype=float, format='csr')
+    S = np.asarray(M.sum(axis=1)).flatten()
+    is_dangling = S == 0
+    S[~is_dangling] = 1.0 / S[~is_dangling]
+    M = M.multiply(S[:, np.newaxis]).tocsr()
+    MT = M.T.tocsr()
+    d = is_dangling.astype(float)
+
+    # Personalization vector
+    if personalization is None:
+        p = np.repeat(1.0 / N, N)
+    else:
+        missing = set(nodelist) - set(personalization)
+        if missing:
+            raise NetworkXError('Personalization vector dictionary '
+                                'must have a value for every node. '
+                                'Missing nodes %s' % missing)
+        p = np.array([personalization[n] for n in nodelist], dtype=float)
+        p /= p.sum()
+
+    # Dangling nodes
+    if dangling is None:
+        dangling_weights = p
+    else:
+        missing = set(nodelist) - set(dangling)
+        if missing:
+            raise NetworkXError('Dangling node dictionary '
+                                'must have a value for every node. '
+                                'Missing nodes %s' % missing)
+        dangling_weights = np.array([dangling[n] for n in nodelist],
+                                    dtype=float)
+        dangling_weights /= dangling_weights.sum()
+
+    # The Google matrix is
+    #   alpha * (M + d dangling_weights^T) + (1 - alpha) * 1 p^T
+    # where M is the row normalized adjacency matrix and d is the
+    # indicator vector of the dangling nodes.
+    def matvec(x):
+        x = np.asarray(x, dtype=float).ravel()
+        y = alpha * (M.dot(x) + d * dangling_weights.dot(x))
+        return y + (1 - alpha) * p.dot(x)
+
+    def rmatvec(x):
+        x = np.asarray(x, dtype=float).ravel()
+        y = alpha * (MT.dot(x) + dangling_weights * d.dot(x))
+        return y + (1 - alpha) * p * x.sum()
+
+    return LinearOperator((N, N), matvec=matvec, rmatvec=rmatvec,
+                          dtype=float)
+
+
 def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight',
                    dangling=None):
     """Return the PageRank of the nodes in the graph.
@@ -488,6 +578,238 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     raise nx.PowerIterationFailedConvergence(max_iter)
 
 
+@not_implemented_for('multigraph')
+def pagerank_push(G, source, alpha=0.85, tol=1.0e-6, weight='weight'):
+    """Return an approximate personalized PageRank for a single seed node.
+
+    The personalized PageRank of `source` is the PageRank obtained with a
+    personalization vector concentrated on `source`.  Instead of a power
+    iteration over the whole graph this function uses the local "forward
+    push" algorithm of Andersen, Chung and Lang [1]_, which only touches
+    nodes in the neighborhood of `source` that receive a significant
+    amount of probability mass.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  For undirected graphs every edge is followed in
+      both directions.
+
+    source : node
+      The seed node of the personalization vector.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    tol : float, optional
+      Residual tolerance.  The push stops once the residual of every
+      node is smaller than `tol` times its out-degree (or `tol` for
+      nodes without outedges).
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    Returns
+    -------
+    pagerank : dictionary
+       Dictionary keyed by the nodes reached by the push with their
+       approximate personalized PageRank as value.  Nodes that are not
+       in the dictionary have an approximate value of zero.
+
+    Raises
+    ------
+    NetworkXError
+        If `source` is not in `G` or `tol` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> ppr = nx.pagerank_push(G, 0, alpha=0.9)
+
+    Notes
+    -----
+    The values are a lower bound of the personalized PageRank computed
+    by ``pagerank(G, alpha, personalization={source: 1})`` (with zero
+    personalization for all other nodes).  The difference between the
+    two, measured in the l1 norm, is the total residual left when the
+    push stops, which is bounded by `tol` times the number of edges and
+    nodes touched.  As in :func:`pagerank`, the mass of dangling nodes
+    is returned to the personalization vector, here the seed node.
+
+    The running time is independent of the size of the graph: at most
+    ``1 / (tol * (1 - alpha))`` edge traversals are performed.
+
+    See Also
+    --------
+    pagerank, pagerank_push_batch
+
+    References
+    ----------
+    .. [1] R. Andersen, F. Chung and K. Lang,
+       "Local graph partitioning using PageRank vectors."
+       Proceedings of the 47th Annual IEEE Symposium on Foundations of
+       Computer Science (FOCS), 2006.
+    """
+    if source not in G:
+        raise NetworkXError('The node %s is not in the graph.' % (source,))
+    if tol <= 0:
+        raise NetworkXError('The residual tolerance must be positive.')
+    adj = G.adj
+
+    def threshold(n):
+        return tol * max(len(adj[n]), 1)
+
+    p = {}
+    r = {source: 1.0}
+    queue = deque([source])
+    queued = set([source])
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        ru = r[u]
+        r[u] = 0.0
+        p[u] = p.get(u, 0.0) + (1.0 - alpha) * ru
+        nbrs = adj[u]
+        if weight is None:
+            wsum = float(len(nbrs))
+            pushes = ((v, 1.0) for v in nbrs)
+        else:
+            wsum = float(sum(d.get(weight, 1) for d in nbrs.values()))
+            pushes = ((v, d.get(weight, 1)) for v, d in nbrs.items())
+        if wsum == 0:
+            # dangling node: send the mass back to the seed
+            pushes = ((source, 1.0),)
+            wsum = 1.0
+        mass = alpha * ru / wsum
+        for v, w in pushes:
+            r[v] = r.get(v, 0.0) + mass * w
+            if v not in queued and r[v] >= threshold(v):
+                queue.append(v)
+                queued.add(v)
+    return p
+
+
+def pagerank_push_batch(G, sources, alpha=0.85, tol=1.0e-6,
+                        weight='weight'):
+    """Return approximate personalized PageRanks for several seed nodes.
+
+    This is the batched version of :func:`pagerank_push`.  The graph is
+    converted once to a SciPy sparse row-stochastic matrix and the
+    forward push of every seed runs on that shared compressed sparse
+    row (CSR) snapshot, reusing the same work arrays.  Only the entries
+    touched by a push are read and reset, so the cost of each query
+    depends on the explored neighborhood and not on the graph size.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    sources : iterable
+      The seed nodes.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    tol : float, optional
+      Residual tolerance, see :func:`pagerank_push`.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    Returns
+    -------
+    pagerank : dictionary
+       Dictionary keyed by seed node.  Each value is a dictionary keyed
+       by the nodes reached from that seed with their approximate
+       personalized PageRank as value.
+
+    Raises
+    ------
+    NetworkXError
+        If a seed node is not in `G` or `tol` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> ppr = nx.pagerank_push_batch(G, [0, 2], alpha=0.9)
+    >>> sorted(ppr)
+    [0, 2]
+
+    Notes
+    -----
+    This implementation works with Multi(Di)Graphs. For multigraphs the
+    weight between two nodes is set to be the sum of all edge weights
+    between those nodes.
+
+    See Also
+    --------
+    pagerank_push, pagerank_scipy
+    """
+    import numpy as np
+
+    if tol <= 0:
+        raise NetworkXError('The residual tolerance must be positive.')
+    nodelist = list(G)
+    index = dict(zip(nodelist, range(len(nodelist))))
+    sources = list(sources)
+    missing = set(sources) - set(index)
+    if missing:
+        raise NetworkXError('Seed nodes %s are not in the graph.' % missing)
+    if not sources:
+        return {}
+
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                  dtype=float, format='csr')
+    indptr, indices = M.indptr, M.indices
+    degree = np.diff(indptr)
+    S = np.asarray(M.sum(axis=1)).flatten()
+    is_dangling = S == 0
+    S[~is_dangling] = 1.0 / S[~is_dangling]
+    data = M.data * np.repeat(S, degree)
+    threshold = tol * np.maximum(degree, 1)
+
+    N = len(nodelist)
+    p = np.zeros(N)
+    r = np.zeros(N)
+    queued = np.zeros(N, dtype=bool)
+    result = {}
+    for source in sources:
+        s = index[source]
+        r[s] = 1.0
+        queued[s] = True
+        queue = deque([s])
+        pushed = set()
+        while queue:
+            u = queue.popleft()
+            queued[u] = False
+            ru = r[u]
+            r[u] = 0.0
+            p[u] += (1.0 - alpha) * ru
+            pushed.add(u)
+            if is_dangling[u]:
+                # dangling node: send the mass back to the seed
+                r[s] += alpha * ru
+                if not queued[s] and r[s] >= threshold[s]:
+                    queued[s] = True
+                    queue.append(s)
+                continue
+            start, end = indptr[u], indptr[u + 1]
+            nbrs = indices[start:end]
+            r[nbrs] += alpha * ru * data[start:end]
+            active = nbrs[(r[nbrs] >= threshold[nbrs]) & ~queued[nbrs]]
+            queued[active] = True
+            queue.extend(active.tolist())
+        result[source] = dict((nodelist[u], float(p[u])) for u in pushed)
+        # reset only the entries touched by this seed
+        for u in pushed:
+            p[u] = 0.0
+            r[indices[indptr[u]:indptr[u + 1]]] = 0.0
+        r[s] = 0.0
+    return result
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+import os
+import shutil
+import tempfile
+
+from nose.tools import *
+from nose import SkipTest
+import networkx
+
+
+class TestOutOfCore(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+            import scipy
+        except ImportError:
+            raise SkipTest('NumPy and SciPy not available.')
+
+    def setUp(self):
+        G = networkx.gnp_random_graph(60, 0.08, seed=42, directed=True)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u * v) % 5 + 1
+        self.G = G
+        self.nodelist = list(range(len(G)))
+        M = networkx.to_scipy_sparse_matrix(G, nodelist=self.nodelist,
+                                            format='csr')
+        self.dir = tempfile.mkdtemp()
+        self.files = []
+        for name in ('indptr', 'indices', 'weights'):
+            path = os.path.join(self.dir, name + '.npy')
+            numpy.save(path, getattr(M, 'data' if name == 'weights'
+                                     else name))
+            self.files.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_pagerank_mmap(self):
+        indptr, indices, weights = self.files
+        expected = networkx.pagerank_scipy(self.G, tol=1.e-10)
+        pr = networkx.pagerank_mmap(indptr, indices, weights, tol=1.e-10,
+                                    chunksize=17, n_jobs=3)
+        for n in self.nodelist:
+            assert_almost_equal(pr[n], expected[n])
+        expected = networkx.pagerank_scipy(self.G, tol=1.e-10, weight=None)
+        pr = networkx.pagerank_mmap(indptr, indices, tol=1.e-10,
+                                    chunksize=17, n_jobs=3)
+        for n in self.nodelist:
+            assert_almost_equal(pr[n], expected[n])
+
+    def test_pagerank_mmap_personalization(self):
+        indptr, indices, weights = self.files
+        p = dict((n, n % 3) for n in self.nodelist)
+        expected = networkx.pagerank_scipy(self.G, personalization=p,
+                                           dangling=p, tol=1.e-10)
+        vector = [p[n] for n in self.nodelist]
+        pr = networkx.pagerank_mmap(indptr, indices, weights, tol=1.e-10,
+                                    personalization=vector, dangling=vector,
+                                    chunksize=100, n_jobs=2)
+        for n in self.nodelist:
+            assert_almost_equal(pr[n], expected[n])
+        assert_raises(networkx.NetworkXError, networkx.pagerank_mmap,
+                      indptr, indices, personalization=[1, 2])
+
+    @raises(networkx.PowerIterationFailedConvergence)
+    def test_pagerank_mmap_max_iter(self):
+        indptr, indices, weights = self.files
+        networkx.pagerank_mmap(indptr, indices, max_iter=0)
+
+    def test_hits_mmap(self):
+        indptr, indices, weights = self.files
+        G = networkx.DiGraph(self.G.edges())
+        eh, ea = networkx.hits_scipy(G, tol=1.e-10)
+        h, a = networkx.hits_mmap(indptr, indices, tol=1.e-10,
+                                  chunksize=11, n_jobs=2)
+        for n in self.nodelist:
+            assert_almost_equal(h[n], eh[n])
+            assert_almost_equal(a[n], ea[n])
+
+    def test_inconsistent(self):
+        indptr, indices, weights = self.files
+        assert_raises(networkx.NetworkXError, networkx.pagerank_mmap,
+                      indptr, [0, 1])
+        assert_raises(networkx.NetworkXError, networkx.hits_mmap,
+                      indptr, indices, [1.0])
+
+    def test_empty(self):
+        assert_equal(len(networkx.pagerank_mmap([0], [])), 0)
+        h, a = networkx.hits_mmap([0], [])
+        assert_equal((len(h), len(a)), (0, 0))
@@ -133,7 +133,30 @@ class TestPageRank(object):
         for n in self.G:
             assert_almost_equal(pr[n], self.G.dangling_pagerank[n], places=4)
 
-
+    def test_pagerank_push(self):
+        G = self.G
+        for source in G:
+            personalize = dict((n, int(n == source)) for n in G)
+            expected = networkx.pagerank(G, alpha=0.9, tol=1.e-10,
+                                         max_iter=500,
+                                         personalization=personalize)
+            p = networkx.pagerank_push(G, source, alpha=0.9, tol=1.e-10)
+            for n in G:
+                assert_almost_equal(p.get(n, 0), expected[n], places=6)
+
+    def test_pagerank_push_local(self):
+        G = networkx.disjoint_union(networkx.path_graph(4),
+                                    networkx.complete_graph(5))
+        p = networkx.pagerank_push(G, 0, tol=1.e-8)
+        assert_equal(set(p), {0, 1, 2, 3})
+        assert_true(sum(p.values()) <= 1)
+        assert_almost_equal(sum(p.values()), 1, places=4)
+
+    def test_pagerank_push_errors(self):
+        assert_raises(networkx.NetworkXError, networkx.pagerank_push,
+                      self.G, 7)
+        assert_raises(networkx.NetworkXError, networkx.pagerank_push,
+                      self.G, 1, tol=0)
 
     def test_empty(self):
         G = networkx.Graph()
@@ -171,6 +194,50 @@ class TestPageRankScipy(TestPageRank):
         for n in self.G:
             assert_almost_equal(pr[n], self.G.dangling_pagerank[n], places=4)
 
+    def test_pagerank_push_batch(self):
+        G = self.G
+        weighted = networkx.DiGraph()
+        weighted.add_weighted_edges_from((u, v, u + v) for u, v in G.edges())
+        for H in (G, weighted, networkx.karate_club_graph()):
+            seeds = list(H)[:3]
+            batch = networkx.pagerank_push_batch(H, seeds, alpha=0.9,
+                                                 tol=1.e-10)
+            assert_equal(set(batch), set(seeds))
+            for source in seeds:
+                p = networkx.pagerank_push(H, source, alpha=0.9, tol=1.e-10)
+                for n in H:
+                    assert_almost_equal(batch[source].get(n, 0),
+                                        p.get(n, 0), places=6)
+        assert_equal(networkx.pagerank_push_batch(G, []), {})
+        assert_raises(networkx.NetworkXError, networkx.pagerank_push_batch,
+                      G, [1, 7])
+
+    def test_google_operator(self):
+        G = self.G
+        personalize = dict((n, random.random()) for n in G)
+        for kwds in ({}, {'personalization': personalize},
+                     {'personalization': personalize,
+                      'dangling': self.dangling_edges}):
+            M = networkx.google_matrix(G, alpha=0.9, **kwds)
+            A = networkx.google_matrix(G, alpha=0.9, operator=True, **kwds)
+            I = numpy.eye(len(G))
+            numpy.testing.assert_allclose(A.matmat(I), M)
+            numpy.testing.assert_allclose(A.rmatvec(I[0]), M.T.dot(I[0]).A1)
+        personalize.pop(1)
+        assert_raises(networkx.NetworkXError, networkx.google_matrix, G,
+                      personalization=personalize, operator=True)
+
+    def test_google_operator_eigs(self):
+        from scipy.sparse.linalg import eigs
+        G = self.G
+        A = networkx.google_matrix(G, alpha=0.9, operator=True)
+        e, ev = eigs(A.T, k=1, which='LM')
+        p = ev[:, 0].real / ev[:, 0].real.sum()
+        expected = networkx.pagerank_numpy(G, alpha=0.9)
+        for (n, a) in zip(G, p):
+            assert_almost_equal(a, expected[n])
+
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+        assert_equal(networkx.google_matrix(G, operator=True).shape, (0, 0))
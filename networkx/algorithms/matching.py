@@ -13,8 +13,11 @@
 # All rights reserved.
 # BSD license.
 """Functions for computing and verifying matchings in a graph."""
+from heapq import heappop
+from heapq import heappush
+from heapq import heapreplace
+from itertools import chain
 from itertools import combinations
-from itertools import repeat
 
 __all__ = ['is_matching', 'is_maximal_matching', 'max_weight_matching',
            'maximal_matching']
@@ -181,9 +184,19 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
     Notes
     -----
     If G has edges with weight attributes the edge data are used as
-    weight values else the weights are assumed to be 1.
-
-    This function takes time O(number_of_nodes ** 3).
+    weight values else the weights are assumed to be 1. Of parallel edges
+    of a multigraph, only the heaviest is considered.
+
+    The nodes, edges and blossoms are numbered and kept in lists. The dual
+    variables are updated lazily, by one addition instead of one per node,
+    and the least-slack edges and blossom duals that bound each dual
+    update are kept in binary heaps. After an augmentation, only the two
+    alternating trees joined by the augmenting path are dissolved; the
+    other trees are kept for the next search. Each augmentation thus takes
+    $O(m \\log n)$ time besides relabeling the nodes of the blossoms
+    created or expanded, and usually much less, and the algorithm takes
+    $O(n m \\log n)$ time when the blossoms stay small. In the worst case
+    the relabeling of nested blossoms makes it $O(n^3)$.
 
     If all edge weights are integers, the algorithm uses only integer
     computations.  If floating point weights are used, the algorithm
@@ -195,7 +208,11 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
     weight, both methods invented by Jack Edmonds [1]_.
 
     Bipartite graphs can also be matched using the functions present in
-    :mod:`networkx.algorithms.bipartite.matching`.
+    :mod:`networkx.algorithms.bipartite.matching`. For graphs too large
+    for this function,
+    :func:`~networkx.algorithms.approximation.matching.approximate_max_weight_matching`
+    finds matchings of guaranteed fractions of the maximum weight in
+    nearly linear time.
 
     References
     ----------
@@ -215,157 +232,239 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
     # Many terms used in the code comments are explained in the paper
     # by Galil. You will probably need the paper to make sense of this code.
     #
-
-    class NoNode:
-        """Dummy value which is different from any node."""
-        pass
-
-    class Blossom:
-        """Representation of a non-trivial blossom or sub-blossom."""
-
-        __slots__ = ['childs', 'edges', 'mybestedges']
-
-        # b.childs is an ordered list of b's sub-blossoms, starting with
-        # the base and going round the blossom.
-
-        # b.edges is the list of b's connecting edges, such that
-        # b.edges[i] = (v, w) where v is a vertex in b.childs[i]
-        # and w is a vertex in b.childs[wrap(i+1)].
-
-        # If b is a top-level S-blossom,
-        # b.mybestedges is a list of least-slack edges to neighbouring
-        # S-blossoms, or None if no such list has been computed yet.
-        # This is used for efficient computation of delta3.
-
-        # Generate the blossom's leaf vertices.
-        def leaves(self):
-            for t in self.childs:
-                if isinstance(t, Blossom):
-                    for v in t.leaves():
-                        yield v
-                else:
-                    yield t
-
-    # Get a list of vertices.
+    # Vertices are numbered from 0 to n - 1 and non-trivial blossoms from
+    # n to 2 * n - 1, so that vertices are their own trivial blossoms.
+    # Edges are identified by triples (v, w, k), where k is the number of
+    # the edge, going from v to w.
+    #
+    # The dual variables are not updated after each delta; instead, the
+    # total of the deltas so far is kept in total[0], and the dual
+    # variable of a vertex or top-level blossom is stored relative to it,
+    # according to its label:
+    #
+    #   label    2 * u(v)                     z(b)
+    #   S        dualvar[v] - total[0]        blossomdual[b] + total[0]
+    #   T        dualvar[v] + total[0]        blossomdual[b] - total[0]
+    #   none     dualvar[v]                   blossomdual[b]
+    #
+    # The stored values are converted when the label changes. The
+    # least-slack edges and the T-blossom duals that bound delta are kept
+    # in heaps, keyed by values which do not change with total[0]; stale
+    # entries are dropped or fixed when they reach the top.
+    #
+    # Unlike in Galil's description, the labels are not all removed after
+    # an augmentation: the vertices form a forest of alternating trees,
+    # each rooted at a single vertex, and only the two trees joined by the
+    # augmenting path are dissolved. The other trees are still valid and
+    # the search continues from them.
+    #
     gnodes = list(G)
     if not gnodes:
         return {}  # don't bother with empty graphs
+    n = len(gnodes)
+    index = {v: i for i, v in enumerate(gnodes)}
 
-    # Find the maximum edge weight.
+    # Find the maximum edge weight, and the edges.
     maxweight = 0
     allinteger = True
+    edgeweight = {}
     for i, j, d in G.edges(data=True):
         wt = d.get(weight, 1)
-        if i != j and wt > maxweight:
-            maxweight = wt
         allinteger = allinteger and (str(type(wt)).split("'")[1]
                                      in ('int', 'long'))
-
-    # If v is a matched vertex, mate[v] is its partner vertex.
-    # If v is a single vertex, v does not occur as a key in mate.
+        if i == j:
+            continue  # ignore self-loops
+        if wt > maxweight:
+            maxweight = wt
+        i = index[i]
+        j = index[j]
+        if i > j:
+            i, j = j, i
+        if (i, j) not in edgeweight or wt > edgeweight[i, j]:
+            edgeweight[i, j] = wt
+
+    # Edge k joins vertices edgeend[k] and has twice its weight in w2[k].
+    # neighbors[v] is the list of the pairs (w, k) of the edges k joining
+    # vertex v to w.
+    edgeend = []
+    w2 = []
+    neighbors = [[] for v in range(n)]
+    for (i, j), wt in edgeweight.items():
+        k = len(w2)
+        edgeend.append((i, j))
+        w2.append(2 * wt)
+        neighbors[i].append((j, k))
+        neighbors[j].append((i, k))
+    del edgeweight
+
+    # If v is a matched vertex, mate[v] is its partner vertex and
+    # mateedge[v] the number of the matched edge.
+    # If v is a single vertex, mate[v] is -1.
     # Initially all vertices are single; updated during augmentation.
-    mate = {}
+    mate = [-1] * n
+    mateedge = [-1] * n
 
     # If b is a top-level blossom,
-    # label.get(b) is None if b is unlabeled (free),
-    #                 1 if b is an S-blossom,
-    #                 2 if b is a T-blossom.
+    # label[b] is 0 if b is unlabeled (free),
+    #             1 if b is an S-blossom,
+    #             2 if b is a T-blossom.
     # The label of a vertex is found by looking at the label of its top-level
     # containing blossom.
     # If v is a vertex inside a T-blossom, label[v] is 2 iff v is reachable
     # from an S-vertex outside the blossom.
-    # Labels are assigned during a stage and reset after each augmentation.
-    label = {}
+    # Labels are assigned during the search and removed from the trees
+    # joined by each augmenting path.
+    label = [0] * (2 * n)
+
+    # If b is a labeled top-level blossom, tree[b] is the single vertex at
+    # the root of its alternating tree.
+    # If r is the root of a tree, treeblossoms[r] lists the blossoms that
+    # were labeled in the tree.
+    tree = [-1] * (2 * n)
+    treeblossoms = {}
 
     # If b is a labeled top-level blossom,
-    # labeledge[b] = (v, w) is the edge through which b obtained its label
-    # such that w is a vertex in b, or None if b's base vertex is single.
+    # labeledge[b] = (v, w, k) is the edge through which b obtained its
+    # label such that w is a vertex in b, or None if b's base vertex is
+    # single.
     # If w is a vertex inside a T-blossom and label[w] == 2,
-    # labeledge[w] = (v, w) is an edge through which w is reachable from
+    # labeledge[w] = (v, w, k) is an edge through which w is reachable from
     # outside the blossom.
-    labeledge = {}
+    labeledge = [None] * (2 * n)
 
     # If v is a vertex, inblossom[v] is the top-level blossom to which v
     # belongs.
     # If v is a top-level vertex, inblossom[v] == v since v is itself
     # a (trivial) top-level blossom.
     # Initially all vertices are top-level trivial blossoms.
-    inblossom = dict(zip(gnodes, gnodes))
+    inblossom = list(range(n))
 
     # If b is a sub-blossom,
     # blossomparent[b] is its immediate parent (sub-)blossom.
-    # If b is a top-level blossom, blossomparent[b] is None.
-    blossomparent = dict(zip(gnodes, repeat(None)))
+    # If b is a top-level blossom, blossomparent[b] is -1.
+    blossomparent = [-1] * (2 * n)
+
+    # If b is a non-trivial (sub-)blossom,
+    # blossomchilds[b] is an ordered list of b's sub-blossoms, starting
+    # with the base and going round the blossom, and
+    # blossomedges[b] is the list of b's connecting edges, such that
+    # blossomedges[b][i] = (v, w, k) where v is a vertex in
+    # blossomchilds[b][i] and w is a vertex in blossomchilds[b][i + 1],
+    # wrapping around.
+    # Both are None for the numbers of unused blossoms.
+    blossomchilds = [None] * (2 * n)
+    blossomedges = [None] * (2 * n)
 
     # If b is a (sub-)blossom,
     # blossombase[b] is its base VERTEX (i.e. recursive sub-blossom).
-    blossombase = dict(zip(gnodes, gnodes))
+    blossombase = list(range(n)) + [-1] * n
+
+    # List of currently unused blossom numbers.
+    unusedblossoms = list(range(2 * n - 1, n - 1, -1))
 
     # If w is a free vertex (or an unreached vertex inside a T-blossom),
-    # bestedge[w] = (v, w) is the least-slack edge from an S-vertex,
+    # bestedge[w] = (v, w, k) is the least-slack edge from an S-vertex,
     # or None if there is no such edge.
-    # If b is a (possibly trivial) top-level S-blossom,
-    # bestedge[b] = (v, w) is the least-slack edge to a different S-blossom
-    # (v inside b), or None if there is no such edge.
-    # This is used for efficient computation of delta2 and delta3.
-    bestedge = {}
+    bestedge = [None] * n
 
     # If v is a vertex,
     # dualvar[v] = 2 * u(v) where u(v) is the v's variable in the dual
     # optimization problem (if all edge weights are integers, multiplication
-    # by two ensures that all values remain integers throughout the algorithm).
+    # by two ensures that all values remain integers throughout the algorithm),
+    # stored relative to the deltas (see above).
     # Initially, u(v) = maxweight / 2.
-    dualvar = dict(zip(gnodes, repeat(maxweight)))
+    dualvar = [maxweight] * n
 
     # If b is a non-trivial blossom,
     # blossomdual[b] = z(b) where z(b) is b's variable in the dual
-    # optimization problem.
-    blossomdual = {}
+    # optimization problem, stored relative to the deltas.
+    blossomdual = [0] * (2 * n)
+
+    # The total of the deltas.
+    total = [0]
 
-    # If (v, w) in allowedge or (w, v) in allowedg, then the edge
-    # (v, w) is known to have zero slack in the optimization problem;
-    # otherwise the edge may or may not have zero slack.
-    allowedge = {}
+    # If allowedge[k] is True, edge k is known to have zero slack in the
+    # optimization problem; otherwise the edge may or may not have zero
+    # slack.
+    allowedge = [False] * len(w2)
 
     # Queue of newly discovered S-vertices.
     queue = []
 
-    # Return 2 * slack of edge (v, w) (does not work inside blossoms).
-    def slack(v, w):
-        return dualvar[v] + dualvar[w] - 2 * G[v][w].get(weight, 1)
+    # Heaps of (key, v, w, k) for the edges from S-vertices v to vertices w
+    # of free blossoms, for delta2, and between S-vertices of different
+    # blossoms, for delta3, with the key 2 * slack + total[0] and
+    # 2 * slack + 2 * total[0] respectively; heap of (key, b) for the
+    # T-blossoms b, for delta4, with key z(b) + total[0].
+    delta2heap = []
+    delta3heap = []
+    delta4heap = []
+
+    # Generate the blossom's leaf vertices.
+    def leaves(b):
+        if b < n:
+            return [b]
+        result = []
+        stack = [b]
+        while stack:
+            t = stack.pop()
+            if t < n:
+                result.append(t)
+            else:
+                stack.extend(blossomchilds[t])
+        return result
+
+    # Give label t to the free top-level blossom b: convert the dual
+    # variables of b and its vertices and return the vertices.
+    def setlabel(b, t):
+        vertices = leaves(b)
+        delta = total[0]
+        if t == 1:
+            for v in vertices:
+                dualvar[v] += delta
+            if b >= n:
+                blossomdual[b] -= delta
+        else:
+            for v in vertices:
+                dualvar[v] -= delta
+            if b >= n:
+                blossomdual[b] += delta
+                heappush(delta4heap, (blossomdual[b], b))
+        return vertices
 
     # Assign label t to the top-level blossom containing vertex w,
-    # coming through an edge from vertex v.
-    def assignLabel(w, t, v):
+    # coming through edge e.
+    def assignLabel(w, t, e):
         b = inblossom[w]
-        assert label.get(w) is None and label.get(b) is None
+        assert label[w] == 0 and label[b] == 0
         label[w] = label[b] = t
-        if v is not None:
-            labeledge[w] = labeledge[b] = (v, w)
+        labeledge[w] = labeledge[b] = e
+        bestedge[w] = None
+        if e is None:
+            tree[b] = w
+            treeblossoms[w] = [b]
         else:
-            labeledge[w] = labeledge[b] = None
-        bestedge[w] = bestedge[b] = None
+            tree[b] = tree[inblossom[e[0]]]
+            treeblossoms[tree[b]].append(b)
+        vertices = setlabel(b, t)
         if t == 1:
             # b became an S-vertex/blossom; add it(s vertices) to the queue.
-            if isinstance(b, Blossom):
-                queue.extend(b.leaves())
-            else:
-                queue.append(b)
+            queue.extend(vertices)
         elif t == 2:
             # b became a T-vertex/blossom; assign label S to its mate.
             # (If b is a non-trivial blossom, its base is the only vertex
             # with an external mate.)
             base = blossombase[b]
-            assignLabel(mate[base], 1, base)
+            assignLabel(mate[base], 1, (base, mate[base], mateedge[base]))
 
     # Trace back from vertices v and w to discover either a new blossom
     # or an augmenting path. Return the base vertex of the new blossom,
-    # or NoNode if an augmenting path was found.
+    # or -1 if an augmenting path was found.
     def scanBlossom(v, w):
         # Trace back from v and w, placing breadcrumbs as we go.
         path = []
-        base = NoNode
-        while v is not NoNode:
+        base = -1
+        while v != -1:
             # Look for a breadcrumb in v's blossom or put a new breadcrumb.
             b = inblossom[v]
             if label[b] & 4:
@@ -377,8 +476,8 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
             # Trace one step back.
             if labeledge[b] is None:
                 # The base of blossom b is single; stop tracing this path.
-                assert blossombase[b] not in mate
-                v = NoNode
+                assert mate[blossombase[b]] == -1
+                v = -1
             else:
                 assert labeledge[b][0] == mate[blossombase[b]]
                 v = labeledge[b][0]
@@ -387,7 +486,7 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
                 # b is a T-blossom; trace one more step back.
                 v = labeledge[b][0]
             # Swap v and w so that we alternate between both paths.
-            if w is not NoNode:
+            if w != -1:
                 v, w = w, v
         # Remove breadcrumbs.
         for b in path:
@@ -395,21 +494,22 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
         # Return base vertex, if we found one.
         return base
 
-    # Construct a new blossom with given base, through S-vertices v and w.
+    # Construct a new blossom with given base, through S-vertices v and w
+    # joined by edge k.
     # Label the new blossom as S; set its dual variable to zero;
     # relabel its T-vertices to S and add them to the queue.
-    def addBlossom(base, v, w):
+    def addBlossom(base, v, w, k):
         bb = inblossom[base]
         bv = inblossom[v]
         bw = inblossom[w]
         # Create blossom.
-        b = Blossom()
+        b = unusedblossoms.pop()
         blossombase[b] = base
-        blossomparent[b] = None
+        blossomparent[b] = -1
         blossomparent[bb] = b
         # Make list of sub-blossoms and their interconnecting edge endpoints.
-        b.childs = path = []
-        b.edges = edgs = [(v, w)]
+        blossomchilds[b] = path = []
+        blossomedges[b] = edgs = [(v, w, k)]
         # Trace back from v to base.
         while bv != bb:
             # Add bv to the new blossom.
@@ -430,7 +530,8 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
             # Add bw to the new blossom.
             blossomparent[bw] = b
             path.append(bw)
-            edgs.append((labeledge[bw][1], labeledge[bw][0]))
+            e = labeledge[bw]
+            edgs.append((e[1], e[0], e[2]))
             assert label[bw] == 2 or (label[bw] == 1 and labeledge[
                                       bw][0] == mate[blossombase[bw]])
             # Trace one step back.
@@ -440,215 +541,231 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
         assert label[bb] == 1
         label[b] = 1
         labeledge[b] = labeledge[bb]
+        tree[b] = tree[bb]
+        treeblossoms[tree[b]].append(b)
         # Set dual variable to zero.
-        blossomdual[b] = 0
+        delta = total[0]
+        blossomdual[b] = -delta
         # Relabel vertices.
-        for v in b.leaves():
-            if label[inblossom[v]] == 2:
-                # This T-vertex now turns into an S-vertex because it becomes
-                # part of an S-blossom; add it to the queue.
-                queue.append(v)
-            inblossom[v] = b
-        # Compute b.mybestedges.
-        bestedgeto = {}
         for bv in path:
-            if isinstance(bv, Blossom):
-                if bv.mybestedges is not None:
-                    # Walk this subblossom's least-slack edges.
-                    nblist = bv.mybestedges
-                    # The sub-blossom won't need this data again.
-                    bv.mybestedges = None
-                else:
-                    # This subblossom does not have a list of least-slack
-                    # edges; get the information from the vertices.
-                    nblist = [(v, w)
-                              for v in bv.leaves()
-                              for w in G.neighbors(v)
-                              if v != w]
-            else:
-                nblist = [(bv, w)
-                          for w in G.neighbors(bv)
-                          if bv != w]
-            for k in nblist:
-                (i, j) = k
-                if inblossom[j] == b:
-                    i, j = j, i
-                bj = inblossom[j]
-                if (bj != b and label.get(bj) == 1 and
-                    ((bj not in bestedgeto) or
-                     slack(i, j) < slack(*bestedgeto[bj]))):
-                    bestedgeto[bj] = k
-            # Forget about least-slack edge of the subblossom.
-            bestedge[bv] = None
-        b.mybestedges = list(bestedgeto.values())
-        # Select bestedge[b].
-        mybestedge = None
-        bestedge[b] = None
-        for k in b.mybestedges:
-            kslack = slack(*k)
-            if mybestedge is None or kslack < mybestslack:
-                mybestedge = k
-                mybestslack = kslack
-        bestedge[b] = mybestedge
+            vertices = leaves(bv)
+            if label[bv] == 2:
+                # These T-vertices now turn into S-vertices because they
+                # become part of an S-blossom; add them to the queue.
+                queue.extend(vertices)
+                for v in vertices:
+                    dualvar[v] += 2 * delta
+                if bv >= n:
+                    blossomdual[bv] -= delta
+            elif bv >= n:
+                blossomdual[bv] += delta
+            for v in vertices:
+                inblossom[v] = b
 
     # Expand the given top-level blossom.
     def expandBlossom(b, endstage):
-        # Convert sub-blossoms into top-level blossoms.
-        for s in b.childs:
-            blossomparent[s] = None
-            if isinstance(s, Blossom):
-                if endstage and blossomdual[s] == 0:
-                    # Recursively expand this sub-blossom.
-                    expandBlossom(s, endstage)
+        # Sub-blossoms with zero dual are expanded as well at the end of
+        # a stage; they are kept on a worklist since the nesting can be
+        # very deep.
+        pending = [b]
+        while pending:
+            b = pending.pop()
+            childs = blossomchilds[b]
+            if not endstage:
+                # The T-blossom leaves the stage bookkeeping; its vertices are
+                # free until relabeled below.
+                delta = total[0]
+                for v in leaves(b):
+                    dualvar[v] += delta
+            # Convert sub-blossoms into top-level blossoms.
+            for s in childs:
+                blossomparent[s] = -1
+                if s < n:
+                    inblossom[s] = s
+                elif endstage and blossomdual[s] == 0:
+                    pending.append(s)
                 else:
-                    for v in s.leaves():
+                    for v in leaves(s):
                         inblossom[v] = s
-            else:
-                inblossom[s] = s
-        # If we expand a T-blossom during a stage, its sub-blossoms must be
-        # relabeled.
-        if (not endstage) and label.get(b) == 2:
-            # Start at the sub-blossom through which the expanding
-            # blossom obtained its label, and relabel sub-blossoms untili
-            # we reach the base.
-            # Figure out through which sub-blossom the expanding blossom
-            # obtained its label initially.
-            entrychild = inblossom[labeledge[b][1]]
+            # If we expand a T-blossom during a stage, its sub-blossoms must be
+            # relabeled.
+            if (not endstage) and label[b] == 2:
+                edgs = blossomedges[b]
+                # Start at the sub-blossom through which the expanding
+                # blossom obtained its label, and relabel sub-blossoms until
+                # we reach the base.
+                # Figure out through which sub-blossom the expanding blossom
+                # obtained its label initially.
+                entrychild = inblossom[labeledge[b][1]]
+                # Decide in which direction we will go round the blossom.
+                j = childs.index(entrychild)
+                if j & 1:
+                    # Start index is odd; go forward and wrap.
+                    j -= len(childs)
+                    jstep = 1
+                else:
+                    # Start index is even; go backward.
+                    jstep = -1
+                # Move along the blossom until we get to the base.
+                e = labeledge[b]
+                while j != 0:
+                    # Relabel the T-sub-blossom.
+                    if jstep == 1:
+                        p, q, k = edgs[j]
+                    else:
+                        q, p, k = edgs[j - 1]
+                    label[e[1]] = 0
+                    label[q] = 0
+                    assignLabel(e[1], 2, e)
+                    # Step to the next S-sub-blossom and note its forward edge.
+                    allowedge[k] = True
+                    j += jstep
+                    if jstep == 1:
+                        e = edgs[j]
+                    else:
+                        w, v, k = edgs[j - 1]
+                        e = (v, w, k)
+                    # Step to the next T-sub-blossom.
+                    allowedge[e[2]] = True
+                    j += jstep
+                # Relabel the base T-sub-blossom WITHOUT stepping through to
+                # its mate (so don't call assignLabel).
+                bw = childs[j]
+                w = e[1]
+                label[w] = label[bw] = 2
+                labeledge[w] = labeledge[bw] = e
+                bestedge[w] = None
+                tree[bw] = tree[b]
+                treeblossoms[tree[b]].append(bw)
+                setlabel(bw, 2)
+                # Continue along the blossom until we get back to entrychild.
+                j += jstep
+                while childs[j] != entrychild:
+                    # Examine the vertices of the sub-blossom to see whether
+                    # it is reachable from a neighbouring S-vertex outside the
+                    # expanding blossom.
+                    bv = childs[j]
+                    if label[bv] == 1:
+                        # This sub-blossom just got label S through one of its
+                        # neighbours; leave it be.
+                        j += jstep
+                        continue
+                    for v in leaves(bv):
+                        if label[v]:
+                            break
+                    # If the sub-blossom contains a reachable vertex, assign
+                    # label T to the sub-blossom.
+                    if label[v]:
+                        assert label[v] == 2
+                        assert inblossom[v] == bv
+                        label[v] = 0
+                        label[mate[blossombase[bv]]] = 0
+                        assignLabel(v, 2, labeledge[v])
+                    j += jstep
+                # The least-slack edges to the sub-blossoms that stay free
+                # count again for delta2.
+                for bv in childs:
+                    if label[bv] == 0:
+                        for w in leaves(bv):
+                            e = bestedge[w]
+                            if e is not None:
+                                v, w, k = e
+                                heappush(delta2heap,
+                                         (dualvar[v] + dualvar[w] - w2[k],
+                                          v, w, k))
+            # Remove the expanded blossom entirely.
+            label[b] = 0
+            labeledge[b] = None
+            tree[b] = -1
+            blossomchilds[b] = None
+            blossomedges[b] = None
+            blossombase[b] = -1
+            blossomdual[b] = 0
+            unusedblossoms.append(b)
+
+    # Swap matched/unmatched edges over an alternating path through blossom b
+    # between vertex v and the base vertex. Keep blossom bookkeeping
+    # consistent.
+    def augmentBlossom(b, v):
+        # Nested blossoms can be thousands of levels deep, so the
+        # recursion is driven by an explicit stack of generators; each
+        # generator yields the sub-blossom it wants augmented first.
+        def _recurse(b, v):
+            # Bubble up through the blossom tree from vertex v to an immediate
+            # sub-blossom of b.
+            t = v
+            while blossomparent[t] != b:
+                t = blossomparent[t]
+            # Recursively deal with the first sub-blossom.
+            if t >= n:
+                yield (t, v)
             # Decide in which direction we will go round the blossom.
-            j = b.childs.index(entrychild)
-            if j & 1:
+            childs = blossomchilds[b]
+            edgs = blossomedges[b]
+            i = j = childs.index(t)
+            if i & 1:
                 # Start index is odd; go forward and wrap.
-                j -= len(b.childs)
+                j -= len(childs)
                 jstep = 1
             else:
                 # Start index is even; go backward.
                 jstep = -1
             # Move along the blossom until we get to the base.
-            v, w = labeledge[b]
             while j != 0:
-                # Relabel the T-sub-blossom.
-                if jstep == 1:
-                    p, q = b.edges[j]
-                else:
-                    q, p = b.edges[j - 1]
-                label[w] = None
-                label[q] = None
-                assignLabel(w, 2, v)
-                # Step to the next S-sub-blossom and note its forward edge.
-                allowedge[(p, q)] = allowedge[(q, p)] = True
+                # Step to the next sub-blossom and augment it recursively.
                 j += jstep
+                t = childs[j]
                 if jstep == 1:
-                    v, w = b.edges[j]
-                else:
-                    w, v = b.edges[j - 1]
-                # Step to the next T-sub-blossom.
-                allowedge[(v, w)] = allowedge[(w, v)] = True
-                j += jstep
-            # Relabel the base T-sub-blossom WITHOUT stepping through to
-            # its mate (so don't call assignLabel).
-            bw = b.childs[j]
-            label[w] = label[bw] = 2
-            labeledge[w] = labeledge[bw] = (v, w)
-            bestedge[bw] = None
-            # Continue along the blossom until we get back to entrychild.
-            j += jstep
-            while b.childs[j] != entrychild:
-                # Examine the vertices of the sub-blossom to see whether
-                # it is reachable from a neighbouring S-vertex outside the
-                # expanding blossom.
-                bv = b.childs[j]
-                if label.get(bv) == 1:
-                    # This sub-blossom just got label S through one of its
-                    # neighbours; leave it be.
-                    j += jstep
-                    continue
-                if isinstance(bv, Blossom):
-                    for v in bv.leaves():
-                        if label.get(v):
-                            break
+                    w, x, k = edgs[j]
                 else:
-                    v = bv
-                # If the sub-blossom contains a reachable vertex, assign
-                # label T to the sub-blossom.
-                if label.get(v):
-                    assert label[v] == 2
-                    assert inblossom[v] == bv
-                    label[v] = None
-                    label[mate[blossombase[bv]]] = None
-                    assignLabel(v, 2, labeledge[v][0])
+                    x, w, k = edgs[j - 1]
+                if t >= n:
+                    yield (t, w)
+                # Step to the next sub-blossom and augment it recursively.
                 j += jstep
-        # Remove the expanded blossom entirely.
-        label.pop(b, None)
-        labeledge.pop(b, None)
-        bestedge.pop(b, None)
-        del blossomparent[b]
-        del blossombase[b]
-        del blossomdual[b]
-
-    # Swap matched/unmatched edges over an alternating path through blossom b
-    # between vertex v and the base vertex. Keep blossom bookkeeping
-    # consistent.
-    def augmentBlossom(b, v):
-        # Bubble up through the blossom tree from vertex v to an immediate
-        # sub-blossom of b.
-        t = v
-        while blossomparent[t] != b:
-            t = blossomparent[t]
-        # Recursively deal with the first sub-blossom.
-        if isinstance(t, Blossom):
-            augmentBlossom(t, v)
-        # Decide in which direction we will go round the blossom.
-        i = j = b.childs.index(t)
-        if i & 1:
-            # Start index is odd; go forward and wrap.
-            j -= len(b.childs)
-            jstep = 1
-        else:
-            # Start index is even; go backward.
-            jstep = -1
-        # Move along the blossom until we get to the base.
-        while j != 0:
-            # Step to the next sub-blossom and augment it recursively.
-            j += jstep
-            t = b.childs[j]
-            if jstep == 1:
-                w, x = b.edges[j]
+                t = childs[j]
+                if t >= n:
+                    yield (t, x)
+                # Match the edge connecting those sub-blossoms.
+                mate[w] = x
+                mate[x] = w
+                mateedge[w] = mateedge[x] = k
+            # Rotate the list of sub-blossoms to put the new base at the front.
+            blossomchilds[b] = childs[i:] + childs[:i]
+            blossomedges[b] = edgs[i:] + edgs[:i]
+            blossombase[b] = blossombase[blossomchilds[b][0]]
+            assert blossombase[b] == v
+
+        stack = [_recurse(b, v)]
+        while stack:
+            top = stack[-1]
+            for args in top:
+                stack.append(_recurse(*args))
+                break
             else:
-                x, w = b.edges[j - 1]
-            if isinstance(t, Blossom):
-                augmentBlossom(t, w)
-            # Step to the next sub-blossom and augment it recursively.
-            j += jstep
-            t = b.childs[j]
-            if isinstance(t, Blossom):
-                augmentBlossom(t, x)
-            # Match the edge connecting those sub-blossoms.
-            mate[w] = x
-            mate[x] = w
-        # Rotate the list of sub-blossoms to put the new base at the front.
-        b.childs = b.childs[i:] + b.childs[:i]
-        b.edges = b.edges[i:] + b.edges[:i]
-        blossombase[b] = blossombase[b.childs[0]]
-        assert blossombase[b] == v
+                stack.pop()
 
     # Swap matched/unmatched edges over an alternating path between two
-    # single vertices. The augmenting path runs through S-vertices v and w.
-    def augmentMatching(v, w):
+    # single vertices. The augmenting path runs through S-vertices v and w
+    # joined by edge k.
+    def augmentMatching(v, w, k):
         for (s, j) in ((v, w), (w, v)):
             # Match vertex s to vertex j. Then trace back from s
             # until we find a single vertex, swapping matched and unmatched
             # edges as we go.
+            sk = k
             while 1:
                 bs = inblossom[s]
                 assert label[bs] == 1
-                assert (
-                        labeledge[bs] is None and blossombase[bs] not in mate)\
-                    or (labeledge[bs][0] == mate[blossombase[bs]])
+                assert (labeledge[bs] is None and
+                        mate[blossombase[bs]] == -1) or (
+                    labeledge[bs][0] == mate[blossombase[bs]])
                 # Augment through the S-blossom from s to base.
-                if isinstance(bs, Blossom):
+                if bs >= n:
                     augmentBlossom(bs, s)
                 # Update mate[s]
                 mate[s] = j
+                mateedge[s] = sk
                 # Trace one step back.
                 if labeledge[bs] is None:
                     # Reached single vertex; stop.
@@ -657,279 +774,379 @@ def max_weight_matching(G, maxcardinality=False, weight='weight'):
                 bt = inblossom[t]
                 assert label[bt] == 2
                 # Trace one more step back.
-                s, j = labeledge[bt]
+                s, j, sk = labeledge[bt]
                 # Augment through the T-blossom from j to base.
                 assert blossombase[bt] == t
-                if isinstance(bt, Blossom):
+                if bt >= n:
                     augmentBlossom(bt, j)
                 # Update mate[j]
                 mate[j] = s
+                mateedge[j] = sk
+
+    # Find the least-slack edge from an S-vertex to the vertex w, which is
+    # free or an unreached vertex inside a T-blossom.
+    def findBestEdge(w):
+        bw = inblossom[w]
+        best = None
+        for v, k in neighbors[w]:
+            if label[inblossom[v]] == 1:
+                d = dualvar[v] - w2[k]
+                if best is None or d < bestd:
+                    best = (v, w, k)
+                    bestd = d
+        bestedge[w] = best
+        if best is not None and label[bw] == 0:
+            heappush(delta2heap, (bestd + dualvar[w],) + best)
+
+    # Remove the labels of the alternating trees with the given roots,
+    # which an augmenting path has just joined.
+    def dissolveTrees(roots):
+        delta = total[0]
+        freed = []
+        expand = []
+        for r in roots:
+            for b in treeblossoms.pop(r):
+                if blossomparent[b] != -1 or label[b] == 0 or tree[b] != r:
+                    # b has been absorbed, expanded or already removed.
+                    continue
+                # Remove the labels of b, its sub-blossoms and its vertices.
+                t = label[b]
+                vertices = []
+                stack = [b]
+                while stack:
+                    s = stack.pop()
+                    label[s] = 0
+                    labeledge[s] = None
+                    tree[s] = -1
+                    if s < n:
+                        vertices.append(s)
+                        bestedge[s] = None
+                    else:
+                        stack.extend(blossomchilds[s])
+                if t == 1:
+                    for v in vertices:
+                        dualvar[v] -= delta
+                    if b >= n:
+                        blossomdual[b] += delta
+                        if blossomdual[b] == 0:
+                            expand.append(b)
+                else:
+                    for v in vertices:
+                        dualvar[v] += delta
+                    if b >= n:
+                        blossomdual[b] -= delta
+                freed.extend(vertices)
+        # Expand the S-blossoms which have zero dual, as at the end of a
+        # stage.
+        for b in expand:
+            expandBlossom(b, True)
+        # The edges of the freed vertices may no longer be allowable, and
+        # the least-slack edges to them and from them must be found again.
+        for v in freed:
+            for w, k in neighbors[v]:
+                allowedge[k] = False
+        for v in freed:
+            findBestEdge(v)
+            for w, k in neighbors[v]:
+                e = labeledge[w]
+                if (e is not None and e[0] == v and label[w] == 2 and
+                        label[inblossom[w]] == 2):
+                    # w is inside a T-blossom of another tree, and it was
+                    # reached through v; it is not reached any more.
+                    label[w] = 0
+                    labeledge[w] = None
+                    findBestEdge(w)
+                    continue
+                e = bestedge[w]
+                if e is not None and e[0] == v:
+                    if label[inblossom[w]] == 1 or label[w] != 0:
+                        bestedge[w] = None
+                    else:
+                        findBestEdge(w)
+
+    # Use the allowable edge k from S-vertex v to vertex w to extend the
+    # labeling. Return True if the matching was augmented.
+    def useEdge(v, w, k):
+        bw = inblossom[w]
+        if label[bw] == 0:
+            # (C1) w is a free vertex;
+            # label w with T and label its mate with S (R12).
+            assignLabel(w, 2, (v, w, k))
+        elif label[bw] == 1:
+            # (C2) w is an S-vertex (not in the same blossom);
+            # follow back-links to discover either an
+            # augmenting path or a new blossom.
+            base = scanBlossom(v, w)
+            if base != -1:
+                # Found a new blossom; add it to the blossom
+                # bookkeeping and turn it into an S-blossom.
+                addBlossom(base, v, w, k)
+            else:
+                # Found an augmenting path; augment the
+                # matching and dissolve the two trees it joins.
+                roots = (tree[inblossom[v]], tree[bw])
+                augmentMatching(v, w, k)
+                dissolveTrees(roots)
+                return True
+        elif label[w] == 0:
+            # w is inside a T-blossom, but w itself has not
+            # yet been reached from outside the blossom;
+            # mark it as reached (we need this to relabel
+            # during T-blossom expansion).
+            assert label[bw] == 2
+            label[w] = 2
+            labeledge[w] = (v, w, k)
+        return False
 
     # Verify that the optimum solution has been reached.
     def verifyOptimum():
         if maxcardinality:
             # Vertices may have negative dual;
             # find a constant non-negative number to add to all vertex duals.
-            vdualoffset = max(0, -min(dualvar.values()))
+            vdualoffset = max(0, -min(dualvar))
         else:
             vdualoffset = 0
+        blossoms = [b for b in range(n, 2 * n)
+                    if blossomchilds[b] is not None]
         # 0. all dual variables are non-negative
-        assert min(dualvar.values()) + vdualoffset >= 0
-        assert len(blossomdual) == 0 or min(blossomdual.values()) >= 0
+        assert min(dualvar) + vdualoffset >= 0
+        assert all(blossomdual[b] >= 0 for b in blossoms)
+        # Depth of every vertex and blossom in the blossom forest, and the
+        # sum of the doubled duals of the blossom and all its ancestors.
+        depth = [-1] * (2 * n)
+        above = [0] * (2 * n)
+        for b in chain(range(n), blossoms):
+            path = []
+            while b != -1 and depth[b] == -1:
+                path.append(b)
+                b = blossomparent[b]
+            d, z = (depth[b], above[b]) if b != -1 else (-1, 0)
+            for b in reversed(path):
+                d += 1
+                if b >= n:
+                    z += 2 * blossomdual[b]
+                depth[b] = d
+                above[b] = z
         # 0. all edges have non-negative slack and
         # 1. all matched edges have zero slack;
-        for i, j, d in G.edges(data=True):
-            wt = d.get(weight, 1)
-            if i == j:
-                continue  # ignore self-loops
-            s = dualvar[i] + dualvar[j] - 2 * wt
-            iblossoms = [i]
-            jblossoms = [j]
-            while blossomparent[iblossoms[-1]] is not None:
-                iblossoms.append(blossomparent[iblossoms[-1]])
-            while blossomparent[jblossoms[-1]] is not None:
-                jblossoms.append(blossomparent[jblossoms[-1]])
-            iblossoms.reverse()
-            jblossoms.reverse()
-            for (bi, bj) in zip(iblossoms, jblossoms):
-                if bi != bj:
-                    break
-                s += 2 * blossomdual[bi]
+        for k, (i, j) in enumerate(edgeend):
+            s = dualvar[i] + dualvar[j] - w2[k]
+            # Climb to the smallest blossom containing both ends.
+            bi, bj = i, j
+            while bi != bj and bi != -1 and bj != -1:
+                if depth[bi] >= depth[bj]:
+                    bi = blossomparent[bi]
+                else:
+                    bj = blossomparent[bj]
+            if bi == bj:
+                s += above[bi]
             assert s >= 0
-            if mate.get(i) == j or mate.get(j) == i:
+            if mate[i] == j or mate[j] == i:
                 assert mate[i] == j and mate[j] == i
                 assert s == 0
         # 2. all single vertices have zero dual value;
-        for v in gnodes:
-            assert (v in mate) or dualvar[v] + vdualoffset == 0
+        for v in range(n):
+            assert mate[v] != -1 or dualvar[v] + vdualoffset == 0
         # 3. all blossoms with positive dual value are full.
-        for b in blossomdual:
+        for b in blossoms:
             if blossomdual[b] > 0:
-                assert len(b.edges) % 2 == 1
-                for (i, j) in b.edges[1::2]:
+                assert len(blossomedges[b]) % 2 == 1
+                for (i, j, k) in blossomedges[b][1::2]:
                     assert mate[i] == j and mate[j] == i
         # Ok.
 
+    # Label single blossoms/vertices with S and put them in the queue.
+    # Each is the root of an alternating tree.
+    for v in range(n):
+        assignLabel(v, 1, None)
+
     # Main loop: continue until no further improvement is possible.
     while 1:
 
-        # Each iteration of this loop is a "stage".
-        # A stage finds an augmenting path and uses that to improve
-        # the matching.
-
-        # Remove labels from top-level blossoms/vertices.
-        label.clear()
-        labeledge.clear()
-
-        # Forget all about least-slack edges.
-        bestedge.clear()
-        for b in blossomdual:
-            b.mybestedges = None
-
-        # Loss of labeling means that we can not be sure that currently
-        # allowable edges remain allowable througout this stage.
-        allowedge.clear()
-
-        # Make queue empty.
-        queue[:] = []
-
-        # Label single blossoms/vertices with S and put them in the queue.
-        for v in gnodes:
-            if (v not in mate) and label.get(inblossom[v]) is None:
-                assignLabel(v, 1, None)
-
-        # Loop until we succeed in augmenting the matching.
-        augmented = 0
-        while 1:
-
-            # Each iteration of this loop is a "substage".
-            # A substage tries to find an augmenting path;
-            # if found, the path is used to improve the matching and
-            # the stage ends. If there is no augmenting path, the
-            # primal-dual method is used to pump some slack out of
-            # the dual variables.
-
-            # Continue labeling until all vertices which are reachable
-            # through an alternating path have got a label.
-            while queue and not augmented:
-
-                # Take an S vertex from the queue.
-                v = queue.pop()
-                assert label[inblossom[v]] == 1
-
-                # Scan its neighbours:
-                for w in G.neighbors(v):
-                    if w == v:
-                        continue  # ignore self-loops
-                    # w is a neighbour to v
-                    bv = inblossom[v]
-                    bw = inblossom[w]
-                    if bv == bw:
-                        # this edge is internal to a blossom; ignore it
-                        continue
-                    if (v, w) not in allowedge:
-                        kslack = slack(v, w)
-                        if kslack <= 0:
-                            # edge k has zero slack => it is allowable
-                            allowedge[(v, w)] = allowedge[(w, v)] = True
-                    if (v, w) in allowedge:
-                        if label.get(bw) is None:
-                            # (C1) w is a free vertex;
-                            # label w with T and label its mate with S (R12).
-                            assignLabel(w, 2, v)
-                        elif label.get(bw) == 1:
-                            # (C2) w is an S-vertex (not in the same blossom);
-                            # follow back-links to discover either an
-                            # augmenting path or a new blossom.
-                            base = scanBlossom(v, w)
-                            if base is not NoNode:
-                                # Found a new blossom; add it to the blossom
-                                # bookkeeping and turn it into an S-blossom.
-                                addBlossom(base, v, w)
-                            else:
-                                # Found an augmenting path; augment the
-                                # matching and end this stage.
-                                augmentMatching(v, w)
-                                augmented = 1
-                                break
-                        elif label.get(w) is None:
-                            # w is inside a T-blossom, but w itself has not
-                            # yet been reached from outside the blossom;
-                            # mark it as reached (we need this to relabel
-                            # during T-blossom expansion).
-                            assert label[bw] == 2
-                            label[w] = 2
-                            labeledge[w] = (v, w)
-                    elif label.get(bw) == 1:
-                        # keep track of the least-slack non-allowable edge to
-                        # a different S-blossom.
-                        if bestedge.get(bv) is None or \
-                         kslack < slack(*bestedge[bv]):
-                            bestedge[bv] = (v, w)
-                    elif label.get(w) is None:
-                        # w is a free vertex (or an unreached vertex inside
-                        # a T-blossom) but we can not reach it yet;
-                        # keep track of the least-slack edge that reaches w.
-                        if bestedge.get(w) is None or \
-                         kslack < slack(*bestedge[w]):
-                            bestedge[w] = (v, w)
-
-            if augmented:
-                break
-
-            # There is no augmenting path under these constraints;
-            # compute delta and reduce slack in the optimization problem.
-            # (Note that our vertex dual variables, edge slacks and delta's
-            # are pre-multiplied by two.)
-            deltatype = -1
-            delta = deltaedge = deltablossom = None
-
-            # Compute delta1: the minumum value of any vertex dual.
-            if not maxcardinality:
-                deltatype = 1
-                delta = min(dualvar.values())
-
-            # Compute delta2: the minimum slack on any edge between
-            # an S-vertex and a free vertex.
-            for v in G.nodes():
-                if label.get(inblossom[v]) is None and \
-                 bestedge.get(v) is not None:
-                    d = slack(*bestedge[v])
-                    if deltatype == -1 or d < delta:
-                        delta = d
-                        deltatype = 2
-                        deltaedge = bestedge[v]
-
-            # Compute delta3: half the minimum slack on any edge between
-            # a pair of S-blossoms.
-            for b in blossomparent:
-                if (blossomparent[b] is None and label.get(b) == 1 and
-                        bestedge.get(b) is not None):
-                    kslack = slack(*bestedge[b])
-                    if allinteger:
-                        assert (kslack % 2) == 0
-                        d = kslack // 2
-                    else:
-                        d = kslack / 2.0
-                    if deltatype == -1 or d < delta:
-                        delta = d
-                        deltatype = 3
-                        deltaedge = bestedge[b]
-
-            # Compute delta4: minimum z variable of any T-blossom.
-            for b in blossomdual:
-                if (blossomparent[b] is None and label.get(b) == 2 and
-                        (deltatype == -1 or blossomdual[b] < delta)):
-                    delta = blossomdual[b]
-                    deltatype = 4
-                    deltablossom = b
-
-            if deltatype == -1:
-                # No further improvement possible; max-cardinality optimum
-                # reached. Do a final delta update to make the optimum
-                # verifyable.
-                assert maxcardinality
-                deltatype = 1
-                delta = max(0, min(dualvar.values()))
-
-            # Update dual variables according to delta.
-            for v in gnodes:
-                if label.get(inblossom[v]) == 1:
-                    # S-vertex: 2*u = 2*u - 2*delta
-                    dualvar[v] -= delta
-                elif label.get(inblossom[v]) == 2:
-                    # T-vertex: 2*u = 2*u + 2*delta
-                    dualvar[v] += delta
-            for b in blossomdual:
-                if blossomparent[b] is None:
-                    if label.get(b) == 1:
-                        # top-level S-blossom: z = z + 2*delta
-                        blossomdual[b] += delta
-                    elif label.get(b) == 2:
-                        # top-level T-blossom: z = z - 2*delta
-                        blossomdual[b] -= delta
+        # Each iteration of this loop is a "substage".
+        # A substage extends the alternating trees, augmenting the matching
+        # along the augmenting paths found. When no tree can be extended,
+        # the primal-dual method is used to pump some slack out of the
+        # dual variables.
+        delta = total[0]
+
+        # Continue labeling until all vertices which are reachable
+        # through an alternating path have got a label.
+        while queue:
+
+            # Take an S vertex from the queue.
+            v = queue.pop()
+            if label[inblossom[v]] != 1:
+                # Its tree has been dissolved.
+                continue
+            dv = dualvar[v]
+
+            # Scan its neighbours:
+            for w, k in neighbors[v]:
+                # w is a neighbour to v
+                bv = inblossom[v]
+                bw = inblossom[w]
+                if bv == bw:
+                    # this edge is internal to a blossom; ignore it
+                    continue
+                lw = label[bw]
+                if not allowedge[k]:
+                    # 2 * slack of the edge, from the stored duals.
+                    kslack = dv + dualvar[w] - w2[k]
+                    if lw == 0:
+                        kslack -= delta
+                    elif lw == 1:
+                        kslack -= 2 * delta
+                    if kslack <= 0:
+                        # edge k has zero slack => it is allowable
+                        allowedge[k] = True
+                if allowedge[k]:
+                    if useEdge(v, w, k):
+                        # The tree of v has been dissolved.
+                        break
+                elif lw == 1:
+                    # keep track of the least-slack non-allowable edge to
+                    # a different S-blossom.
+                    heappush(delta3heap, (kslack + 2 * delta, v, w, k))
+                elif label[w] == 0:
+                    # w is a free vertex (or an unreached vertex inside
+                    # a T-blossom) but we can not reach it yet;
+                    # keep track of the least-slack edge that reaches w.
+                    e = bestedge[w]
+                    if e is None or dv - w2[k] < dualvar[e[0]] - w2[e[2]]:
+                        bestedge[w] = (v, w, k)
+                        if lw == 0:
+                            heappush(delta2heap, (kslack + delta, v, w, k))
+
+        # There is no augmenting path under these constraints;
+        # compute delta and reduce slack in the optimization problem.
+        # (Note that our vertex dual variables, edge slacks and delta's
+        # are pre-multiplied by two.)
+        deltatype = -1
+        deltaedge = deltablossom = None
+        totaldelta = delta
+        delta = None
+
+        # Compute delta1: the minumum value of any vertex dual, which is
+        # the dual of the single vertices.
+        if not maxcardinality:
+            deltatype = 1
+            delta = max(0, maxweight - totaldelta)
+
+        # Compute delta2: the minimum slack on any edge between
+        # an S-vertex and a free vertex.
+        while delta2heap:
+            key, v, w, k = delta2heap[0]
+            if label[inblossom[v]] != 1 or label[inblossom[w]] != 0:
+                heappop(delta2heap)
+                continue
+            d = dualvar[v] + dualvar[w] - w2[k]
+            if d != key:
+                heapreplace(delta2heap, (d, v, w, k))
+                continue
+            d -= totaldelta
+            if deltatype == -1 or d < delta:
+                delta = d
+                deltatype = 2
+                deltaedge = (v, w, k)
+            break
 
-            # Take action at the point where minimum delta occurred.
-            if deltatype == 1:
-                # No further improvement possible; optimum reached.
-                break
-            elif deltatype == 2:
-                # Use the least-slack edge to continue the search.
-                (v, w) = deltaedge
-                assert label[inblossom[v]] == 1
-                allowedge[(v, w)] = allowedge[(w, v)] = True
-                queue.append(v)
-            elif deltatype == 3:
-                # Use the least-slack edge to continue the search.
-                (v, w) = deltaedge
-                allowedge[(v, w)] = allowedge[(w, v)] = True
-                assert label[inblossom[v]] == 1
-                queue.append(v)
-            elif deltatype == 4:
-                # Expand the least-z blossom.
-                expandBlossom(deltablossom, False)
-
-            # End of a this substage.
-
-        # Paranoia check that the matching is symmetric.
-        for v in mate:
-            assert mate[mate[v]] == v
+        # Compute delta3: half the minimum slack on any edge between
+        # a pair of S-blossoms.
+        while delta3heap:
+            key, v, w, k = delta3heap[0]
+            if (inblossom[v] == inblossom[w] or
+                    label[inblossom[v]] != 1 or label[inblossom[w]] != 1):
+                heappop(delta3heap)
+                continue
+            kslack = dualvar[v] + dualvar[w] - w2[k]
+            if kslack != key:
+                heapreplace(delta3heap, (kslack, v, w, k))
+                continue
+            kslack -= 2 * totaldelta
+            if allinteger:
+                assert (kslack % 2) == 0
+                d = kslack // 2
+            else:
+                d = kslack / 2.0
+            if deltatype == -1 or d < delta:
+                delta = d
+                deltatype = 3
+                deltaedge = (v, w, k)
+            break
 
-        # Stop when no more augmenting path can be found.
-        if not augmented:
+        # Compute delta4: minimum z variable of any T-blossom.
+        while delta4heap:
+            key, b = delta4heap[0]
+            if (label[b] != 2 or blossomparent[b] != -1 or
+                    blossomchilds[b] is None or blossomdual[b] != key):
+                heappop(delta4heap)
+                continue
+            d = key - totaldelta
+            if deltatype == -1 or d < delta:
+                delta = d
+                deltatype = 4
+                deltablossom = b
             break
 
-        # End of a stage; expand all S-blossoms which have zero dual.
-        for b in list(blossomdual.keys()):
-            if b not in blossomdual:
-                continue  # already expanded
-            if (blossomparent[b] is None and label.get(b) == 1 and
-                    blossomdual[b] == 0):
-                expandBlossom(b, True)
+        if deltatype == -1:
+            # No further improvement possible; max-cardinality optimum
+            # reached. Do a final delta update to make the optimum
+            # verifyable.
+            assert maxcardinality
+            deltatype = 1
+            duals = []
+            for v in range(n):
+                lv = label[inblossom[v]]
+                if lv == 1:
+                    duals.append(dualvar[v] - totaldelta)
+                elif lv == 2:
+                    duals.append(dualvar[v] + totaldelta)
+                else:
+                    duals.append(dualvar[v])
+            delta = max(0, min(duals))
+
+        # Update dual variables according to delta.
+        total[0] = totaldelta + delta
+
+        # Take action at the point where minimum delta occurred.
+        if deltatype == 1:
+            # No further improvement possible; optimum reached.
+            break
+        elif deltatype == 2 or deltatype == 3:
+            # Use the least-slack edge to continue the search.
+            v, w, k = deltaedge
+            assert label[inblossom[v]] == 1
+            allowedge[k] = True
+            useEdge(v, w, k)
+        elif deltatype == 4:
+            # Expand the least-z blossom.
+            expandBlossom(deltablossom, False)
+
+        # End of a this substage.
+
+    # Store the dual variables independently of the deltas.
+    delta = total[0]
+    for v in range(n):
+        lv = label[inblossom[v]]
+        if lv == 1:
+            dualvar[v] -= delta
+        elif lv == 2:
+            dualvar[v] += delta
+    for b in range(n, 2 * n):
+        if blossomchilds[b] is not None and blossomparent[b] == -1:
+            if label[b] == 1:
+                blossomdual[b] += delta
+            elif label[b] == 2:
+                blossomdual[b] -= delta
+
+    # Paranoia check that the matching is symmetric.
+    for v in range(n):
+        if mate[v] != -1:
+            assert mate[mate[v]] == v
 
     # Verify that we reached the optimum solution (only for integer weights).
     if allinteger:
         verifyOptimum()
 
-    return mate
-
+    return {gnodes[v]: gnodes[mate[v]] for v in range(n) if mate[v] != -1}
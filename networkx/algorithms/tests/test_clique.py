@@ -30,6 +30,44 @@ class TestCliques:
         assert_equal(cl,
                      [[2, 6, 1, 3], [2, 6, 4], [5, 4, 7], [8, 9], [10, 11]])
 
+    def test_find_cliques_degeneracy(self):
+        expected = sorted(map(sorted, nx.find_cliques(self.G)))
+        cl = nx.find_cliques_degeneracy(self.G)
+        assert_equal(sorted(map(sorted, cl)), expected)
+        cl = nx.find_cliques_degeneracy(self.G, n_jobs=2, chunksize=1)
+        assert_equal(sorted(map(sorted, cl)), expected)
+        cl = nx.find_cliques_degeneracy(self.G, min_size=3)
+        assert_equal(sorted(map(sorted, cl)),
+                     [c for c in expected if len(c) >= 3])
+        self.G.add_edge(1, 1)
+        self.G.add_node(12)
+        cl = nx.find_cliques_degeneracy(self.G)
+        assert_equal(sorted(map(sorted, cl)), expected + [[12]])
+        assert_equal(list(nx.find_cliques_degeneracy(nx.Graph())), [])
+
+    def test_degeneracy_order(self):
+        from networkx.algorithms.clique import _degeneracy_adjacency
+        for seed in [293] + list(range(10)):
+            G = nx.gnm_random_graph(60, 200, seed=seed)
+            nodes, adj = _degeneracy_adjacency(G)
+            assert_equal(sorted(nodes), sorted(G))
+            degeneracy = max(nx.core_number(G).values())
+            later = max(sum(1 for u in adj[v] if u > v)
+                        for v in range(len(nodes)))
+            assert_true(later <= degeneracy)
+
+    def test_find_cliques_degeneracy_random(self):
+        G = nx.gnp_random_graph(60, 0.4, seed=3)
+        expected = sorted(map(sorted, nx.find_cliques(G)))
+        for n_jobs in (None, 3):
+            cl = nx.find_cliques_degeneracy(G, n_jobs=n_jobs)
+            assert_equal(sorted(map(sorted, cl)), expected)
+            cl = nx.find_cliques_degeneracy(G, min_size=5, n_jobs=n_jobs)
+            assert_equal(sorted(map(sorted, cl)),
+                         [c for c in expected if len(c) >= 5])
+        assert_equal(nx.graph_clique_number(G, n_jobs=2),
+                     nx.graph_clique_number(G))
+
     def test_find_cliques2(self):
         hcl = list(nx.find_cliques(self.H))
         assert_equal(sorted(map(sorted, hcl)),
@@ -34,6 +34,23 @@ class TestTriangles:
         assert_equal(list(nx.triangles(G).values()),[5, 3, 3, 5, 5])
         assert_equal(nx.triangles(G,1),3)
 
+    def test_forward_matches_local(self):
+        G = nx.gnp_random_graph(50, 0.3, seed=7)
+        G.add_edges_from([(0, 0), (5, 5)])
+        local = nx.triangles(G, list(G))
+        assert_equal(nx.triangles(G), local)
+        assert_equal(nx.triangles(G, n_jobs=2), local)
+        assert_equal(sum(local.values()) // 3,
+                     sum(1 for c in nx.enumerate_all_cliques(G)
+                         if len(c) == 3))
+
+    def test_parallel(self):
+        G = nx.complete_graph(5)
+        assert_equal(nx.triangles(G, n_jobs=3), {v: 6 for v in G})
+        assert_equal(nx.clustering(G, n_jobs=2), {v: 1.0 for v in G})
+        assert_equal(nx.average_clustering(G, n_jobs=2), 1)
+        assert_equal(nx.transitivity(G, n_jobs=2), 1)
+
 
 class TestWeightedClustering:
 
@@ -124,3 +124,61 @@ class TestCore:
         # k=2
         k_corona_subgraph = nx.k_corona(self.H, k=0)
         assert_equal(sorted(k_corona_subgraph.nodes()), [0])
+
+
+class TestDynamicCoreNumber:
+
+    def test_random_updates(self):
+        import random
+        random.seed(17)
+        G = nx.gnm_random_graph(60, 150, seed=5)
+        cores = nx.DynamicCoreNumber(G)
+        for _ in range(300):
+            u, v = random.sample(range(65), 2)
+            if G.has_edge(u, v):
+                cores.remove_edge(u, v)
+            else:
+                cores.add_edge(u, v)
+            assert_equal(cores.core, nx.core_number(G))
+
+    def test_batches_and_nodes(self):
+        G = nx.Graph()
+        cores = nx.DynamicCoreNumber(G)
+        cores.add_edges_from(nx.complete_graph(5).edges(), weight=2)
+        assert_equal(G[0][1]['weight'], 2)
+        assert_equal(cores[0], 4)
+        cores.remove_node(4)
+        assert_equal(cores.core, {0: 3, 1: 3, 2: 3, 3: 3})
+        cores.remove_edges_from([(0, 1), (0, 9)])
+        assert_equal(cores.core, nx.core_number(G))
+        cores.add_node(7)
+        assert_equal(cores[7], 0)
+        assert_true(7 in cores)
+        assert_equal(len(cores), 5)
+        assert_raises(nx.NetworkXError, cores.add_edge, 1, 1)
+        assert_raises(nx.NetworkXError, cores.remove_edge, 0, 7)
+
+    def test_attribute_cache(self):
+        G = nx.karate_club_graph()
+        cores = nx.DynamicCoreNumber(G, attr='core')
+        cores.add_edge(0, 33)
+        assert_equal(nx.get_node_attributes(G, 'core'), nx.core_number(G))
+        # the cached values are reused
+        G.node[0]['core'] = 100
+        assert_equal(nx.DynamicCoreNumber(G, attr='core')[0], 100)
+
+    def test_subgraphs(self):
+        G = nx.karate_club_graph()
+        cores = nx.DynamicCoreNumber(G)
+        cores.add_edge(0, 26)
+        for k in range(1, 5):
+            assert_nodes_equal(cores.k_core(k), nx.k_core(G, k))
+            assert_nodes_equal(cores.k_shell(k), nx.k_shell(G, k))
+            assert_nodes_equal(cores.k_crust(k), nx.k_crust(G, k))
+            assert_nodes_equal(cores.k_corona(k), nx.k_corona(G, k))
+
+    def test_not_implemented(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.DynamicCoreNumber,
+                      nx.DiGraph())
+        assert_raises(nx.NetworkXNotImplemented, nx.DynamicCoreNumber,
+                      nx.MultiGraph())
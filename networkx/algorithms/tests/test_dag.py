@@ -1,4 +1,5 @@
 from itertools import combinations
+import random
 
 from nose.tools import assert_equal
 from nose.tools import assert_false
@@ -366,3 +367,155 @@ def test_is_aperiodic_disconnected2():
     nx.add_cycle(G, [0, 1, 2])
     G.add_edge(3, 3)
     assert_false(nx.is_aperiodic(G))
+
+
+class TestReachabilityIndex(object):
+    """Unit tests for the reachability index of directed graphs."""
+
+    def check(self, G, index):
+        for u in G:
+            desc = nx.descendants(G, u)
+            anc = nx.ancestors(G, u)
+            assert_equal(index.descendants(u), desc)
+            assert_equal(index.ancestors(u), anc)
+            bits = index.descendants_bitset(u)
+            assert_equal({v for i, v in enumerate(index.nodes)
+                          if bits >> i & 1}, desc)
+            bits = index.ancestors_bitset(u)
+            assert_equal({v for i, v in enumerate(index.nodes)
+                          if bits >> i & 1}, anc)
+            for v in G:
+                assert_equal(index.reachable(u, v), u == v or v in desc)
+
+    def test_dags(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(40, 0.08, seed=seed, directed=True)
+            G = nx.DiGraph([(u, v) for u, v in G.edges() if u < v])
+            G.add_nodes_from(range(40))
+            for labels in (1, 2, 4):
+                self.check(G, nx.ReachabilityIndex(G, labels, seed=seed))
+
+    def test_cyclic(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(40, 0.04, seed=seed, directed=True)
+            self.check(G, nx.ReachabilityIndex(G, seed=seed))
+
+    def test_topological_nodes(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 1), (2, 3), (4, 0)])
+        index = nx.ReachabilityIndex(G)
+        position = {v: i for i, v in enumerate(index.nodes)}
+        assert_equal(sorted(index.nodes), list(range(5)))
+        for u, v in G.edges():
+            if {u, v} != {1, 2}:
+                assert_true(position[u] < position[v])
+        assert_equal(abs(position[1] - position[2]), 1)
+
+    def test_self_and_empty(self):
+        G = nx.DiGraph()
+        G.add_node('a')
+        index = nx.ReachabilityIndex(G)
+        assert_true(index.reachable('a', 'a'))
+        assert_equal(index.descendants('a'), set())
+        assert_equal(index.descendants_bitset('a'), 0)
+        assert_equal(nx.ReachabilityIndex(nx.DiGraph()).nodes, [])
+
+    def test_long_path(self):
+        # Deep enough to overflow a recursive traversal.
+        G = nx.path_graph(5000, create_using=nx.DiGraph())
+        index = nx.ReachabilityIndex(G)
+        assert_true(index.reachable(0, 4999))
+        assert_false(index.reachable(4999, 0))
+        assert_equal(len(index.ancestors(4999)), 4999)
+
+    def test_missing_node(self):
+        index = nx.ReachabilityIndex(nx.DiGraph([(0, 1)]))
+        assert_raises(nx.NetworkXError, index.reachable, 0, 2)
+        assert_raises(nx.NetworkXError, index.descendants, 2)
+
+    def test_undirected(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.ReachabilityIndex,
+                      nx.Graph())
+
+
+class TestIncrementalTopologicalOrder(object):
+    """Unit tests for the topological order maintained under edge
+    insertions."""
+
+    def check(self, G, order):
+        assert_equal(set(order), set(G))
+        assert_equal(len(order), len(G))
+        nodes = list(order)
+        assert_equal(sorted(nodes, key=order.position), nodes)
+        for u, v in G.edges():
+            assert_true(order.position(u) < order.position(v))
+
+    def test_initial_order(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (0, 3)])
+        order = nx.IncrementalTopologicalOrder(G)
+        self.check(G, order)
+        assert_equal(sorted(order.position(v) for v in G), list(range(4)))
+
+    def test_random_insertions(self):
+        rng = random.Random(42)
+        n = 30
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        order = nx.IncrementalTopologicalOrder(G)
+        for step in range(500):
+            u, v = rng.randrange(n + 2), rng.randrange(n + 2)
+            closes = u == v or (u in G and v in G and nx.has_path(G, v, u))
+            cycle = order.add_edge(u, v, weight=step)
+            if closes:
+                assert_equal(cycle[0], (u, v))
+                assert_equal(cycle[-1][1], u)
+                for (a, b), (c, d) in zip(cycle, cycle[1:]):
+                    assert_equal(b, c)
+                    assert_true(G.has_edge(c, d))
+                assert_false(G.has_edge(u, v))
+            else:
+                assert_equal(cycle, None)
+                assert_equal(G[u][v]['weight'], step)
+            if step % 50 == 49:
+                order.remove_node(rng.choice(list(G)))
+            self.check(G, order)
+
+    def test_cycle(self):
+        G = nx.DiGraph()
+        order = nx.IncrementalTopologicalOrder(G)
+        assert_equal(order.add_edges_from([(0, 1), (1, 2), (2, 3)]), None)
+        assert_equal(order.add_edge(3, 1), [(3, 1), (1, 2), (2, 3)])
+        assert_equal(order.add_edge(2, 2), [(2, 2)])
+        assert_equal(order.add_edges_from([(4, 0), (3, 0), (3, 5)]),
+                     [(3, 0), (0, 1), (1, 2), (2, 3)])
+        assert_false(G.has_edge(3, 5))
+        self.check(G, order)
+
+    def test_removals(self):
+        G = nx.path_graph(6, create_using=nx.DiGraph())
+        order = nx.IncrementalTopologicalOrder(G)
+        order.remove_edge(2, 3)
+        assert_equal(order.add_edge(5, 0), None)
+        self.check(G, order)
+        for v in [1, 2, 3, 4]:
+            order.remove_node(v)
+            self.check(G, order)
+        assert_equal(list(order), [5, 0])
+        assert_raises(nx.NetworkXError, order.position, 3)
+        assert_raises(nx.NetworkXError, order.remove_node, 3)
+
+    def test_longest_path(self):
+        G = nx.DiGraph()
+        order = nx.IncrementalTopologicalOrder(G)
+        order.add_edges_from([(3, 4), (1, 2), (2, 3), (0, 1)], weight=2)
+        assert_equal(nx.dag_longest_path(G, topo_order=order),
+                     [0, 1, 2, 3, 4])
+        assert_equal(nx.dag_longest_path_length(G, topo_order=order), 8)
+
+    def test_cyclic_graph(self):
+        G = nx.DiGraph([(0, 1), (1, 0)])
+        assert_raises(nx.NetworkXUnfeasible, nx.IncrementalTopologicalOrder,
+                      G)
+
+    def test_undirected(self):
+        assert_raises(nx.NetworkXNotImplemented,
+                      nx.IncrementalTopologicalOrder, nx.Graph())
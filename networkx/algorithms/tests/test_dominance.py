@@ -261,3 +261,90 @@ class TestDominanceFrontiers(object):
                   'exit': set()}
         for n in df:
             assert_equal(set(df[n]),set(answer[n]))
+
+
+class TestImmediatePostDominators(object):
+
+    def test_exceptions(self):
+        G = nx.Graph()
+        G.add_node(0)
+        assert_raises(nx.NetworkXNotImplemented,
+                      nx.immediate_post_dominators, G, 0)
+        G = nx.DiGraph([[0, 0]])
+        assert_raises(nx.NetworkXError, nx.immediate_post_dominators, G, 1)
+
+    def test_domrel_png(self):
+        edges = [(1, 2), (2, 3), (2, 4), (2, 6), (3, 5), (4, 5), (5, 2)]
+        G = nx.DiGraph(edges)
+        assert_equal(nx.immediate_post_dominators(G, 6),
+                     {1: 2, 2: 6, 3: 5, 4: 5, 5: 2, 6: 6})
+
+    def test_boost_example(self):
+        edges = [(0, 1), (1, 2), (1, 3), (2, 7), (3, 4), (4, 5), (4, 6),
+                 (5, 7), (6, 4)]
+        G = nx.MultiDiGraph(edges + [(5, 7)])
+        assert_equal(nx.immediate_post_dominators(G, 7),
+                     {0: 1, 1: 7, 2: 7, 3: 4, 4: 5, 5: 7, 6: 4, 7: 7})
+
+    def test_matches_reversed(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(50, 0.06, seed=seed, directed=True)
+            expected = nx.immediate_post_dominators(G, 0)
+            with nx.utils.reversed(G):
+                assert_equal(nx.immediate_dominators(G, 0), expected)
+
+
+class TestDominatorTree(object):
+
+    def test_boost_example(self):
+        edges = [(0, 1), (1, 2), (1, 3), (2, 7), (3, 4), (4, 5), (4, 6),
+                 (5, 7), (6, 4)]
+        G = nx.DiGraph(edges)
+        G.add_node(8)
+        tree = nx.DominatorTree(G, 0)
+        assert_equal(tree.idom, nx.immediate_dominators(G, 0))
+        assert_equal(len(tree), 8)
+        assert_false(8 in tree)
+        assert_true(tree.dominates(1, 6))
+        assert_true(tree.dominates(4, 4))
+        assert_false(tree.strictly_dominates(4, 4))
+        assert_false(tree.dominates(2, 7))
+        assert_equal(sorted(tree.children(1)), [2, 3, 7])
+        assert_equal(tree.immediate_dominator(0), 0)
+        assert_raises(nx.NetworkXError, tree.dominates, 0, 8)
+
+    def test_post(self):
+        edges = [(0, 1), (1, 2), (1, 3), (2, 7), (3, 4), (4, 5), (4, 6),
+                 (5, 7), (6, 4)]
+        G = nx.DiGraph(edges)
+        tree = nx.DominatorTree(G, 7, post=True)
+        assert_true(tree.dominates(4, 3))
+        assert_true(tree.dominates(1, 0))
+        assert_false(tree.dominates(4, 1))
+
+    def test_random(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(60, 0.05, seed=seed, directed=True)
+            tree = nx.DominatorTree(G, 0)
+            idom = tree.idom
+            for b in idom:
+                dominators = set([b])
+                x = b
+                while x != 0:
+                    x = idom[x]
+                    dominators.add(x)
+                for a in idom:
+                    assert_equal(tree.dominates(a, b), a in dominators)
+
+    def test_deep(self):
+        # Deep enough to overflow a recursive implementation.
+        G = nx.path_graph(10000, create_using=nx.DiGraph())
+        tree = nx.DominatorTree(G, 0)
+        assert_true(tree.dominates(0, 9999))
+        assert_false(tree.dominates(9999, 0))
+
+    def test_exceptions(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.DominatorTree,
+                      nx.path_graph(3), 0)
+        assert_raises(nx.NetworkXError, nx.DominatorTree,
+                      nx.DiGraph([(0, 1)]), 2)
@@ -218,6 +218,52 @@ class TestMaxWeightMatching(object):
                      {1: 2, 2: 1, 3: 5, 4: 9, 5: 3,
                       6: 7, 7: 6, 8: 10, 9: 4, 10: 8})
 
+    def brute_force(self, G, maxcardinality=False):
+        """Returns the best (cardinality, weight) over all matchings."""
+        edges = [(u, v, w) for u, v, w in G.edges(data='weight')
+                 if u != v]
+
+        def best(i, used):
+            if i == len(edges):
+                return (0, 0)
+            result = best(i + 1, used)
+            u, v, w = edges[i]
+            if u not in used and v not in used:
+                size, total = best(i + 1, used | {u, v})
+                result = max(result, (size + 1, total + w),
+                             key=lambda r: r if maxcardinality else r[1])
+            return result
+
+        return best(0, frozenset())
+
+    def test_random_small_graphs(self):
+        """Compare with all matchings of small random graphs."""
+        for seed in range(60):
+            G = nx.gnp_random_graph(7, 0.5, seed=seed)
+            for i, (u, v) in enumerate(G.edges()):
+                G[u][v]['weight'] = (seed * 5 + i * 11) % 13 - 3
+            for maxcardinality in (False, True):
+                mate = nx.max_weight_matching(G, maxcardinality)
+                assert_true(nx.is_matching(G, mate))
+                size = len(mate) // 2
+                total = sum(G[u][v]['weight'] for u, v in mate.items()) // 2
+                expected = self.brute_force(G, maxcardinality)
+                if maxcardinality:
+                    assert_equal((size, total), expected)
+                else:
+                    assert_equal(total, expected[1])
+
+    def test_random_large_graph(self):
+        """Integer weights make the function verify the optimality of the
+        result with the dual variables."""
+        G = nx.gnm_random_graph(2000, 6000, seed=7)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = i * 7919 % 100 + 1
+        for maxcardinality in (False, True):
+            mate = nx.max_weight_matching(G, maxcardinality)
+            assert_true(nx.is_matching(G, mate))
+            assert_true(all(mate[mate[v]] == v for v in mate))
+
 
 class TestIsMatching(object):
     """Unit tests for the
@@ -0,0 +1,334 @@
+"""Unit tests for the :mod:`networkx.algorithms.traversal.visitor`
+module.
+
+"""
+from nose.tools import assert_equal
+from nose.tools import assert_true
+from nose.tools import raises
+
+import networkx as nx
+
+
+class Recorder(nx.DFSVisitor, nx.BFSVisitor):
+    """Records every event of a traversal."""
+
+    def __init__(self):
+        self.events = []
+
+    def __getattribute__(self, name):
+        if name in _events:
+            return lambda *args: self.events.append((name,) + args)
+        return object.__getattribute__(self, name)
+
+_events = set(n for n in dir(nx.DFSVisitor) + dir(nx.BFSVisitor)
+              if not n.startswith('_'))
+
+
+class ArticulationPoints(nx.DFSVisitor):
+    """Finds the articulation points of an undirected graph with the low
+    points of the nodes."""
+
+    def __init__(self):
+        self.time = 0
+        self.discovery = {}
+        self.low = {}
+        self.parent = {}
+        self.children = {}
+        self.points = set()
+
+    def start_vertex(self, u):
+        self.parent[u] = None
+
+    def discover_vertex(self, u):
+        self.discovery[u] = self.low[u] = self.time
+        self.children[u] = 0
+        self.time += 1
+
+    def tree_edge(self, u, v):
+        self.parent[v] = u
+        self.children[u] += 1
+
+    def back_edge(self, u, v):
+        self.low[u] = min(self.low[u], self.discovery[v])
+
+    def finish_vertex(self, u):
+        p = self.parent[u]
+        if p is None:
+            if self.children[u] > 1:
+                self.points.add(u)
+            return
+        self.low[p] = min(self.low[p], self.low[u])
+        if self.parent[p] is not None and self.low[u] >= self.discovery[p]:
+            self.points.add(p)
+
+
+class StronglyConnectedComponents(nx.DFSVisitor):
+    """Tarjan's algorithm for the strongly connected components."""
+
+    def __init__(self):
+        self.index = {}
+        self.low = {}
+        self.stack = []
+        self.on_stack = set()
+        self.components = []
+
+    def discover_vertex(self, u):
+        self.index[u] = self.low[u] = len(self.index)
+        self.stack.append(u)
+        self.on_stack.add(u)
+
+    def finish_edge(self, u, v):
+        if v in self.on_stack:
+            self.low[u] = min(self.low[u], self.low[v])
+
+    def finish_vertex(self, u):
+        if self.low[u] == self.index[u]:
+            component = set()
+            while True:
+                v = self.stack.pop()
+                self.on_stack.discard(v)
+                component.add(v)
+                if v == u:
+                    break
+            self.components.append(component)
+
+
+class FinishOrder(nx.DFSVisitor):
+
+    def __init__(self):
+        self.order = []
+
+    def finish_vertex(self, u):
+        self.order.append(u)
+
+
+class TestDepthFirstVisit(object):
+
+    def test_directed_events(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (0, 3), (3, 2)])
+        visitor = Recorder()
+        nx.depth_first_visit(G, visitor, 0)
+        assert_equal(visitor.events, [
+            ('start_vertex', 0), ('discover_vertex', 0),
+            ('examine_edge', 0, 1), ('tree_edge', 0, 1),
+            ('discover_vertex', 1),
+            ('examine_edge', 1, 2), ('tree_edge', 1, 2),
+            ('discover_vertex', 2),
+            ('examine_edge', 2, 0), ('back_edge', 2, 0),
+            ('finish_edge', 2, 0),
+            ('finish_vertex', 2), ('finish_edge', 1, 2),
+            ('finish_vertex', 1), ('finish_edge', 0, 1),
+            ('examine_edge', 0, 3), ('tree_edge', 0, 3),
+            ('discover_vertex', 3),
+            ('examine_edge', 3, 2), ('forward_or_cross_edge', 3, 2),
+            ('finish_edge', 3, 2),
+            ('finish_vertex', 3), ('finish_edge', 0, 3),
+            ('finish_vertex', 0)])
+
+    def test_undirected_events(self):
+        G = nx.cycle_graph(3)
+        G.add_edge(3, 3)
+        visitor = Recorder()
+        nx.depth_first_visit(G, visitor)
+        names = [e[0] for e in visitor.events]
+        assert_equal(names.count('tree_edge'), 2)
+        assert_equal(names.count('forward_or_cross_edge'), 0)
+        back = [e[1:] for e in visitor.events if e[0] == 'back_edge']
+        assert_equal(back, [(2, 0), (3, 3)])
+        assert_equal(names.count('start_vertex'), 2)
+
+    def test_tree_matches_dfs_edges(self):
+        G = nx.gnp_random_graph(40, 0.1, seed=3, directed=True)
+
+        class Tree(nx.DFSVisitor):
+            edges = []
+
+            def tree_edge(self, u, v):
+                self.edges.append((u, v))
+
+        nx.depth_first_visit(G, Tree())
+        assert_equal(Tree.edges, list(nx.dfs_edges(G)))
+
+    def test_articulation_points(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(30, 0.08, seed=seed)
+            visitor = ArticulationPoints()
+            nx.depth_first_visit(G, visitor)
+            assert_equal(visitor.points, set(nx.articulation_points(G)))
+
+    def test_strongly_connected_components(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(30, 0.06, seed=seed, directed=True)
+            visitor = StronglyConnectedComponents()
+            nx.depth_first_visit(G, visitor)
+            expected = nx.strongly_connected_components(G)
+            assert_equal(sorted(map(sorted, visitor.components)),
+                         sorted(map(sorted, expected)))
+
+    def test_topological_order(self):
+        G = nx.gn_graph(50, seed=1)
+        visitor = FinishOrder()
+        nx.depth_first_visit(G, visitor)
+        order = visitor.order[::-1]
+        position = {v: i for i, v in enumerate(order)}
+        assert_equal(len(order), len(G))
+        assert_true(all(position[u] < position[v] for u, v in G.edges()))
+
+    def test_deep_graph(self):
+        G = nx.path_graph(10000, create_using=nx.DiGraph())
+        visitor = FinishOrder()
+        nx.depth_first_visit(G, visitor, 0)
+        assert_equal(visitor.order, list(range(9999, -1, -1)))
+
+    def test_plain_object(self):
+        class Discover(object):
+            nodes = []
+
+            def discover_vertex(self, u):
+                self.nodes.append(u)
+
+        nx.depth_first_visit(nx.path_graph(3), Discover())
+        assert_equal(Discover.nodes, [0, 1, 2])
+
+    @raises(nx.NetworkXError)
+    def test_missing_source(self):
+        nx.depth_first_visit(nx.path_graph(3), nx.DFSVisitor(), 5)
+
+
+class TestBreadthFirstVisit(object):
+
+    def test_events(self):
+        G = nx.DiGraph([(0, 1), (0, 2), (1, 2), (2, 0)])
+        visitor = Recorder()
+        nx.breadth_first_visit(G, visitor, 0)
+        assert_equal(visitor.events, [
+            ('discover_vertex', 0), ('examine_vertex', 0),
+            ('examine_edge', 0, 1), ('tree_edge', 0, 1),
+            ('discover_vertex', 1),
+            ('examine_edge', 0, 2), ('tree_edge', 0, 2),
+            ('discover_vertex', 2),
+            ('finish_vertex', 0),
+            ('examine_vertex', 1),
+            ('examine_edge', 1, 2), ('non_tree_edge', 1, 2),
+            ('gray_target', 1, 2),
+            ('finish_vertex', 1),
+            ('examine_vertex', 2),
+            ('examine_edge', 2, 0), ('non_tree_edge', 2, 0),
+            ('black_target', 2, 0),
+            ('finish_vertex', 2)])
+
+    def test_tree_matches_bfs_edges(self):
+        G = nx.gnp_random_graph(40, 0.1, seed=5)
+
+        class Tree(nx.BFSVisitor):
+            edges = []
+
+            def tree_edge(self, u, v):
+                self.edges.append((u, v))
+
+        nx.breadth_first_visit(G, Tree(), 0)
+        assert_equal(Tree.edges, list(nx.bfs_edges(G, 0)))
+
+    def test_all_components(self):
+        visitor = Recorder()
+        nx.breadth_first_visit(nx.Graph([(0, 1), (2, 3)]), visitor)
+        discovered = [e[1] for e in visitor.events
+                      if e[0] == 'discover_vertex']
+        assert_equal(discovered, [0, 1, 2, 3])
+
+    @raises(nx.NetworkXError)
+    def test_missing_source(self):
+        nx.breadth_first_visit(nx.path_graph(3), nx.BFSVisitor(), 5)
+
+
+class TestArrays(object):
+
+    def test_depth_first_arrays(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(40, 0.05, seed=seed, directed=True)
+            nodes, parent, discovery, finish = nx.depth_first_arrays(G)
+            assert_equal(nodes, list(G))
+            tree = [(nodes[parent[i]], v) for i, v in enumerate(nodes)
+                    if parent[i] != -1]
+            assert_equal(sorted(tree), sorted(nx.dfs_edges(G)))
+            pre = sorted(range(len(nodes)), key=discovery.__getitem__)
+            post = sorted(range(len(nodes)), key=finish.__getitem__)
+            assert_equal([nodes[i] for i in pre],
+                         list(nx.dfs_preorder_nodes(G)))
+            assert_equal([nodes[i] for i in post],
+                         list(nx.dfs_postorder_nodes(G)))
+            assert_equal(sorted(discovery + finish),
+                         list(range(2 * len(G))))
+
+    def test_depth_first_arrays_source(self):
+        G = nx.DiGraph([(0, 1), (2, 0)])
+        nodes, parent, discovery, finish = nx.depth_first_arrays(G, 0)
+        assert_equal(parent, [-1, 0, -1])
+        assert_equal(discovery, [0, 1, -1])
+        assert_equal(finish, [3, 2, -1])
+
+    def test_breadth_first_arrays(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(40, 0.08, seed=seed)
+            nodes, parent, distance, order = nx.breadth_first_arrays(G, 0)
+            lengths = dict(nx.single_source_shortest_path_length(G, 0))
+            for i, v in enumerate(nodes):
+                assert_equal(distance[i], lengths.get(v, -1))
+            tree = [(nodes[parent[i]], v) for i, v in enumerate(nodes)
+                    if parent[i] != -1]
+            assert_equal(sorted(tree), sorted(nx.bfs_edges(G, 0)))
+            assert_equal([nodes[i] for i in order],
+                         [0] + [v for u, v in nx.bfs_edges(G, 0)])
+
+    @raises(nx.NetworkXError)
+    def test_arrays_missing_source(self):
+        nx.breadth_first_arrays(nx.path_graph(3), 5)
+
+
+class TestMultiSourceBFSArrays(object):
+
+    def check(self, G, sources, reverse=False):
+        nodes, distance, parent = nx.multi_source_bfs_arrays(
+            G, sources, return_parents=True, reverse=reverse)
+        H = G.reverse() if reverse and G.is_directed() else G
+        index = {v: j for j, v in enumerate(nodes)}
+        for i, s in enumerate(sources):
+            lengths = dict(nx.single_source_shortest_path_length(H, s))
+            assert_equal(distance[i],
+                         [lengths.get(v, -1) for v in nodes])
+            assert_equal(distance[i][index[s]], 0)
+            assert_equal(parent[i][index[s]], -1)
+            for j, v in enumerate(nodes):
+                p = parent[i][j]
+                if v == s or v not in lengths:
+                    assert_equal(p, -1)
+                else:
+                    # the parent is a predecessor one level closer to s
+                    u = nodes[p]
+                    assert_equal(index[u], p)
+                    assert_true(H.has_edge(u, v))
+                    assert_equal(lengths[u], lengths[v] - 1)
+
+    def test_random_graphs(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(60, 0.04, seed=seed)
+            self.check(G, list(range(0, 60, 3)))
+            D = nx.gnp_random_graph(60, 0.04, seed=seed, directed=True)
+            self.check(D, list(range(0, 60, 2)))
+            self.check(D, list(range(0, 60, 2)), reverse=True)
+
+    def test_many_sources(self):
+        G = nx.grid_2d_graph(10, 10)
+        self.check(G, list(G) * 2)
+
+    def test_no_parents(self):
+        nodes, distance = nx.multi_source_bfs_arrays(nx.path_graph(3), [2])
+        assert_equal(distance, [[2, 1, 0]])
+
+    def test_no_sources(self):
+        nodes, distance = nx.multi_source_bfs_arrays(nx.path_graph(3), [])
+        assert_equal(distance, [])
+
+    @raises(nx.NetworkXError)
+    def test_missing_source(self):
+        nx.multi_source_bfs_arrays(nx.path_graph(3), [0, 5])
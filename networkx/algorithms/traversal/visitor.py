@@ -0,0 +1,629 @@
+"""
+=========================
+Visitor-based traversals
+=========================
+
+Depth-first and breadth-first traversals that call methods of a visitor
+object at each event of the search, in the style of the Boost Graph
+Library, and fast traversals that record their results in lists.
+
+Algorithms built on these traversals do not pay for a generator and a
+tuple per edge: only the events that the visitor handles are reported.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from collections import deque
+
+import networkx as nx
+
+__all__ = ['DFSVisitor', 'BFSVisitor',
+           'depth_first_visit', 'breadth_first_visit',
+           'depth_first_arrays', 'breadth_first_arrays',
+           'multi_source_bfs_arrays']
+
+# Colors of the nodes during a traversal; undiscovered nodes have none.
+GRAY = 1
+BLACK = 2
+
+
+class DFSVisitor(object):
+    """Base class of the visitors of :func:`depth_first_visit`.
+
+    Subclasses override the methods of the events they handle; the other
+    events are not reported at all, so they cost nothing.
+    """
+
+    def start_vertex(self, u):
+        """Called on each node from which a new search tree starts,
+        before it is discovered."""
+
+    def discover_vertex(self, u):
+        """Called when `u` is first reached."""
+
+    def examine_edge(self, u, v):
+        """Called on each edge leaving `u`, before it is classified."""
+
+    def tree_edge(self, u, v):
+        """Called on each edge of the depth-first forest, before `v` is
+        discovered."""
+
+    def back_edge(self, u, v):
+        """Called on each edge to an ancestor `v` of `u`, or to `u`
+        itself."""
+
+    def forward_or_cross_edge(self, u, v):
+        """Called on each edge to a node `v` already finished; only in
+        directed graphs."""
+
+    def finish_edge(self, u, v):
+        """Called on each edge once it is fully processed: right after it
+        is classified, or when `v` is finished for a tree edge."""
+
+    def finish_vertex(self, u):
+        """Called when all the edges leaving `u` are processed."""
+
+
+class BFSVisitor(object):
+    """Base class of the visitors of :func:`breadth_first_visit`.
+
+    Subclasses override the methods of the events they handle; the other
+    events are not reported at all, so they cost nothing.
+    """
+
+    def discover_vertex(self, u):
+        """Called when `u` is first reached, as it enters the queue."""
+
+    def examine_vertex(self, u):
+        """Called when `u` leaves the queue."""
+
+    def examine_edge(self, u, v):
+        """Called on each edge leaving `u`, before it is classified."""
+
+    def tree_edge(self, u, v):
+        """Called on each edge of the breadth-first forest, before `v` is
+        discovered."""
+
+    def non_tree_edge(self, u, v):
+        """Called on each edge to a node `v` already discovered."""
+
+    def gray_target(self, u, v):
+        """Called on each edge to a node `v` still in the queue, after
+        :meth:`non_tree_edge`."""
+
+    def black_target(self, u, v):
+        """Called on each edge to a node `v` already examined, after
+        :meth:`non_tree_edge`."""
+
+    def finish_vertex(self, u):
+        """Called when all the edges leaving `u` are examined."""
+
+
+def _callbacks(visitor, base, names):
+    """Returns the bound methods of `visitor` for the given events, with
+    None for the events it does not handle."""
+    callbacks = []
+    for name in names:
+        default = getattr(base, name)
+        default = getattr(default, '__func__', default)
+        method = getattr(visitor, name, None)
+        if getattr(method, '__func__', None) is default:
+            method = None
+        callbacks.append(method)
+    return callbacks
+
+
+def depth_first_visit(G, visitor, source=None):
+    """Runs a depth-first search of G, calling the methods of `visitor`
+    at each event.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    visitor : object
+        An object with some of the methods of :class:`DFSVisitor`, usually
+        an instance of a subclass of it.
+
+    source : node, optional
+        The node where the search starts. If None, the search is started
+        again from each node of G not yet discovered, in the order of G.
+
+    Raises
+    ------
+    NetworkXError
+        If `source` is not in G.
+
+    Notes
+    -----
+    The search is iterative, so the depth of the graph is not limited by
+    the recursion limit. The neighbors of a node are visited in the order
+    of ``G[u]``, and the search tree is the one of :func:`dfs_edges`.
+
+    In undirected graphs, the edge from a node to its parent in the tree
+    is not examined again and every other edge is reported once, as a
+    back edge from the descendant. Parallel edges of multigraphs are
+    reported once. An exception raised by the visitor stops the search.
+
+    Examples
+    --------
+    The reverse of the order in which the nodes of a DAG finish is a
+    topological order.
+
+    >>> class Finish(nx.DFSVisitor):
+    ...     def __init__(self):
+    ...         self.order = []
+    ...     def finish_vertex(self, u):
+    ...         self.order.append(u)
+    >>> G = nx.DiGraph([(0, 2), (1, 2), (2, 3)])
+    >>> visitor = Finish()
+    >>> nx.depth_first_visit(G, visitor)
+    >>> visitor.order[::-1]
+    [1, 0, 2, 3]
+
+    See Also
+    --------
+    depth_first_arrays, breadth_first_visit, dfs_labeled_edges
+    """
+    (start_vertex, discover_vertex, examine_edge, tree_edge, back_edge,
+     forward_or_cross_edge, finish_edge, finish_vertex) = _callbacks(
+        visitor, DFSVisitor,
+        ('start_vertex', 'discover_vertex', 'examine_edge', 'tree_edge',
+         'back_edge', 'forward_or_cross_edge', 'finish_edge',
+         'finish_vertex'))
+    undirected = not G.is_directed()
+    adj = G.adj
+    if source is None:
+        nodes = G
+    elif source in G:
+        nodes = [source]
+    else:
+        raise nx.NetworkXError('source node %r not in G' % (source,))
+    color = {}
+    for s in nodes:
+        if s in color:
+            continue
+        if start_vertex:
+            start_vertex(s)
+        color[s] = GRAY
+        if discover_vertex:
+            discover_vertex(s)
+        stack = [(s, None, iter(adj[s]))]
+        while stack:
+            u, p, children = stack[-1]
+            for v in children:
+                if undirected and v == p:
+                    continue
+                if examine_edge:
+                    examine_edge(u, v)
+                c = color.get(v)
+                if c is None:
+                    if tree_edge:
+                        tree_edge(u, v)
+                    color[v] = GRAY
+                    if discover_vertex:
+                        discover_vertex(v)
+                    stack.append((v, u, iter(adj[v])))
+                    break
+                if c == GRAY:
+                    if back_edge:
+                        back_edge(u, v)
+                elif undirected:
+                    # Already reported as a back edge from v.
+                    continue
+                elif forward_or_cross_edge:
+                    forward_or_cross_edge(u, v)
+                if finish_edge:
+                    finish_edge(u, v)
+            else:
+                stack.pop()
+                color[u] = BLACK
+                if finish_vertex:
+                    finish_vertex(u)
+                if finish_edge and p is not None:
+                    finish_edge(p, u)
+
+
+def breadth_first_visit(G, visitor, source=None):
+    """Runs a breadth-first search of G, calling the methods of `visitor`
+    at each event.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    visitor : object
+        An object with some of the methods of :class:`BFSVisitor`, usually
+        an instance of a subclass of it.
+
+    source : node, optional
+        The node where the search starts. If None, the search is started
+        again from each node of G not yet discovered, in the order of G.
+
+    Raises
+    ------
+    NetworkXError
+        If `source` is not in G.
+
+    Notes
+    -----
+    The neighbors of a node are visited in the order of ``G[u]``, and the
+    search tree is the one of :func:`bfs_edges`. In undirected graphs,
+    each edge is examined from both of its endpoints. An exception raised
+    by the visitor stops the search.
+
+    Examples
+    --------
+    >>> class Depth(nx.BFSVisitor):
+    ...     def __init__(self, source):
+    ...         self.depth = {source: 0}
+    ...     def tree_edge(self, u, v):
+    ...         self.depth[v] = self.depth[u] + 1
+    >>> visitor = Depth(0)
+    >>> nx.breadth_first_visit(nx.path_graph(4), visitor, 0)
+    >>> visitor.depth
+    {0: 0, 1: 1, 2: 2, 3: 3}
+
+    See Also
+    --------
+    breadth_first_arrays, depth_first_visit, bfs_edges
+    """
+    (discover_vertex, examine_vertex, examine_edge, tree_edge, non_tree_edge,
+     gray_target, black_target, finish_vertex) = _callbacks(
+        visitor, BFSVisitor,
+        ('discover_vertex', 'examine_vertex', 'examine_edge', 'tree_edge',
+         'non_tree_edge', 'gray_target', 'black_target', 'finish_vertex'))
+    adj = G.adj
+    if source is None:
+        nodes = G
+    elif source in G:
+        nodes = [source]
+    else:
+        raise nx.NetworkXError('source node %r not in G' % (source,))
+    color = {}
+    for s in nodes:
+        if s in color:
+            continue
+        color[s] = GRAY
+        if discover_vertex:
+            discover_vertex(s)
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            if examine_vertex:
+                examine_vertex(u)
+            for v in adj[u]:
+                if examine_edge:
+                    examine_edge(u, v)
+                c = color.get(v)
+                if c is None:
+                    if tree_edge:
+                        tree_edge(u, v)
+                    color[v] = GRAY
+                    if discover_vertex:
+                        discover_vertex(v)
+                    queue.append(v)
+                    continue
+                if non_tree_edge:
+                    non_tree_edge(u, v)
+                if c == GRAY:
+                    if gray_target:
+                        gray_target(u, v)
+                elif black_target:
+                    black_target(u, v)
+            color[u] = BLACK
+            if finish_vertex:
+                finish_vertex(u)
+
+
+def _index_adjacency(G, reverse=False):
+    """Returns the nodes of G, their indices, and the adjacency lists of
+    the indices, following the edges backward if `reverse` is True and G
+    is directed."""
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = G.pred if reverse and G.is_directed() else G.adj
+    return nodes, index, [[index[v] for v in adj[u]] for u in nodes]
+
+
+def _source_indices(G, index, source):
+    if source is None:
+        return range(len(index))
+    try:
+        return [index[source]]
+    except KeyError:
+        raise nx.NetworkXError('source node %r not in G' % (source,))
+
+
+def depth_first_arrays(G, source=None):
+    """Returns the parents and the discovery and finish times of a
+    depth-first search of G, in lists indexed by node number.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node, optional
+        The node where the search starts. If None, the search is started
+        again from each node of G not yet discovered, in the order of G.
+
+    Returns
+    -------
+    nodes : list
+        The nodes of G, in the order of G. Node ``nodes[i]`` has number
+        ``i``, and the other lists are indexed by these numbers.
+
+    parent : list
+        The number of the parent of each node in the depth-first forest,
+        or -1 for the roots and the nodes not reached.
+
+    discovery, finish : lists
+        The times at which each node is discovered and finished, or -1
+        for the nodes not reached. The times are the integers from 0 to
+        twice the number of nodes reached, minus one, so that a node is
+        a descendant of another if and only if its interval of times is
+        inside the interval of the other.
+
+    Raises
+    ------
+    NetworkXError
+        If `source` is not in G.
+
+    Notes
+    -----
+    The search is the one of :func:`depth_first_visit`, run on lists of
+    integers without any callback, generator or tuple per edge.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (0, 3)])
+    >>> nodes, parent, discovery, finish = nx.depth_first_arrays(G, 0)
+    >>> parent
+    [-1, 0, 1, 0]
+    >>> discovery, finish
+    ([0, 1, 2, 5], [7, 4, 3, 6])
+
+    See Also
+    --------
+    depth_first_visit, breadth_first_arrays
+    """
+    nodes, index, adj = _index_adjacency(G)
+    n = len(nodes)
+    parent = [-1] * n
+    discovery = [-1] * n
+    finish = [-1] * n
+    # The position in its adjacency list of the next neighbor of a node.
+    position = [0] * n
+    time = 0
+    for s in _source_indices(G, index, source):
+        if discovery[s] != -1:
+            continue
+        discovery[s] = time
+        time += 1
+        stack = [s]
+        while stack:
+            u = stack[-1]
+            nbrs = adj[u]
+            i = position[u]
+            end = len(nbrs)
+            while i < end and discovery[nbrs[i]] != -1:
+                i += 1
+            if i < end:
+                v = nbrs[i]
+                position[u] = i + 1
+                parent[v] = u
+                discovery[v] = time
+                time += 1
+                stack.append(v)
+            else:
+                position[u] = i
+                stack.pop()
+                finish[u] = time
+                time += 1
+    return nodes, parent, discovery, finish
+
+
+def breadth_first_arrays(G, source=None):
+    """Returns the parents and distances of a breadth-first search of G,
+    in lists indexed by node number.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node, optional
+        The node where the search starts. If None, the search is started
+        again from each node of G not yet discovered, in the order of G.
+
+    Returns
+    -------
+    nodes : list
+        The nodes of G, in the order of G. Node ``nodes[i]`` has number
+        ``i``, and the other lists are indexed by these numbers.
+
+    parent : list
+        The number of the parent of each node in the breadth-first
+        forest, or -1 for the roots and the nodes not reached.
+
+    distance : list
+        The number of edges between each node and the root of its tree,
+        or -1 for the nodes not reached.
+
+    order : list
+        The numbers of the nodes reached, in the order of discovery.
+
+    Raises
+    ------
+    NetworkXError
+        If `source` is not in G.
+
+    Examples
+    --------
+    >>> nodes, parent, distance, order = nx.breadth_first_arrays(
+    ...     nx.star_graph(3), 1)
+    >>> parent, distance, order
+    ([1, -1, 0, 0], [1, 0, 2, 2], [1, 0, 2, 3])
+
+    See Also
+    --------
+    breadth_first_visit, depth_first_arrays
+    """
+    nodes, index, adj = _index_adjacency(G)
+    n = len(nodes)
+    parent = [-1] * n
+    distance = [-1] * n
+    order = []
+    for s in _source_indices(G, index, source):
+        if distance[s] != -1:
+            continue
+        distance[s] = 0
+        head = len(order)
+        order.append(s)
+        while head < len(order):
+            u = order[head]
+            head += 1
+            d = distance[u] + 1
+            for v in adj[u]:
+                if distance[v] == -1:
+                    distance[v] = d
+                    parent[v] = u
+                    order.append(v)
+    return nodes, parent, distance, order
+
+
+def multi_source_bfs_arrays(G, sources, return_parents=False, reverse=False):
+    """Returns the distances from each of several sources to all the nodes
+    of G, computed by one bit-parallel breadth-first search.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : iterable of nodes
+        The sources of the searches. A node may appear more than once.
+
+    return_parents : bool, optional (default False)
+        If True, also return the parents of the nodes in the
+        breadth-first tree of each source.
+
+    reverse : bool, optional (default False)
+        If True, follow the edges of a directed graph backward, so that
+        the distances are to the sources instead of from them.
+
+    Returns
+    -------
+    nodes : list
+        The nodes of G, in the order of G. Node ``nodes[j]`` has number
+        ``j``, and the other lists are indexed by these numbers.
+
+    distance : list of lists
+        ``distance[i][j]`` is the number of edges of a shortest path from
+        the `i`-th source to node ``nodes[j]``, or -1 if there is none.
+
+    parent : list of lists
+        Returned only if `return_parents` is True. ``parent[i][j]`` is the
+        number of the node before ``nodes[j]`` on a shortest path from the
+        `i`-th source, or -1 for the source and the nodes not reached.
+
+    Raises
+    ------
+    NetworkXError
+        If a source is not in G.
+
+    Notes
+    -----
+    This is the multi-source breadth-first search (MS-BFS) of Then et al.
+    [1]_. Each node holds a bitmask of the sources that have reached it
+    and a bitmask of the sources for which it is in the frontier, and a
+    node of the frontier expands the searches of all its sources with one
+    operation per edge. The searches of sources that are close to each
+    other share most of their work, and each edge is scanned at most once
+    per level instead of once per source. The masks are Python integers,
+    so the number of sources is not limited by the size of a machine
+    word.
+
+    The running time is $O(d (n + m) + k n)$ word operations for $k$
+    sources, where $d$ is the largest finite distance, plus the cost of
+    the operations on masks of $k$ bits.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nodes, distance = nx.multi_source_bfs_arrays(G, [0, 3])
+    >>> distance
+    [[0, 1, 2, 3], [3, 2, 1, 0]]
+    >>> nodes, distance, parent = nx.multi_source_bfs_arrays(
+    ...     G, [1], return_parents=True)
+    >>> parent
+    [[1, -1, 1, 2]]
+
+    See Also
+    --------
+    breadth_first_arrays, multi_source_dijkstra_path_length
+
+    References
+    ----------
+    .. [1] Then, M., Kaufmann, M., Chirigati, F., Hoang-Vu, T.-A., Pham,
+       K., Kemper, A., Neumann, T. and Vo, H. T.
+       "The More the Merrier: Efficient Multi-Source Graph Traversal."
+       *Proceedings of the VLDB Endowment*, 8(4), 449--460, 2014.
+    """
+    nodes, index, adj = _index_adjacency(G, reverse)
+    n = len(nodes)
+    sources = list(sources)
+    distance = [[-1] * n for s in sources]
+    parent = [[-1] * n for s in sources] if return_parents else None
+    # The sources that have reached each node, the sources for which it is
+    # in the frontier, and the sources that reach it at the next level.
+    seen = [0] * n
+    visit = [0] * n
+    visit_next = [0] * n
+    frontier = []
+    for i, s in enumerate(sources):
+        try:
+            j = index[s]
+        except KeyError:
+            raise nx.NetworkXError('source node %r not in G' % (s,))
+        if not visit[j]:
+            frontier.append(j)
+        visit[j] |= 1 << i
+        seen[j] |= 1 << i
+        distance[i][j] = 0
+    level = 0
+    while frontier:
+        level += 1
+        reached = []
+        for u in frontier:
+            bits = visit[u]
+            visit[u] = 0
+            for v in adj[u]:
+                new = bits & ~seen[v]
+                if not new:
+                    continue
+                old = visit_next[v]
+                if not old:
+                    reached.append(v)
+                elif return_parents:
+                    new &= ~old
+                visit_next[v] = old | new
+                if return_parents:
+                    while new:
+                        low = new & -new
+                        parent[low.bit_length() - 1][v] = u
+                        new ^= low
+        frontier = reached
+        for v in reached:
+            new = visit_next[v]
+            visit_next[v] = 0
+            seen[v] |= new
+            visit[v] = new
+            while new:
+                low = new & -new
+                distance[low.bit_length() - 1][v] = level
+                new ^= low
+    if return_parents:
+        return nodes, distance, parent
+    return nodes, distance
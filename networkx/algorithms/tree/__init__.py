@@ -1,3 +1,4 @@
 from .recognition import *
 from .branchings import *
 from .mst import *
+from .dynamic_mst import *
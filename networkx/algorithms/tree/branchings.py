@@ -2,32 +2,19 @@
 """
 Algorithms for finding optimum branchings and spanning arborescences.
 
-This implementation is based on:
+The optimum branchings are found with the algorithm of Tarjan, as
+described by:
+
+    H. N. Gabow, Z. Galil, T. Spencer and R. E. Tarjan, Efficient
+    algorithms for finding minimum spanning trees in undirected and
+    directed graphs, Combinatorica 6 (1986), 109–122.
+
+The :class:`Edmonds` class implements the original algorithm of:
 
     J. Edmonds, Optimum branchings, J. Res. Natl. Bur. Standards 71B (1967),
     233–240. URL: http://archive.org/details/jresv71Bn4p233
 
 """
-# TODO: Implement method from Gabow, Galil, Spence and Tarjan:
-#
-#@article{
-#    year={1986},
-#    issn={0209-9683},
-#    journal={Combinatorica},
-#    volume={6},
-#    number={2},
-#    doi={10.1007/BF02579168},
-#    title={Efficient algorithms for finding minimum spanning trees in
-#        undirected and directed graphs},
-#    url={http://dx.doi.org/10.1007/BF02579168},
-#    publisher={Springer-Verlag},
-#    keywords={68 B 15; 68 C 05},
-#    author={Gabow, Harold N. and Galil, Zvi and Spencer, Thomas and Tarjan,
-#        Robert E.},
-#    pages={109-122},
-#    language={English}
-#}
-
 from __future__ import division
 from __future__ import print_function
 
@@ -593,27 +580,248 @@ class Edmonds(object):
 
         return H
 
+def _link(a, b, key, add, child, sibling):
+    """Links the roots `a` and `b` of two pairing heaps of edges and
+    returns the root of the result.
+
+    The effective key of a root ``r`` is ``key[r] + add[r]``. The offset
+    ``add[x]`` of any other node applies to ``x`` and its descendants, so
+    that a whole heap is shifted by changing the offset of its root.
+
+    """
+    if key[b] + add[b] < key[a] + add[a]:
+        a, b = b, a
+    add[b] -= add[a]
+    sibling[b] = child[a]
+    child[a] = b
+    return a
+
+
+def _pop(r, key, add, child, sibling):
+    """Removes the root `r` of a pairing heap and returns the root of the
+    heap made of its children, or -1 if it has none.
+
+    """
+    # Push the offset of the root down to its children, which become
+    # roots, then merge them with the standard two-pass method.
+    delta = add[r]
+    roots = []
+    c = child[r]
+    while c != -1:
+        add[c] += delta
+        roots.append(c)
+        next_c = sibling[c]
+        sibling[c] = -1
+        c = next_c
+    child[r] = -1
+    if not roots:
+        return -1
+    merged = [_link(roots[i], roots[i + 1], key, add, child, sibling)
+              for i in range(0, len(roots) - 1, 2)]
+    if len(roots) % 2:
+        merged.append(roots[-1])
+    root = merged.pop()
+    while merged:
+        root = _link(merged.pop(), root, key, add, child, sibling)
+    return root
+
+
+def _optimum_branching(G, attr, default, kind, style):
+    """Returns an optimum branching or spanning arborescence of `G`.
+
+    This is the algorithm of Tarjan [1]_, with the correction of
+    Camerini, Fratta and Maffioli [2]_, in the form of Gabow, Galil,
+    Spencer and Tarjan [3]_. The nodes are contracted with a union-find
+    structure that can be rolled back, and the edges entering each
+    contracted node are kept in a meldable pairing heap whose keys are
+    shifted lazily, so the running time is O(m log n) and no graph
+    is copied.
+
+    If `style` is 'branching', a node takes its best entering edge only
+    if that edge improves the branching. If it is 'arborescence', every
+    node with an entering edge takes one; the result is a spanning
+    arborescence if and only if `G` has one.
+
+    References
+    ----------
+    .. [1] R. E. Tarjan, "Finding optimum branchings", Networks 7(1),
+       25-35, 1977.
+    .. [2] P. M. Camerini, L. Fratta and F. Maffioli, "A note on finding
+       optimum branchings", Networks 9(4), 309-312, 1979.
+    .. [3] H. N. Gabow, Z. Galil, T. Spencer and R. E. Tarjan, "Efficient
+       algorithms for finding minimum spanning trees in undirected and
+       directed graphs", Combinatorica 6(2), 109-122, 1986.
+
+    """
+    if kind not in KINDS:
+        raise nx.NetworkXException("Unknown value for `kind`.")
+    branching = STYLES.get(style, style) == 'branching'
+    # The algorithm minimizes the sum of the edge costs.
+    sign = 1 if kind == 'min' else -1
+
+    is_multigraph = G.is_multigraph()
+    if is_multigraph:
+        edges = [(u, v, k, d) for u, v, k, d in G.edges(keys=True, data=True)
+                 if u != v]
+    else:
+        edges = [(u, v, d) for u, v, d in G.edges(data=True) if u != v]
+    index = {node: i for i, node in enumerate(G)}
+    n = len(index)
+    m = len(edges)
+    if attr is None:
+        weights = [default] * m
+    else:
+        weights = [e[-1].get(attr, default) for e in edges]
+    src = [index[e[0]] for e in edges]
+    dst = [index[e[1]] for e in edges]
+    key = [sign * w for w in weights]
+    add = [0] * m
+    child = [-1] * m
+    sibling = [-1] * m
+
+    # The heap of edges entering each node.
+    heap = [-1] * n
+    for e in range(m):
+        v = dst[e]
+        h = heap[v]
+        heap[v] = e if h == -1 else _link(h, e, key, add, child, sibling)
+
+    # Union-find without path compression, so that unions can be undone.
+    parent = list(range(n))
+    size = [1] * n
+    history = []
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(x, y):
+        x, y = find(x), find(y)
+        if x == y:
+            return False
+        if size[x] < size[y]:
+            x, y = y, x
+        parent[y] = x
+        size[x] += size[y]
+        history.append(y)
+        return True
+
+    # Contraction phase. For each node in turn, follow the best entering
+    # edges until reaching a root or a node already visited. When the
+    # walk closes a cycle, contract it into a single node whose heap is
+    # the meld of the heaps of the cycle, each of them shifted by the
+    # cost of the cycle edge chosen from it.
+    #
+    # A node may also stay a root. This is modeled by a virtual edge
+    # entering each node, of cost 0 for branchings and of a huge cost
+    # for arborescences, shifted with the heap of the node; `root_cost`
+    # is its cost minus that initial cost.
+    seen = [-1] * n
+    entering = [None] * n
+    root_cost = [0] * n
+    # Each contraction is stored as the contracted node, the size of the
+    # union-find history before it, and the cycle as pairs of an edge and
+    # the root cost of the node it enters.
+    cycles = []
+    for s in range(n):
+        u = s
+        path = []
+        while seen[u] < 0:
+            seen[u] = s
+            h = heap[u]
+            # Discard the edges that became internal to a contraction.
+            while h != -1 and find(src[h]) == u:
+                h = _pop(h, key, add, child, sibling)
+            heap[u] = h
+            if h == -1:
+                break
+            cost = key[h] + add[h]
+            if branching and cost >= root_cost[u]:
+                break
+            rest = _pop(h, key, add, child, sibling)
+            if rest != -1:
+                add[rest] -= cost
+            heap[u] = rest
+            path.append((u, h, cost))
+            u = find(src[h])
+            if seen[u] == s:
+                # The walk closed a cycle through u.
+                time = len(history)
+                cycle = []
+                merged = -1
+                while True:
+                    w, e, c = path.pop()
+                    cycle.append((e, root_cost[w] - c))
+                    h = heap[w]
+                    if h != -1:
+                        merged = (h if merged == -1 else
+                                  _link(merged, h, key, add, child, sibling))
+                    if w == u:
+                        break
+                    union(u, w)
+                u = find(u)
+                heap[u] = merged
+                root_cost[u] = min(c for e, c in cycle)
+                seen[u] = -1
+                cycles.append((u, time, cycle))
+        for w, e, c in path:
+            entering[find(dst[e])] = e
+
+    # Expansion phase. Undo the contractions from the last one. All the
+    # edges of a cycle are kept, except the one entering the same node
+    # as the edge chosen for the contracted node. If the contracted node
+    # is a root, so is the node of the cycle with the cheapest virtual
+    # edge, which is the cycle edge of largest cost if all the root costs
+    # were equal.
+    for u, time, cycle in reversed(cycles):
+        e_in = entering[u]
+        while len(history) > time:
+            y = history.pop()
+            x = parent[y]
+            size[x] -= size[y]
+            parent[y] = y
+        for e, c in cycle:
+            entering[find(dst[e])] = e
+        if e_in is None:
+            e, c = min(cycle, key=itemgetter(1))
+            entering[find(dst[e])] = None
+        else:
+            entering[find(dst[e_in])] = e_in
+
+    H = G.__class__()
+    H.add_nodes_from(G)
+    for e in entering:
+        if e is None:
+            continue
+        data = {} if attr is None else {attr: weights[e]}
+        if is_multigraph:
+            u, v, k, d = edges[e]
+            H.add_edge(u, v, key=k, **data)
+        else:
+            u, v, d = edges[e]
+            H.add_edge(u, v, **data)
+    return H
+
+
 def maximum_branching(G, attr='weight', default=1):
-    ed = Edmonds(G)
-    B = ed.find_optimum(attr, default, kind='max', style='branching')
-    return B
+    return _optimum_branching(G, attr, default, kind='max', style='branching')
+
 
 def minimum_branching(G, attr='weight', default=1):
-    ed = Edmonds(G)
-    B = ed.find_optimum(attr, default, kind='min', style='branching')
-    return B
+    return _optimum_branching(G, attr, default, kind='min', style='branching')
+
 
 def maximum_spanning_arborescence(G, attr='weight', default=1):
-    ed = Edmonds(G)
-    B = ed.find_optimum(attr, default, kind='max', style='arborescence')
+    B = _optimum_branching(G, attr, default, kind='max', style='arborescence')
     if not is_arborescence(B):
         msg = 'No maximum spanning arborescence in G.'
         raise nx.exception.NetworkXException(msg)
     return B
 
+
 def minimum_spanning_arborescence(G, attr='weight', default=1):
-    ed = Edmonds(G)
-    B = ed.find_optimum(attr, default, kind='min', style='arborescence')
+    B = _optimum_branching(G, attr, default, kind='min', style='arborescence')
     if not is_arborescence(B):
         msg = 'No maximum spanning arborescence in G.'
         raise nx.exception.NetworkXException(msg)
@@ -635,7 +843,16 @@ default : float
 Returns
 -------
 B : (multi)digraph-like
-    A {kind} {style}.
+    A {kind} {style}. Its edges keep the keys of `G` and have the
+    attribute `attr`, unless `attr` is None.
+
+Notes
+-----
+This uses Tarjan's algorithm, which runs in $O(m \\log n)$ time for a
+graph with $n$ nodes and $m$ edges. It contracts cycles with a
+union-find structure and keeps the edges entering each node in a
+meldable pairing heap, instead of building a new graph at each
+contraction as :class:`Edmonds` does.
 """
 
 docstring_arborescence = docstring_branching + """
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+"""
+Maintenance of a minimum spanning forest under edge updates.
+
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from .mst import kruskal_mst_edges
+
+__all__ = ['DynamicMinimumSpanningForest']
+
+
+class _LinkCutTrees(object):
+    """Link-cut trees of Sleator and Tarjan over integer nodes, answering
+    path maximum queries.
+
+    The nodes are stored in flat lists. Every node has a value, and
+    :meth:`path_max` returns the node of largest value on the path
+    between two nodes of the same tree.
+    """
+
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.value = []
+        self.best = []
+        self.free = []
+
+    def new_node(self, value):
+        """Returns a new isolated node of the given value."""
+        if self.free:
+            x = self.free.pop()
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flip[x] = False
+            self.value[x] = value
+            self.best[x] = x
+            return x
+        x = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def delete_node(self, x):
+        """Marks the isolated node `x` for reuse."""
+        self.free.append(x)
+
+    def _is_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _update(self, x):
+        value = self.value
+        best = self.best
+        b = x
+        for c in (self.left[x], self.right[x]):
+            if c != -1 and value[best[c]] > value[b]:
+                b = best[c]
+        best[x] = b
+
+    def _push(self, x):
+        if self.flip[x]:
+            left, right, flip = self.left, self.right, self.flip
+            l, r = left[x], right[x]
+            left[x], right[x] = r, l
+            if l != -1:
+                flip[l] = not flip[l]
+            if r != -1:
+                flip[r] = not flip[r]
+            flip[x] = False
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            c = right[x]
+            left[p] = c
+            right[x] = p
+        else:
+            c = left[x]
+            right[p] = c
+            left[x] = p
+        if c != -1:
+            parent[c] = p
+        parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        # Push the pending flips down from the root of the splay tree.
+        stack = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            stack.append(y)
+        while stack:
+            self._push(stack.pop())
+        parent = self.parent
+        while not self._is_root(x):
+            p = parent[x]
+            if not self._is_root(p):
+                g = parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        """Returns the root of the tree containing `x`."""
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        """Returns True if `x` and `y` are in the same tree."""
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        """Joins the trees of `x` and `y` with the edge ``(x, y)``."""
+        self._make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        """Removes the tree edge ``(x, y)``."""
+        self._make_root(x)
+        self._access(y)
+        # The path from x to y is x followed by y.
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._update(y)
+
+    def path_max(self, x, y):
+        """Returns the node of largest value on the path from `x` to
+        `y`."""
+        self._make_root(x)
+        self._access(y)
+        return self.best[y]
+
+    def set_value(self, x, value):
+        """Changes the value of `x`."""
+        self._access(x)
+        self.value[x] = value
+        self._update(x)
+
+
+class DynamicMinimumSpanningForest(object):
+    """Minimum spanning forest of an undirected graph that is maintained
+    while edges are added, removed and reweighted.
+
+    The forest is initially computed with Kruskal's algorithm. Then each
+    update changes it in time roughly proportional to the logarithm of
+    the number of nodes, except when a forest edge is removed or made
+    heavier, in which case a replacement edge is searched for among the
+    edges incident to the smaller of the two trees left by the removal.
+    The edges of the forest and its total weight are always available.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected graph. It is copied, and is not modified by the
+        updates.
+
+    weight : string
+        Edge attribute holding the weight of the edge. If this attribute
+        is not present, the weight is considered to be 1. Default value:
+        'weight'.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    See also
+    --------
+    minimum_spanning_tree, minimum_spanning_edges
+
+    Notes
+    -----
+    The forest is stored in link-cut trees [1]_ in which each forest edge
+    is represented by a node carrying its weight. The heaviest edge on
+    the path between two nodes is thus found in amortized $O(\\log n)$
+    time. Adding an edge, or making an edge outside the forest lighter,
+    replaces the heaviest edge of the cycle it closes if that edge is
+    heavier.
+
+    When a forest edge is removed, or made heavier, the two trees it
+    joined are explored alternately from its endpoints until the smaller
+    one is fully known, and the lightest edge leaving it replaces the
+    removed edge. This search is proportional to the size of the smaller
+    tree and to the number of edges incident to it; the polylogarithmic
+    bounds of the fully dynamic algorithm of Holm, de Lichtenberg and
+    Thorup are not attained.
+
+    When several edges have the same weight, the forest may differ from
+    the one returned by :func:`minimum_spanning_tree`, but its total
+    weight is the same.
+
+    References
+    ----------
+    .. [1] D. D. Sleator and R. E. Tarjan, "A data structure for dynamic
+       trees", Journal of Computer and System Sciences 26(3), 362-391,
+       1983.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> nx.set_edge_attributes(G, 'weight', 2)
+    >>> msf = nx.DynamicMinimumSpanningForest(G)
+    >>> msf.total_weight
+    6
+    >>> msf.add_edge(0, 2, 1)
+    >>> msf.total_weight
+    5
+    >>> msf.update_weight(0, 2, 3)
+    >>> msf.total_weight
+    6
+    >>> msf.remove_edge(0, 1)
+    >>> sorted(msf.edges())
+    [(0, 3), (1, 2), (2, 3)]
+    """
+
+    def __init__(self, G, weight='weight'):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for directed type')
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for multigraph type')
+        self.weight = weight
+        self._trees = _LinkCutTrees()
+        # Weights of all the edges, and neighbors in the forest.
+        self._adj = {}
+        self._forest_adj = {}
+        # Link-cut tree nodes of the graph nodes and of the forest edges.
+        self._node_id = {}
+        self._edge_id = {}
+        self._edge_of_id = {}
+        self.total_weight = 0
+        for u in G:
+            self.add_node(u)
+        for u, v, d in G.edges(data=True):
+            self._adj[u][v] = self._adj[v][u] = d.get(weight, 1)
+        for u, v, d in kruskal_mst_edges(G, True, weight=weight, data=True):
+            self._link(u, v, d.get(weight, 1))
+
+    def __len__(self):
+        return len(self._adj)
+
+    def __contains__(self, n):
+        return n in self._adj
+
+    def number_of_edges(self):
+        """Returns the number of edges of the forest."""
+        return len(self._edge_id) // 2
+
+    def edges(self, data=False):
+        """Returns an iterator over the edges of the forest.
+
+        Parameters
+        ----------
+        data : bool, optional (default=False)
+            If True, the edges are ``(u, v, w)`` tuples, where `w` is the
+            weight of the edge, otherwise ``(u, v)`` tuples.
+        """
+        seen = set()
+        for u, nbrs in self._forest_adj.items():
+            seen.add(u)
+            for v in nbrs:
+                if v not in seen:
+                    if data:
+                        yield u, v, self._adj[u][v]
+                    else:
+                        yield u, v
+
+    def in_forest(self, u, v):
+        """Returns True if ``(u, v)`` is an edge of the forest."""
+        return (u, v) in self._edge_id
+
+    def forest(self):
+        """Returns the forest as a new graph.
+
+        The graph has all the nodes and the forest edges, with their
+        weights stored in the `weight` attribute.
+        """
+        T = nx.Graph()
+        T.add_nodes_from(self._adj)
+        T.add_weighted_edges_from(self.edges(data=True), weight=self.weight)
+        return T
+
+    def add_node(self, n):
+        """Adds the isolated node `n`, if not already present."""
+        if n not in self._adj:
+            self._adj[n] = {}
+            self._forest_adj[n] = set()
+            self._node_id[n] = self._trees.new_node(float('-inf'))
+
+    def remove_node(self, n):
+        """Removes the node `n` and its incident edges.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not a node.
+        """
+        try:
+            nbrs = list(self._adj[n])
+        except KeyError:
+            raise nx.NetworkXError('node %r is not in the graph' % (n,))
+        for v in nbrs:
+            self.remove_edge(n, v)
+        self._trees.delete_node(self._node_id.pop(n))
+        del self._adj[n]
+        del self._forest_adj[n]
+
+    def add_edge(self, u, v, weight=1):
+        """Adds the edge ``(u, v)`` with the given weight, adding the
+        nodes if needed. If the edge is present, its weight is changed.
+        """
+        self.add_node(u)
+        self.add_node(v)
+        if v in self._adj[u]:
+            self.update_weight(u, v, weight)
+            return
+        self._adj[u][v] = self._adj[v][u] = weight
+        if u != v:
+            self._insert(u, v, weight)
+
+    def remove_edge(self, u, v):
+        """Removes the edge ``(u, v)``.
+
+        Raises
+        ------
+        NetworkXError
+            If ``(u, v)`` is not an edge.
+        """
+        self._check_edge(u, v)
+        del self._adj[u][v]
+        if u != v:
+            del self._adj[v][u]
+        if (u, v) in self._edge_id:
+            self._cut(u, v)
+            self._replace(u, v)
+
+    def update_weight(self, u, v, weight):
+        """Changes the weight of the edge ``(u, v)``.
+
+        Raises
+        ------
+        NetworkXError
+            If ``(u, v)`` is not an edge.
+        """
+        old = self._check_edge(u, v)
+        self._adj[u][v] = self._adj[v][u] = weight
+        if u == v:
+            return
+        if (u, v) not in self._edge_id:
+            if weight < old:
+                self._insert(u, v, weight)
+            return
+        self.total_weight += weight - old
+        self._trees.set_value(self._edge_id[u, v], weight)
+        if weight > old:
+            # A lighter edge across the cut may now replace this one.
+            self._cut(u, v)
+            self._replace(u, v)
+
+    def _check_edge(self, u, v):
+        try:
+            return self._adj[u][v]
+        except KeyError:
+            raise nx.NetworkXError('edge %r is not in the graph' % ((u, v),))
+
+    def _link(self, u, v, weight):
+        trees = self._trees
+        e = trees.new_node(weight)
+        trees.link(self._node_id[u], e)
+        trees.link(e, self._node_id[v])
+        self._edge_id[u, v] = self._edge_id[v, u] = e
+        self._edge_of_id[e] = (u, v)
+        self._forest_adj[u].add(v)
+        self._forest_adj[v].add(u)
+        self.total_weight += weight
+
+    def _cut(self, u, v):
+        trees = self._trees
+        e = self._edge_id.pop((u, v))
+        del self._edge_id[v, u]
+        del self._edge_of_id[e]
+        trees.cut(self._node_id[u], e)
+        trees.cut(e, self._node_id[v])
+        self.total_weight -= trees.value[e]
+        trees.delete_node(e)
+        self._forest_adj[u].discard(v)
+        self._forest_adj[v].discard(u)
+
+    def _insert(self, u, v, weight):
+        """Makes the edge ``(u, v)`` a forest edge if it joins two trees
+        or if it is lighter than the heaviest edge of the cycle it
+        closes."""
+        trees = self._trees
+        x, y = self._node_id[u], self._node_id[v]
+        if trees.connected(x, y):
+            e = trees.path_max(x, y)
+            if not trees.value[e] > weight:
+                return
+            self._cut(*self._edge_of_id[e])
+        self._link(u, v, weight)
+
+    def _replace(self, u, v):
+        """Joins the trees of `u` and `v`, just separated, with the
+        lightest edge between them, if any."""
+        forest_adj = self._forest_adj
+        # Explore both trees alternately until one of them is exhausted.
+        sides = ({u}, {v})
+        stacks = ([u], [v])
+        i = 0
+        while stacks[i]:
+            x = stacks[i].pop()
+            for y in forest_adj[x]:
+                if y not in sides[i]:
+                    sides[i].add(y)
+                    stacks[i].append(y)
+            i = 1 - i
+        # The tree whose stack is empty is fully explored.
+        side = sides[i]
+        adj = self._adj
+        best = None
+        for x in side:
+            for y, w in adj[x].items():
+                if y not in side and (best is None or w < best[2]):
+                    best = (x, y, w)
+        if best is not None:
+            self._link(*best)
@@ -14,6 +14,7 @@ Algorithms for calculating min/max spanning trees/forests.
 __all__ = [
     'minimum_spanning_edges', 'maximum_spanning_edges',
     'minimum_spanning_tree', 'maximum_spanning_tree',
+    'spanning_forest_edge_indices',
 ]
 
 from heapq import heappop, heappush
@@ -195,11 +196,255 @@ def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True):
                 else:
                     yield u, v
 
+
+def spanning_forest_edge_indices(u, v, weights, n=None, minimum=True,
+                                 algorithm='kruskal'):
+    """Returns the indices of the edges of an optimum spanning forest of
+    a graph given as arrays of edge endpoints and weights.
+
+    Edge ``i`` joins the integer nodes ``u[i]`` and ``v[i]`` and has
+    weight ``weights[i]``. Ties between equal weights are broken by the
+    edge index, so the forest is unique and is the one that
+    :func:`minimum_spanning_edges` (or :func:`maximum_spanning_edges`)
+    with ``algorithm='kruskal'`` finds when the edges are listed in the
+    same order.
+
+    Parameters
+    ----------
+    u, v : array_like of integers
+        Endpoints of the edges, between 0 and ``n - 1``.
+
+    weights : array_like
+        Weights of the edges.
+
+    n : integer, optional
+        Number of nodes. If None, it is one more than the largest
+        endpoint.
+
+    minimum : bool, optional (default=True)
+        If True find a minimum spanning forest, otherwise a maximum one.
+
+    algorithm : string, optional (default='kruskal')
+        Either 'kruskal', which sorts the edges once and scans them with
+        an array-based union-find, or 'boruvka', which contracts every
+        component along its best edge in each round using array
+        reductions over all the edges at once.
+
+    Returns
+    -------
+    indices : NumPy array
+        The indices of the edges in the forest, in the order Kruskal's
+        algorithm selects them (increasing weight for a minimum forest,
+        decreasing weight for a maximum one).
+
+    Raises
+    ------
+    ValueError
+        If `algorithm` is not recognized or the arrays differ in length.
+
+    Notes
+    -----
+    The edges are ordered with a single stable sort of the weights.
+    Kruskal's scan stops as soon as ``n - 1`` edges are selected.
+    Borůvka's algorithm needs O(log n) rounds, each of them a
+    constant number of vectorized passes over the remaining edges; it
+    does not require distinct weights. Self-loops are never selected.
+
+    See Also
+    --------
+    minimum_spanning_edges, maximum_spanning_edges
+    """
+    import numpy as np
+    u = np.asarray(u, dtype=np.intp).ravel()
+    v = np.asarray(v, dtype=np.intp).ravel()
+    weights = np.asarray(weights).ravel()
+    if not len(u) == len(v) == len(weights):
+        raise ValueError('u, v and weights must have the same length.')
+    if algorithm not in ('kruskal', 'boruvka'):
+        msg = '{} is not a valid choice for an algorithm.'.format(algorithm)
+        raise ValueError(msg)
+    m = len(u)
+    if n is None:
+        n = int(max(u.max(), v.max())) + 1 if m else 0
+    if m == 0 or n < 2:
+        return np.zeros(0, dtype=np.intp)
+    if not minimum:
+        if weights.dtype.kind in 'bu':
+            weights = weights.astype(float)
+        weights = -weights
+    # A stable sort keeps equal weights in index order, like `sorted`.
+    order = np.argsort(weights, kind='mergesort')
+    if algorithm == 'kruskal':
+        ranks = _kruskal_ranks(u[order], v[order], n)
+    else:
+        ranks = _boruvka_ranks(u[order], v[order], n)
+    return order[ranks]
+
+
+def _kruskal_ranks(su, sv, n):
+    """Returns the positions, in the sorted edge arrays `su` and `sv`, of
+    the edges selected by Kruskal's algorithm.
+
+    """
+    import numpy as np
+    parent = list(range(n))
+    size = [1] * n
+    selected = []
+    target = n - 1
+    for i, (a, b) in enumerate(zip(su.tolist(), sv.tolist())):
+        # Find the roots with path halving.
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            continue
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+        selected.append(i)
+        if len(selected) == target:
+            break
+    return np.array(selected, dtype=np.intp)
+
+
+def _boruvka_ranks(su, sv, n):
+    """Returns the positions, in the sorted edge arrays `su` and `sv`, of
+    the edges selected by Borůvka's algorithm.
+
+    """
+    import numpy as np
+    m = len(su)
+    # Edges between distinct components, as component labels, together
+    # with their positions in the sorted order. Filtering keeps `rank`
+    # sorted, so an edge is found from its rank by binary search.
+    keep = su != sv
+    cu, cv = su[keep], sv[keep]
+    rank = np.flatnonzero(keep)
+    k = n
+    chosen = []
+    while len(rank):
+        # The best edge of each component is its incident edge of
+        # minimum rank.
+        best = np.full(k, m, dtype=np.intp)
+        np.minimum.at(best, cu, rank)
+        np.minimum.at(best, cv, rank)
+        comps = np.flatnonzero(best < m)
+        edges = np.searchsorted(rank, best[comps])
+        other = np.where(cu[edges] == comps, cv[edges], cu[edges])
+        # Hook each component to its neighbor. Two components that chose
+        # the same edge point at each other; the smaller one becomes the
+        # root of the merged component.
+        parent = np.arange(k)
+        parent[comps] = other
+        mutual = (parent[other] == comps) & (comps < other)
+        parent[comps[mutual]] = comps[mutual]
+        chosen.append(np.unique(best[comps]))
+        # Pointer jumping flattens the trees to their roots.
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        roots, labels = np.unique(parent, return_inverse=True)
+        k = len(roots)
+        cu, cv = labels[cu], labels[cv]
+        keep = cu != cv
+        cu, cv, rank = cu[keep], cv[keep], rank[keep]
+    if not chosen:
+        return np.zeros(0, dtype=np.intp)
+    return np.sort(np.concatenate(chosen))
+
+
+def _array_mst_edges(G, minimum, weight, keys, data, algorithm):
+    """Iterates over the edges of an optimum spanning forest computed by
+    :func:`spanning_forest_edge_indices`, in the same order and format as
+    :func:`kruskal_mst_edges`.
+
+    """
+    import numpy as np
+    is_multigraph = G.is_multigraph()
+    if is_multigraph:
+        edges = list(G.edges(keys=True, data=True))
+    else:
+        edges = list(G.edges(data=True))
+    m = len(edges)
+    index = {node: i for i, node in enumerate(G)}
+    u = np.fromiter((index[e[0]] for e in edges), dtype=np.intp, count=m)
+    v = np.fromiter((index[e[1]] for e in edges), dtype=np.intp, count=m)
+    w = np.array([e[-1].get(weight, 1) for e in edges])
+    indices = spanning_forest_edge_indices(u, v, w, n=len(index),
+                                           minimum=minimum,
+                                           algorithm=algorithm)
+    for i in indices.tolist():
+        if is_multigraph:
+            a, b, k, d = edges[i]
+            if keys:
+                yield (a, b, k, d) if data else (a, b, k)
+                continue
+        else:
+            a, b, d = edges[i]
+        yield (a, b, d) if data else (a, b)
+
+
+def array_kruskal_mst_edges(G, minimum, weight='weight', keys=True,
+                            data=True):
+    """Iterates over the edges of a minimum spanning forest as computed by
+    Kruskal's algorithm on NumPy edge arrays.
+
+    `G` is a NetworkX graph, possibly a multigraph. The edges are copied
+    into integer arrays and :func:`spanning_forest_edge_indices` selects
+    the forest with a single sort of the weights. The edges are
+    generated in the same order and format as by
+    :func:`kruskal_mst_edges`, ties included.
+
+    If `minimum` is False, a maximum spanning forest is found instead.
+
+    `weight` is the edge attribute that stores the edge weights. Edges
+    without this attribute have weight 1.
+
+    If `G` is a multigraph and `keys` is True, the edge keys are
+    generated after the nodes. If `data` is True, the edge attribute
+    dictionaries are generated last.
+
+    """
+    return _array_mst_edges(G, minimum, weight, keys, data, 'kruskal')
+
+
+def array_boruvka_mst_edges(G, minimum, weight='weight', keys=True,
+                            data=True):
+    """Iterates over the edges of a minimum spanning forest as computed by
+    Borůvka's algorithm on NumPy edge arrays.
+
+    `G` is a NetworkX graph, possibly a multigraph. The edges are copied
+    into integer arrays and :func:`spanning_forest_edge_indices` runs
+    the rounds of Borůvka's algorithm as vectorized passes over them.
+    Unlike :func:`boruvka_mst_edges`, the edge weights need not be
+    distinct: ties are broken by the order of the edges in `G`, so the
+    forest and the order of its edges are those of
+    :func:`kruskal_mst_edges`.
+
+    If `minimum` is False, a maximum spanning forest is found instead.
+
+    `weight` is the edge attribute that stores the edge weights. Edges
+    without this attribute have weight 1.
+
+    If `G` is a multigraph and `keys` is True, the edge keys are
+    generated after the nodes. If `data` is True, the edge attribute
+    dictionaries are generated last.
+
+    """
+    return _array_mst_edges(G, minimum, weight, keys, data, 'boruvka')
+
+
 ALGORITHMS = {
     'boruvka': boruvka_mst_edges,
     u'borůvka': boruvka_mst_edges,
     'kruskal': kruskal_mst_edges,
-    'prim': prim_mst_edges
+    'prim': prim_mst_edges,
+    'array_kruskal': array_kruskal_mst_edges,
+    'array_boruvka': array_boruvka_mst_edges,
 }
 
 
@@ -232,8 +477,8 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -293,6 +538,11 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edge
+    weights into a NumPy array and call
+    :func:`spanning_forest_edge_indices`; they require NumPy, accept
+    multigraphs and ties, and return the same edges as 'kruskal'.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
 
@@ -317,8 +567,8 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
 
     algorithm : string
        The algorithm to use when finding a maximum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -378,6 +628,11 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edge
+    weights into a NumPy array and call
+    :func:`spanning_forest_edge_indices`; they require NumPy, accept
+    multigraphs and ties, and return the same edges as 'kruskal'.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
     """
@@ -420,8 +675,8 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     Returns
     -------
@@ -445,6 +700,11 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edge
+    weights into a NumPy array and call
+    :func:`spanning_forest_edge_indices`; they require NumPy, accept
+    multigraphs and ties, and return the same edges as 'kruskal'.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
@@ -467,8 +727,8 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
 
     Returns
@@ -494,6 +754,11 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edge
+    weights into a NumPy array and call
+    :func:`spanning_forest_edge_indices`; they require NumPy, accept
+    multigraphs and ties, and return the same edges as 'kruskal'.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
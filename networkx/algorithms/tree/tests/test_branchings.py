@@ -311,3 +311,55 @@ def test_edmonds1_minbranch():
     x = branchings.minimum_branching(G)
     x_ = build_branching(edges)
     assert_equal_branchings(x, x_)
+
+def test_edmonds_agrees():
+    # Compare the weights with those found by the Edmonds class.
+    for seed in range(20):
+        G = nx.gnp_random_graph(30, 0.15, seed=seed, directed=True)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = (7 * i + seed) % 11 - 3
+        for kind in ('max', 'min'):
+            for style in ('branching', 'arborescence'):
+                ed = branchings.Edmonds(G)
+                x_ = ed.find_optimum(kind=kind, style=style)
+                x = branchings._optimum_branching(G, 'weight', 1, kind, style)
+                if style == 'branching':
+                    assert_true(recognition.is_branching(x))
+                else:
+                    assert_equal(recognition.is_arborescence(x),
+                                 recognition.is_arborescence(x_))
+                assert_equal(branchings.branching_weight(x),
+                             branchings.branching_weight(x_))
+
+def test_nested_root_cycle():
+    # The cycle through the root is contracted twice, and the edge to
+    # drop is not the lightest one of the outer cycle.
+    G = nx.DiGraph()
+    G.add_weighted_edges_from([
+        (0, 1, 4), (0, 2, -5), (0, 3, 4), (0, 4, 5), (1, 0, 8), (1, 2, -2),
+        (1, 3, -1), (1, 4, -5), (2, 1, 1), (3, 0, 1), (3, 1, 5), (3, 2, -3),
+        (4, 0, -4), (4, 3, 2)])
+    x = branchings.maximum_spanning_arborescence(G)
+    x_ = build_branching([(2, 1, 1), (1, 0, 8), (0, 3, 4), (0, 4, 5)])
+    assert_equal_branchings(x, x_)
+
+def test_multigraph_keys():
+    G = nx.MultiDiGraph()
+    G.add_edge(0, 1, key='a', weight=1)
+    G.add_edge(0, 1, key='b', weight=3)
+    G.add_edge(1, 0, key='c', weight=2)
+    x = branchings.maximum_branching(G)
+    assert_equal(list(x.edges(keys=True, data=True)),
+                 [(0, 1, 'b', {'weight': 3})])
+
+def test_self_loops_and_no_attr():
+    G = nx.DiGraph([(0, 0), (0, 1), (1, 2), (2, 0)])
+    x = branchings.maximum_spanning_arborescence(G, attr=None)
+    assert_true(recognition.is_arborescence(x))
+    assert_equal(x.number_of_edges(), 2)
+    assert_true(all(d == {} for u, v, d in x.edges(data=True)))
+
+@raises(nx.NetworkXException)
+def test_no_arborescence():
+    G = nx.DiGraph([(0, 1), (2, 1)])
+    branchings.minimum_spanning_arborescence(G)
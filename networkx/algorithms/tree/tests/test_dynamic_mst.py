@@ -0,0 +1,152 @@
+"""Unit tests for the :mod:`networkx.algorithms.tree.dynamic_mst` module."""
+import random
+
+from nose.tools import assert_equal
+from nose.tools import assert_false
+from nose.tools import assert_true
+from nose.tools import raises
+
+import networkx as nx
+
+
+class TestDynamicMinimumSpanningForest(object):
+
+    def check(self, msf, H):
+        T = msf.forest()
+        expected = nx.minimum_spanning_tree(H).size(weight='weight')
+        assert_equal(msf.total_weight, expected)
+        assert_equal(T.size(weight='weight'), expected)
+        assert_equal(set(T), set(H))
+        assert_true(nx.is_forest(T))
+        assert_equal(nx.number_connected_components(T),
+                     nx.number_connected_components(H))
+        for u, v, w in msf.edges(data=True):
+            assert_equal(H[u][v]['weight'], w)
+            assert_true(msf.in_forest(u, v))
+
+    def test_initial_forest(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 7), (0, 3, 5), (1, 2, 8),
+                                   (1, 3, 9), (1, 4, 7), (2, 4, 5),
+                                   (3, 4, 15), (3, 5, 6), (4, 5, 8),
+                                   (4, 6, 9), (5, 6, 11), (7, 8, 1)])
+        G.add_node(9)
+        msf = nx.DynamicMinimumSpanningForest(G)
+        T = nx.minimum_spanning_tree(G)
+        assert_equal(sorted(map(sorted, msf.edges())),
+                     sorted(map(sorted, T.edges())))
+        assert_equal(msf.total_weight, 40)
+        assert_equal(msf.number_of_edges(), 7)
+        assert_equal(len(msf), 10)
+        assert_true(9 in msf)
+
+    def test_insert_replaces_cycle_maximum(self):
+        G = nx.path_graph(5)
+        nx.set_edge_attributes(G, 'weight', 3)
+        G[2][3]['weight'] = 10
+        msf = nx.DynamicMinimumSpanningForest(G)
+        assert_equal(msf.total_weight, 19)
+        msf.add_edge(0, 4, 4)
+        assert_equal(msf.total_weight, 13)
+        assert_false(msf.in_forest(2, 3))
+        assert_true(msf.in_forest(0, 4))
+        msf.add_edge(1, 3, 11)
+        assert_false(msf.in_forest(1, 3))
+        assert_equal(msf.total_weight, 13)
+
+    def test_remove_finds_replacement(self):
+        G = nx.cycle_graph(6)
+        nx.set_edge_attributes(G, 'weight', 1)
+        G[0][5]['weight'] = 5
+        msf = nx.DynamicMinimumSpanningForest(G)
+        assert_false(msf.in_forest(0, 5))
+        msf.remove_edge(2, 3)
+        assert_true(msf.in_forest(0, 5))
+        assert_equal(msf.total_weight, 9)
+        msf.remove_edge(0, 5)
+        assert_equal(msf.number_of_edges(), 4)
+        assert_equal(msf.total_weight, 4)
+
+    def test_weight_changes(self):
+        G = nx.cycle_graph(4)
+        nx.set_edge_attributes(G, 'weight', 2)
+        msf = nx.DynamicMinimumSpanningForest(G)
+        (u, v), = [e for e in G.edges() if not msf.in_forest(*e)]
+        msf.update_weight(u, v, 1)
+        assert_true(msf.in_forest(u, v))
+        assert_equal(msf.total_weight, 5)
+        msf.update_weight(u, v, 7)
+        assert_false(msf.in_forest(u, v))
+        assert_equal(msf.total_weight, 6)
+        # A forest edge made heavier stays if it is still the best.
+        G = nx.path_graph(3)
+        msf = nx.DynamicMinimumSpanningForest(G)
+        msf.update_weight(0, 1, 100)
+        assert_true(msf.in_forest(0, 1))
+        assert_equal(msf.total_weight, 101)
+
+    def test_random_updates(self):
+        rng = random.Random(42)
+        n = 20
+        G = nx.gnp_random_graph(n, 0.2, seed=42)
+        for u, v in G.edges():
+            G[u][v]['weight'] = rng.randint(1, 10)
+        msf = nx.DynamicMinimumSpanningForest(G)
+        H = G.copy()
+        self.check(msf, H)
+        for step in range(300):
+            op = rng.random()
+            u, v = rng.randrange(n + 2), rng.randrange(n + 2)
+            if op < 0.35:
+                w = rng.randint(1, 10)
+                msf.add_edge(u, v, w)
+                H.add_edge(u, v, weight=w)
+            elif op < 0.6 and H.size():
+                u, v = rng.choice(list(H.edges()))
+                msf.remove_edge(u, v)
+                H.remove_edge(u, v)
+            elif op < 0.95 and H.size():
+                u, v = rng.choice(list(H.edges()))
+                w = rng.randint(1, 10)
+                msf.update_weight(u, v, w)
+                H[u][v]['weight'] = w
+            elif len(H) > 2:
+                u = rng.choice(list(H))
+                msf.remove_node(u)
+                H.remove_node(u)
+            self.check(msf, H)
+
+    def test_self_loops(self):
+        msf = nx.DynamicMinimumSpanningForest(nx.Graph())
+        msf.add_edge(0, 0, -5)
+        assert_equal(msf.number_of_edges(), 0)
+        assert_equal(msf.total_weight, 0)
+        msf.update_weight(0, 0, -6)
+        msf.remove_edge(0, 0)
+        assert_equal(len(msf), 1)
+
+    def test_default_weight(self):
+        G = nx.Graph([(0, 1), (1, 2)])
+        G.add_edge(0, 2, cost=3)
+        msf = nx.DynamicMinimumSpanningForest(G, weight='cost')
+        assert_equal(msf.total_weight, 2)
+        T = msf.forest()
+        assert_equal(sorted(T.edges(data='cost')), [(0, 1, 1), (1, 2, 1)])
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_edge(self):
+        msf = nx.DynamicMinimumSpanningForest(nx.path_graph(3))
+        msf.remove_edge(0, 2)
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_node(self):
+        msf = nx.DynamicMinimumSpanningForest(nx.path_graph(3))
+        msf.remove_node(5)
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed(self):
+        nx.DynamicMinimumSpanningForest(nx.DiGraph())
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        nx.DynamicMinimumSpanningForest(nx.MultiGraph())
@@ -12,6 +12,7 @@ from unittest import TestCase
 
 from nose.tools import assert_equal
 from nose.tools import raises
+from nose import SkipTest
 
 import networkx as nx
 
@@ -206,3 +207,147 @@ class TestPrim(MultigraphMSTTestBase, TestCase):
         G.add_edge(0, 1, key='b', weight=1)
         T = nx.maximum_spanning_tree(G)
         assert_equal([(0, 1, 2)], list(T.edges(data='weight')))
+
+
+class ArrayMSTTestBase(MultigraphMSTTestBase):
+    # Abstract class
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    # The orientation of the edges of a tree depends on the order in
+    # which they are added, so compare each edge in sorted orientation.
+    def test_minimum_tree(self):
+        T = nx.minimum_spanning_tree(self.G, algorithm=self.algo)
+        actual = sorted((min(u, v), max(u, v), d)
+                        for u, v, d in T.edges(data=True))
+        assert_equal(actual, self.minimum_spanning_edgelist)
+
+    def test_maximum_tree(self):
+        T = nx.maximum_spanning_tree(self.G, algorithm=self.algo)
+        actual = sorted((min(u, v), max(u, v), d)
+                        for u, v, d in T.edges(data=True))
+        assert_equal(actual, self.maximum_spanning_edgelist)
+
+    def test_weight_attribute(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=1, distance=7)
+        G.add_edge(0, 2, weight=30, distance=1)
+        G.add_edge(1, 2, weight=1, distance=1)
+        G.add_node(3)
+        T = nx.minimum_spanning_tree(G, algorithm=self.algo, weight='distance')
+        assert_equal(sorted(T), list(range(4)))
+        assert_equal(sorted((min(u, v), max(u, v)) for u, v in T.edges()),
+                     [(0, 2), (1, 2)])
+        T = nx.maximum_spanning_tree(G, algorithm=self.algo, weight='distance')
+        assert_equal(sorted(T), list(range(4)))
+        assert_equal(sorted((min(u, v), max(u, v)) for u, v in T.edges()),
+                     [(0, 1), (0, 2)])
+
+    def test_same_as_kruskal(self):
+        """Tests that ties are broken exactly as in Kruskal's algorithm,
+        including the order in which the edges are generated.
+
+        """
+        for seed in range(5):
+            G = nx.gnm_random_graph(60, 300, seed=seed)
+            G.add_node(60)
+            for i, (u, v) in enumerate(G.edges()):
+                G[u][v]['weight'] = (7 * i + seed) % 5
+            for func in (nx.minimum_spanning_edges,
+                         nx.maximum_spanning_edges):
+                expected = list(func(G, algorithm='kruskal'))
+                actual = list(func(G, algorithm=self.algo))
+                assert_equal(actual, expected)
+
+    def test_multigraph_same_as_kruskal(self):
+        G = nx.MultiGraph()
+        for i in range(200):
+            u, v = (i * 13) % 30, (i * 7 + 3) % 30
+            G.add_edge(u, v, key=i, weight=i % 4)
+        expected = list(nx.minimum_spanning_edges(G, algorithm='kruskal'))
+        actual = list(nx.minimum_spanning_edges(G, algorithm=self.algo))
+        assert_equal(actual, expected)
+        expected = list(nx.minimum_spanning_edges(G, algorithm='kruskal',
+                                                  keys=False, data=False))
+        actual = list(nx.minimum_spanning_edges(G, algorithm=self.algo,
+                                                keys=False, data=False))
+        assert_equal(actual, expected)
+
+
+class TestArrayKruskal(ArrayMSTTestBase, TestCase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using Kruskal's algorithm on edge arrays.
+
+    """
+    algorithm = 'array_kruskal'
+
+
+class TestArrayBoruvka(ArrayMSTTestBase, TestCase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using Borůvka's algorithm on edge arrays.
+
+    """
+    algorithm = 'array_boruvka'
+
+
+class TestSpanningForestEdgeIndices(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_algorithms_agree(self):
+        rng = numpy.random.RandomState(42)
+        n, m = 500, 3000
+        u = rng.randint(0, n, m)
+        v = rng.randint(0, n, m)
+        w = rng.randint(0, 20, m)
+        for minimum in (True, False):
+            a = nx.spanning_forest_edge_indices(u, v, w, n, minimum=minimum)
+            b = nx.spanning_forest_edge_indices(u, v, w, n, minimum=minimum,
+                                                algorithm='boruvka')
+            assert_equal(a.tolist(), b.tolist())
+            G = nx.MultiGraph()
+            G.add_nodes_from(range(n))
+            for i in range(m):
+                G.add_edge(u[i], v[i], key=i, weight=w[i])
+            T = (nx.minimum_spanning_tree if minimum
+                 else nx.maximum_spanning_tree)(G)
+            assert_equal(w[a].sum(), T.size(weight='weight'))
+            assert_equal(len(a), T.number_of_edges())
+
+    def test_unsigned_maximum(self):
+        u = [0, 1, 0]
+        v = [1, 2, 2]
+        w = numpy.array([1, 3, 2], dtype=numpy.uint8)
+        a = nx.spanning_forest_edge_indices(u, v, w, minimum=False)
+        assert_equal(a.tolist(), [1, 2])
+
+    def test_self_loops_and_isolated(self):
+        a = nx.spanning_forest_edge_indices([0, 1, 3], [0, 2, 1], [0, 5, 1],
+                                            n=5, algorithm='boruvka')
+        assert_equal(a.tolist(), [2, 1])
+
+    def test_empty(self):
+        for algorithm in ('kruskal', 'boruvka'):
+            a = nx.spanning_forest_edge_indices([], [], [],
+                                                algorithm=algorithm)
+            assert_equal(len(a), 0)
+
+    @raises(ValueError)
+    def test_bad_algorithm(self):
+        nx.spanning_forest_edge_indices([0], [1], [1], algorithm='prim')
+
+    @raises(ValueError)
+    def test_length_mismatch(self):
+        nx.spanning_forest_edge_indices([0, 1], [1], [1])